@@ -3,8 +3,11 @@ r"""A debugging script for discover_compat_targets."""
 from __future__ import annotations
 
 import logging
+import tempfile
+from pathlib import Path
 
 from feu.compat import discover_compat_targets, show_compat_targets
+from feu.compat.discoverers import get_default_registry
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -12,6 +15,8 @@ logger: logging.Logger = logging.getLogger(__name__)
 def main() -> None:
     r"""Define the main function."""
     pkg_name = "torch"
+    # Reuse the discovered ranges of the previous runs until the package metadata changes
+    get_default_registry().set_cache_dir(Path(tempfile.gettempdir()).joinpath("feu", "discovery"))
     compat = discover_compat_targets(pkg_name)
     logger.info(compat)
     show_compat_targets(compat=compat, pkg_name=pkg_name)
@@ -0,0 +1,146 @@
+# noqa: INP001
+r"""Benchmark the Python version comparisons of the wheel tag matching.
+
+This compares ``tags_match_exactly``, which compares the precomputed
+integer ``python_ordinal`` of the tags, with the previous
+implementation, which parsed a ``packaging.version.Version`` for both
+Python versions of every ``abi3`` tag. Every wheel tag of the packages
+is matched against every default compatibility target.
+
+By default, the wheel filenames are synthetic releases publishing only
+``abi3`` wheels, so the benchmark runs offline and every comparison
+goes through the ``abi3`` branch. Use ``--pypi`` to fetch the real
+wheel filenames of the packages from PyPI instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+
+from packaging.version import Version
+
+from feu.compat.discoverers.utils import (
+    build_tags_by_version,
+    tags_match_exactly,
+    target_to_wheel_tags,
+)
+from feu.compat.matrix import DEFAULT_TARGETS
+from feu.version import fetch_pypi_wheel_filenames
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from feu.compat.wheel_tags import WheelTags
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+PLATFORMS = (
+    "manylinux_2_17_x86_64.manylinux2014_x86_64",
+    "manylinux_2_17_aarch64.manylinux2014_aarch64",
+    "macosx_11_0_arm64",
+    "macosx_10_15_x86_64",
+    "win_amd64",
+)
+
+
+def legacy_tags_match_exactly(tag: WheelTags, wanted: WheelTags) -> bool:
+    r"""Implement the previous ``tags_match_exactly``, which compares
+    the Python versions with ``packaging.version.Version``."""
+    if tag.os != wanted.os or tag.arch != wanted.arch or tag.free_threaded != wanted.free_threaded:
+        return False
+    if tag.abi3:
+        return (
+            tag.python_version is not None
+            and wanted.python_version is not None
+            and Version(wanted.python_version) >= Version(tag.python_version)
+        )
+    return tag.python_version == wanted.python_version
+
+
+def make_wheel_filenames(pkg_name: str, num_versions: int = 300) -> dict[str, tuple[str, ...]]:
+    r"""Generate the wheel filenames of a synthetic package publishing
+    ``abi3`` wheels for every platform."""
+    wheel_filenames = {}
+    for i in range(num_versions):
+        version = f"{i // 20}.{i % 20}.0"
+        python_tag = f"cp3{8 + i * 6 // num_versions}"
+        wheel_filenames[version] = tuple(
+            f"{pkg_name}-{version}-{python_tag}-abi3-{platform}.whl" for platform in PLATFORMS
+        )
+    return wheel_filenames
+
+
+def measure(func: Callable[[], int], repeat: int = 5) -> tuple[float, int]:
+    r"""Return the best wall time in milliseconds and the result of a
+    function."""
+    best = float("inf")
+    result = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3, result
+
+
+def count_matches(
+    tags: list[WheelTags],
+    wanted: list[WheelTags],
+    match: Callable[[WheelTags, WheelTags], bool],
+) -> int:
+    r"""Count the matching (tag, target) pairs."""
+    return sum(match(tag, target_tags) for target_tags in wanted for tag in tags)
+
+
+def parse_args() -> argparse.Namespace:
+    r"""Parse the command line arguments.
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("packages", nargs="*", default=["duckdb", "pyarrow"])
+    parser.add_argument(
+        "--pypi",
+        action="store_true",
+        help="Fetch the real wheel filenames from PyPI instead of generating them.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    r"""Define the main function."""
+    args = parse_args()
+    wanted = [target_to_wheel_tags(target) for target in DEFAULT_TARGETS]
+    for pkg_name in args.packages:
+        wheel_filenames = (
+            fetch_pypi_wheel_filenames(pkg_name) if args.pypi else make_wheel_filenames(pkg_name)
+        )
+        tags = [
+            tag
+            for version_tags in build_tags_by_version(wheel_filenames).values()
+            for tag in version_tags
+        ]
+        num_abi3 = sum(tag.abi3 for tag in tags)
+        logger.info(f"{pkg_name}: {len(tags)} tags ({num_abi3} abi3), {len(wanted)} targets")
+        legacy_ms, legacy_matches = measure(
+            partial(count_matches, tags, wanted, legacy_tags_match_exactly)
+        )
+        ordinal_ms, ordinal_matches = measure(
+            partial(count_matches, tags, wanted, tags_match_exactly)
+        )
+        if legacy_matches != ordinal_matches:
+            msg = f"Different results: {legacy_matches} != {ordinal_matches}"
+            raise RuntimeError(msg)
+        logger.info(
+            f"  Version:  {legacy_ms:8.2f} ms\n"
+            f"  ordinals: {ordinal_ms:8.2f} ms ({legacy_ms / ordinal_ms:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
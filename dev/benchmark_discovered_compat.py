@@ -0,0 +1,113 @@
+# noqa: INP001
+r"""Benchmark the loading of the ``feu.compat.discovered`` data.
+
+This compares the ``compat.json`` database with the previous storage
+format, one generated Python module per package returning a literal
+``dict[Target, list[VersionRange]]``. The legacy modules are
+regenerated from the database in a temporary directory, then both
+formats are loaded for all the packages and for a single package, and
+the wall time and the peak memory (``tracemalloc``) are reported.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from feu.compat.database import CompatDatabase
+from feu.compat.discovered import DATABASE_PATH
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MODULE_PREFIX = "legacy_discovered_"
+
+MODULE_TEMPLATE = """\
+from feu.compat.registry import VersionRange
+from feu.compat.target import Target
+
+
+def compat():
+    return {compat!r}
+"""
+
+
+def write_legacy_modules(database: CompatDatabase, output_dir: Path) -> list[str]:
+    r"""Write one legacy module per package and return the module
+    names."""
+    names = []
+    for index, pkg_name in enumerate(database):
+        name = f"{MODULE_PREFIX}{index}"
+        content = MODULE_TEMPLATE.format(compat=database.decode(pkg_name))
+        (output_dir / f"{name}.py").write_text(content)
+        names.append(name)
+    return names
+
+
+def load_legacy(names: list[str]) -> None:
+    r"""Import the legacy modules without bytecode cache and call
+    their ``compat`` function."""
+    for name in names:
+        sys.modules.pop(name, None)
+        importlib.import_module(name).compat()
+
+
+def load_database(pkg_names: list[str]) -> None:
+    r"""Load the database and decode the given packages."""
+    database = CompatDatabase.load(DATABASE_PATH)
+    for pkg_name in pkg_names:
+        database.decode(pkg_name)
+
+
+def measure(func: Callable[[], None], repeat: int = 5) -> tuple[float, int]:
+    r"""Return the best wall time in milliseconds and the peak memory
+    in bytes of a function."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1e3, peak
+
+
+def main() -> None:
+    r"""Define the main function."""
+    sys.dont_write_bytecode = True
+    database = CompatDatabase.load(DATABASE_PATH)
+    pkg_names = list(database)
+    logger.info("Database: %s (%d bytes)", database, DATABASE_PATH.stat().st_size)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_dir = Path(tmp_dir)
+        names = write_legacy_modules(database, output_dir)
+        size = sum(path.stat().st_size for path in output_dir.glob("*.py"))
+        logger.info("Legacy modules: %d files (%d bytes)", len(names), size)
+        sys.path.insert(0, tmp_dir)
+        try:
+            cases = {
+                "legacy (all)": lambda: load_legacy(names),
+                "database (all)": lambda: load_database(pkg_names),
+                "legacy (one)": lambda: load_legacy(names[:1]),
+                "database (one)": lambda: load_database(pkg_names[:1]),
+            }
+            for case, func in cases.items():
+                elapsed, peak = measure(func)
+                logger.info("%-16s %8.2f ms %10d bytes peak", case, elapsed, peak)
+        finally:
+            sys.path.remove(tmp_dir)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
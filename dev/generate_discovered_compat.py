@@ -1,73 +1,69 @@
 # noqa: INP001
 r"""A maintenance script to (re)generate the ``feu.compat.discovered``
-modules.
+compatibility database.
 
 For each package name given, this fetches the current PyPI metadata via
-``discover_compat_targets`` and writes the result as a Python module
-under ``src/feu/compat/discovered/``, to be committed to the repository.
-Re-run this script periodically to refresh the automatically discovered
-compatibility data.
+``discover_compat_targets_incremental`` and writes the results as a
+compact ``CompatDatabase`` JSON file at
+``src/feu/compat/discovered/compat.json``, to be committed to the
+repository. The stable releases of each package are stored with its
+constraints, to find the compatible releases without network access.
+Re-run this script periodically to refresh the automatically
+discovered compatibility data.
+
+The refresh is incremental: the database stores a watermark per
+package, so a package that did not change on PyPI is not recomputed,
+and only the new or updated releases of the other packages are
+evaluated. Use ``--full`` to discover every package from scratch. The
+packages are discovered sequentially by default, use ``--jobs`` to
+discover several packages concurrently.
 """
 
 from __future__ import annotations
 
+import argparse
 import logging
-import re
-from pathlib import Path
 
-from feu.compat import discover_compat_targets
+from feu.compat.database import CompatDatabase
+from feu.compat.discovered import DATABASE_PATH
 from feu.compat.packages import get_package_names
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-OUTPUT_DIR = Path(__file__).resolve().parent.parent / "src" / "feu" / "compat" / "discovered"
 
-MODULE_TEMPLATE = '''\
-r"""Automatically discovered compatibility constraints for
-``{pkg_name}``.
-
-Generated by ``dev/generate_discovered_compat.py``. Do not edit by
-hand: re-run the script to refresh this module.
-"""
-
-from __future__ import annotations
-
-__all__ = ["PKG_NAME", "compat"]
-
-from feu.compat.registry import VersionRange
-from feu.compat.target import Target
-
-PKG_NAME = {pkg_name!r}
+def parse_args() -> argparse.Namespace:
+    r"""Parse the command line arguments.
 
-
-def compat() -> dict[Target, list[VersionRange]]:
-    r"""Return the precomputed compatibility constraints for
-    ``{pkg_name}``."""
-    return {compat!r}
-'''
-
-
-def module_name(pkg_name: str) -> str:
-    r"""Convert a PyPI package name to a valid Python module name."""
-    return re.sub(r"[^0-9a-zA-Z_]", "_", pkg_name).lower()
-
-
-def generate(pkg_name: str) -> None:
-    r"""Discover and write the compatibility module for one package."""
-    logger.info("Discovering compatibility targets for %s...", pkg_name)
-    compat = discover_compat_targets(pkg_name)
-    content = MODULE_TEMPLATE.format(pkg_name=pkg_name, compat=compat)
-    path = OUTPUT_DIR / f"{module_name(pkg_name)}.py"
-    path.write_text(content)
-    logger.info("Wrote %s", path)
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the existing database and discover every package from scratch.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of packages discovered concurrently (default: 1, i.e. sequentially).",
+    )
+    return parser.parse_args()
 
 
 def main() -> None:
     r"""Define the main function."""
+    args = parse_args()
+    previous = None
+    if not args.full and DATABASE_PATH.is_file():
+        previous = CompatDatabase.load(DATABASE_PATH)
+
     packages = get_package_names()
-    logger.info(f"Generating compatibility module for packages: {packages}")
-    for pkg_name in packages:
-        generate(pkg_name)
+    logger.info(f"Generating compatibility database for packages: {packages}")
+    database = CompatDatabase.discover(packages, previous=previous, max_workers=args.jobs)
+    database.save(DATABASE_PATH)
+    logger.info("Wrote %s to %s", database, DATABASE_PATH)
 
 
 if __name__ == "__main__":
@@ -9,15 +9,16 @@ from pathlib import Path
 from feu.utils.io import save_json
 from feu.utils.mapping import sort_by_keys
 from feu.version import (
+    PyprojectDocument,
     fetch_latest_major_versions_map,
     fetch_latest_minor_versions_map,
     partition_package_bounds,
-    read_pyproject_dependencies,
-    read_pyproject_optional_dependencies,
 )
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+MAX_WORKERS = 8
+
 
 def fetch_package_versions(base_dir: Path) -> dict[str, list[str]]:
     r"""Get the versions for each package.
@@ -28,17 +29,17 @@ def fetch_package_versions(base_dir: Path) -> dict[str, list[str]]:
     Returns:
         A dictionary with the versions for each package.
     """
-    pyproject_path = base_dir.joinpath("pyproject.toml")
-
-    deps = read_pyproject_dependencies(pyproject_path) + read_pyproject_optional_dependencies(
-        pyproject_path
-    )
+    doc = PyprojectDocument.load(base_dir.joinpath("pyproject.toml"))
+    deps = doc.dependencies() + doc.optional_dependencies()
     major_deps, minor_deps = partition_package_bounds(deps, ["packaging"])
 
-    return sort_by_keys(
-        fetch_latest_major_versions_map(major_deps, include_lower_bound=True)
-        | fetch_latest_minor_versions_map(minor_deps, include_lower_bound=True)
+    major_versions = fetch_latest_major_versions_map(
+        major_deps, include_lower_bound=True, max_workers=MAX_WORKERS
+    )
+    minor_versions = fetch_latest_minor_versions_map(
+        minor_deps, include_lower_bound=True, max_workers=MAX_WORKERS
     )
+    return sort_by_keys(major_versions | minor_versions)
 
 
 def main() -> None:
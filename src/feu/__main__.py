@@ -2,19 +2,28 @@ r"""Contain the main entry point."""
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from feu.compat import UnsupportedVersionError
 from feu.compat import find_closest_version as find_closest_version_
-from feu.compat import is_valid_version, resolve_target
+from feu.compat import get_compatible_releases, is_valid_version, resolve_target
 from feu.imports import check_click, is_click_available
 from feu.install import install_package_closest_version
 from feu.utils.installer import InstallerSpec
 from feu.utils.package import PackageSpec
+from feu.version import scan_package_bounds
+from feu.version.scan import MERGE_MODES
+
+if TYPE_CHECKING:
+    from feu.compat import Target
 
 if is_click_available():
     import click
 else:  # pragma: no cover
     from feu.utils.fallback.click import click
 
+LATEST_COMPATIBLE_MODES = ("latest", "oldest", "per-minor")
+
 
 @click.group()
 def cli() -> None:
@@ -247,9 +256,216 @@ def check_valid_version(
     )
 
 
+@click.command()
+@click.option("-n", "--pkg-name", "pkg_name", help="Package name", required=True, type=str)
+@click.option(
+    "-p",
+    "--python-version",
+    "python_version",
+    help="Python version. If not provided, the current python version is used.",
+    required=False,
+    type=str,
+    default=None,
+)
+@click.option(
+    "-f",
+    "--free-threaded",
+    "free_threaded",
+    help="Whether the target is a free-threaded build. If not provided, the "
+    "current interpreter's free-threaded status is used.",
+    required=False,
+    type=bool,
+    default=None,
+)
+@click.option(
+    "-o",
+    "--os",
+    "os_",
+    help="Target OS. If not provided, the current OS is used.",
+    required=False,
+    type=str,
+    default=None,
+)
+@click.option(
+    "-r",
+    "--arch",
+    "arch",
+    help="Target CPU architecture. If not provided, the current architecture is used.",
+    required=False,
+    type=str,
+    default=None,
+)
+@click.option(
+    "-m",
+    "--mode",
+    "mode",
+    help="Which compatible release to print: 'latest', 'oldest', or 'per-minor' "
+    "(the latest release of each minor series).",
+    required=False,
+    type=str,
+    default="latest",
+)
+def latest_compatible(
+    pkg_name: str,
+    *,
+    python_version: str | None,
+    free_threaded: bool | None,
+    os_: str | None,
+    arch: str | None,
+    mode: str,
+) -> None:
+    r"""Print the latest compatible release of a package for a target,
+    without network access.
+
+    Args:
+        pkg_name: The package name.
+        python_version: The python version. If not provided, the
+            current python version is used.
+        free_threaded: Whether the target is a free-threaded build.
+            If not provided, the current interpreter's free-threaded
+            status is used.
+        os_: The target OS. If not provided, the current OS is used.
+        arch: The target CPU architecture. If not provided, the
+            current architecture is used.
+        mode: Which compatible release to print, either
+            ``'latest'``, ``'oldest'``, or ``'per-minor'``.
+
+    Raises:
+        click.BadParameter: If ``mode`` is not valid.
+        click.ClickException: If the releases of the package are not
+            stored in the compatibility data, or if none of them is
+            compatible with the target.
+
+    Example:
+        ```console
+        $ python -m feu latest-compatible --pkg-name=torch --python-version=3.9 --os=windows --arch=x86_64
+
+        ```
+    """
+    if mode not in LATEST_COMPATIBLE_MODES:
+        msg = f"{mode!r} is not one of {', '.join(map(repr, LATEST_COMPATIBLE_MODES))}."
+        raise click.BadParameter(msg, param_hint="'-m' / '--mode'")
+    target = resolve_target(python_version, free_threaded, os_, arch)
+    releases = get_compatible_releases(pkg_name=pkg_name, target=target)
+    if releases is None:
+        msg = f"no compatible release data for {pkg_name}/{_format_target(target)}"
+        raise click.ClickException(msg)
+    if releases.latest is None:
+        msg = f"no release of {pkg_name} is compatible with {_format_target(target)}"
+        raise click.ClickException(msg)
+    if mode == "per-minor":
+        for version in releases.latest_per_minor:
+            print(version)  # noqa: T201
+    else:
+        print(releases.latest if mode == "latest" else releases.oldest)  # noqa: T201
+
+
+@click.command()
+@click.option(
+    "-d",
+    "--root",
+    "root",
+    help="Root directory to scan for pyproject.toml files.",
+    required=False,
+    type=str,
+    default=".",
+)
+@click.option(
+    "-m",
+    "--mode",
+    "mode",
+    help="How to merge the bounds of a package found in several files: 'tightest' or 'loosest'.",
+    required=False,
+    type=str,
+    default="tightest",
+)
+@click.option(
+    "-w",
+    "--max-workers",
+    "max_workers",
+    help="Maximum number of workers used to parse the files. If not provided, "
+    "the executor default is used.",
+    required=False,
+    type=int,
+    default=None,
+)
+@click.option(
+    "--processes",
+    "use_processes",
+    help="Parse the files in a process pool instead of a thread pool.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "-c",
+    "--cache-path",
+    "cache_path",
+    help="Optional JSON file used to cache the parsed files across calls, so "
+    "that a rescan only parses the changed files.",
+    required=False,
+    type=str,
+    default=None,
+)
+def scan_bounds(
+    root: str,
+    mode: str,
+    max_workers: int | None,
+    use_processes: bool,
+    cache_path: str | None,
+) -> None:
+    r"""Print the merged version bounds of each package declared in the
+    ``pyproject.toml`` files of a directory tree.
+
+    Args:
+        root: The root directory to scan.
+        mode: The merge mode, either ``'tightest'`` or ``'loosest'``.
+        max_workers: The maximum number of workers used to parse the
+            files.
+        use_processes: If ``True``, the files are parsed in a process
+            pool instead of a thread pool.
+        cache_path: An optional JSON file used to cache the parsed
+            files across calls.
+
+    Raises:
+        click.BadParameter: If ``mode`` is not valid.
+
+    Example:
+        ```console
+        $ python -m feu scan-bounds --root=. --mode=loosest
+
+        ```
+    """
+    if mode not in MERGE_MODES:
+        msg = f"{mode!r} is not one of {', '.join(map(repr, MERGE_MODES))}."
+        raise click.BadParameter(msg, param_hint="'-m' / '--mode'")
+    for bounds in scan_package_bounds(
+        root,
+        mode=mode,
+        max_workers=max_workers,
+        use_processes=use_processes,
+        cache_path=cache_path,
+    ):
+        specifiers = []
+        if bounds.lower is not None:
+            specifiers.append(f">={bounds.lower}")
+        if bounds.upper is not None:
+            specifiers.append(f"<{bounds.upper}")
+        print(f"{bounds.name}{','.join(specifiers)}")  # noqa: T201
+
+
+def _format_target(target: Target) -> str:
+    r"""Format a target for the command messages, e.g.
+    ``3.13t/linux/x86_64``, where ``t`` marks a free-threaded build and
+    ``any`` an unspecified OS or architecture."""
+    python_version = f"{target.python_version}t" if target.free_threaded else target.python_version
+    return f"{python_version}/{target.os or 'any'}/{target.arch or 'any'}"
+
+
 cli.add_command(install)
 cli.add_command(find_closest_version)
 cli.add_command(check_valid_version)
+cli.add_command(latest_compatible)
+cli.add_command(scan_bounds)
 
 
 if __name__ == "__main__":  # pragma: no cover
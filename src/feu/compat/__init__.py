@@ -8,13 +8,16 @@ __all__ = [
     "CompatDiscoverer",
     "CompatDiscovererRegistry",
     "CompatRegistry",
+    "CompatibleReleases",
     "JaxCompatDiscoverer",
     "Target",
     "UnsupportedVersionError",
     "VersionRange",
     "WheelTags",
     "discover_compat_targets",
+    "discover_compat_targets_incremental",
     "find_closest_version",
+    "get_compatible_releases",
     "get_default_registry",
     "is_valid_version",
     "parse_wheel_filename",
@@ -29,14 +32,21 @@ from feu.compat.discoverers import (
     CompatDiscovererRegistry,
     JaxCompatDiscoverer,
     discover_compat_targets,
+    discover_compat_targets_incremental,
 )
 from feu.compat.interface import (
     find_closest_version,
+    get_compatible_releases,
     get_default_registry,
     is_valid_version,
     register_compat,
 )
 from feu.compat.matrix import show_compat_targets
-from feu.compat.registry import CompatRegistry, UnsupportedVersionError, VersionRange
+from feu.compat.registry import (
+    CompatibleReleases,
+    CompatRegistry,
+    UnsupportedVersionError,
+    VersionRange,
+)
 from feu.compat.target import Target, resolve_target
 from feu.compat.wheel_tags import WheelTags, parse_wheel_filename
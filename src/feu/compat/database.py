@@ -0,0 +1,531 @@
+r"""Define a compact serialized format for package/target compatibility
+constraints.
+
+A database stores the constraints of many packages in a single JSON
+document. The targets, the version strings, and the range lists are
+interned in shared tables, and each package is a list of
+``[target_index, ranges_index]`` pairs, so the file stays small and
+decoding a package only creates the objects of that package. The
+database can also store the ``DiscoveryWatermark`` of each package, to
+incrementally refresh the constraints, and the stable releases of each
+package, to find the compatible releases without network access.
+"""
+
+from __future__ import annotations
+
+__all__ = ["CompatDatabase"]
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from feu.compat.discoverers import discover_compat_targets_incremental
+from feu.compat.discoverers.incremental import DiscoveryWatermark
+from feu.compat.discoverers.utils import sort_stable_versions
+from feu.compat.matrix import DEFAULT_TARGETS
+from feu.compat.registry import VersionRange
+from feu.compat.target import Target
+from feu.version import fetch_pypi_upload_times
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from concurrent.futures import Executor
+
+    from feu.compat.registry import CompatRegistry
+
+FORMAT_VERSION = 1
+
+
+class CompatDatabase:
+    r"""Compact, read-only collection of package/target compatibility
+    constraints.
+
+    The database is decoded lazily: the tables are parsed once, and the
+    ``Target`` and ``VersionRange`` objects of a package are only
+    created when the package is decoded. The decoded objects are shared
+    between the packages.
+
+    Args:
+        data: The JSON-compatible representation of the database, as
+            returned by ``to_dict``.
+
+    Raises:
+        ValueError: if the format version of ``data`` is not supported.
+
+    Example:
+        ```pycon
+        >>> from feu.compat import Target, VersionRange
+        >>> from feu.compat.database import CompatDatabase
+        >>> database = CompatDatabase.from_mapping(
+        ...     {"numpy": {Target(python_version="3.11"): [VersionRange("1.23.2", None)]}}
+        ... )
+        >>> database
+        CompatDatabase(packages=1, targets=1, versions=1, ranges=1)
+        >>> database.decode("numpy")
+        {Target(python_version='3.11', free_threaded=False, os=None, arch=None): [VersionRange(min='1.23.2', max=None)]}
+
+        ```
+    """
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        if data.get("format_version") != FORMAT_VERSION:
+            msg = (
+                f"Unsupported compatibility database format: {data.get('format_version')} "
+                f"(expected {FORMAT_VERSION})"
+            )
+            raise ValueError(msg)
+        self._targets: list[list[Any]] = data["targets"]
+        self._versions: list[str] = data["versions"]
+        self._ranges: list[list[int]] = data["ranges"]
+        self._packages: dict[str, list[list[int]]] = data["packages"]
+        self._watermarks: dict[str, list[Any]] = data.get("watermarks", {})
+        self._releases: dict[str, list[int]] = data.get("releases", {})
+        self._decoded_targets: dict[int, Target] = {}
+        self._decoded_ranges: dict[int, tuple[VersionRange, ...]] = {}
+        self._decoded_version_ranges: dict[tuple[int, int], VersionRange] = {}
+
+    def __contains__(self, pkg_name: object) -> bool:
+        return pkg_name in self._packages
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._packages)
+
+    def __len__(self) -> int:
+        return len(self._packages)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(packages={len(self._packages)}, "
+            f"targets={len(self._targets)}, versions={len(self._versions)}, "
+            f"ranges={len(self._ranges)})"
+        )
+
+    @classmethod
+    def discover(
+        cls,
+        pkg_names: Sequence[str],
+        targets: Sequence[Target] = DEFAULT_TARGETS,
+        previous: CompatDatabase | None = None,
+        max_workers: int | None = 1,
+        executor: Executor | None = None,
+    ) -> CompatDatabase:
+        r"""Create a database by discovering the constraints of packages
+        from PyPI.
+
+        Each package is discovered with
+        ``discover_compat_targets_incremental``, so the packages of
+        ``previous`` are refreshed incrementally. The packages are
+        independent, so they can be discovered concurrently by setting
+        ``max_workers`` or ``executor``, which overlaps their PyPI
+        requests. The output is the same as a sequential discovery:
+        the packages follow the order of ``pkg_names``.
+
+        The concurrency is across packages. Within a package,
+        ``discover_compat_targets`` can also split the targets over
+        several workers.
+
+        Args:
+            pkg_names: The package names to discover.
+            targets: The compatibility targets to compute constraints
+                for. Defaults to ``DEFAULT_TARGETS``.
+            previous: An optional database with the previously
+                discovered constraints and watermarks.
+            max_workers: The maximum number of threads used to
+                discover the packages concurrently. ``1`` (default)
+                discovers the packages sequentially in the calling
+                thread, and ``None`` uses the ``ThreadPoolExecutor``
+                default. Ignored if ``executor`` is specified.
+            executor: An optional executor used to discover the
+                packages concurrently. The executor is not shut down by
+                this function.
+
+        Returns:
+            The database, with the watermark and the stable releases
+                of each package.
+
+        Example:
+            ```pycon
+            >>> from feu.compat.database import CompatDatabase
+            >>> from feu.compat.discovered import load_discovered
+            >>> database = CompatDatabase.discover(
+            ...     ["numpy", "torch"], previous=load_discovered(), max_workers=2
+            ... )  # doctest: +SKIP
+
+            ```
+        """
+        baselines = {
+            pkg_name: (previous.decode(pkg_name), previous.watermark(pkg_name))
+            for pkg_name in pkg_names
+            if previous is not None and pkg_name in previous
+        }
+
+        def _discover(
+            pkg_name: str,
+        ) -> tuple[dict[Target, list[VersionRange]], DiscoveryWatermark, list[str]]:
+            compat, watermark = baselines.get(pkg_name, (None, None))
+            compat, new_watermark = discover_compat_targets_incremental(
+                pkg_name, previous=compat, watermark=watermark, targets=targets
+            )
+            releases = None
+            if new_watermark == watermark:
+                # The package did not change, so its releases were not fetched again
+                releases = previous.releases(pkg_name)
+            if releases is None:
+                upload_times = fetch_pypi_upload_times(pkg_name)
+                releases = sort_stable_versions(
+                    version for version, upload_time in upload_times.items() if upload_time
+                )
+            return compat, new_watermark, releases
+
+        if executor is not None:
+            results = list(executor.map(_discover, pkg_names))
+        elif max_workers == 1:
+            results = [_discover(pkg_name) for pkg_name in pkg_names]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_discover, pkg_names))
+        return cls.from_mapping(
+            {pkg_name: compat for pkg_name, (compat, _, _) in zip(pkg_names, results)},
+            watermarks={
+                pkg_name: watermark for pkg_name, (_, watermark, _) in zip(pkg_names, results)
+            },
+            releases={pkg_name: releases for pkg_name, (_, _, releases) in zip(pkg_names, results)},
+        )
+
+    @classmethod
+    def from_mapping(
+        cls,
+        mapping: Mapping[str, Mapping[Target, list[VersionRange]]],
+        watermarks: Mapping[str, DiscoveryWatermark] | None = None,
+        releases: Mapping[str, Sequence[str]] | None = None,
+    ) -> CompatDatabase:
+        r"""Create a database from package constraints.
+
+        Args:
+            mapping: Mapping of package name to ``Target`` to list of
+                ``VersionRange``, e.g. the state of a
+                ``CompatRegistry``.
+            watermarks: Optional mapping of package name to the
+                ``DiscoveryWatermark`` of its constraints.
+            releases: Optional mapping of package name to its stable
+                releases, sorted in ascending order.
+
+        Returns:
+            The database.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import Target, VersionRange
+            >>> from feu.compat.database import CompatDatabase
+            >>> database = CompatDatabase.from_mapping(
+            ...     {"numpy": {Target(python_version="3.11"): [VersionRange("1.23.2", None)]}}
+            ... )
+            >>> list(database)
+            ['numpy']
+
+            ```
+        """
+        targets: dict[Target, int] = {}
+        versions: dict[str, int] = {}
+        ranges: dict[tuple[int, ...], int] = {}
+        packages = {}
+        for pkg_name, compat in mapping.items():
+            entries = []
+            for target, version_ranges in compat.items():
+                target_index = targets.setdefault(target, len(targets))
+                flat = tuple(
+                    -1 if bound is None else versions.setdefault(bound, len(versions))
+                    for version_range in version_ranges
+                    for bound in version_range
+                )
+                ranges_index = ranges.setdefault(flat, len(ranges))
+                entries.append([target_index, ranges_index])
+            packages[pkg_name] = entries
+        data = {
+            "format_version": FORMAT_VERSION,
+            "targets": [
+                [target.python_version, target.free_threaded, target.os, target.arch]
+                for target in targets
+            ],
+            "versions": list(versions),
+            "ranges": [list(flat) for flat in ranges],
+            "packages": packages,
+        }
+        if watermarks:
+            data["watermarks"] = {
+                pkg_name: _encode_watermark(watermark) for pkg_name, watermark in watermarks.items()
+            }
+        if releases:
+            data["releases"] = {
+                pkg_name: [versions.setdefault(version, len(versions)) for version in pkg_releases]
+                for pkg_name, pkg_releases in releases.items()
+            }
+            data["versions"] = list(versions)
+        return cls(data)
+
+    @classmethod
+    def load(cls, path: str | Path) -> CompatDatabase:
+        r"""Load a database from a JSON file.
+
+        Args:
+            path: The path to the JSON file.
+
+        Returns:
+            The database.
+
+        Example:
+            ```pycon
+            >>> from feu.compat.database import CompatDatabase
+            >>> from feu.compat.discovered import DATABASE_PATH
+            >>> database = CompatDatabase.load(DATABASE_PATH)
+            >>> "numpy" in database
+            True
+
+            ```
+        """
+        return cls(json.loads(Path(path).read_bytes()))
+
+    def decode(self, pkg_name: str) -> dict[Target, list[VersionRange]]:
+        r"""Decode the constraints of a package.
+
+        Args:
+            pkg_name: The package name (e.g., ``"numpy"``).
+
+        Returns:
+            A mapping of ``Target`` to list of ``VersionRange``, in the
+                same shape expected by ``CompatRegistry.register_many``.
+
+        Raises:
+            KeyError: if the package is not in the database.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import Target, VersionRange
+            >>> from feu.compat.database import CompatDatabase
+            >>> database = CompatDatabase.from_mapping(
+            ...     {"numpy": {Target(python_version="3.11"): [VersionRange(None, "2.0.0")]}}
+            ... )
+            >>> database.decode("numpy")
+            {Target(python_version='3.11', free_threaded=False, os=None, arch=None): [VersionRange(min=None, max='2.0.0')]}
+
+            ```
+        """
+        return {
+            self._decode_target(target_index): list(self._decode_ranges(ranges_index))
+            for target_index, ranges_index in self._packages[pkg_name]
+        }
+
+    def watermark(self, pkg_name: str) -> DiscoveryWatermark | None:
+        r"""Get the discovery watermark of a package.
+
+        Args:
+            pkg_name: The package name (e.g., ``"numpy"``).
+
+        Returns:
+            The watermark stored for the package, or ``None`` if the
+                database has no watermark for it.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import Target, VersionRange
+            >>> from feu.compat.database import CompatDatabase
+            >>> from feu.compat.discoverers import DiscoveryWatermark
+            >>> database = CompatDatabase.from_mapping(
+            ...     {"numpy": {Target(python_version="3.11"): [VersionRange("1.23.2", None)]}},
+            ...     watermarks={"numpy": DiscoveryWatermark(123, "2.0.0", None)},
+            ... )
+            >>> database.watermark("numpy")
+            DiscoveryWatermark(serial=123, last_version='2.0.0', last_upload=None, dependency_serials=())
+            >>> database.watermark("torch")
+
+            ```
+        """
+        watermark = self._watermarks.get(pkg_name)
+        if watermark is None:
+            return None
+        # The serials of the dependencies are only stored if the discoverer has dependencies
+        serial, last_version, last_upload, *dependency_serials = watermark
+        return DiscoveryWatermark(
+            serial=serial,
+            last_version=last_version,
+            last_upload=last_upload,
+            dependency_serials=tuple(dependency_serials[0].items()) if dependency_serials else (),
+        )
+
+    def releases(self, pkg_name: str) -> list[str] | None:
+        r"""Get the stable releases of a package.
+
+        Args:
+            pkg_name: The package name (e.g., ``"numpy"``).
+
+        Returns:
+            The stable releases stored for the package, sorted in
+                ascending order, or ``None`` if the database has no
+                releases for it.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import Target, VersionRange
+            >>> from feu.compat.database import CompatDatabase
+            >>> database = CompatDatabase.from_mapping(
+            ...     {"numpy": {Target(python_version="3.11"): [VersionRange("1.23.2", None)]}},
+            ...     releases={"numpy": ["1.22.4", "1.23.2", "2.0.0"]},
+            ... )
+            >>> database.releases("numpy")
+            ['1.22.4', '1.23.2', '2.0.0']
+            >>> database.releases("torch")
+
+            ```
+        """
+        indices = self._releases.get(pkg_name)
+        if indices is None:
+            return None
+        return [self._versions[index] for index in indices]
+
+    def register(self, registry: CompatRegistry) -> None:
+        r"""Register every package of the database into a registry.
+
+        The packages are registered as lazy loaders, so a package is
+        only decoded on its first lookup. The releases of the packages
+        are registered with ``CompatRegistry.register_releases``.
+
+        Args:
+            registry: The registry to populate.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import CompatRegistry, Target, VersionRange
+            >>> from feu.compat.database import CompatDatabase
+            >>> database = CompatDatabase.from_mapping(
+            ...     {"numpy": {Target(python_version="3.11"): [VersionRange("1.23.2", None)]}}
+            ... )
+            >>> registry = CompatRegistry()
+            >>> database.register(registry)
+            >>> registry.is_valid_version("numpy", "1.0.0", Target(python_version="3.11"))
+            False
+
+            ```
+        """
+        for pkg_name in self._packages:
+            registry.register_loader(pkg_name, partial(self._load, pkg_name))
+        for pkg_name in self._releases:
+            registry.register_releases(pkg_name, self.releases(pkg_name))
+
+    def save(self, path: str | Path) -> None:
+        r"""Save the database to a JSON file.
+
+        The file has one line per target, range list, and package, so
+        a refresh produces readable diffs.
+
+        Args:
+            path: The path to the JSON file.
+        """
+        Path(path).write_text(self.to_json())
+
+    def to_dict(self) -> dict[str, Any]:
+        r"""Return the JSON-compatible representation of the database.
+
+        Returns:
+            The representation of the database.
+        """
+        data = {
+            "format_version": FORMAT_VERSION,
+            "targets": self._targets,
+            "versions": self._versions,
+            "ranges": self._ranges,
+            "packages": self._packages,
+        }
+        if self._watermarks:
+            data["watermarks"] = self._watermarks
+        if self._releases:
+            data["releases"] = self._releases
+        return data
+
+    def to_json(self) -> str:
+        r"""Serialize the database to a JSON string.
+
+        Returns:
+            The JSON string, with one line per table item.
+        """
+
+        def dump(value: Any) -> str:
+            return json.dumps(value, separators=(",", ":"))
+
+        def dump_lines(values: list[str], indent: str) -> str:
+            return ",\n".join(f"{indent}{value}" for value in values)
+
+        def dump_section(name: str, mapping: Mapping[str, Any]) -> str:
+            lines = [f"{dump(key)}:{dump(value)}" for key, value in mapping.items()]
+            return f'  }},\n  "{name}": {{\n{dump_lines(lines, "    ")}\n'
+
+        packages = [f"{dump(name)}:{dump(entries)}" for name, entries in self._packages.items()]
+        watermarks = dump_section("watermarks", self._watermarks) if self._watermarks else ""
+        releases = dump_section("releases", self._releases) if self._releases else ""
+        return (
+            "{\n"
+            f'  "format_version": {FORMAT_VERSION},\n'
+            '  "targets": [\n'
+            f"{dump_lines([dump(target) for target in self._targets], '    ')}\n"
+            "  ],\n"
+            '  "versions": [\n'
+            f"{dump_lines([dump(version) for version in self._versions], '    ')}\n"
+            "  ],\n"
+            '  "ranges": [\n'
+            f"{dump_lines([dump(flat) for flat in self._ranges], '    ')}\n"
+            "  ],\n"
+            '  "packages": {\n'
+            f"{dump_lines(packages, '    ')}\n"
+            f"{watermarks}"
+            f"{releases}"
+            "  }\n"
+            "}\n"
+        )
+
+    def _load(self, pkg_name: str) -> dict[str, dict[Target, list[VersionRange]]]:
+        r"""Decode a package in the format expected by
+        ``CompatRegistry.register_loader``."""
+        return {pkg_name: self.decode(pkg_name)}
+
+    def _decode_ranges(self, index: int) -> tuple[VersionRange, ...]:
+        r"""Decode a list of ranges, reusing the already decoded
+        ``VersionRange`` objects."""
+        ranges = self._decoded_ranges.get(index)
+        if ranges is None:
+            flat = self._ranges[index]
+            ranges = tuple(
+                self._decode_version_range(flat[i], flat[i + 1]) for i in range(0, len(flat), 2)
+            )
+            self._decoded_ranges[index] = ranges
+        return ranges
+
+    def _decode_version_range(self, min_index: int, max_index: int) -> VersionRange:
+        r"""Decode a range, reusing the already decoded ranges."""
+        version_range = self._decoded_version_ranges.get((min_index, max_index))
+        if version_range is None:
+            version_range = VersionRange(
+                None if min_index < 0 else self._versions[min_index],
+                None if max_index < 0 else self._versions[max_index],
+            )
+            self._decoded_version_ranges[min_index, max_index] = version_range
+        return version_range
+
+    def _decode_target(self, index: int) -> Target:
+        r"""Decode a target, reusing the already decoded targets."""
+        target = self._decoded_targets.get(index)
+        if target is None:
+            python_version, free_threaded, os, arch = self._targets[index]
+            target = Target.of(
+                python_version=python_version, free_threaded=free_threaded, os=os, arch=arch
+            )
+            self._decoded_targets[index] = target
+        return target
+
+
+def _encode_watermark(watermark: DiscoveryWatermark) -> list[Any]:
+    r"""Encode a watermark in a JSON-serializable format."""
+    encoded = [watermark.serial, watermark.last_version, watermark.last_upload]
+    if watermark.dependency_serials:
+        encoded.append(dict(watermark.dependency_serials))
+    return encoded
@@ -1,38 +1,87 @@
 r"""Contain the automatically discovered package/target compatibility
 constraints.
 
-Each submodule of this package holds the precomputed output of
-``discover_compat_targets`` for one package, refreshed by the
+The ``compat.json`` file of this package holds the precomputed output
+of ``discover_compat_targets`` for each package, in the compact
+``CompatDatabase`` format, refreshed by the
 ``dev/generate_discovered_compat.py`` maintenance script. This is
 the automatic counterpart to ``feu.compat.defaults.DEFAULT_COMPAT``,
 the human-curated variant, which takes precedence when both specify a
 given package/target.
+
+The ``feu.compat.discovered.<pkg>`` submodules (e.g.
+``feu.compat.discovered.numpy``) are deprecated. They predate
+``compat.json`` and are kept for backward compatibility: their
+``compat()`` function decodes the package from the database and emits
+a ``DeprecationWarning``. Use ``load_discovered().decode(pkg_name)``
+instead.
 """
 
 from __future__ import annotations
 
-__all__ = ["register_discovered"]
+__all__ = ["DATABASE_PATH", "load_discovered", "register_discovered"]
 
-import importlib
-import pkgutil
+import warnings
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from feu.compat.database import CompatDatabase
+
 if TYPE_CHECKING:
-    from feu.compat.registry import CompatRegistry
+    from feu.compat.registry import CompatRegistry, VersionRange
+    from feu.compat.target import Target
+
+DATABASE_PATH = Path(__file__).resolve().parent / "compat.json"
+
+
+def load_discovered() -> CompatDatabase:
+    r"""Load the automatically discovered package compatibility
+    constraints.
+
+    Returns:
+        The database stored in ``DATABASE_PATH``.
+
+    Example:
+        ```pycon
+        >>> from feu.compat.discovered import load_discovered
+        >>> database = load_discovered()
+        >>> "numpy" in database
+        True
+
+        ```
+    """
+    return CompatDatabase.load(DATABASE_PATH)
 
 
 def register_discovered(registry: CompatRegistry) -> None:
     r"""Populate a registry with the automatically discovered package
     compatibility constraints.
 
-    Every submodule of ``feu.compat.discovered`` is imported and must
-    define ``PKG_NAME`` (the real package name) and a ``compat()``
-    function returning the precomputed output of
-    ``discover_compat_targets`` for that package.
+    The whole database file is read and parsed once, when this
+    function is called. Each package is then registered as a lazy
+    loader, so the ``Target`` and ``VersionRange`` objects of a package
+    are only created on the first lookup of that package.
 
     Args:
         registry: The registry to populate.
     """
-    for module_info in pkgutil.iter_modules(__path__):
-        module = importlib.import_module(f"{__name__}.{module_info.name}")
-        registry.register_many({module.PKG_NAME: module.compat()})
+    load_discovered().register(registry)
+
+
+def _decode_deprecated(pkg_name: str) -> dict[Target, list[VersionRange]]:
+    r"""Decode a package for the deprecated ``compat()`` function of the
+    ``feu.compat.discovered.<pkg>`` submodules.
+
+    Args:
+        pkg_name: The package name (e.g., ``"numpy"``).
+
+    Returns:
+        The discovered constraints of the package.
+    """
+    warnings.warn(
+        f"feu.compat.discovered.<pkg>.compat() is deprecated, use "
+        f"feu.compat.discovered.load_discovered().decode({pkg_name!r}) instead",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return load_discovered().decode(pkg_name)
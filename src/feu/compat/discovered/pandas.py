@@ -1,16 +1,21 @@
-r"""Automatically discovered compatibility constraints for
-``pandas``.
+r"""Deprecated compatibility module for the automatically discovered
+constraints of ``pandas``.
 
-Generated by ``dev/generate_discovered_compat.py``. Do not edit by
-hand: re-run the script to refresh this module.
+The constraints are stored in ``compat.json``. Use
+``feu.compat.discovered.load_discovered().decode("pandas")`` instead.
 """
 
 from __future__ import annotations
 
 __all__ = ["PKG_NAME", "compat"]
 
-from feu.compat.registry import VersionRange
-from feu.compat.target import Target
+from typing import TYPE_CHECKING
+
+from feu.compat.discovered import _decode_deprecated
+
+if TYPE_CHECKING:
+    from feu.compat.registry import VersionRange
+    from feu.compat.target import Target
 
 PKG_NAME = "pandas"
 
@@ -18,156 +23,4 @@ PKG_NAME = "pandas"
 def compat() -> dict[Target, list[VersionRange]]:
     r"""Return the precomputed compatibility constraints for
     ``pandas``."""
-    return {
-        Target(python_version="3.9", free_threaded=False, os="linux", arch="x86_64"): [
-            VersionRange(min="1.1.3", max="2.3.3")
-        ],
-        Target(python_version="3.9", free_threaded=False, os="linux", arch="arm64"): [
-            VersionRange(min="1.2.2", max="1.2.2"),
-            VersionRange(min="1.2.5", max="2.3.3"),
-        ],
-        Target(python_version="3.9", free_threaded=False, os="macos", arch="x86_64"): [
-            VersionRange(min="1.1.3", max="2.3.3")
-        ],
-        Target(python_version="3.9", free_threaded=False, os="macos", arch="arm64"): [
-            VersionRange(min="1.4.0", max="2.3.3")
-        ],
-        Target(python_version="3.9", free_threaded=False, os="windows", arch="x86_64"): [
-            VersionRange(min="1.1.3", max="2.3.3")
-        ],
-        Target(python_version="3.9", free_threaded=False, os="windows", arch="arm64"): [],
-        Target(python_version="3.10", free_threaded=False, os="linux", arch="x86_64"): [
-            VersionRange(min="1.3.3", max="2.3.3")
-        ],
-        Target(python_version="3.10", free_threaded=False, os="linux", arch="arm64"): [
-            VersionRange(min="1.3.3", max="2.3.3")
-        ],
-        Target(python_version="3.10", free_threaded=False, os="macos", arch="x86_64"): [
-            VersionRange(min="1.3.5", max="2.3.3")
-        ],
-        Target(python_version="3.10", free_threaded=False, os="macos", arch="arm64"): [
-            VersionRange(min="1.3.4", max="2.3.3")
-        ],
-        Target(python_version="3.10", free_threaded=False, os="windows", arch="x86_64"): [
-            VersionRange(min="1.3.4", max="2.3.3")
-        ],
-        Target(python_version="3.10", free_threaded=False, os="windows", arch="arm64"): [],
-        Target(python_version="3.11", free_threaded=False, os="linux", arch="x86_64"): [
-            VersionRange(min="1.5.0", max=None)
-        ],
-        Target(python_version="3.11", free_threaded=False, os="linux", arch="arm64"): [
-            VersionRange(min="1.5.0", max=None)
-        ],
-        Target(python_version="3.11", free_threaded=False, os="macos", arch="x86_64"): [
-            VersionRange(min="1.5.0", max=None)
-        ],
-        Target(python_version="3.11", free_threaded=False, os="macos", arch="arm64"): [
-            VersionRange(min="1.5.0", max=None)
-        ],
-        Target(python_version="3.11", free_threaded=False, os="windows", arch="x86_64"): [
-            VersionRange(min="1.5.0", max=None)
-        ],
-        Target(python_version="3.11", free_threaded=False, os="windows", arch="arm64"): [
-            VersionRange(min="3.0.0", max=None)
-        ],
-        Target(python_version="3.12", free_threaded=False, os="linux", arch="x86_64"): [
-            VersionRange(min="2.1.1", max=None)
-        ],
-        Target(python_version="3.12", free_threaded=False, os="linux", arch="arm64"): [
-            VersionRange(min="2.1.1", max=None)
-        ],
-        Target(python_version="3.12", free_threaded=False, os="macos", arch="x86_64"): [
-            VersionRange(min="2.1.1", max=None)
-        ],
-        Target(python_version="3.12", free_threaded=False, os="macos", arch="arm64"): [
-            VersionRange(min="2.1.1", max=None)
-        ],
-        Target(python_version="3.12", free_threaded=False, os="windows", arch="x86_64"): [
-            VersionRange(min="2.1.1", max=None)
-        ],
-        Target(python_version="3.12", free_threaded=False, os="windows", arch="arm64"): [
-            VersionRange(min="3.0.0", max=None)
-        ],
-        Target(python_version="3.13", free_threaded=False, os="linux", arch="x86_64"): [
-            VersionRange(min="2.2.3", max=None)
-        ],
-        Target(python_version="3.13", free_threaded=False, os="linux", arch="arm64"): [
-            VersionRange(min="2.2.3", max=None)
-        ],
-        Target(python_version="3.13", free_threaded=False, os="macos", arch="x86_64"): [
-            VersionRange(min="2.2.3", max=None)
-        ],
-        Target(python_version="3.13", free_threaded=False, os="macos", arch="arm64"): [
-            VersionRange(min="2.2.3", max=None)
-        ],
-        Target(python_version="3.13", free_threaded=False, os="windows", arch="x86_64"): [
-            VersionRange(min="2.2.3", max=None)
-        ],
-        Target(python_version="3.13", free_threaded=False, os="windows", arch="arm64"): [
-            VersionRange(min="3.0.0", max=None)
-        ],
-        Target(python_version="3.13", free_threaded=True, os="linux", arch="x86_64"): [
-            VersionRange(min="2.2.3", max="3.0.3")
-        ],
-        Target(python_version="3.13", free_threaded=True, os="linux", arch="arm64"): [
-            VersionRange(min="2.2.3", max="3.0.3")
-        ],
-        Target(python_version="3.13", free_threaded=True, os="macos", arch="x86_64"): [
-            VersionRange(min="2.2.3", max="3.0.3")
-        ],
-        Target(python_version="3.13", free_threaded=True, os="macos", arch="arm64"): [
-            VersionRange(min="2.2.3", max="3.0.3")
-        ],
-        Target(python_version="3.13", free_threaded=True, os="windows", arch="x86_64"): [
-            VersionRange(min="3.0.0", max="3.0.3")
-        ],
-        Target(python_version="3.13", free_threaded=True, os="windows", arch="arm64"): [],
-        Target(python_version="3.14", free_threaded=False, os="linux", arch="x86_64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=False, os="linux", arch="arm64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=False, os="macos", arch="x86_64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=False, os="macos", arch="arm64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=False, os="windows", arch="x86_64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=False, os="windows", arch="arm64"): [
-            VersionRange(min="3.0.0", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=True, os="linux", arch="x86_64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=True, os="linux", arch="arm64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=True, os="macos", arch="x86_64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=True, os="macos", arch="arm64"): [
-            VersionRange(min="2.3.3", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=True, os="windows", arch="x86_64"): [
-            VersionRange(min="3.0.0", max=None)
-        ],
-        Target(python_version="3.14", free_threaded=True, os="windows", arch="arm64"): [
-            VersionRange(min="3.0.0", max=None)
-        ],
-        Target(python_version="3.15", free_threaded=False, os="linux", arch="x86_64"): [],
-        Target(python_version="3.15", free_threaded=False, os="linux", arch="arm64"): [],
-        Target(python_version="3.15", free_threaded=False, os="macos", arch="x86_64"): [],
-        Target(python_version="3.15", free_threaded=False, os="macos", arch="arm64"): [],
-        Target(python_version="3.15", free_threaded=False, os="windows", arch="x86_64"): [],
-        Target(python_version="3.15", free_threaded=False, os="windows", arch="arm64"): [],
-        Target(python_version="3.15", free_threaded=True, os="linux", arch="x86_64"): [],
-        Target(python_version="3.15", free_threaded=True, os="linux", arch="arm64"): [],
-        Target(python_version="3.15", free_threaded=True, os="macos", arch="x86_64"): [],
-        Target(python_version="3.15", free_threaded=True, os="macos", arch="arm64"): [],
-        Target(python_version="3.15", free_threaded=True, os="windows", arch="x86_64"): [],
-        Target(python_version="3.15", free_threaded=True, os="windows", arch="arm64"): [],
-    }
+    return _decode_deprecated(PKG_NAME)
@@ -21,22 +21,31 @@ from __future__ import annotations
 
 __all__ = [
     "BaseCompatDiscoverer",
+    "CachedCompatDiscoverer",
+    "CompatBaseline",
+    "CompatBitMatrix",
     "CompatDiscoverer",
     "CompatDiscovererRegistry",
+    "DiscoveryWatermark",
     "DuckdbCompatDiscoverer",
     "JaxCompatDiscoverer",
     "PolarsCompatDiscoverer",
     "PydanticCompatDiscoverer",
     "discover_compat_targets",
+    "discover_compat_targets_incremental",
     "get_default_registry",
     "register_discoverers",
 ]
 
 from feu.compat.discoverers.base import BaseCompatDiscoverer
+from feu.compat.discoverers.bitmatrix import CompatBitMatrix
+from feu.compat.discoverers.cache import CachedCompatDiscoverer
 from feu.compat.discoverers.default import CompatDiscoverer
 from feu.compat.discoverers.duckdb import DuckdbCompatDiscoverer
+from feu.compat.discoverers.incremental import CompatBaseline, DiscoveryWatermark
 from feu.compat.discoverers.interface import (
     discover_compat_targets,
+    discover_compat_targets_incremental,
     get_default_registry,
     register_discoverers,
 )
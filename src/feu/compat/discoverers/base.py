@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from feu.compat.discoverers.incremental import CompatBaseline
     from feu.compat.registry import VersionRange
     from feu.compat.target import Target
 
@@ -47,3 +48,69 @@ class BaseCompatDiscoverer(ABC):
                 the same shape expected by
                 ``CompatRegistry.register_many``.
         """
+
+    def discover_incremental(
+        self,
+        pkg_name: str,
+        targets: Sequence[Target],
+        baseline: CompatBaseline | None,  # noqa: ARG002
+    ) -> dict[Target, list[VersionRange]]:
+        r"""Discover the version range compatible with each target,
+        reusing the previously discovered ranges.
+
+        The default implementation ignores ``baseline`` and calls
+        ``discover``. Subclasses can override it to only evaluate the
+        releases that were not already processed.
+
+        Args:
+            pkg_name: The package name to inspect (e.g., ``"numpy"``).
+            targets: The compatibility targets to compute constraints
+                for. Each target must have concrete (non-``None``)
+                ``os`` and ``arch``.
+            baseline: The previously discovered ranges, which contain
+                every target of ``targets``, or ``None`` to discover
+                the ranges from scratch.
+
+        Returns:
+            A mapping of ``Target`` to a list of ``VersionRange``, in
+                the same shape expected by
+                ``CompatRegistry.register_many``.
+        """
+        return self.discover(pkg_name, targets)
+
+    def dependencies(self, pkg_name: str) -> tuple[str, ...]:  # noqa: ARG002
+        r"""Get the other PyPI packages whose metadata is read to
+        discover the compatibility targets of a package.
+
+        A change of one of these packages can change the discovered
+        ranges even if the package itself did not change, so the
+        incremental discovery tracks their PyPI serials. The default
+        implementation returns an empty tuple.
+
+        Args:
+            pkg_name: The package name to inspect (e.g., ``"numpy"``).
+
+        Returns:
+            The names of the other packages.
+        """
+        return ()
+
+    def fingerprint(self, pkg_name: str) -> str | None:  # noqa: ARG002
+        r"""Compute a fingerprint of the metadata used to discover the
+        compatibility targets of a package.
+
+        The discovered ranges only depend on the package name, the
+        targets, and this metadata, so a discovery with the same
+        fingerprint can be reused, e.g. by ``CachedCompatDiscoverer``.
+        The default implementation returns ``None``, i.e. the
+        discovery is never reused. Subclasses can override it to
+        enable the caching.
+
+        Args:
+            pkg_name: The package name to inspect (e.g., ``"numpy"``).
+
+        Returns:
+            The fingerprint, or ``None`` if the discovery cannot be
+                reused.
+        """
+        return None
@@ -0,0 +1,325 @@
+r"""Define a packed bitset representation of the compatibility between
+the versions of a package and compatibility targets."""
+
+from __future__ import annotations
+
+__all__ = ["CompatBitMatrix"]
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+from packaging.version import Version
+
+from feu.compat.registry import VersionRange
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+    from feu.compat.target import Target
+
+_BINARY_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_RUN_PATTERN = re.compile(r"1+")
+
+
+class CompatBitMatrix:
+    r"""Implement a version x target compatibility matrix stored as one
+    packed bitset per target.
+
+    The bit ``i`` of the row of a target is set if the ``i``-th version
+    (in ascending order) is compatible with the target. The rows are
+    Python integers, so the unions and intersections of matrices are
+    bitwise operations, and the contiguous runs of compatible versions
+    are located in the binary representation of the rows instead of
+    checking every version.
+
+    Args:
+        versions: The versions of the package, sorted in ascending
+            order.
+        rows: Mapping of ``Target`` to the bitset of its compatible
+            versions. The bits at or above ``len(versions)`` are
+            ignored.
+
+    Example:
+        ```pycon
+        >>> from feu.compat import Target
+        >>> from feu.compat.discoverers import CompatBitMatrix
+        >>> target = Target(python_version="3.11", os="linux", arch="x86_64")
+        >>> matrix = CompatBitMatrix.from_sets(
+        ...     ["1.0.0", "1.1.0", "2.0.0"], {target: {"1.0.0", "2.0.0"}}
+        ... )
+        >>> matrix
+        CompatBitMatrix(versions=3, targets=1)
+        >>> matrix.ranges(target)
+        [VersionRange(min='1.0.0', max='1.0.0'), VersionRange(min='2.0.0', max=None)]
+
+        ```
+    """
+
+    def __init__(self, versions: Sequence[str], rows: Mapping[Target, int]) -> None:
+        self._versions = tuple(versions)
+        self._positions = {version: i for i, version in enumerate(self._versions)}
+        full = (1 << len(self._versions)) - 1
+        self._rows = {target: bits & full for target, bits in rows.items()}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(versions={len(self._versions)}, "
+            f"targets={len(self._rows)})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompatBitMatrix):
+            return NotImplemented
+        return self._versions == other._versions and self._rows == other._rows
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __and__(self, other: CompatBitMatrix) -> CompatBitMatrix:
+        return self._combine(other, lambda left, right: left & right)
+
+    def __or__(self, other: CompatBitMatrix) -> CompatBitMatrix:
+        return self._combine(other, lambda left, right: left | right)
+
+    @property
+    def versions(self) -> tuple[str, ...]:
+        r"""The versions of the package, sorted in ascending order."""
+        return self._versions
+
+    @property
+    def targets(self) -> tuple[Target, ...]:
+        r"""The compatibility targets of the matrix."""
+        return tuple(self._rows)
+
+    @classmethod
+    def from_sets(
+        cls, versions: Sequence[str], compatible: Mapping[Target, Iterable[str]]
+    ) -> CompatBitMatrix:
+        r"""Create a matrix from the compatible versions of each
+        target.
+
+        Args:
+            versions: The versions of the package, sorted in ascending
+                order.
+            compatible: Mapping of ``Target`` to its compatible
+                versions. The versions that are not in ``versions`` are
+                ignored.
+
+        Returns:
+            The compatibility matrix.
+        """
+        return cls(versions, {target: _pack(versions, v) for target, v in compatible.items()})
+
+    @classmethod
+    def from_ranges(
+        cls, versions: Sequence[str], compat: Mapping[Target, Sequence[VersionRange]]
+    ) -> CompatBitMatrix:
+        r"""Create a matrix from per-target ``VersionRange`` lists.
+
+        A version is compatible with a target if one of its ranges
+        contains it, so the matrix of ranges discovered on an older
+        list of versions can be expanded over the current versions.
+
+        Args:
+            versions: The versions of the package, sorted in ascending
+                order.
+            compat: Mapping of ``Target`` to a list of
+                ``VersionRange``, as returned by the discoverers.
+
+        Returns:
+            The compatibility matrix.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import Target, VersionRange
+            >>> from feu.compat.discoverers import CompatBitMatrix
+            >>> target = Target(python_version="3.11", os="linux", arch="x86_64")
+            >>> matrix = CompatBitMatrix.from_ranges(
+            ...     ["1.0.0", "1.1.0", "1.2.0", "2.0.0"], {target: [VersionRange("1.1.0", "1.2.0")]}
+            ... )
+            >>> matrix.compatible_versions(target)
+            ['1.1.0', '1.2.0']
+
+            ```
+        """
+        parsed = [Version(version) for version in versions]
+        rows = {}
+        for target, ranges in compat.items():
+            bits = 0
+            for version_range in ranges:
+                start = (
+                    0
+                    if version_range.min is None
+                    else bisect_left(parsed, Version(version_range.min))
+                )
+                end = (
+                    len(parsed)
+                    if version_range.max is None
+                    else bisect_right(parsed, Version(version_range.max))
+                )
+                if start < end:
+                    bits |= ((1 << end) - 1) ^ ((1 << start) - 1)
+            rows[target] = bits
+        return cls(versions, rows)
+
+    def bits(self, target: Target) -> int:
+        r"""Get the bitset of the versions compatible with a target.
+
+        Args:
+            target: The compatibility target.
+
+        Returns:
+            The bitset, where the bit ``i`` is set if the ``i``-th
+                version is compatible with the target.
+
+        Raises:
+            KeyError: if the target is not in the matrix.
+        """
+        return self._rows[target]
+
+    def is_compatible(self, version: str, target: Target) -> bool:
+        r"""Indicate if a version is compatible with a target.
+
+        Args:
+            version: The version to check.
+            target: The compatibility target.
+
+        Returns:
+            ``True`` if the version is compatible with the target,
+                otherwise ``False``. A version that is not in the
+                matrix is not compatible.
+
+        Raises:
+            KeyError: if the target is not in the matrix.
+        """
+        bits = self._rows[target]
+        position = self._positions.get(version)
+        return position is not None and bool(bits >> position & 1)
+
+    def compatible_versions(self, target: Target) -> list[str]:
+        r"""Get the versions compatible with a target.
+
+        Args:
+            target: The compatibility target.
+
+        Returns:
+            The compatible versions, sorted in ascending order.
+
+        Raises:
+            KeyError: if the target is not in the matrix.
+        """
+        return [
+            version
+            for start, end in self._iter_runs(self._rows[target])
+            for version in self._versions[start : end + 1]
+        ]
+
+    def ranges(self, target: Target, latest: str | None = None) -> list[VersionRange]:
+        r"""Group the versions compatible with a target into contiguous
+        ``VersionRange`` objects.
+
+        This is the bitset counterpart of ``group_into_ranges``: the
+        runs of compatible versions are the runs of set bits of the
+        row, located in its binary representation instead of checking
+        every version.
+
+        Args:
+            target: The compatibility target.
+            latest: The overall latest version. The final range's
+                ``max`` is ``None`` (unbounded) when its end is
+                ``latest``. Defaults to the last version of the
+                matrix.
+
+        Returns:
+            The list of contiguous ``VersionRange`` objects.
+
+        Raises:
+            KeyError: if the target is not in the matrix.
+        """
+        if latest is None and self._versions:
+            latest = self._versions[-1]
+        ranges = [
+            VersionRange(self._versions[start], self._versions[end])
+            for start, end in self._iter_runs(self._rows[target])
+        ]
+        if ranges and ranges[-1].max == latest:
+            ranges[-1] = VersionRange(ranges[-1].min, None)
+        return ranges
+
+    def to_ranges(self, latest: str | None = None) -> dict[Target, list[VersionRange]]:
+        r"""Convert the matrix to per-target ``VersionRange`` lists.
+
+        Args:
+            latest: The overall latest version. Defaults to the last
+                version of the matrix. See ``ranges``.
+
+        Returns:
+            A mapping of ``Target`` to a list of ``VersionRange``, in
+                the same shape expected by
+                ``CompatRegistry.register_many``.
+        """
+        return {target: self.ranges(target, latest) for target in self._rows}
+
+    def select(self, mask: int, other: CompatBitMatrix) -> CompatBitMatrix:
+        r"""Combine two matrices over the same versions, using the
+        rows of this matrix for the versions in ``mask`` and the rows
+        of ``other`` for the other versions.
+
+        Args:
+            mask: The bitset of the versions read from this matrix.
+            other: The matrix the other versions are read from. It
+                must have the same versions and targets.
+
+        Returns:
+            The combined matrix.
+
+        Raises:
+            ValueError: if the matrices have different versions or
+                targets.
+        """
+        return self._combine(other, lambda left, right: (left & mask) | (right & ~mask))
+
+    def version_mask(self, versions: Iterable[str]) -> int:
+        r"""Get the bitset of some versions of the matrix.
+
+        Args:
+            versions: The versions. The versions that are not in the
+                matrix are ignored.
+
+        Returns:
+            The bitset where the bits of the given versions are set.
+        """
+        return _pack(self._versions, versions)
+
+    def _combine(
+        self, other: CompatBitMatrix, operation: Callable[[int, int], int]
+    ) -> CompatBitMatrix:
+        r"""Combine the rows of two matrices over the same versions and
+        targets with a bitwise operation."""
+        if self._versions != other._versions:
+            msg = "The matrices must have the same versions"
+            raise ValueError(msg)
+        if self._rows.keys() != other._rows.keys():
+            msg = "The matrices must have the same targets"
+            raise ValueError(msg)
+        return CompatBitMatrix(
+            self._versions,
+            {target: operation(bits, other._rows[target]) for target, bits in self._rows.items()},
+        )
+
+    def _iter_runs(self, bits: int) -> Iterator[tuple[int, int]]:
+        r"""Iterate over the first and last positions of the runs of
+        set bits of a row, in ascending order."""
+        # The binary representation is reversed so the i-th character is the bit i
+        digits = format(bits, f"0{len(self._versions)}b")[::-1]
+        for match in _RUN_PATTERN.finditer(digits):
+            yield match.start(), match.end() - 1
+
+
+def _pack(versions: Sequence[str], compatible: Iterable[str]) -> int:
+    r"""Pack a subset of the sorted ``versions`` into a bitset."""
+    if not isinstance(compatible, (set, frozenset)):
+        compatible = set(compatible)
+    # The binary representation starts with the most significant bit (the last version)
+    flags = bytes(map(compatible.__contains__, reversed(versions)))
+    return int(flags.translate(_BINARY_DIGITS), 2) if flags else 0
@@ -0,0 +1,180 @@
+r"""Define a compatibility discoverer that caches the discovered ranges
+on disk."""
+
+from __future__ import annotations
+
+__all__ = ["CachedCompatDiscoverer"]
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import feu
+from feu.compat.discoverers.base import BaseCompatDiscoverer
+from feu.compat.registry import VersionRange
+from feu.compat.target import Target
+from feu.utils.io import load_json, save_json
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from feu.compat.discoverers.incremental import CompatBaseline
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 1
+
+
+class CachedCompatDiscoverer(BaseCompatDiscoverer):
+    r"""Implement a compatibility discoverer that caches the ranges
+    discovered by another discoverer in JSON files.
+
+    The cache key is a hash of the ``feu`` version, the discoverer
+    class, the package name, the targets, and the ``fingerprint`` of
+    the metadata read by the discoverer (e.g. the wheel filenames of
+    the package), so a cached discovery is reused until the package
+    metadata changes on PyPI or ``feu`` is upgraded, which may change
+    the discovery logic.
+    The discoveries of a discoverer without fingerprint are not
+    cached.
+
+    Args:
+        discoverer: The discoverer whose discoveries are cached.
+        cache_dir: The directory of the cache files. It is created
+            on the first write.
+
+    Example:
+        ```pycon
+        >>> from feu.compat.discoverers import CachedCompatDiscoverer, CompatDiscoverer
+        >>> from feu.compat.target import Target
+        >>> discoverer = CachedCompatDiscoverer(CompatDiscoverer(), cache_dir="/tmp/feu")
+        >>> discoverer
+        CachedCompatDiscoverer(discoverer=CompatDiscoverer(), cache_dir=/tmp/feu)
+        >>> compat = discoverer.discover(
+        ...     "numpy", targets=(Target(python_version="3.11", os="linux", arch="x86_64"),)
+        ... )  # doctest: +SKIP
+
+        ```
+    """
+
+    def __init__(self, discoverer: BaseCompatDiscoverer, cache_dir: str | Path) -> None:
+        self._discoverer = discoverer
+        self._cache_dir = Path(cache_dir)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(discoverer={self._discoverer!r}, "
+            f"cache_dir={self._cache_dir})"
+        )
+
+    @property
+    def discoverer(self) -> BaseCompatDiscoverer:
+        r"""The discoverer whose discoveries are cached."""
+        return self._discoverer
+
+    def discover(
+        self, pkg_name: str, targets: Sequence[Target]
+    ) -> dict[Target, list[VersionRange]]:
+        return self._discover_cached(
+            pkg_name, targets, lambda: self._discoverer.discover(pkg_name, targets)
+        )
+
+    def discover_incremental(
+        self, pkg_name: str, targets: Sequence[Target], baseline: CompatBaseline | None
+    ) -> dict[Target, list[VersionRange]]:
+        return self._discover_cached(
+            pkg_name,
+            targets,
+            lambda: self._discoverer.discover_incremental(pkg_name, targets, baseline),
+        )
+
+    def dependencies(self, pkg_name: str) -> tuple[str, ...]:
+        return self._discoverer.dependencies(pkg_name)
+
+    def fingerprint(self, pkg_name: str) -> str | None:
+        return self._discoverer.fingerprint(pkg_name)
+
+    def cache_path(self, pkg_name: str, targets: Sequence[Target]) -> Path | None:
+        r"""Get the path of the cache file of a discovery.
+
+        Args:
+            pkg_name: The package name to inspect (e.g., ``"numpy"``).
+            targets: The compatibility targets.
+
+        Returns:
+            The path of the cache file, or ``None`` if the discovery
+                cannot be cached because the discoverer has no
+                fingerprint.
+        """
+        fingerprint = self._discoverer.fingerprint(pkg_name)
+        if fingerprint is None:
+            return None
+        discoverer_cls = type(self._discoverer)
+        key = [
+            CACHE_FORMAT_VERSION,
+            feu.__version__,
+            f"{discoverer_cls.__module__}.{discoverer_cls.__qualname__}",
+            pkg_name,
+            [_encode_target(target) for target in targets],
+            fingerprint,
+        ]
+        digest = hashlib.sha256(json.dumps(key, separators=(",", ":")).encode()).hexdigest()
+        return self._cache_dir.joinpath(f"{digest}.json")
+
+    def _discover_cached(
+        self,
+        pkg_name: str,
+        targets: Sequence[Target],
+        discover: Callable[[], dict[Target, list[VersionRange]]],
+    ) -> dict[Target, list[VersionRange]]:
+        r"""Load a discovery from the cache, or run and cache it."""
+        path = self.cache_path(pkg_name, targets)
+        if path is None:
+            return discover()
+        if path.is_file():
+            try:
+                compat = _decode_compat(load_json(path))
+            except (ValueError, KeyError, TypeError) as exc:
+                logger.warning(f"Ignoring the invalid discovery cache file {path}: {exc}")
+            else:
+                logger.debug(f"{pkg_name}: loaded the discovered ranges from {path}")
+                return compat
+        compat = discover()
+        save_json(_encode_compat(compat), path, exist_ok=True)
+        logger.debug(f"{pkg_name}: saved the discovered ranges to {path}")
+        return compat
+
+
+def _encode_target(target: Target) -> list[Any]:
+    r"""Encode a target in a JSON-serializable format."""
+    return [target.python_version, target.free_threaded, target.os, target.arch]
+
+
+def _encode_compat(compat: dict[Target, list[VersionRange]]) -> dict[str, Any]:
+    r"""Encode the discovered ranges in a JSON-serializable format."""
+    return {
+        "format_version": CACHE_FORMAT_VERSION,
+        "compat": [
+            [*_encode_target(target), [list(version_range) for version_range in ranges]]
+            for target, ranges in compat.items()
+        ],
+    }
+
+
+def _decode_compat(data: dict[str, Any]) -> dict[Target, list[VersionRange]]:
+    r"""Decode the discovered ranges from their JSON-serializable format.
+
+    Raises:
+        ValueError: if the format version of ``data`` is not supported.
+    """
+    if data["format_version"] != CACHE_FORMAT_VERSION:
+        msg = f"Unsupported cache format: {data['format_version']}"
+        raise ValueError(msg)
+    return {
+        Target.of(python_version=python_version, free_threaded=free_threaded, os=os, arch=arch): [
+            VersionRange(min_version, max_version) for min_version, max_version in ranges
+        ]
+        for python_version, free_threaded, os, arch, ranges in data["compat"]
+    }
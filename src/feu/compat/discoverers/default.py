@@ -9,18 +9,24 @@ from typing import TYPE_CHECKING
 from packaging.version import Version
 
 from feu.compat.discoverers.base import BaseCompatDiscoverer
-from feu.compat.discoverers.utils import build_compat_ranges, build_tags_by_version
-from feu.compat.matrix import is_compatible
+from feu.compat.discoverers.utils import (
+    WheelTagIndex,
+    build_compat_ranges_from_sets,
+    build_tags_by_version,
+    fingerprint_metadata,
+)
+from feu.compat.matrix import build_requires_python_table
 from feu.version import (
     fetch_pypi_requires_python,
     fetch_pypi_wheel_filenames,
-    filter_stable_versions,
-    filter_valid_versions,
+    iter_stable_versions,
+    iter_valid_versions,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from feu.compat.discoverers.incremental import CompatBaseline
     from feu.compat.registry import VersionRange
     from feu.compat.target import Target
     from feu.compat.wheel_tags import WheelTags
@@ -55,9 +61,19 @@ class CompatDiscoverer(BaseCompatDiscoverer):
 
     def discover(
         self, pkg_name: str, targets: Sequence[Target]
+    ) -> dict[Target, list[VersionRange]]:
+        return self.discover_incremental(pkg_name, targets, baseline=None)
+
+    def discover_incremental(
+        self, pkg_name: str, targets: Sequence[Target], baseline: CompatBaseline | None
     ) -> dict[Target, list[VersionRange]]:
         return discover_from_wheel_filenames(
-            pkg_name, targets, fetch_pypi_wheel_filenames(pkg_name)
+            pkg_name, targets, fetch_pypi_wheel_filenames(pkg_name), baseline=baseline
+        )
+
+    def fingerprint(self, pkg_name: str) -> str | None:
+        return fingerprint_metadata(
+            fetch_pypi_wheel_filenames(pkg_name), fetch_pypi_requires_python(pkg_name)
         )
 
 
@@ -65,6 +81,7 @@ def discover_from_wheel_filenames(
     pkg_name: str,
     targets: Sequence[Target],
     wheel_filenames: dict[str, tuple[str, ...]],
+    baseline: CompatBaseline | None = None,
 ) -> dict[Target, list[VersionRange]]:
     r"""Compute the compatibility target ranges from a pre-fetched
     mapping of version to wheel filenames.
@@ -79,43 +96,58 @@ def discover_from_wheel_filenames(
         targets: The compatibility targets to compute constraints for.
         wheel_filenames: Mapping of version to published wheel
             filenames for that version.
+        baseline: If specified, the previously discovered ranges,
+            used to only evaluate the versions that were not already
+            processed.
 
     Returns:
         A mapping of ``Target`` to a list of ``VersionRange``, in the
             same shape expected by ``CompatRegistry.register_many``.
     """
-    versions = filter_stable_versions(filter_valid_versions(wheel_filenames.keys()))
+    versions = iter_stable_versions(iter_valid_versions(wheel_filenames.keys()))
     versions = sorted(versions, key=Version)
     latest = versions[-1] if versions else None
 
     tags_by_version = build_tags_by_version(
         {version: wheel_filenames[version] for version in versions}
     )
-    has_pure_python_wheel = any(
-        tag.python_version is None for tags in tags_by_version.values() for tag in tags
-    )
+    index = WheelTagIndex(tags_by_version)
+    has_pure_python_wheel = index.has_pure_python_wheels
     requires_python = fetch_pypi_requires_python(pkg_name) if has_pure_python_wheel else {}
-
-    def _is_version_compatible(version: str, target: Target, wanted: WheelTags) -> bool:
-        return _is_target_compatible(
+    python_compatible = build_requires_python_table(
+        [requires_python.get(version) for version in versions],
+        [target.python_version for target in targets],
+    )
+    versions_by_requires_python: dict[str | None, list[str]] = {}
+    for version in versions:
+        versions_by_requires_python.setdefault(requires_python.get(version), []).append(version)
+
+    def _compatible_versions(target: Target, wanted: WheelTags) -> set[str]:
+        python_compatible_versions = set()
+        if has_pure_python_wheel:
+            python_compatible_versions = {
+                version
+                for specifier, group in versions_by_requires_python.items()
+                if python_compatible[specifier, target.python_version]
+                for version in group
+            }
+        return _find_compatible_versions(
+            index,
             wanted,
-            target.python_version,
-            tags_by_version[version],
-            requires_python.get(version),
+            python_compatible_versions,
             treat_sdist_as_pure_python=has_pure_python_wheel,
         )
 
-    return build_compat_ranges(versions, latest, targets, _is_version_compatible)
+    return build_compat_ranges_from_sets(versions, latest, targets, _compatible_versions, baseline)
 
 
-def _is_target_compatible(
+def _find_compatible_versions(
+    index: WheelTagIndex,
     wanted: WheelTags,
-    wanted_python_version: str,
-    tags: set[WheelTags],
-    requires_python: str | None,
+    python_compatible_versions: set[str],
     treat_sdist_as_pure_python: bool = False,
-) -> bool:
-    r"""Indicate if a release's wheels satisfy a wanted target.
+) -> set[str]:
+    r"""Find the releases whose wheels satisfy a wanted target.
 
     A release is compatible if it shipped a wheel matching the
     target's Python version, OS, arch, and free-threaded axes
@@ -142,37 +174,20 @@ def _is_target_compatible(
     supports the target's OS/arch/free-threading.
 
     Args:
+        index: The wheel tag index of the releases.
         wanted: The tags describing the wanted target.
-        wanted_python_version: The wanted target's Python version.
-        tags: The wheel tags parsed from the release's wheel
-            filenames.
-        requires_python: The release's ``requires_python`` specifier,
-            used only to validate pure-Python and sdist-only releases.
+        python_compatible_versions: The releases whose
+            ``requires_python`` specifier allows the wanted Python
+            version, used only to validate pure-Python and sdist-only
+            releases.
         treat_sdist_as_pure_python: If ``True``, a release with no
             wheel files falls back to ``requires_python`` instead of
             being treated as incompatible.
 
     Returns:
-        ``True`` if the release satisfies the wanted target.
+        The releases that satisfy the wanted target.
     """
-    if not tags:
-        return treat_sdist_as_pure_python and is_compatible(requires_python, wanted_python_version)
-    for tag in tags:
-        if tag.os is not None and tag.os != wanted.os:
-            continue
-        if tag.arch is not None and tag.arch != wanted.arch:
-            continue
-        if tag.python_version is None:
-            if is_compatible(requires_python, wanted_python_version):
-                return True
-            continue
-        if tag.free_threaded != wanted.free_threaded:
-            continue
-        if tag.abi3:
-            if Version(wanted_python_version) < Version(tag.python_version):
-                continue
-            return True
-        if tag.python_version != wanted.python_version:
-            continue
-        return True
-    return False
+    fallback = index.pure_python_versions(wanted)
+    if treat_sdist_as_pure_python:
+        fallback |= index.untagged_versions
+    return index.matches(wanted) | (fallback & python_compatible_versions)
@@ -8,11 +8,13 @@ from typing import TYPE_CHECKING
 
 from feu.compat.discoverers.base import BaseCompatDiscoverer
 from feu.compat.discoverers.default import discover_from_wheel_filenames
-from feu.version import fetch_pypi_wheel_filenames
+from feu.compat.discoverers.utils import fingerprint_metadata
+from feu.version import fetch_pypi_requires_python, fetch_pypi_wheel_filenames
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from feu.compat.discoverers.incremental import CompatBaseline
     from feu.compat.registry import VersionRange
     from feu.compat.target import Target
 
@@ -45,6 +47,11 @@ class DuckdbCompatDiscoverer(BaseCompatDiscoverer):
 
     def discover(
         self, pkg_name: str, targets: Sequence[Target]
+    ) -> dict[Target, list[VersionRange]]:
+        return self.discover_incremental(pkg_name, targets, baseline=None)
+
+    def discover_incremental(
+        self, pkg_name: str, targets: Sequence[Target], baseline: CompatBaseline | None
     ) -> dict[Target, list[VersionRange]]:
         wheel_filenames = fetch_pypi_wheel_filenames(pkg_name)
         wheel_filenames = {
@@ -52,4 +59,9 @@ class DuckdbCompatDiscoverer(BaseCompatDiscoverer):
             for version, filenames in wheel_filenames.items()
             if version not in IGNORED_VERSIONS
         }
-        return discover_from_wheel_filenames(pkg_name, targets, wheel_filenames)
+        return discover_from_wheel_filenames(pkg_name, targets, wheel_filenames, baseline)
+
+    def fingerprint(self, pkg_name: str) -> str | None:
+        return fingerprint_metadata(
+            fetch_pypi_wheel_filenames(pkg_name), fetch_pypi_requires_python(pkg_name)
+        )
@@ -0,0 +1,233 @@
+r"""Define the objects used to incrementally refresh previously
+discovered compatibility targets."""
+
+from __future__ import annotations
+
+__all__ = ["CompatBaseline", "DiscoveryWatermark"]
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from packaging.version import Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from feu.compat.registry import VersionRange
+    from feu.compat.target import Target
+
+
+@dataclass(frozen=True)
+class DiscoveryWatermark:
+    r"""Summarize the PyPI state of a package when its compatibility
+    targets were discovered.
+
+    Args:
+        serial: The PyPI last serial of the package. An unchanged
+            serial means that the package did not change since the
+            discovery.
+        last_version: The latest stable version of the package.
+        last_upload: The UTC ISO 8601 upload time of the most recently
+            uploaded file of the package, as returned by
+            ``fetch_pypi_upload_times``. A release whose files were all
+            uploaded at or before this time was already processed.
+        dependency_serials: The PyPI last serial of each package the
+            discoverer depends on (e.g. ``jaxlib`` for ``jax``), as
+            ``(package, serial)`` pairs. A change of these packages
+            can change the compatibility of the releases that were
+            already processed.
+
+    Example:
+        ```pycon
+        >>> from feu.compat.discoverers import DiscoveryWatermark
+        >>> watermark = DiscoveryWatermark(
+        ...     serial=123, last_version="2.0.0", last_upload="2024-06-01T00:00:00.000000+00:00"
+        ... )
+        >>> watermark.is_processed("2024-01-10T00:00:00.000000+00:00")
+        True
+        >>> watermark.is_processed("2024-07-01T00:00:00.000000+00:00")
+        False
+
+        ```
+    """
+
+    serial: int
+    last_version: str | None
+    last_upload: str | None
+    dependency_serials: tuple[tuple[str, int], ...] = ()
+
+    @classmethod
+    def from_upload_times(
+        cls,
+        serial: int,
+        upload_times: Mapping[str, str | None],
+        versions: Sequence[str],
+        dependency_serials: Sequence[tuple[str, int]] = (),
+    ) -> DiscoveryWatermark:
+        r"""Create the watermark of a package.
+
+        Args:
+            serial: The PyPI last serial of the package.
+            upload_times: Mapping of release version to the upload time
+                of its most recent file, as returned by
+                ``fetch_pypi_upload_times``.
+            versions: The stable versions of the package, sorted in
+                ascending order.
+            dependency_serials: The PyPI last serial of each package
+                the discoverer depends on, as ``(package, serial)``
+                pairs.
+
+        Returns:
+            The watermark.
+
+        Example:
+            ```pycon
+            >>> from feu.compat.discoverers import DiscoveryWatermark
+            >>> DiscoveryWatermark.from_upload_times(
+            ...     serial=123,
+            ...     upload_times={
+            ...         "1.0.0": "2023-06-15T00:00:00.000000+00:00",
+            ...         "2.0.0": "2024-06-01T00:00:00.000000+00:00",
+            ...     },
+            ...     versions=["1.0.0", "2.0.0"],
+            ... )
+            DiscoveryWatermark(serial=123, last_version='2.0.0', last_upload='2024-06-01T00:00:00.000000+00:00', dependency_serials=())
+
+            ```
+        """
+        return cls(
+            serial=serial,
+            last_version=versions[-1] if versions else None,
+            last_upload=max((t for t in upload_times.values() if t is not None), default=None),
+            dependency_serials=tuple(dependency_serials),
+        )
+
+    def is_processed(self, upload_time: str | None) -> bool:
+        r"""Indicate if a release was already processed when the
+        watermark was created.
+
+        Args:
+            upload_time: The upload time of the most recent file of the
+                release, or ``None`` if the release has no files.
+
+        Returns:
+            ``True`` if the release was already processed, otherwise
+                ``False``. A release without files is never considered
+                processed.
+        """
+        return (
+            upload_time is not None
+            and self.last_upload is not None
+            and upload_time <= self.last_upload
+        )
+
+
+class CompatBaseline:
+    r"""Previously discovered compatibility targets, reused to only
+    evaluate the releases that changed since the discovery.
+
+    The compatibility of a release in ``processed_versions`` is read
+    from the previous ranges instead of being recomputed from its
+    wheel files, so a refresh only evaluates the new or updated
+    releases. The ranges are then regrouped over the current versions,
+    which extends or splits the previous ranges.
+
+    Args:
+        compat: The previously discovered mapping of ``Target`` to list
+            of ``VersionRange``. It must contain every target to
+            discover.
+        processed_versions: The current versions that were already
+            processed when ``compat`` was discovered.
+
+    Example:
+        ```pycon
+        >>> from feu.compat import Target, VersionRange
+        >>> from feu.compat.discoverers import CompatBaseline
+        >>> target = Target(python_version="3.11", os="linux", arch="x86_64")
+        >>> baseline = CompatBaseline(
+        ...     {target: [VersionRange("1.0.0", "1.2.0")]}, processed_versions=["1.1.0", "1.3.0"]
+        ... )
+        >>> baseline.is_compatible("1.1.0", target)
+        True
+        >>> baseline.is_compatible("1.3.0", target)
+        False
+
+        ```
+    """
+
+    def __init__(
+        self,
+        compat: Mapping[Target, Sequence[VersionRange]],
+        processed_versions: Iterable[str],
+    ) -> None:
+        self._compat = compat
+        self._processed_versions = frozenset(processed_versions)
+        self._parsed: dict[Target, list[tuple[Version | None, Version | None]]] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(targets={len(self._compat)}, "
+            f"processed_versions={len(self._processed_versions)})"
+        )
+
+    @property
+    def processed_versions(self) -> frozenset[str]:
+        r"""The current versions that were already processed."""
+        return self._processed_versions
+
+    def is_processed(self, version: str) -> bool:
+        r"""Indicate if a version was already processed.
+
+        Args:
+            version: The version to check.
+
+        Returns:
+            ``True`` if the compatibility of the version can be read
+                from the previous ranges, otherwise ``False``.
+        """
+        return version in self._processed_versions
+
+    def ranges(self, target: Target) -> Sequence[VersionRange]:
+        r"""Get the previous ranges of a target.
+
+        Args:
+            target: The compatibility target.
+
+        Returns:
+            The previously discovered ranges of the target.
+
+        Raises:
+            KeyError: if the target is not in the previous ranges.
+        """
+        return self._compat[target]
+
+    def is_compatible(self, version: str, target: Target) -> bool:
+        r"""Indicate if a version is compatible with a target according
+        to the previous ranges.
+
+        Args:
+            version: The version to check.
+            target: The compatibility target.
+
+        Returns:
+            ``True`` if one of the previous ranges of the target
+                contains the version, otherwise ``False``.
+
+        Raises:
+            KeyError: if the target is not in the previous ranges.
+        """
+        ranges = self._parsed.get(target)
+        if ranges is None:
+            ranges = [
+                (
+                    None if version_range.min is None else Version(version_range.min),
+                    None if version_range.max is None else Version(version_range.max),
+                )
+                for version_range in self._compat[target]
+            ]
+            self._parsed[target] = ranges
+        parsed = Version(version)
+        return any(
+            (low is None or low <= parsed) and (high is None or parsed <= high)
+            for low, high in ranges
+        )
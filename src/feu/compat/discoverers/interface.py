@@ -3,30 +3,48 @@ discovery."""
 
 from __future__ import annotations
 
-__all__ = ["discover_compat_targets", "get_default_registry", "register_discoverers"]
+__all__ = [
+    "discover_compat_targets",
+    "discover_compat_targets_incremental",
+    "get_default_registry",
+    "register_discoverers",
+]
 
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING
 
 from feu.compat.discoverers.duckdb import DuckdbCompatDiscoverer
+from feu.compat.discoverers.incremental import CompatBaseline, DiscoveryWatermark
 from feu.compat.discoverers.jax import JaxCompatDiscoverer
 from feu.compat.discoverers.polars import PolarsCompatDiscoverer
 from feu.compat.discoverers.pydantic import PydanticCompatDiscoverer
 from feu.compat.discoverers.registry import CompatDiscovererRegistry
+from feu.compat.discoverers.utils import sort_stable_versions
 from feu.compat.matrix import DEFAULT_TARGETS
+from feu.version import fetch_pypi_last_serial, fetch_pypi_upload_times
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
+    from concurrent.futures import Executor
 
     from feu.compat.discoverers.base import BaseCompatDiscoverer
     from feu.compat.registry import VersionRange
     from feu.compat.target import Target
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+_DEFAULT_REGISTRY_LOCK = threading.Lock()
+
 
 def get_default_registry() -> CompatDiscovererRegistry:
     r"""Return the default global compatibility discoverer registry.
 
     The registry is created on the first call and reused on all
-    subsequent calls (singleton pattern).
+    subsequent calls (singleton pattern). It is created once even if
+    several threads call this function concurrently.
 
     Returns:
         A singleton ``CompatDiscovererRegistry``.
@@ -39,14 +57,17 @@ def get_default_registry() -> CompatDiscovererRegistry:
         ```
     """
     if not hasattr(get_default_registry, "_registry"):
-        get_default_registry._registry = CompatDiscovererRegistry(
-            {
-                "duckdb": DuckdbCompatDiscoverer(),
-                "jax": JaxCompatDiscoverer(),
-                "polars": PolarsCompatDiscoverer(),
-                "pydantic": PydanticCompatDiscoverer(),
-            }
-        )
+        with _DEFAULT_REGISTRY_LOCK:
+            # Another thread may have created the registry while waiting for the lock
+            if not hasattr(get_default_registry, "_registry"):
+                get_default_registry._registry = CompatDiscovererRegistry(
+                    {
+                        "duckdb": DuckdbCompatDiscoverer(),
+                        "jax": JaxCompatDiscoverer(),
+                        "polars": PolarsCompatDiscoverer(),
+                        "pydantic": PydanticCompatDiscoverer(),
+                    }
+                )
     return get_default_registry._registry
 
 
@@ -73,7 +94,11 @@ def register_discoverers(
 
 
 def discover_compat_targets(
-    pkg_name: str, targets: Sequence[Target] = DEFAULT_TARGETS
+    pkg_name: str,
+    targets: Sequence[Target] = DEFAULT_TARGETS,
+    *,
+    max_workers: int = 1,
+    executor: Executor | None = None,
 ) -> dict[Target, list[VersionRange]]:
     r"""Discover the version range compatible with each target.
 
@@ -81,21 +106,151 @@ def discover_compat_targets(
     the default global registry if one exists, otherwise falls back to
     the default ``CompatDiscoverer``.
 
+    The targets can be evaluated concurrently: they are split into
+    ``max_workers`` groups, each discovered by a separate call of the
+    discoverer, in ``executor`` if specified or else in a pool of
+    ``max_workers`` threads. A ``ProcessPoolExecutor`` runs the
+    per-target evaluation in parallel, in which case the discoverer
+    must be picklable and each worker process fetches the package
+    metadata once. The output is the same as a sequential discovery:
+    the targets follow the order of ``targets``. To discover several
+    packages concurrently, use ``CompatDatabase.discover``.
+
     Args:
         pkg_name: The package name to inspect (e.g., ``"numpy"``).
         targets: The compatibility targets to compute constraints for.
             Each target must have concrete (non-``None``) ``os`` and
             ``arch``. Defaults to ``DEFAULT_TARGETS``.
+        max_workers: The number of groups the targets are split into.
+            ``1`` (default) discovers all the targets in a single call
+            in the calling thread.
+        executor: An optional executor used to discover the groups of
+            targets concurrently. The executor is not shut down by
+            this function.
 
     Returns:
         A mapping of ``Target`` to a list of ``VersionRange``, in the
             same shape expected by ``CompatRegistry.register_many``.
 
+    Raises:
+        ValueError: If ``max_workers`` is lower than 1.
+
     Example:
         ```pycon
+        >>> from concurrent.futures import ProcessPoolExecutor
         >>> from feu.compat import discover_compat_targets
         >>> compat = discover_compat_targets("numpy")  # doctest: +SKIP
+        >>> with ProcessPoolExecutor(max_workers=4) as executor:  # doctest: +SKIP
+        ...     compat = discover_compat_targets("numpy", max_workers=4, executor=executor)
+        ...
+
+        ```
+    """
+    if max_workers < 1:
+        msg = f"max_workers must be at least 1, but received {max_workers}"
+        raise ValueError(msg)
+    discoverer = get_default_registry().find_discoverer(pkg_name)
+    groups = [tuple(targets[i::max_workers]) for i in range(max_workers) if targets[i::max_workers]]
+    if executor is None and len(groups) <= 1:
+        return discoverer.discover(pkg_name, targets)
+    discover = partial(_discover_targets, discoverer, pkg_name)
+    if executor is not None:
+        results = list(executor.map(discover, groups))
+    else:
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            results = list(pool.map(discover, groups))
+    compat = {target: ranges for result in results for target, ranges in result.items()}
+    return {target: compat[target] for target in targets}
+
+
+def discover_compat_targets_incremental(
+    pkg_name: str,
+    previous: Mapping[Target, Sequence[VersionRange]] | None = None,
+    watermark: DiscoveryWatermark | None = None,
+    targets: Sequence[Target] = DEFAULT_TARGETS,
+) -> tuple[dict[Target, list[VersionRange]], DiscoveryWatermark]:
+    r"""Refresh the version range compatible with each target, only
+    processing the releases that changed since a previous discovery.
+
+    If the PyPI serial of the package, and of the packages its
+    discoverer depends on (e.g. ``jaxlib`` for ``jax``), did not change
+    since ``watermark``, the previous ranges are returned without any
+    other request. Otherwise, only the releases with a file uploaded
+    after the watermark are evaluated, and the previous ranges are
+    extended or split to cover them. The ranges are discovered from
+    scratch if there is no previous discovery, if it does not cover
+    every target, or if one of the dependency packages changed, because
+    such a change can affect the releases that were already
+    processed.
+
+    Args:
+        pkg_name: The package name to inspect (e.g., ``"numpy"``).
+        previous: The previously discovered mapping of ``Target`` to
+            list of ``VersionRange``, or ``None`` if the package was
+            never discovered.
+        watermark: The watermark returned with ``previous``, or
+            ``None`` if the package was never discovered.
+        targets: The compatibility targets to compute constraints for.
+            Each target must have concrete (non-``None``) ``os`` and
+            ``arch``. Defaults to ``DEFAULT_TARGETS``.
+
+    Returns:
+        A tuple with the mapping of ``Target`` to a list of
+            ``VersionRange``, and the watermark to store with it for
+            the next refresh.
+
+    Example:
+        ```pycon
+        >>> from feu.compat.discoverers import discover_compat_targets_incremental
+        >>> compat, watermark = discover_compat_targets_incremental("numpy")  # doctest: +SKIP
+        >>> compat, watermark = discover_compat_targets_incremental(
+        ...     "numpy", previous=compat, watermark=watermark
+        ... )  # doctest: +SKIP
 
         ```
     """
-    return get_default_registry().find_discoverer(pkg_name).discover(pkg_name, targets)
+    discoverer = get_default_registry().find_discoverer(pkg_name)
+    serial = fetch_pypi_last_serial(pkg_name)
+    dependency_serials = tuple(
+        (dependency, fetch_pypi_last_serial(dependency))
+        for dependency in discoverer.dependencies(pkg_name)
+    )
+    reusable = previous is not None and watermark is not None and set(targets).issubset(previous)
+    if reusable and watermark.dependency_serials != dependency_serials:
+        logger.debug(f"{pkg_name}: the dependencies changed, discovering every release")
+        reusable = False
+    if reusable and watermark.serial == serial:
+        logger.debug(f"{pkg_name} did not change since serial {serial}")
+        return {target: list(previous[target]) for target in targets}, watermark
+
+    upload_times = fetch_pypi_upload_times(pkg_name)
+    baseline = None
+    if reusable:
+        baseline = CompatBaseline(
+            previous,
+            processed_versions=[
+                version
+                for version, upload_time in upload_times.items()
+                if watermark.is_processed(upload_time)
+            ],
+        )
+        logger.debug(
+            f"{pkg_name}: {len(upload_times) - len(baseline.processed_versions)} "
+            f"release(s) to evaluate since serial {watermark.serial}"
+        )
+    compat = discoverer.discover_incremental(pkg_name, targets, baseline)
+    new_watermark = DiscoveryWatermark.from_upload_times(
+        serial, upload_times, sort_stable_versions(upload_times.keys()), dependency_serials
+    )
+    return compat, new_watermark
+
+
+def _discover_targets(
+    discoverer: BaseCompatDiscoverer, pkg_name: str, targets: Sequence[Target]
+) -> dict[Target, list[VersionRange]]:
+    r"""Discover the ranges of a group of targets.
+
+    It is a module-level function, so it can be sent to a process
+    pool.
+    """
+    return discoverer.discover(pkg_name, targets)
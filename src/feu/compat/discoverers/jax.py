@@ -8,10 +8,11 @@ from typing import TYPE_CHECKING
 
 from feu.compat.discoverers.base import BaseCompatDiscoverer
 from feu.compat.discoverers.utils import (
-    build_compat_ranges,
+    WheelTagIndex,
+    build_compat_ranges_from_sets,
     build_tags_by_version,
+    fingerprint_metadata,
     sort_stable_versions,
-    tags_match_exactly,
 )
 from feu.version import fetch_pypi_wheel_filenames
 
@@ -60,20 +61,22 @@ class JaxCompatDiscoverer(BaseCompatDiscoverer):
         jax_versions = sort_stable_versions(fetch_pypi_wheel_filenames(pkg_name).keys())
         latest = jax_versions[-1] if jax_versions else None
 
-        jaxlib_tags_by_version = build_tags_by_version(fetch_pypi_wheel_filenames(JAXLIB_PKG_NAME))
+        jaxlib_index = WheelTagIndex(
+            build_tags_by_version(fetch_pypi_wheel_filenames(JAXLIB_PKG_NAME))
+        )
 
-        def _is_version_compatible(version: str, _target: Target, wanted: WheelTags) -> bool:
-            return _is_target_compatible(wanted, jaxlib_tags_by_version.get(version, set()))
+        # Unlike pure-Python packages, ``jaxlib`` always ships platform-specific
+        # wheels, so a match requires the Python version, free-threaded, OS, and
+        # arch axes to all agree exactly.
+        def _compatible_versions(_target: Target, wanted: WheelTags) -> set[str]:
+            return jaxlib_index.exact_matches(wanted)
 
-        return build_compat_ranges(jax_versions, latest, targets, _is_version_compatible)
+        return build_compat_ranges_from_sets(jax_versions, latest, targets, _compatible_versions)
 
+    def dependencies(self, pkg_name: str) -> tuple[str, ...]:  # noqa: ARG002
+        return (JAXLIB_PKG_NAME,)
 
-def _is_target_compatible(wanted: WheelTags, tags: set[WheelTags]) -> bool:
-    r"""Indicate if a ``jaxlib`` release's wheels satisfy a wanted
-    target.
-
-    Unlike pure-Python packages, ``jaxlib`` always ships platform-
-    specific wheels, so a match requires the Python version, free-
-    threaded, OS, and arch axes to all agree exactly.
-    """
-    return any(tags_match_exactly(tag, wanted) for tag in tags)
+    def fingerprint(self, pkg_name: str) -> str | None:
+        return fingerprint_metadata(
+            fetch_pypi_wheel_filenames(pkg_name), fetch_pypi_wheel_filenames(JAXLIB_PKG_NAME)
+        )
@@ -8,16 +8,18 @@ from typing import TYPE_CHECKING
 
 from feu.compat.discoverers.base import BaseCompatDiscoverer
 from feu.compat.discoverers.utils import (
-    build_compat_ranges,
+    WheelTagIndex,
+    build_compat_ranges_from_sets,
     build_tags_by_version,
+    fingerprint_metadata,
     sort_stable_versions,
-    tags_match_exactly,
 )
 from feu.version import fetch_pypi_pinned_dependency_version, fetch_pypi_wheel_filenames
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from feu.compat.discoverers.incremental import CompatBaseline
     from feu.compat.registry import VersionRange
     from feu.compat.target import Target
     from feu.compat.wheel_tags import WheelTags
@@ -61,6 +63,11 @@ class PolarsCompatDiscoverer(BaseCompatDiscoverer):
 
     def discover(
         self, pkg_name: str, targets: Sequence[Target]
+    ) -> dict[Target, list[VersionRange]]:
+        return self.discover_incremental(pkg_name, targets, baseline=None)
+
+    def discover_incremental(
+        self, pkg_name: str, targets: Sequence[Target], baseline: CompatBaseline | None
     ) -> dict[Target, list[VersionRange]]:
         wheel_filenames = fetch_pypi_wheel_filenames(pkg_name)
         versions = sort_stable_versions(wheel_filenames.keys())
@@ -73,7 +80,11 @@ class PolarsCompatDiscoverer(BaseCompatDiscoverer):
 
         runtime_tags: dict[str, set[WheelTags]] = {}
         for version, tags in tags_by_version.items():
-            if any(tag.python_version is not None for tag in tags):
+            # A release without wheels is compatible with no target, and
+            # its metadata may be missing from PyPI (e.g. a deleted release).
+            if not tags or any(tag.python_version is not None for tag in tags):
+                continue
+            if baseline is not None and baseline.is_processed(version):
                 continue
             runtime_version = fetch_pypi_pinned_dependency_version(
                 pkg_name, version, POLARS_RUNTIME_PKG_NAME
@@ -86,32 +97,48 @@ class PolarsCompatDiscoverer(BaseCompatDiscoverer):
                 )
             runtime_tags[version] = runtime_tags_by_version.get(runtime_version, set())
 
-        def _is_version_compatible(version: str, _target: Target, wanted: WheelTags) -> bool:
-            return _is_target_compatible(
-                wanted, tags_by_version[version], runtime_tags.get(version)
-            )
+        index = WheelTagIndex(tags_by_version)
+        runtime_index = WheelTagIndex(runtime_tags)
+
+        def _compatible_versions(_target: Target, wanted: WheelTags) -> set[str]:
+            return _find_compatible_versions(index, runtime_index, wanted)
+
+        return build_compat_ranges_from_sets(
+            versions, latest, targets, _compatible_versions, baseline
+        )
+
+    def dependencies(self, pkg_name: str) -> tuple[str, ...]:  # noqa: ARG002
+        return (POLARS_RUNTIME_PKG_NAME,)
 
-        return build_compat_ranges(versions, latest, targets, _is_version_compatible)
+    def fingerprint(self, pkg_name: str) -> str | None:
+        # The pinned dependency version of a release never changes, so the
+        # wheel filenames of both packages cover every input of the discovery.
+        return fingerprint_metadata(
+            fetch_pypi_wheel_filenames(pkg_name),
+            fetch_pypi_wheel_filenames(POLARS_RUNTIME_PKG_NAME),
+        )
 
 
-def _is_target_compatible(
-    wanted: WheelTags, tags: set[WheelTags], runtime_tags: set[WheelTags] | None
-) -> bool:
-    r"""Indicate if a ``polars`` release satisfies a wanted target.
+def _find_compatible_versions(
+    index: WheelTagIndex, runtime_index: WheelTagIndex, wanted: WheelTags
+) -> set[str]:
+    r"""Find the ``polars`` releases that satisfy a wanted target.
 
     A release that ships platform-specific wheels must match the
     target's Python version, free-threaded, OS, and arch axes exactly. A
     release that only ships a pure-Python wheel is compatible only if
     its pinned ``polars-runtime-32`` release shipped a wheel matching
     those axes exactly.
+
+    Args:
+        index: The wheel tag index of the ``polars`` releases.
+        runtime_index: The wheel tag index of the pinned ``polars-runtime-32``
+            release of each pure-Python ``polars`` release, keyed by
+            ``polars`` version.
+        wanted: The tags describing the wanted target.
+
+    Returns:
+        The ``polars`` releases that satisfy the wanted target.
     """
-    for tag in tags:
-        if tag.python_version is None:
-            if runtime_tags is None:
-                continue
-            if any(tags_match_exactly(runtime_tag, wanted) for runtime_tag in runtime_tags):
-                return True
-            continue
-        if tags_match_exactly(tag, wanted):
-            return True
-    return False
+    pinned = runtime_index.exact_matches(wanted) & index.pure_python_versions()
+    return index.exact_matches(wanted) | pinned
@@ -8,16 +8,18 @@ from typing import TYPE_CHECKING
 
 from feu.compat.discoverers.base import BaseCompatDiscoverer
 from feu.compat.discoverers.utils import (
-    build_compat_ranges,
+    WheelTagIndex,
+    build_compat_ranges_from_sets,
     build_tags_by_version,
+    fingerprint_metadata,
     sort_stable_versions,
-    tags_match_exactly,
 )
 from feu.version import fetch_pypi_pinned_dependency_version, fetch_pypi_wheel_filenames
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from feu.compat.discoverers.incremental import CompatBaseline
     from feu.compat.registry import VersionRange
     from feu.compat.target import Target
     from feu.compat.wheel_tags import WheelTags
@@ -62,6 +64,11 @@ class PydanticCompatDiscoverer(BaseCompatDiscoverer):
 
     def discover(
         self, pkg_name: str, targets: Sequence[Target]
+    ) -> dict[Target, list[VersionRange]]:
+        return self.discover_incremental(pkg_name, targets, baseline=None)
+
+    def discover_incremental(
+        self, pkg_name: str, targets: Sequence[Target], baseline: CompatBaseline | None
     ) -> dict[Target, list[VersionRange]]:
         wheel_filenames = fetch_pypi_wheel_filenames(pkg_name)
         versions = sort_stable_versions(wheel_filenames.keys())
@@ -74,7 +81,11 @@ class PydanticCompatDiscoverer(BaseCompatDiscoverer):
 
         core_tags_by_version: dict[str, set[WheelTags]] = {}
         for version, tags in tags_by_version.items():
-            if any(tag.python_version is not None for tag in tags):
+            # A release without wheels is compatible with no target, and
+            # its metadata may be missing from PyPI (e.g. a deleted release).
+            if not tags or any(tag.python_version is not None for tag in tags):
+                continue
+            if baseline is not None and baseline.is_processed(version):
                 continue
             core_version = fetch_pypi_pinned_dependency_version(
                 pkg_name, version, PYDANTIC_CORE_PKG_NAME
@@ -87,32 +98,47 @@ class PydanticCompatDiscoverer(BaseCompatDiscoverer):
                 )
             core_tags_by_version[version] = pydantic_core_tags_by_version.get(core_version, set())
 
-        def _is_version_compatible(version: str, _target: Target, wanted: WheelTags) -> bool:
-            return _is_target_compatible(
-                wanted, tags_by_version[version], core_tags_by_version.get(version)
-            )
+        index = WheelTagIndex(tags_by_version)
+        core_index = WheelTagIndex(core_tags_by_version)
+
+        def _compatible_versions(_target: Target, wanted: WheelTags) -> set[str]:
+            return _find_compatible_versions(index, core_index, wanted)
+
+        return build_compat_ranges_from_sets(
+            versions, latest, targets, _compatible_versions, baseline
+        )
+
+    def dependencies(self, pkg_name: str) -> tuple[str, ...]:  # noqa: ARG002
+        return (PYDANTIC_CORE_PKG_NAME,)
 
-        return build_compat_ranges(versions, latest, targets, _is_version_compatible)
+    def fingerprint(self, pkg_name: str) -> str | None:
+        # The pydantic-core version pinned by each release is published with
+        # the release and immutable, so it is not part of the fingerprint.
+        return fingerprint_metadata(
+            fetch_pypi_wheel_filenames(pkg_name), fetch_pypi_wheel_filenames(PYDANTIC_CORE_PKG_NAME)
+        )
 
 
-def _is_target_compatible(
-    wanted: WheelTags, tags: set[WheelTags], core_tags: set[WheelTags] | None
-) -> bool:
-    r"""Indicate if a ``pydantic`` release satisfies a wanted target.
+def _find_compatible_versions(
+    index: WheelTagIndex, core_index: WheelTagIndex, wanted: WheelTags
+) -> set[str]:
+    r"""Find the ``pydantic`` releases that satisfy a wanted target.
 
     A release that ships platform-specific wheels (``pydantic`` 1.x)
     must match the target's Python version, free-threaded, OS, and arch
     axes exactly. A release that only ships a pure-Python wheel
     (``pydantic`` 2.x) is compatible only if its pinned ``pydantic-
     core`` release shipped a wheel matching those axes exactly.
+
+    Args:
+        index: The wheel tag index of the ``pydantic`` releases.
+        core_index: The wheel tag index of the pinned ``pydantic-core``
+            release of each pure-Python ``pydantic`` release, keyed by
+            ``pydantic`` version.
+        wanted: The tags describing the wanted target.
+
+    Returns:
+        The ``pydantic`` releases that satisfy the wanted target.
     """
-    for tag in tags:
-        if tag.python_version is None:
-            if core_tags is None:
-                continue
-            if any(tags_match_exactly(core_tag, wanted) for core_tag in core_tags):
-                return True
-            continue
-        if tags_match_exactly(tag, wanted):
-            return True
-    return False
+    pinned = core_index.exact_matches(wanted) & index.pure_python_versions()
+    return index.exact_matches(wanted) | pinned
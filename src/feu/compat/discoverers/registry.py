@@ -4,8 +4,10 @@ from __future__ import annotations
 
 __all__ = ["CompatDiscovererRegistry"]
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from feu.compat.discoverers.cache import CachedCompatDiscoverer
 from feu.compat.discoverers.default import CompatDiscoverer
 
 if TYPE_CHECKING:
@@ -18,10 +20,17 @@ class CompatDiscovererRegistry:
     r"""Implement a registry that manages and dispatches compatibility
     discoverers based on package name.
 
+    If a cache directory is set, the discoverers returned by
+    ``find_discoverer`` are wrapped in a ``CachedCompatDiscoverer``,
+    so a discovery is reused until the metadata of the package
+    changes.
+
     Args:
         initial_state: Optional initial mapping of package name to
             discoverer. If provided, the state is copied to prevent
             external mutations.
+        cache_dir: Optional directory used to cache the discovered
+            ranges on disk. ``None`` (default) disables the cache.
 
     Example:
         ```pycon
@@ -34,8 +43,13 @@ class CompatDiscovererRegistry:
         ```
     """
 
-    def __init__(self, initial_state: dict[str, BaseCompatDiscoverer] | None = None) -> None:
+    def __init__(
+        self,
+        initial_state: dict[str, BaseCompatDiscoverer] | None = None,
+        cache_dir: str | Path | None = None,
+    ) -> None:
         self._state: dict[str, BaseCompatDiscoverer] = dict(initial_state or {})
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}(\n  (state): {self._state}\n)"
@@ -103,6 +117,31 @@ class CompatDiscovererRegistry:
         for pkg_name, discoverer in mapping.items():
             self.register(pkg_name, discoverer, exist_ok=exist_ok)
 
+    @property
+    def cache_dir(self) -> Path | None:
+        r"""The directory used to cache the discovered ranges, or
+        ``None`` if the cache is disabled."""
+        return self._cache_dir
+
+    def set_cache_dir(self, cache_dir: str | Path | None) -> None:
+        r"""Set the directory used to cache the discovered ranges.
+
+        Args:
+            cache_dir: The cache directory, or ``None`` to disable the
+                cache.
+
+        Example:
+            ```pycon
+            >>> from feu.compat.discoverers import CompatDiscovererRegistry
+            >>> registry = CompatDiscovererRegistry()
+            >>> registry.set_cache_dir("/tmp/feu")
+            >>> registry.find_discoverer("pydantic")
+            CachedCompatDiscoverer(discoverer=CompatDiscoverer(), cache_dir=/tmp/feu)
+
+            ```
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+
     def has_discoverer(self, pkg_name: str) -> bool:
         r"""Indicate if a compatibility discoverer is registered for the
         given package name.
@@ -134,7 +173,9 @@ class CompatDiscovererRegistry:
 
         Returns:
             The compatibility discoverer for the package, or a
-                ``CompatDiscoverer`` if none is registered.
+                ``CompatDiscoverer`` if none is registered. It is
+                wrapped in a ``CachedCompatDiscoverer`` if a cache
+                directory is set.
 
         Example:
             ```pycon
@@ -146,4 +187,7 @@ class CompatDiscovererRegistry:
 
             ```
         """
-        return self._state.get(pkg_name, CompatDiscoverer())
+        discoverer = self._state.get(pkg_name, CompatDiscoverer())
+        if self._cache_dir is None:
+            return discoverer
+        return CachedCompatDiscoverer(discoverer, cache_dir=self._cache_dir)
@@ -3,25 +3,32 @@ r"""Define helper functions shared by compatibility discoverers."""
 from __future__ import annotations
 
 __all__ = [
+    "WheelTagIndex",
     "build_compat_ranges",
+    "build_compat_ranges_from_sets",
     "build_tags_by_version",
+    "fingerprint_metadata",
     "group_into_ranges",
     "sort_stable_versions",
     "tags_match_exactly",
     "target_to_wheel_tags",
 ]
 
-from typing import TYPE_CHECKING
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
 
 from packaging.version import Version
 
+from feu.compat.discoverers.bitmatrix import CompatBitMatrix
 from feu.compat.registry import VersionRange
-from feu.compat.wheel_tags import WheelTags, parse_wheel_filename
-from feu.version import filter_stable_versions, filter_valid_versions
+from feu.compat.wheel_tags import WheelTags, parse_python_ordinal, parse_wheel_filename
+from feu.version import iter_stable_versions, iter_valid_versions
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Sequence
+    from collections.abc import Callable, Iterable, Mapping, Sequence
 
+    from feu.compat.discoverers.incremental import CompatBaseline
     from feu.compat.target import Target
 
 
@@ -36,7 +43,34 @@ def sort_stable_versions(versions: Iterable[str]) -> list[str]:
     Returns:
         The stable, valid versions, sorted in ascending order.
     """
-    return sorted(filter_stable_versions(filter_valid_versions(versions)), key=Version)
+    return sorted(iter_stable_versions(iter_valid_versions(versions)), key=Version)
+
+
+def fingerprint_metadata(*metadata: Any) -> str:
+    r"""Compute a fingerprint of some package metadata.
+
+    Args:
+        *metadata: The JSON-serializable metadata, e.g. the wheel
+            filenames of a package returned by
+            ``fetch_pypi_wheel_filenames``.
+
+    Returns:
+        The SHA-256 hex digest of the canonical JSON representation of
+            the metadata, which does not depend on the order of the
+            dictionary keys.
+
+    Example:
+        ```pycon
+        >>> from feu.compat.discoverers.utils import fingerprint_metadata
+        >>> fingerprint_metadata({"1.0.0": ("pkg-1.0.0-py3-none-any.whl",)}) == fingerprint_metadata(
+        ...     {"1.0.0": ["pkg-1.0.0-py3-none-any.whl"]}
+        ... )
+        True
+
+        ```
+    """
+    content = json.dumps(metadata, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()
 
 
 def build_tags_by_version(
@@ -59,6 +93,169 @@ def build_tags_by_version(
     }
 
 
+class WheelTagIndex:
+    r"""Implement an inverted index from wheel tags to the versions
+    that published them.
+
+    The index maps each normalized ``(python_version, free_threaded,
+    os, arch, abi3)`` key to the set of versions with a wheel matching
+    it, so the versions compatible with a target are computed with a
+    few set unions, instead of checking every tag of every version
+    for each target.
+
+    Args:
+        tags_by_version: Mapping of version to the ``WheelTags``
+            parsed from its wheel filenames, as returned by
+            ``build_tags_by_version``.
+
+    Example:
+        ```pycon
+        >>> from feu.compat.discoverers.utils import WheelTagIndex, build_tags_by_version
+        >>> from feu.compat.wheel_tags import WheelTags
+        >>> index = WheelTagIndex(
+        ...     build_tags_by_version(
+        ...         {
+        ...             "1.0.0": ("pkg-1.0.0-cp311-cp311-manylinux_2_17_x86_64.whl",),
+        ...             "1.1.0": ("pkg-1.1.0-cp39-abi3-manylinux_2_17_x86_64.whl",),
+        ...             "1.2.0": ("pkg-1.2.0-cp312-cp312-manylinux_2_17_x86_64.whl",),
+        ...         }
+        ...     )
+        ... )
+        >>> sorted(index.exact_matches(WheelTags("3.11", False, "linux", "x86_64")))
+        ['1.0.0', '1.1.0']
+
+        ```
+    """
+
+    def __init__(self, tags_by_version: Mapping[str, Iterable[WheelTags]]) -> None:
+        self._versions_by_key: dict[
+            tuple[str | None, bool, str | None, str | None, bool], set[str]
+        ] = {}
+        untagged_versions = []
+        for version, tags in tags_by_version.items():
+            is_untagged = True
+            for tag in tags:
+                key = (tag.python_version, tag.free_threaded, tag.os, tag.arch, tag.abi3)
+                self._versions_by_key.setdefault(key, set()).add(version)
+                is_untagged = False
+            if is_untagged:
+                untagged_versions.append(version)
+        self._untagged_versions = frozenset(untagged_versions)
+
+        # Secondary indices for the keys that are not looked up exactly
+        self._abi3: dict[
+            tuple[bool, str | None, str | None], list[tuple[tuple[int, int], set[str]]]
+        ] = {}
+        self._pure_python: dict[tuple[str | None, str | None], set[str]] = {}
+        for key, versions in self._versions_by_key.items():
+            python_version, free_threaded, os, arch, abi3 = key
+            if python_version is None:
+                self._pure_python.setdefault((os, arch), set()).update(versions)
+            elif abi3 and (python_ordinal := parse_python_ordinal(python_version)) is not None:
+                self._abi3.setdefault((free_threaded, os, arch), []).append(
+                    (python_ordinal, versions)
+                )
+
+    def __len__(self) -> int:
+        return len(self._versions_by_key)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(keys={len(self._versions_by_key)})"
+
+    @property
+    def has_pure_python_wheels(self) -> bool:
+        r"""``True`` if at least one version published a pure-Python
+        wheel (a wheel without Python version), otherwise ``False``."""
+        return bool(self._pure_python)
+
+    @property
+    def untagged_versions(self) -> frozenset[str]:
+        r"""The versions without any parsed wheel tag, e.g. the
+        sdist-only versions."""
+        return self._untagged_versions
+
+    def exact_matches(self, wanted: WheelTags) -> set[str]:
+        r"""Get the versions with a wheel matching a wanted target
+        exactly.
+
+        This is the set version of ``tags_match_exactly``: it returns
+        the versions with at least one tag ``t`` such that
+        ``tags_match_exactly(t, wanted)`` is ``True``.
+
+        Args:
+            wanted: The tags describing the wanted target.
+
+        Returns:
+            The matching versions.
+        """
+        return self._matches(wanted, [wanted.os], [wanted.arch], include_none=True)
+
+    def matches(self, wanted: WheelTags) -> set[str]:
+        r"""Get the versions with a CPython wheel compatible with a
+        wanted target.
+
+        Unlike ``exact_matches``, a tag without OS or arch matches any
+        OS or arch. The pure-Python tags (without Python version) are
+        excluded, see ``pure_python_versions``.
+
+        Args:
+            wanted: The tags describing the wanted target.
+
+        Returns:
+            The matching versions.
+        """
+        return self._matches(wanted, [wanted.os, None], [wanted.arch, None], include_none=False)
+
+    def pure_python_versions(self, wanted: WheelTags | None = None) -> set[str]:
+        r"""Get the versions with a pure-Python wheel (a wheel without
+        Python version).
+
+        Args:
+            wanted: If specified, only the wheels compatible with the
+                OS and arch of this target are considered. A tag
+                without OS or arch matches any OS or arch.
+
+        Returns:
+            The versions with a pure-Python wheel.
+        """
+        if wanted is None:
+            return set().union(*self._pure_python.values())
+        return set().union(
+            *(
+                self._pure_python.get((os, arch), ())
+                for os in {wanted.os, None}
+                for arch in {wanted.arch, None}
+            )
+        )
+
+    def _matches(
+        self,
+        wanted: WheelTags,
+        oses: list[str | None],
+        arches: list[str | None],
+        include_none: bool,
+    ) -> set[str]:
+        r"""Get the versions with a regular tag of the wanted Python
+        version, or an ``abi3`` tag of an earlier or equal Python
+        version, for the given OS and arch values."""
+        result: set[str] = set()
+        if wanted.python_version is None and not include_none:
+            return result
+        wanted_ordinal = wanted.python_ordinal
+        for os in dict.fromkeys(oses):
+            for arch in dict.fromkeys(arches):
+                key = (wanted.python_version, wanted.free_threaded, os, arch, False)
+                result.update(self._versions_by_key.get(key, ()))
+                if wanted_ordinal is None:
+                    continue
+                for python_ordinal, versions in self._abi3.get(
+                    (wanted.free_threaded, os, arch), ()
+                ):
+                    if python_ordinal <= wanted_ordinal:
+                        result.update(versions)
+        return result
+
+
 def target_to_wheel_tags(target: Target) -> WheelTags:
     r"""Convert a compatibility target to the ``WheelTags`` it is looking
     for.
@@ -99,9 +296,9 @@ def tags_match_exactly(tag: WheelTags, wanted: WheelTags) -> bool:
         return False
     if tag.abi3:
         return (
-            tag.python_version is not None
-            and wanted.python_version is not None
-            and Version(wanted.python_version) >= Version(tag.python_version)
+            tag.python_ordinal is not None
+            and wanted.python_ordinal is not None
+            and wanted.python_ordinal >= tag.python_ordinal
         )
     return tag.python_version == wanted.python_version
 
@@ -151,6 +348,7 @@ def build_compat_ranges(
     latest: str | None,
     targets: Sequence[Target],
     is_version_compatible: Callable[[str, Target, WheelTags], bool],
+    baseline: CompatBaseline | None = None,
 ) -> dict[Target, list[VersionRange]]:
     r"""Build the per-target compatibility ranges from a version
     compatibility predicate.
@@ -163,6 +361,10 @@ def build_compat_ranges(
         is_version_compatible: Callable indicating if a given version
             is compatible with a given target, called with the
             version, the target, and the target's ``WheelTags``.
+        baseline: If specified, the previously discovered ranges. The
+            predicate is only called for the versions that were not
+            already processed, and the compatibility of the other
+            versions is read from the baseline.
 
     Returns:
         A mapping of ``Target`` to a list of ``VersionRange``, in the
@@ -171,8 +373,80 @@ def build_compat_ranges(
     result: dict[Target, list[VersionRange]] = {}
     for target in targets:
         wanted = target_to_wheel_tags(target)
-        compatible = {
-            version for version in versions if is_version_compatible(version, target, wanted)
-        }
+        if baseline is None:
+            compatible = {
+                version for version in versions if is_version_compatible(version, target, wanted)
+            }
+        else:
+            compatible = {
+                version
+                for version in versions
+                if (
+                    baseline.is_compatible(version, target)
+                    if baseline.is_processed(version)
+                    else is_version_compatible(version, target, wanted)
+                )
+            }
         result[target] = group_into_ranges(versions, compatible, latest)
     return result
+
+
+def build_compat_ranges_from_sets(
+    versions: Sequence[str],
+    latest: str | None,
+    targets: Sequence[Target],
+    compatible_versions: Callable[[Target, WheelTags], set[str]],
+    baseline: CompatBaseline | None = None,
+) -> dict[Target, list[VersionRange]]:
+    r"""Build the per-target compatibility ranges from the set of
+    compatible versions of each target.
+
+    This is the set-based counterpart of ``build_compat_ranges``,
+    typically used with a ``WheelTagIndex`` to compute each target's
+    compatible versions with a few set unions. The sets are packed
+    into a ``CompatBitMatrix``, so merging the baseline and grouping
+    the ranges are bitwise operations.
+
+    Args:
+        versions: All the versions considered, sorted ascending.
+        latest: The overall latest version, or ``None`` if
+            ``versions`` is empty.
+        targets: The compatibility targets to compute constraints for.
+        compatible_versions: Callable returning the versions
+            compatible with a given target, called with the target
+            and the target's ``WheelTags``. The returned set can
+            contain versions that are not in ``versions``; they are
+            ignored.
+        baseline: If specified, the previously discovered ranges. The
+            compatibility of the versions that were already processed
+            is read from the baseline.
+
+    Returns:
+        A mapping of ``Target`` to a list of ``VersionRange``, in the
+            same shape expected by ``CompatRegistry.register_many``.
+
+    Example:
+        ```pycon
+        >>> from feu.compat import Target
+        >>> from feu.compat.discoverers.utils import build_compat_ranges_from_sets
+        >>> target = Target(python_version="3.11", os="linux", arch="x86_64")
+        >>> build_compat_ranges_from_sets(
+        ...     ["1.0.0", "1.1.0", "2.0.0"],
+        ...     "2.0.0",
+        ...     [target],
+        ...     lambda _target, _wanted: {"1.0.0", "2.0.0"},
+        ... )
+        {Target(...): [VersionRange(min='1.0.0', max='1.0.0'), VersionRange(min='2.0.0', max=None)]}
+
+        ```
+    """
+    matrix = CompatBitMatrix.from_sets(
+        versions,
+        {target: compatible_versions(target, target_to_wheel_tags(target)) for target in targets},
+    )
+    if baseline is not None:
+        previous = CompatBitMatrix.from_ranges(
+            versions, {target: baseline.ranges(target) for target in targets}
+        )
+        matrix = previous.select(previous.version_mask(baseline.processed_versions), matrix)
+    return matrix.to_ranges(latest)
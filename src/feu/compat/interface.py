@@ -5,26 +5,31 @@ from __future__ import annotations
 
 __all__ = [
     "find_closest_version",
+    "get_compatible_releases",
     "get_default_registry",
     "is_valid_version",
     "register_compat",
 ]
 
+import threading
 from typing import TYPE_CHECKING
 
 from feu.compat.discovered import register_discovered
 from feu.compat.registry import CompatRegistry
 
 if TYPE_CHECKING:
-    from feu.compat.registry import VersionRange
+    from feu.compat.registry import CompatibleReleases, VersionRange
     from feu.compat.target import Target
 
+_DEFAULT_REGISTRY_LOCK = threading.Lock()
+
 
 def get_default_registry() -> CompatRegistry:
     r"""Return the default global compatibility registry.
 
     The registry is created on the first call and reused on all
-    subsequent calls (singleton pattern).
+    subsequent calls (singleton pattern). It is created once even if
+    several threads call this function concurrently.
 
     Returns:
         A singleton ``CompatRegistry`` configured with the default
@@ -40,9 +45,12 @@ def get_default_registry() -> CompatRegistry:
         ```
     """
     if not hasattr(get_default_registry, "_registry"):
-        registry = CompatRegistry()
-        register_discovered(registry)
-        get_default_registry._registry = registry
+        with _DEFAULT_REGISTRY_LOCK:
+            # Another thread may have created the registry while waiting for the lock
+            if not hasattr(get_default_registry, "_registry"):
+                registry = CompatRegistry()
+                register_discovered(registry)
+                get_default_registry._registry = registry
     return get_default_registry._registry
 
 
@@ -103,6 +111,33 @@ def find_closest_version(pkg_name: str, pkg_version: str, target: Target) -> str
     )
 
 
+def get_compatible_releases(pkg_name: str, target: Target) -> CompatibleReleases | None:
+    r"""Get the oldest, latest, and latest per minor series releases
+    of a package compatible with a target using the default registry.
+
+    The releases come from the discovered compatibility database, so
+    this function does not access the network.
+
+    Args:
+        pkg_name: The package name (e.g., ``"torch"``).
+        target: The compatibility target.
+
+    Returns:
+        The compatible releases, or ``None`` if the releases of the
+            package are unknown.
+
+    Example:
+        ```pycon
+        >>> from feu.compat import get_compatible_releases, Target
+        >>> releases = get_compatible_releases(
+        ...     "torch", Target(python_version="3.9", os="windows", arch="x86_64")
+        ... )
+
+        ```
+    """
+    return get_default_registry().get_compatible_releases(pkg_name=pkg_name, target=target)
+
+
 def is_valid_version(pkg_name: str, pkg_version: str, target: Target) -> bool:
     r"""Check if a package version is valid for a target using the
     default registry.
@@ -6,10 +6,12 @@ from __future__ import annotations
 __all__ = [
     "DEFAULT_PYTHON_VERSIONS",
     "DEFAULT_TARGETS",
+    "build_requires_python_table",
     "is_compatible",
     "show_compat_targets",
 ]
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from packaging.specifiers import InvalidSpecifier, SpecifierSet
@@ -19,6 +21,8 @@ from feu.compat.target import Target
 from feu.imports import check_rich, is_rich_available
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from feu.compat.registry import VersionRange
 
 if is_rich_available():  # pragma: no cover
@@ -29,7 +33,7 @@ if is_rich_available():  # pragma: no cover
 DEFAULT_PYTHON_VERSIONS = ("3.9", "3.10", "3.11", "3.12", "3.13", "3.14", "3.15")
 
 DEFAULT_TARGETS: tuple[Target, ...] = tuple(
-    Target(python_version=python_version, free_threaded=free_threaded, os=os, arch=arch)
+    Target.of(python_version=python_version, free_threaded=free_threaded, os=os, arch=arch)
     for python_version in DEFAULT_PYTHON_VERSIONS
     for free_threaded in ((False, True) if Version(python_version) >= Version("3.13") else (False,))
     for os in ("linux", "macos", "windows")
@@ -37,10 +41,55 @@ DEFAULT_TARGETS: tuple[Target, ...] = tuple(
 )
 
 
+def build_requires_python_table(
+    requires_python: Iterable[str | None],
+    python_versions: Iterable[str] = DEFAULT_PYTHON_VERSIONS,
+) -> dict[tuple[str | None, str], bool]:
+    r"""Precompute ``is_compatible`` for a set of ``requires_python``
+    specifiers and Python versions.
+
+    A package usually declares a handful of distinct ``requires_python``
+    specifiers across all its releases, so computing the table once
+    turns the compatibility checks of a discovery run into dictionary
+    lookups.
+
+    Args:
+        requires_python: The ``requires_python`` specifier strings.
+            Duplicates are evaluated once.
+        python_versions: The Python versions to check.
+
+    Returns:
+        A dictionary mapping each ``(requires_python, python_version)``
+            pair to the output of ``is_compatible``.
+
+    Example:
+        ```pycon
+        >>> from feu.compat.matrix import build_requires_python_table
+        >>> table = build_requires_python_table([">=3.10", None], ["3.9", "3.10"])
+        >>> table[(">=3.10", "3.9")]
+        False
+        >>> table[(">=3.10", "3.10")]
+        True
+        >>> table[(None, "3.9")]
+        True
+
+        ```
+    """
+    python_versions = tuple(dict.fromkeys(python_versions))
+    return {
+        (spec, python_version): is_compatible(spec, python_version)
+        for spec in dict.fromkeys(requires_python)
+        for python_version in python_versions
+    }
+
+
 def is_compatible(requires_python: str | None, python_version: str) -> bool:
     r"""Indicate if a ``requires_python`` specifier allows a given Python
     version.
 
+    The parsed specifier sets are cached by string, so a specifier is
+    parsed only once.
+
     Args:
         requires_python: The ``requires_python`` specifier string, or
             ``None`` if the release does not declare one.
@@ -52,10 +101,10 @@ def is_compatible(requires_python: str | None, python_version: str) -> bool:
     """
     if not requires_python:
         return True
-    try:
-        return SpecifierSet(requires_python).contains(python_version, prereleases=True)
-    except InvalidSpecifier:
+    specifier = _parse_specifier_set(requires_python)
+    if specifier is None:
         return True
+    return specifier.contains(python_version, prereleases=True)
 
 
 def show_compat_targets(
@@ -100,6 +149,23 @@ def show_compat_targets(
     get_console().print(table)
 
 
+@lru_cache(maxsize=256)
+def _parse_specifier_set(requires_python: str) -> SpecifierSet | None:
+    r"""Parse a ``requires_python`` specifier string.
+
+    Args:
+        requires_python: The specifier string to parse.
+
+    Returns:
+        The parsed specifier set, or ``None`` if the string is not a
+            valid specifier.
+    """
+    try:
+        return SpecifierSet(requires_python)
+    except InvalidSpecifier:
+        return None
+
+
 def _format_ranges(ranges: list[VersionRange]) -> str:
     r"""Format a list of ``VersionRange`` as a single display string.
 
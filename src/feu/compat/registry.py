@@ -7,14 +7,19 @@ closest valid version and validation of a given version.
 
 from __future__ import annotations
 
-__all__ = ["CompatRegistry", "UnsupportedVersionError", "VersionRange"]
+__all__ = ["CompatRegistry", "CompatibleReleases", "UnsupportedVersionError", "VersionRange"]
 
-import copy
+import operator
+import re
+import threading
+from bisect import bisect_left, bisect_right
 from typing import TYPE_CHECKING, NamedTuple
 
 from packaging.version import Version
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
     from feu.compat.target import Target
 
 
@@ -32,6 +37,25 @@ class VersionRange(NamedTuple):
     max: str | None
 
 
+class CompatibleReleases(NamedTuple):
+    r"""Summarize the released versions of a package compatible with a
+    target.
+
+    Args:
+        oldest: The oldest compatible release, or ``None`` if no
+            release is compatible.
+        latest: The latest compatible release, or ``None`` if no
+            release is compatible.
+        latest_per_minor: The latest compatible release of each minor
+            series (e.g. ``"2.1.3"`` for the ``2.1`` series), sorted
+            in ascending order.
+    """
+
+    oldest: str | None
+    latest: str | None
+    latest_per_minor: tuple[str, ...]
+
+
 class UnsupportedVersionError(Exception):
     r"""Raised when no package version is compatible with a given
     target."""
@@ -52,6 +76,27 @@ class CompatRegistry:
     ``os``/``arch`` fields) wins; ties are broken by most-recently
     registered.
 
+    The constraints of a package can also be registered lazily with
+    ``register_loader``: the loader is called on the first access to
+    the package. The released versions of a package can be registered
+    with ``register_releases``, to find its compatible releases with
+    ``get_compatible_releases`` without network access.
+
+    The registered entries are also indexed by package name and
+    ``(python_version, free_threaded)``, with the version ranges parsed
+    and sorted at registration time, so resolving the entry of a target
+    is a few dictionary lookups and checking a version is a binary
+    search over the ranges.
+
+    The registry is thread-safe. The state and the index are published
+    as an immutable snapshot: a write copies the containers it
+    modifies, under a lock, and swaps the snapshot atomically, so the
+    lookups never block and never see a partially registered package.
+
+    A registry can also be layered on top of another one with
+    ``overlay``, e.g. to override some constraints per request without
+    copying or modifying a shared registry.
+
     Args:
         initial_state: Optional initial mapping of package
             constraints. If provided, the state is copied to prevent
@@ -76,20 +121,91 @@ class CompatRegistry:
     def __init__(
         self, initial_state: dict[str, dict[Target, list[VersionRange]]] | None = None
     ) -> None:
-        self._state: dict[str, dict[Target, list[VersionRange]]] = copy.deepcopy(
-            initial_state or {}
-        )
+        self._base: CompatRegistry | None = None
+        self._lock = threading.RLock()
+        self._compiled: dict[tuple[VersionRange, ...], _CompiledRanges] = {}
+        self._target_indexes: dict[
+            tuple[str, tuple[Target, ...] | None], tuple[tuple[_Snapshot, ...], _TargetIndex]
+        ] = {}
+        writer = _SnapshotWriter(_EMPTY_SNAPSHOT)
+        # The targets and ranges are immutable, so only the containers are copied
+        for pkg_name, targets in (initial_state or {}).items():
+            for target, ranges in targets.items():
+                writer.set_entry(pkg_name, target, list(ranges), self._compile)
+        self._snapshot = writer.snapshot()
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(\n  {self._state}\n)"
+        # The pending loaders are listed by name, not called
+        snapshot = self._snapshot
+        lines = [f"(loaded): {list(snapshot.state)}", f"(pending): {list(snapshot.loaders)}"]
+        if self._base is not None:
+            lines.append(f"(base): {self._base!r}".replace("\n", "\n  "))
+        return f"{self.__class__.__qualname__}(\n  " + "\n  ".join(lines) + "\n)"
 
     def __str__(self) -> str:
         return self.__repr__()
 
     @property
     def state(self) -> dict[str, dict[Target, list[VersionRange]]]:
-        r"""The registered package constraints."""
-        return self._state
+        r"""The registered package constraints.
+
+        Accessing the state calls all the pending loaders. The returned
+        mapping is a snapshot: it is not updated by later
+        registrations, and must not be modified. The state of an
+        overlay is the state of its base registry updated with the
+        constraints of the overlay.
+        """
+        if self._snapshot.loaders:
+            with self._lock:
+                writer = _SnapshotWriter(self._snapshot)
+                for key in list(writer.loaders):
+                    self._write_load(writer, key)
+                self._snapshot = writer.snapshot()
+        state = self._snapshot.state
+        if self._base is None:
+            return state
+        merged = dict(self._base.state)
+        for pkg_name, targets in state.items():
+            merged[pkg_name] = {**merged.get(pkg_name, {}), **targets}
+        return merged
+
+    def overlay(
+        self, mapping: dict[str, dict[Target, list[VersionRange]]] | None = None
+    ) -> CompatRegistry:
+        r"""Create a registry layered on top of this registry.
+
+        A lookup in the overlay resolves the entry of the target among
+        the constraints of the overlay first, and falls through to
+        this registry only if none of them matches the target. Only
+        the constraints of ``mapping`` are copied, so creating an
+        overlay is cheap even if this registry is large, and the
+        overlay sees the later registrations in this registry. The
+        registrations in the overlay never modify this registry.
+
+        Args:
+            mapping: Optional mapping of package name to ``Target`` to
+                list of ``VersionRange`` registered in the overlay.
+
+        Returns:
+            The overlay registry.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import CompatRegistry, Target
+            >>> from feu.compat.registry import VersionRange
+            >>> target = Target(python_version="3.11")
+            >>> registry = CompatRegistry({"numpy": {target: [VersionRange("1.23.2", "2.4.6")]}})
+            >>> overlay = registry.overlay({"numpy": {target: [VersionRange("2.0.0", None)]}})
+            >>> overlay.is_valid_version("numpy", "1.26.4", target)
+            False
+            >>> registry.is_valid_version("numpy", "1.26.4", target)
+            True
+
+            ```
+        """
+        registry = CompatRegistry(mapping)
+        registry._base = self
+        return registry
 
     def register(
         self,
@@ -115,18 +231,10 @@ class CompatRegistry:
                 given package name and target, and ``exist_ok`` is
                 ``False``.
         """
-        table = self._state
-        table[pkg_name] = table.get(pkg_name, {})
-
-        if target in table[pkg_name] and not exist_ok:
-            msg = (
-                f"A package configuration ({table[pkg_name][target]}) is already "
-                f"registered for package {pkg_name} and target {target}. Please "
-                f"use `exist_ok=True` if you want to overwrite the package config"
-            )
-            raise RuntimeError(msg)
-
-        table[pkg_name][target] = list(ranges)
+        with self._lock:
+            writer = _SnapshotWriter(self._snapshot)
+            self._write_register(writer, pkg_name, target, ranges, exist_ok)
+            self._snapshot = writer.snapshot()
 
     def register_many(
         self,
@@ -135,51 +243,235 @@ class CompatRegistry:
     ) -> None:
         r"""Register multiple package configurations at once.
 
+        The configurations are published atomically: a concurrent
+        reader sees either none or all of them, and nothing is
+        registered if one of them raises an error.
+
         Args:
             mapping: Mapping of package name to ``Target`` to list of
                 ``VersionRange``.
             exist_ok: Forwarded to ``register``.
+
+        Raises:
+            RuntimeError: If a configuration already exists for one of
+                the package names and targets, and ``exist_ok`` is
+                ``False``.
         """
+        with self._lock:
+            writer = _SnapshotWriter(self._snapshot)
+            self._write_many(writer, mapping, exist_ok)
+            self._snapshot = writer.snapshot()
+
+    def register_loader(
+        self,
+        pkg_name: str,
+        loader: Callable[[], dict[str, dict[Target, list[VersionRange]]]],
+        exist_ok: bool = False,
+    ) -> None:
+        r"""Register a function that lazily provides the constraints of a
+        package.
+
+        The loader is called once, on the first lookup or registration
+        for the package, and its output is registered with
+        ``register_many``. Package names are matched after replacing
+        the characters that are not valid in a Python identifier with
+        ``_`` and lowercasing, e.g. ``"scikit-learn"`` and
+        ``"scikit_learn"`` share the same loader.
+
+        Args:
+            pkg_name: The package name (e.g., ``"numpy"``).
+            loader: The function returning a mapping of package name to
+                ``Target`` to list of ``VersionRange``.
+            exist_ok: If ``False``, a ``RuntimeError`` is raised when a
+                loader is already pending for this package. Set to
+                ``True`` to overwrite.
+
+        Raises:
+            RuntimeError: If a loader is already pending for the package
+                and ``exist_ok`` is ``False``.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import CompatRegistry, Target
+            >>> from feu.compat.registry import VersionRange
+            >>> registry = CompatRegistry()
+            >>> registry.register_loader(
+            ...     "numpy",
+            ...     lambda: {"numpy": {Target(python_version="3.11"): [VersionRange("1.23.2", None)]}},
+            ... )
+            >>> registry.is_valid_version("numpy", "2.0.2", Target(python_version="3.11"))
+            True
+
+            ```
+        """
+        key = _loader_key(pkg_name)
+        with self._lock:
+            if key in self._snapshot.loaders and not exist_ok:
+                msg = (
+                    f"A loader is already registered for package {pkg_name}. Please use "
+                    "`exist_ok=True` if you want to overwrite the loader"
+                )
+                raise RuntimeError(msg)
+            writer = _SnapshotWriter(self._snapshot)
+            writer.loaders[key] = loader
+            self._snapshot = writer.snapshot()
+
+    def register_releases(
+        self, pkg_name: str, versions: Iterable[str], exist_ok: bool = False
+    ) -> None:
+        r"""Register the released versions of a package.
+
+        The releases are used by ``get_compatible_releases``, e.g. the
+        stable versions of the package on PyPI when its constraints
+        were discovered. Only the versions are stored here: the
+        compatible releases of a target are computed lazily, on its
+        first lookup.
+
+        Args:
+            pkg_name: The package name (e.g., ``"numpy"``).
+            versions: The released versions of the package, in any
+                order.
+            exist_ok: If ``False``, a ``RuntimeError`` is raised when
+                the releases of this package are already registered.
+                Set to ``True`` to overwrite.
+
+        Raises:
+            RuntimeError: If the releases of the package are already
+                registered and ``exist_ok`` is ``False``.
+        """
+        releases = _Releases(tuple(versions))
+        with self._lock:
+            if pkg_name in self._snapshot.releases and not exist_ok:
+                msg = (
+                    f"The releases of package {pkg_name} are already registered. Please use "
+                    "`exist_ok=True` if you want to overwrite the releases"
+                )
+                raise RuntimeError(msg)
+            writer = _SnapshotWriter(self._snapshot)
+            writer.releases[pkg_name] = releases
+            self._snapshot = writer.snapshot()
+
+    def _write_register(
+        self,
+        writer: _SnapshotWriter,
+        pkg_name: str,
+        target: Target,
+        ranges: list[VersionRange],
+        exist_ok: bool,
+    ) -> None:
+        r"""Register a package configuration in a snapshot writer."""
+        # The lazy constraints of the package are registered first, so the
+        # registration order and the conflicts are the same as if they were
+        # registered eagerly.
+        self._write_load(writer, _loader_key(pkg_name))
+        previous = writer.state.get(pkg_name, {}).get(target)
+        if previous is not None and not exist_ok:
+            msg = (
+                f"A package configuration ({previous}) is already "
+                f"registered for package {pkg_name} and target {target}. Please "
+                f"use `exist_ok=True` if you want to overwrite the package config"
+            )
+            raise RuntimeError(msg)
+        writer.set_entry(pkg_name, target, list(ranges), self._compile)
+
+    def _write_many(
+        self,
+        writer: _SnapshotWriter,
+        mapping: dict[str, dict[Target, list[VersionRange]]],
+        exist_ok: bool,
+    ) -> None:
+        r"""Register multiple package configurations in a snapshot
+        writer."""
         for pkg_name, targets in mapping.items():
             for target, ranges in targets.items():
-                self.register(
-                    pkg_name=pkg_name,
-                    target=target,
-                    ranges=ranges,
-                    exist_ok=exist_ok,
-                )
+                self._write_register(writer, pkg_name, target, ranges, exist_ok)
 
-    @staticmethod
-    def _matches(entry_target: Target, lookup: Target) -> bool:
-        if entry_target.python_version != lookup.python_version:
-            return False
-        if entry_target.free_threaded != lookup.free_threaded:
-            return False
-        if entry_target.os is not None and entry_target.os != lookup.os:
-            return False
-        return not (entry_target.arch is not None and entry_target.arch != lookup.arch)
+    def _write_load(self, writer: _SnapshotWriter, key: str) -> None:
+        r"""Call and register the pending loader of a package in a
+        snapshot writer, if any."""
+        loader = writer.loaders.pop(key, None)
+        if loader is not None:
+            self._write_many(writer, loader(), exist_ok=False)
+
+    def _load(self, key: str) -> None:
+        r"""Call and register the pending loader of a package, if any.
+
+        The loader is called under the write lock, so it is called once
+        even if several threads look up the package concurrently.
+        """
+        if key not in self._snapshot.loaders:
+            return
+        with self._lock:
+            writer = _SnapshotWriter(self._snapshot)
+            self._write_load(writer, key)
+            self._snapshot = writer.snapshot()
+
+    def _compile(self, ranges: Sequence[VersionRange]) -> _CompiledRanges:
+        r"""Compile some version ranges, sharing the compiled ranges of
+        the identical range lists.
+
+        The shared compiled ranges are kept in a least recently used
+        cache of at most ``_MAX_COMPILED_RANGES`` range lists. An
+        evicted range list stays valid in the snapshots that use it,
+        it is only compiled again the next time it is registered.
+        """
+        key = tuple(ranges)
+        compiled = self._compiled.pop(key, None)
+        if compiled is None:
+            compiled = _CompiledRanges(key)
+            if len(self._compiled) >= _MAX_COMPILED_RANGES:
+                del self._compiled[next(iter(self._compiled))]
+        self._compiled[key] = compiled
+        return compiled
 
-    @staticmethod
-    def _specificity(entry_target: Target) -> int:
-        return (entry_target.os is not None) + (entry_target.arch is not None)
+    def _resolve_compiled(self, pkg_name: str, target: Target) -> _CompiledRanges | None:
+        r"""Resolve the compiled ranges of the best entry matching a
+        package/target, or ``None`` if no entry matches.
+
+        The entries of this registry take precedence over the entries
+        of the base registry of an overlay.
+        """
+        compiled = self._resolve_own_compiled(pkg_name, target)
+        if compiled is None and self._base is not None:
+            return self._base._resolve_compiled(pkg_name, target)
+        return compiled
+
+    def _resolve_own_compiled(self, pkg_name: str, target: Target) -> _CompiledRanges | None:
+        r"""Resolve the compiled ranges of the best entry of this
+        registry matching a package/target, ignoring the base registry.
+
+        The candidates are looked up from the most to the least specific
+        ``(os, arch)`` key. The two keys with one wildcard have the same
+        specificity, so the most recently registered one wins.
+        """
+        snapshot = self._snapshot
+        if snapshot.loaders:
+            self._load(_loader_key(pkg_name))
+            snapshot = self._snapshot
+        entries = snapshot.index.get(pkg_name, {}).get(
+            (target.python_version, target.free_threaded)
+        )
+        if not entries:
+            return None
+        os, arch = target.os, target.arch
+        if os is not None and arch is not None and (os, arch) in entries:
+            return entries[os, arch].ranges
+        os_entry = entries.get((os, None)) if os is not None else None
+        arch_entry = entries.get((None, arch)) if arch is not None else None
+        if os_entry is not None and arch_entry is not None:
+            return max(os_entry, arch_entry, key=lambda entry: entry.order).ranges
+        if os_entry is not None or arch_entry is not None:
+            return (os_entry or arch_entry).ranges
+        entry = entries.get((None, None))
+        return None if entry is None else entry.ranges
 
     def _resolve_ranges(self, pkg_name: str, target: Target) -> list[VersionRange] | None:
         r"""Resolve the raw registered ranges for a package/target,
         preserving the distinction between "no entry registered"
         (``None``) and "an entry registered with zero ranges" (``[]``,
         i.e. explicitly unsupported)."""
-        if pkg_name not in self._state:
-            return None
-        best: list[VersionRange] | None = None
-        best_specificity = -1
-        for entry_target, ranges in self._state[pkg_name].items():
-            if not self._matches(entry_target, target):
-                continue
-            specificity = self._specificity(entry_target)
-            if specificity >= best_specificity:
-                best_specificity = specificity
-                best = ranges
-        return best
+        compiled = self._resolve_compiled(pkg_name, target)
+        return None if compiled is None else list(compiled.raw)
 
     def get_config(self, pkg_name: str, target: Target) -> list[VersionRange]:
         r"""Get the list of valid version ranges for a package and
@@ -232,21 +524,22 @@ class CompatRegistry:
             UnsupportedVersionError: If no package version is valid
                 for the given target.
         """
-        if self.is_unsupported(pkg_name=pkg_name, target=target):
+        return list(self._get_compiled(pkg_name=pkg_name, target=target).parsed)
+
+    def _get_compiled(self, pkg_name: str, target: Target) -> _CompiledRanges:
+        r"""Resolve the compiled ranges of a package/target.
+
+        Raises:
+            UnsupportedVersionError: If no package version is valid
+                for the given target.
+        """
+        compiled = self._resolve_compiled(pkg_name, target)
+        if compiled is None:
+            return _EMPTY_RANGES
+        if not compiled.raw:
             msg = f"No version of package {pkg_name} is compatible with target {target}"
             raise UnsupportedVersionError(msg)
-        ranges = self.get_config(pkg_name=pkg_name, target=target)
-        resolved = [
-            (
-                Version(version_range.min) if version_range.min is not None else None,
-                Version(version_range.max) if version_range.max is not None else None,
-            )
-            for version_range in ranges
-        ]
-        # ``find_closest_version`` assumes ranges are sorted ascending by
-        # min version, but registration order is not guaranteed to be sorted.
-        resolved.sort(key=lambda r: (r[0] is not None, r[0]))
-        return resolved
+        return compiled
 
     def find_closest_version(self, pkg_name: str, pkg_version: str, target: Target) -> str:
         r"""Find the closest valid version for a package.
@@ -264,33 +557,57 @@ class CompatRegistry:
                 for the given target.
         """
         version = Version(pkg_version)
-        ranges = self.get_version_ranges(pkg_name=pkg_name, target=target)
+        compiled = self._get_compiled(pkg_name=pkg_name, target=target)
+        return compiled.find_closest(pkg_version, version)
 
-        # If unconfigured (no ranges), return the input version
-        if not ranges:
-            return pkg_version
+    def find_closest_versions(
+        self, pkg_name: str, pkg_versions: Iterable[str], targets: Sequence[Target]
+    ) -> dict[Target, dict[str, str]]:
+        r"""Find the closest valid versions of a package for several
+        versions and targets.
 
-        for min_version, max_version in ranges:
-            if (min_version is None or min_version <= version) and (
-                max_version is None or version <= max_version
-            ):
-                return pkg_version
+        This is equivalent to calling ``find_closest_version`` for each
+        version and target, but each version is parsed once and the
+        ranges of each target are resolved once.
 
-        if ranges[0][0] is not None and version < ranges[0][0]:
-            return ranges[0][0].base_version
-        if ranges[-1][1] is not None and version > ranges[-1][1]:
-            return ranges[-1][1].base_version
+        Args:
+            pkg_name: The package name to check (e.g., ``"numpy"``).
+            pkg_versions: The requested package versions.
+            targets: The compatibility targets.
 
-        # In a gap between two ranges: snap up to the next range's min.
-        for min_version, _ in ranges:
-            if min_version is not None and version < min_version:
-                return min_version.base_version
+        Returns:
+            A dictionary mapping each target to a dictionary mapping
+                each requested version to its closest valid version.
 
-        # Unreachable: `version` is outside every range and not below the
-        # first min or above the last max, so it must fall in a gap caught
-        # above. Kept as a defensive guard for the exhaustiveness checker.
-        msg = "unreachable: version did not match any range, boundary, or gap"  # pragma: no cover
-        raise AssertionError(msg)  # pragma: no cover
+        Raises:
+            UnsupportedVersionError: If no package version is valid
+                for one of the given targets.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import CompatRegistry, Target
+            >>> from feu.compat.registry import VersionRange
+            >>> registry = CompatRegistry()
+            >>> t311, t312 = Target(python_version="3.11"), Target(python_version="3.12")
+            >>> registry.register("numpy", t311, ranges=[VersionRange("1.23.2", "2.4.6")])
+            >>> registry.register("numpy", t312, ranges=[VersionRange("1.26.0", None)])
+            >>> closest = registry.find_closest_versions("numpy", ["1.24.0", "3.0.0"], [t311, t312])
+            >>> closest[t311]
+            {'1.24.0': '1.24.0', '3.0.0': '2.4.6'}
+            >>> closest[t312]
+            {'1.24.0': '1.26.0', '3.0.0': '3.0.0'}
+
+            ```
+        """
+        versions = {pkg_version: Version(pkg_version) for pkg_version in pkg_versions}
+        result = {}
+        for target in targets:
+            compiled = self._get_compiled(pkg_name=pkg_name, target=target)
+            result[target] = {
+                pkg_version: compiled.find_closest(pkg_version, version)
+                for pkg_version, version in versions.items()
+            }
+        return result
 
     def is_valid_version(self, pkg_name: str, pkg_version: str, target: Target) -> bool:
         r"""Check if a package version is valid for a target.
@@ -305,15 +622,494 @@ class CompatRegistry:
             unconfigured, ``False`` otherwise, including when no
             package version is valid for the given target.
         """
-        if self.is_unsupported(pkg_name=pkg_name, target=target):
+        compiled = self._resolve_compiled(pkg_name, target)
+        if compiled is not None and not compiled.raw:
             return False
         version = Version(pkg_version)
-        ranges = self.get_version_ranges(pkg_name=pkg_name, target=target)
         # If unconfigured (no ranges), any version is valid
-        if not ranges:
+        if compiled is None:
             return True
-        return any(
-            (min_version is None or min_version <= version)
-            and (max_version is None or version <= max_version)
-            for min_version, max_version in ranges
+        return compiled.contains(version)
+
+    def is_valid_versions(
+        self, pkg_name: str, pkg_versions: Iterable[str], target: Target
+    ) -> dict[str, bool]:
+        r"""Check if several package versions are valid for a target.
+
+        This is equivalent to calling ``is_valid_version`` for each
+        version, but the ranges of the target are resolved once.
+
+        Args:
+            pkg_name: The package name to check (e.g., ``"numpy"``).
+            pkg_versions: The package versions to validate.
+            target: The compatibility target.
+
+        Returns:
+            A dictionary mapping each version to ``True`` if it is
+                valid for the target, ``False`` otherwise. The
+                dictionary follows the order of ``pkg_versions``.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import CompatRegistry, Target
+            >>> from feu.compat.registry import VersionRange
+            >>> registry = CompatRegistry()
+            >>> registry.register(
+            ...     "numpy", Target(python_version="3.11"), ranges=[VersionRange("1.23.2", "2.4.6")]
+            ... )
+            >>> registry.is_valid_versions(
+            ...     "numpy", ["1.22.0", "2.0.2", "2.5.0"], Target(python_version="3.11")
+            ... )
+            {'1.22.0': False, '2.0.2': True, '2.5.0': False}
+
+            ```
+        """
+        compiled = self._resolve_compiled(pkg_name, target)
+        if compiled is not None and not compiled.raw:
+            return dict.fromkeys(pkg_versions, False)
+        versions = {pkg_version: Version(pkg_version) for pkg_version in pkg_versions}
+        # If unconfigured (no ranges), any version is valid
+        if compiled is None:
+            return dict.fromkeys(versions, True)
+        return {
+            pkg_version: compiled.contains(version) for pkg_version, version in versions.items()
+        }
+
+    def targets_for_version(
+        self, pkg_name: str, pkg_version: str, targets: Sequence[Target] | None = None
+    ) -> list[Target]:
+        r"""Find the targets for which a package version is valid.
+
+        This is equivalent to keeping the targets for which
+        ``is_valid_version`` returns ``True``, but the ranges of all
+        the targets are merged into an interval index the first time a
+        package and a list of targets are queried, so the next queries
+        are a binary search over the range bounds. The index is rebuilt
+        when the package constraints change.
+
+        Args:
+            pkg_name: The package name to check (e.g., ``"numpy"``).
+            pkg_version: The package version to validate.
+            targets: The compatibility targets to check, e.g.
+                ``DEFAULT_TARGETS``. If ``None``, the targets
+                registered for the package are checked.
+
+        Returns:
+            The targets for which the package version is valid, in
+                the order of ``targets``.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import CompatRegistry, Target
+            >>> from feu.compat.registry import VersionRange
+            >>> t311, t312 = Target(python_version="3.11"), Target(python_version="3.12")
+            >>> registry = CompatRegistry()
+            >>> registry.register("numpy", t311, ranges=[VersionRange("1.23.2", "2.4.6")])
+            >>> registry.register("numpy", t312, ranges=[VersionRange("1.26.0", None)])
+            >>> [t.python_version for t in registry.targets_for_version("numpy", "1.24.0")]
+            ['3.11']
+            >>> [t.python_version for t in registry.targets_for_version("numpy", "2.0.2")]
+            ['3.11', '3.12']
+
+            ```
+        """
+        version = Version(pkg_version)
+        return list(self._get_target_index(pkg_name, targets).query(version))
+
+    def get_compatible_releases(self, pkg_name: str, target: Target) -> CompatibleReleases | None:
+        r"""Get the oldest, latest, and latest per minor series
+        releases of a package compatible with a target.
+
+        The compatible releases are the registered releases that
+        ``is_valid_version`` accepts. They are computed on the first
+        lookup of a package and resolved ranges, which is a single pass
+        over the releases, and memoized, so the next lookups with the
+        same ranges are dictionary lookups. They are not precomputed at
+        discovery time, because a curated overlay or a later
+        registration can change the ranges that apply to a target.
+
+        Args:
+            pkg_name: The package name (e.g., ``"numpy"``).
+            target: The compatibility target.
+
+        Returns:
+            The compatible releases, or ``None`` if no release is
+                registered for the package.
+
+        Example:
+            ```pycon
+            >>> from feu.compat import CompatRegistry, Target
+            >>> from feu.compat.registry import VersionRange
+            >>> target = Target(python_version="3.11")
+            >>> registry = CompatRegistry()
+            >>> registry.register("numpy", target, ranges=[VersionRange("1.23.2", "2.0.2")])
+            >>> registry.register_releases(
+            ...     "numpy", ["1.22.4", "1.23.2", "1.23.5", "1.26.4", "2.0.0", "2.0.2", "2.1.0"]
+            ... )
+            >>> registry.get_compatible_releases("numpy", target)
+            CompatibleReleases(oldest='1.23.2', latest='2.0.2', latest_per_minor=('1.23.5', '1.26.4', '2.0.2'))
+
+            ```
+        """
+        compiled = self._resolve_compiled(pkg_name, target)
+        registry = self
+        while pkg_name not in registry._snapshot.releases:
+            if registry._base is None:
+                return None
+            registry = registry._base
+        return registry._snapshot.releases[pkg_name].compatible(compiled)
+
+    def _get_target_index(self, pkg_name: str, targets: Sequence[Target] | None) -> _TargetIndex:
+        r"""Get the interval index of a package and some targets,
+        building it if the package constraints changed since it was
+        built."""
+        key = (pkg_name, None if targets is None else tuple(targets))
+        # The loaders are called before the snapshots are captured, so a
+        # registration made while the index is built only invalidates it.
+        chain = self._snapshot_chain(pkg_name)
+        cached = self._target_indexes.get(key)
+        if cached is not None and all(map(operator.is_, cached[0], chain)):
+            return cached[1]
+        if targets is None:
+            targets = tuple(
+                dict.fromkeys(
+                    target
+                    for snapshot in reversed(chain)
+                    for target in snapshot.state.get(pkg_name, {})
+                )
+            )
+        index = _TargetIndex(
+            targets, [self._resolve_compiled(pkg_name, target) for target in targets]
         )
+        with self._lock:
+            if key not in self._target_indexes and len(self._target_indexes) >= _MAX_TARGET_INDEXES:
+                del self._target_indexes[next(iter(self._target_indexes))]
+            self._target_indexes[key] = (chain, index)
+        return index
+
+    def _snapshot_chain(self, pkg_name: str) -> tuple[_Snapshot, ...]:
+        r"""Call the pending loader of a package in this registry and
+        its base registries, and return their current snapshots, from
+        this registry to the last base registry."""
+        self._load(_loader_key(pkg_name))
+        chain = (self._snapshot,)
+        if self._base is None:
+            return chain
+        return chain + self._base._snapshot_chain(pkg_name)
+
+
+class _CompiledRanges:
+    r"""Pre-parsed and pre-sorted version ranges of a registry entry.
+
+    Args:
+        ranges: The registered version ranges.
+    """
+
+    __slots__ = ("_mins", "_num_unbounded_mins", "_prefix_max", "parsed", "raw")
+
+    def __init__(self, ranges: tuple[VersionRange, ...]) -> None:
+        self.raw = ranges
+        parsed = [
+            (
+                Version(version_range.min) if version_range.min is not None else None,
+                Version(version_range.max) if version_range.max is not None else None,
+            )
+            for version_range in ranges
+        ]
+        # ``find_closest_version`` assumes ranges are sorted ascending by
+        # min version, but registration order is not guaranteed to be sorted.
+        parsed.sort(key=lambda r: (r[0] is not None, r[0]))
+        self.parsed: tuple[tuple[Version | None, Version | None], ...] = tuple(parsed)
+        self._num_unbounded_mins = sum(min_version is None for min_version, _ in parsed)
+        self._mins = [min_version for min_version, _ in parsed[self._num_unbounded_mins :]]
+        # ``_prefix_max[i]`` is the highest max of the first ``i + 1``
+        # ranges, or ``None`` if one of them has no max.
+        self._prefix_max: list[Version | None] = []
+        highest: Version | None = None
+        for i, (_, max_version) in enumerate(parsed):
+            if max_version is None or (i > 0 and highest is None):
+                highest = None
+            elif highest is None or max_version > highest:
+                highest = max_version
+            self._prefix_max.append(highest)
+
+    def num_lower(self, version: Version) -> int:
+        r"""Return the number of ranges whose min is at or below a
+        version."""
+        return self._num_unbounded_mins + bisect_right(self._mins, version)
+
+    def contains(self, version: Version, num_lower: int | None = None) -> bool:
+        r"""Indicate if a version is in one of the ranges.
+
+        Args:
+            version: The version to check.
+            num_lower: The output of ``num_lower(version)``, if already
+                computed.
+
+        Returns:
+            ``True`` if the version is in one of the ranges.
+        """
+        if num_lower is None:
+            num_lower = self.num_lower(version)
+        if num_lower == 0:
+            return False
+        highest = self._prefix_max[num_lower - 1]
+        return highest is None or version <= highest
+
+    def find_closest(self, pkg_version: str, version: Version) -> str:
+        r"""Find the closest version in the ranges.
+
+        Args:
+            pkg_version: The requested version string.
+            version: The parsed requested version.
+
+        Returns:
+            ``pkg_version`` if it is in one of the ranges or if there
+                is no range, otherwise the closest range bound.
+        """
+        ranges = self.parsed
+
+        # If unconfigured (no ranges), return the input version
+        if not ranges:
+            return pkg_version
+
+        num_lower = self.num_lower(version)
+        if self.contains(version, num_lower):
+            return pkg_version
+
+        if ranges[0][0] is not None and version < ranges[0][0]:
+            return ranges[0][0].base_version
+        if ranges[-1][1] is not None and version > ranges[-1][1]:
+            return ranges[-1][1].base_version
+
+        # In a gap between two ranges: snap up to the next range's min,
+        # i.e. the first range whose min is above the version.
+        return ranges[num_lower][0].base_version
+
+
+class _Releases:
+    r"""Released versions of a package, with the memoized compatible
+    releases of each resolved entry.
+
+    The compatible releases are not precomputed when the releases are
+    registered, because the ranges that apply to a target are only
+    known at lookup time: a curated overlay or a later registration
+    can replace the discovered ranges. The first lookup of an entry
+    is a single pass over the releases, and the next ones are
+    dictionary lookups. The memo is filled under a lock, so concurrent
+    first lookups compute the table once.
+
+    Args:
+        versions: The released versions, in any order.
+    """
+
+    __slots__ = ("_compatible", "_lock", "_sorted", "versions")
+
+    def __init__(self, versions: tuple[str, ...]) -> None:
+        self.versions = versions
+        self._sorted: list[tuple[Version, str]] | None = None
+        self._compatible: dict[_CompiledRanges | None, CompatibleReleases] = {}
+        self._lock = threading.Lock()
+
+    def compatible(self, compiled: _CompiledRanges | None) -> CompatibleReleases:
+        r"""Return the releases compatible with some compiled ranges.
+
+        Args:
+            compiled: The resolved ranges, or ``None`` if no entry
+                matches the target.
+
+        Returns:
+            The compatible releases.
+        """
+        releases = self._compatible.get(compiled)
+        if releases is not None:
+            return releases
+        with self._lock:
+            releases = self._compatible.get(compiled)
+            if releases is not None:
+                return releases
+            if self._sorted is None:
+                self._sorted = sorted((Version(version), version) for version in self.versions)
+            # If unconfigured (no ranges), any version is valid
+            compatible = [
+                (version, raw)
+                for version, raw in self._sorted
+                if compiled is None or compiled.contains(version)
+            ]
+            latest_per_minor = {(version.major, version.minor): raw for version, raw in compatible}
+            releases = CompatibleReleases(
+                oldest=compatible[0][1] if compatible else None,
+                latest=compatible[-1][1] if compatible else None,
+                latest_per_minor=tuple(latest_per_minor.values()),
+            )
+            self._compatible[compiled] = releases
+        return releases
+
+
+class _TargetIndex:
+    r"""Interval index of the targets for which a version is valid.
+
+    The distinct bounds of the ranges split the versions into slots:
+    the slot ``2 * i + 1`` contains only the bound ``i``, and the slot
+    ``2 * i`` contains the versions strictly between the bounds
+    ``i - 1`` and ``i``. The valid targets are the same for all the
+    versions of a slot, so they are precomputed per slot.
+
+    Args:
+        targets: The compatibility targets.
+        compiled: The compiled ranges resolved for each target, or
+            ``None`` if no entry matches the target.
+    """
+
+    __slots__ = ("_bounds", "_slots")
+
+    def __init__(
+        self, targets: Sequence[Target], compiled: Sequence[_CompiledRanges | None]
+    ) -> None:
+        self._bounds = sorted(
+            {
+                bound
+                for ranges in compiled
+                if ranges is not None
+                for version_range in ranges.parsed
+                for bound in version_range
+                if bound is not None
+            }
+        )
+        num_slots = 2 * len(self._bounds) + 1
+        slot_of = {bound: 2 * i + 1 for i, bound in enumerate(self._bounds)}
+        # Sweep over the slots, counting the ranges of each target that
+        # contain the current slot, as the ranges of a target can overlap.
+        events: list[list[tuple[int, int]]] = [[] for _ in range(num_slots + 1)]
+        mask = 0
+        for i, ranges in enumerate(compiled):
+            if ranges is None:
+                # If unconfigured (no ranges), any version is valid
+                mask |= 1 << i
+                continue
+            for min_version, max_version in ranges.parsed:
+                start = 0 if min_version is None else slot_of[min_version]
+                end = num_slots - 1 if max_version is None else slot_of[max_version]
+                if start <= end:
+                    events[start].append((i, 1))
+                    events[end + 1].append((i, -1))
+        counts = [0] * len(targets)
+        valid: dict[int, tuple[Target, ...]] = {}
+        self._slots: list[tuple[Target, ...]] = []
+        for slot in range(num_slots):
+            for i, delta in events[slot]:
+                counts[i] += delta
+                mask = mask | (1 << i) if counts[i] else mask & ~(1 << i)
+            if mask not in valid:
+                valid[mask] = tuple(t for i, t in enumerate(targets) if mask >> i & 1)
+            self._slots.append(valid[mask])
+
+    def query(self, version: Version) -> tuple[Target, ...]:
+        r"""Return the targets for which a version is valid."""
+        i = bisect_left(self._bounds, version)
+        if i < len(self._bounds) and self._bounds[i] == version:
+            return self._slots[2 * i + 1]
+        return self._slots[2 * i]
+
+
+class _IndexEntry(NamedTuple):
+    r"""Index entry of a registered package/target."""
+
+    order: int
+    ranges: _CompiledRanges
+
+
+class _Snapshot(NamedTuple):
+    r"""Immutable state of a ``CompatRegistry``.
+
+    The containers of a published snapshot are never modified, so
+    they can be read without lock.
+    """
+
+    state: dict[str, dict[Target, list[VersionRange]]]
+    index: dict[str, dict[tuple[str, bool], dict[tuple[str | None, str | None], _IndexEntry]]]
+    num_indexed: int
+    loaders: dict[str, Callable[[], dict[str, dict[Target, list[VersionRange]]]]]
+    releases: dict[str, _Releases]
+
+
+class _SnapshotWriter:
+    r"""Build a new snapshot from a published one, copying the
+    containers the first time they are modified.
+
+    Args:
+        snapshot: The published snapshot.
+    """
+
+    __slots__ = ("_copied", "index", "loaders", "num_indexed", "releases", "state")
+
+    def __init__(self, snapshot: _Snapshot) -> None:
+        self.state = dict(snapshot.state)
+        self.index = dict(snapshot.index)
+        self.num_indexed = snapshot.num_indexed
+        self.loaders = dict(snapshot.loaders)
+        self.releases = dict(snapshot.releases)
+        self._copied: set[str] = set()
+
+    def set_entry(
+        self,
+        pkg_name: str,
+        target: Target,
+        ranges: list[VersionRange],
+        compile_ranges: Callable[[list[VersionRange]], _CompiledRanges],
+    ) -> None:
+        r"""Add or update the entry of a package/target.
+
+        An overwritten target keeps its original registration order,
+        like its key in the state dictionary.
+        """
+        if pkg_name not in self._copied:
+            self.state[pkg_name] = dict(self.state.get(pkg_name, {}))
+            self.index[pkg_name] = {
+                key: dict(entries) for key, entries in self.index.get(pkg_name, {}).items()
+            }
+            self._copied.add(pkg_name)
+        self.state[pkg_name][target] = ranges
+        entries = self.index[pkg_name].setdefault((target.python_version, target.free_threaded), {})
+        key = (target.os, target.arch)
+        previous = entries.get(key)
+        if previous is None:
+            order = self.num_indexed
+            self.num_indexed += 1
+        else:
+            order = previous.order
+        entries[key] = _IndexEntry(order=order, ranges=compile_ranges(ranges))
+
+    def snapshot(self) -> _Snapshot:
+        r"""Create the new snapshot.
+
+        The writer must not be used after this call.
+        """
+        return _Snapshot(
+            state=self.state,
+            index=self.index,
+            num_indexed=self.num_indexed,
+            loaders=self.loaders,
+            releases=self.releases,
+        )
+
+
+_EMPTY_RANGES = _CompiledRanges(())
+_MAX_COMPILED_RANGES = 1024
+_MAX_TARGET_INDEXES = 128
+_EMPTY_SNAPSHOT = _Snapshot(state={}, index={}, num_indexed=0, loaders={}, releases={})
+
+_LOADER_KEY_PATTERN = re.compile(r"[^0-9a-zA-Z_]")
+
+
+def _loader_key(pkg_name: str) -> str:
+    r"""Return the key of the loader of a package.
+
+    Args:
+        pkg_name: The package name.
+
+    Returns:
+        The package name as a lowercase Python identifier, e.g.
+            ``"scikit_learn"`` for ``"scikit-learn"``.
+    """
+    return _LOADER_KEY_PATTERN.sub("_", pkg_name).lower()
@@ -7,6 +7,7 @@ __all__ = ["VALID_ARCH", "VALID_OS", "Target", "resolve_target"]
 
 import re
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from feu.utils.platform import (
     get_current_arch,
@@ -15,13 +16,29 @@ from feu.utils.platform import (
     is_free_threaded,
 )
 
-_PYTHON_VERSION_PATTERN = re.compile(r"^\d+\.\d+$")
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_PYTHON_VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)$")
 VALID_OS = frozenset({"linux", "macos", "windows"})
 VALID_ARCH = frozenset({"x86_64", "arm64"})
 
+_INTERNED_TARGETS: dict[tuple[str, bool, str | None, str | None], Target] = {}
+
+
+class _TargetCache:
+    r"""Declare the slots of the values precomputed by ``Target``.
+
+    They are declared in a base class, so they are not dataclass fields
+    and do not appear in ``dataclasses.fields``, ``asdict``, or
+    ``astuple``.
+    """
+
+    __slots__ = ("_hash", "python_ordinal")
 
-@dataclass(frozen=True)
-class Target:
+
+@dataclass(frozen=True, slots=True)
+class Target(_TargetCache):
     r"""Identify the environment a package compatibility constraint
     applies to.
 
@@ -39,6 +56,12 @@ class Target:
             ``None`` means "any architecture" when used as a registry
             entry, and "unspecified" when used as a lookup target.
 
+    The integer ``(major, minor)`` of ``python_version`` is
+    precomputed in ``python_ordinal``, so Python versions are compared
+    without parsing them, and the hash is computed once at creation.
+    Use ``Target.of`` to get a shared instance instead of creating a
+    new one for each identical target.
+
     Raises:
         ValueError: if ``python_version`` is not a ``"major.minor"``
             string, or if ``os``/``arch`` is not one of the supported
@@ -59,18 +82,74 @@ class Target:
     arch: str | None = None
 
     def __post_init__(self) -> None:
-        if not _PYTHON_VERSION_PATTERN.match(self.python_version):
+        match = _PYTHON_VERSION_PATTERN.match(self.python_version)
+        if not match:
             msg = (
                 f"invalid python_version {self.python_version!r}: expected a "
                 "'major.minor' string, e.g. '3.11'"
             )
             raise ValueError(msg)
+        object.__setattr__(self, "python_ordinal", (int(match.group(1)), int(match.group(2))))
         if self.os is not None and self.os not in VALID_OS:
             msg = f"invalid os {self.os!r}: expected one of {sorted(VALID_OS)} or None"
             raise ValueError(msg)
         if self.arch is not None and self.arch not in VALID_ARCH:
             msg = f"invalid arch {self.arch!r}: expected one of {sorted(VALID_ARCH)} or None"
             raise ValueError(msg)
+        object.__setattr__(
+            self, "_hash", hash((self.python_version, self.free_threaded, self.os, self.arch))
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[Callable[..., Target], tuple[str, bool, str | None, str | None]]:
+        # The cached hash is not pickled because string hashes differ
+        # between processes
+        return self.__class__.of, (self.python_version, self.free_threaded, self.os, self.arch)
+
+    @classmethod
+    def of(
+        cls,
+        python_version: str,
+        free_threaded: bool = False,
+        os: str | None = None,
+        arch: str | None = None,
+    ) -> Target:
+        r"""Get the shared ``Target`` instance of some field values.
+
+        The instances are interned, so the identical targets of the
+        compatibility data share one object, and the validation runs
+        once per distinct target.
+
+        Args:
+            python_version: The Python version, e.g. ``"3.11"``.
+            free_threaded: ``True`` for a free-threaded Python build.
+            os: The operating system.
+            arch: The CPU architecture.
+
+        Returns:
+            The shared target, equal to ``Target(python_version,
+                free_threaded, os, arch)``.
+
+        Raises:
+            ValueError: if ``python_version`` is not a
+                ``"major.minor"`` string, or if ``os``/``arch`` is not
+                one of the supported values.
+
+        Example:
+            ```pycon
+            >>> from feu.compat.target import Target
+            >>> Target.of("3.11", os="linux") is Target.of("3.11", os="linux")
+            True
+
+            ```
+        """
+        key = (python_version, free_threaded, os, arch)
+        target = _INTERNED_TARGETS.get(key)
+        if target is None:
+            target = _INTERNED_TARGETS.setdefault(key, cls(*key))
+        return target
 
 
 def resolve_target(
@@ -124,7 +203,7 @@ def resolve_target(
         free_threaded = True
     if free_threaded is None:
         free_threaded = is_free_threaded()
-    return Target(
+    return Target.of(
         python_version=python_version,
         free_threaded=free_threaded,
         os=os or get_current_os(),
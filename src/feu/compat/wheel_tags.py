@@ -10,15 +10,23 @@ __all__ = [
     "parse_arch",
     "parse_os",
     "parse_pure_python_tag",
+    "parse_python_ordinal",
     "parse_python_tag",
     "parse_wheel_filename",
 ]
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
+# Match the last three dash-separated components of a wheel filename,
+# i.e. the python, abi and platform tags
+_WHEEL_FILENAME_PATTERN = re.compile(
+    r"^(?:[^-]*-){2,}(?P<python_tag>[^-]*)-(?P<abi_tag>[^-]*)-(?P<platform_tag>[^-]*)\.whl$"
+)
 _PYTHON_TAG_PATTERN = re.compile(r"^cp3(\d+)$")
 _PURE_PYTHON_TAG_COMPONENT_PATTERN = re.compile(r"^py(\d)(\d*)$")
+_PYTHON_ORDINAL_PATTERN = re.compile(r"^(\d+)\.(\d+)")
 
 OS_TABLE: dict[str, str] = {
     "manylinux": "linux",
@@ -37,8 +45,17 @@ ARCH_TABLE: dict[str, str] = {
 }
 
 
-@dataclass(frozen=True)
-class WheelTags:
+class _WheelTagsCache:
+    r"""Declare the slots of the values precomputed by ``WheelTags``.
+
+    Declaring them outside the dataclass keeps them out of its fields.
+    """
+
+    __slots__ = ("_hash", "python_ordinal")
+
+
+@dataclass(frozen=True, slots=True)
+class WheelTags(_WheelTagsCache):
     r"""Compatibility-relevant tags extracted from a wheel filename.
 
     Args:
@@ -59,6 +76,12 @@ class WheelTags:
             (an ``abi3`` ABI tag), meaning it is forward-compatible
             with every CPython version from ``python_version`` onward,
             not just that exact version.
+
+    The hash and the ``python_ordinal`` (the integer ``(major,
+    minor)`` of ``python_version``, see ``parse_python_ordinal``) are
+    computed once at creation, and the tags returned by
+    ``parse_wheel_filename`` are interned, so identical tags share one
+    object.
     """
 
     python_version: str | None
@@ -67,6 +90,63 @@ class WheelTags:
     arch: str | None
     abi3: bool = False
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "python_ordinal", parse_python_ordinal(self.python_version))
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((self.python_version, self.free_threaded, self.os, self.arch, self.abi3)),
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[WheelTags], tuple[str | None, bool, str | None, str | None, bool]]:
+        # The cached hash is not pickled because string hashes differ
+        # between processes
+        return self.__class__, (
+            self.python_version,
+            self.free_threaded,
+            self.os,
+            self.arch,
+            self.abi3,
+        )
+
+
+def parse_python_ordinal(python_version: str | None) -> tuple[int, int] | None:
+    r"""Parse a Python version string into an integer ``(major,
+    minor)`` ordinal.
+
+    The ordinals compare like the Python versions, without parsing a
+    ``packaging.version.Version`` for every comparison.
+
+    Args:
+        python_version: The Python version, e.g. ``"3.12"``.
+
+    Returns:
+        The ``(major, minor)`` ordinal, e.g. ``(3, 12)``, or ``None``
+            if ``python_version`` is ``None`` or doesn't start with
+            ``"major.minor"``.
+
+    Example:
+        ```pycon
+        >>> from feu.compat.wheel_tags import parse_python_ordinal
+        >>> parse_python_ordinal("3.12")
+        (3, 12)
+        >>> parse_python_ordinal("3.9") < parse_python_ordinal("3.10")
+        True
+
+        ```
+    """
+    if python_version is None:
+        return None
+    match = _PYTHON_ORDINAL_PATTERN.match(python_version)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
 
 def parse_python_tag(python_tag: str) -> str | None:
     r"""Parse a wheel Python tag into a CPython version string.
@@ -217,24 +297,38 @@ def parse_wheel_filename(filename: str) -> list[WheelTags]:
 
         ```
     """
-    if not filename.endswith(".whl"):
+    match = _WHEEL_FILENAME_PATTERN.match(filename)
+    if match is None:
         return []
-    stem = filename[: -len(".whl")]
-    parts = stem.split("-")
-    if len(parts) < 5:
-        return []
-    python_tag, abi_tag, platform_tag = parts[-3], parts[-2], parts[-1]
+    return list(_parse_tags(*match.group("python_tag", "abi_tag", "platform_tag")))
+
 
+@lru_cache(maxsize=4096)
+def _parse_tags(python_tag: str, abi_tag: str, platform_tag: str) -> tuple[WheelTags, ...]:
+    r"""Parse the python, abi and platform tags of a wheel filename.
+
+    A package publishes a handful of distinct tag triples across all
+    its wheel filenames, so the results are memoized.
+
+    Args:
+        python_tag: The wheel Python tag, e.g. ``"cp312"``.
+        abi_tag: The wheel ABI tag, e.g. ``"cp312"``.
+        platform_tag: The wheel platform tag, e.g.
+            ``"macosx_11_0_arm64"``.
+
+    Returns:
+        The interned ``WheelTags``, see ``parse_wheel_filename``.
+    """
     cpython_version = parse_python_tag(python_tag)
     if cpython_version is not None:
         python_versions: list[str | None] = [cpython_version]
     else:
         pure_python_versions = parse_pure_python_tag(python_tag)
         if pure_python_versions is None:
-            return []
+            return ()
         python_versions = pure_python_versions
 
-    first_platform_component = platform_tag.split(".")[0]
+    first_platform_component = platform_tag.split(".", maxsplit=1)[0]
     if first_platform_component == "any":
         os_name = None
         arch_name = None
@@ -242,18 +336,29 @@ def parse_wheel_filename(filename: str) -> list[WheelTags]:
         os_name = parse_os(first_platform_component)
         arch_name = parse_arch(first_platform_component)
         if os_name is None or arch_name is None:
-            return []
+            return ()
 
     free_threaded = abi_tag.endswith("t")
     abi3 = abi_tag == "abi3"
-
-    return [
-        WheelTags(
-            python_version=python_version,
-            free_threaded=free_threaded,
-            os=os_name,
-            arch=arch_name,
-            abi3=abi3,
-        )
+    return tuple(
+        _intern_wheel_tags(python_version, free_threaded, os_name, arch_name, abi3)
         for python_version in python_versions
-    ]
+    )
+
+
+@lru_cache(maxsize=1024)
+def _intern_wheel_tags(
+    python_version: str | None,
+    free_threaded: bool,
+    os: str | None,
+    arch: str | None,
+    abi3: bool,
+) -> WheelTags:
+    r"""Get the shared ``WheelTags`` instance of some tag values."""
+    return WheelTags(
+        python_version=python_version,
+        free_threaded=free_threaded,
+        os=os,
+        arch=arch,
+        abi3=abi3,
+    )
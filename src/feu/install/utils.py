@@ -29,9 +29,9 @@ from feu.utils.package import (
 )
 from feu.version import (
     fetch_pypi_versions,
-    filter_stable_versions,
-    filter_valid_versions,
     get_python_major_minor,
+    iter_stable_versions,
+    iter_valid_versions,
     sort_versions,
 )
 
@@ -151,15 +151,15 @@ def get_installable_versions(
 
         ```
     """
-    registry = get_default_registry()
-    versions = filter_stable_versions(
-        filter_valid_versions(fetch_pypi_versions(pkg_name, start_date=start_date))
+    versions = list(
+        iter_stable_versions(
+            iter_valid_versions(fetch_pypi_versions(pkg_name, start_date=start_date))
+        )
+    )
+    valid = get_default_registry().is_valid_versions(
+        pkg_name=pkg_name, pkg_versions=versions, target=target
     )
-    return [
-        version
-        for version in versions
-        if registry.is_valid_version(pkg_name=pkg_name, pkg_version=version, target=target)
-    ]
+    return [version for version in versions if valid[version]]
 
 
 def install_all_versions(
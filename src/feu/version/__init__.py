@@ -3,7 +3,14 @@ r"""Contain functions to manage package versions."""
 from __future__ import annotations
 
 __all__ = [
+    "DEFAULT_EXCLUDED_DIRS",
+    "InstalledDistributions",
     "PackageBounds",
+    "PackageBoundsIndex",
+    "PyprojectDocument",
+    "PyprojectScanner",
+    "ReleaseIndex",
+    "VersionReport",
     "compare_version",
     "fetch_latest_major_versions",
     "fetch_latest_major_versions_map",
@@ -11,34 +18,51 @@ __all__ = [
     "fetch_latest_minor_versions_map",
     "fetch_latest_stable_version",
     "fetch_latest_version",
+    "fetch_pypi_last_serial",
     "fetch_pypi_pinned_dependency_version",
+    "fetch_pypi_release_index",
     "fetch_pypi_requires_python",
+    "fetch_pypi_upload_times",
     "fetch_pypi_versions",
     "fetch_pypi_wheel_filenames",
     "fetch_sampled_latest_minor_versions",
+    "fetch_version_report",
     "fetch_versions",
     "filter_every_n_versions",
     "filter_last_n_versions",
     "filter_range_versions",
     "filter_stable_versions",
     "filter_valid_versions",
+    "find_pyproject_files",
+    "get_installed_distributions",
     "get_package_bounds",
     "get_package_version",
+    "get_package_versions",
     "get_python_major_minor",
+    "iter_every_n_versions",
+    "iter_last_n_versions",
+    "iter_range_versions",
+    "iter_stable_versions",
+    "iter_unique_versions",
+    "iter_valid_versions",
+    "latest_by_key",
     "latest_major_versions",
     "latest_minor_versions",
     "latest_version",
+    "merge_package_bounds",
     "normalize_package_name",
     "partition_package_bounds",
     "read_pyproject_dependencies",
     "read_pyproject_optional_dependencies",
     "read_pyproject_package_bounds",
+    "scan_package_bounds",
     "sort_versions",
     "unique_versions",
 ]
 
 from feu.version.bound import (
     PackageBounds,
+    PackageBoundsIndex,
     get_package_bounds,
     normalize_package_name,
     partition_package_bounds,
@@ -50,11 +74,19 @@ from feu.version.filtering import (
     filter_range_versions,
     filter_stable_versions,
     filter_valid_versions,
+    iter_every_n_versions,
+    iter_last_n_versions,
+    iter_range_versions,
+    iter_stable_versions,
+    iter_unique_versions,
+    iter_valid_versions,
+    latest_by_key,
     latest_major_versions,
     latest_minor_versions,
     unique_versions,
 )
 from feu.version.package import (
+    VersionReport,
     fetch_latest_major_versions,
     fetch_latest_major_versions_map,
     fetch_latest_minor_versions,
@@ -62,17 +94,36 @@ from feu.version.package import (
     fetch_latest_stable_version,
     fetch_latest_version,
     fetch_sampled_latest_minor_versions,
+    fetch_version_report,
     fetch_versions,
 )
 from feu.version.pypi import (
+    ReleaseIndex,
+    fetch_pypi_last_serial,
     fetch_pypi_pinned_dependency_version,
+    fetch_pypi_release_index,
     fetch_pypi_requires_python,
+    fetch_pypi_upload_times,
     fetch_pypi_versions,
     fetch_pypi_wheel_filenames,
 )
 from feu.version.pyproject import (
+    PyprojectDocument,
     read_pyproject_dependencies,
     read_pyproject_optional_dependencies,
     read_pyproject_package_bounds,
 )
-from feu.version.runtime import get_package_version, get_python_major_minor
+from feu.version.runtime import (
+    InstalledDistributions,
+    get_installed_distributions,
+    get_package_version,
+    get_package_versions,
+    get_python_major_minor,
+)
+from feu.version.scan import (
+    DEFAULT_EXCLUDED_DIRS,
+    PyprojectScanner,
+    find_pyproject_files,
+    merge_package_bounds,
+    scan_package_bounds,
+)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 __all__ = [
     "PackageBounds",
+    "PackageBoundsIndex",
     "get_package_bounds",
     "normalize_package_name",
     "partition_package_bounds",
@@ -14,7 +15,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
 
 @dataclass(frozen=True)
@@ -40,8 +41,222 @@ class PackageBounds:
     section: str
 
 
+class PackageBoundsIndex:
+    """Immutable index of ``PackageBounds`` keyed by normalized package
+    name.
+
+    The package names are normalized once when the index is built, so
+    looking up a package is a dictionary access instead of a scan of
+    all the entries. A package can appear several times (e.g. once per
+    ``pyproject.toml`` section), and the entries keep the order in which
+    they were given.
+
+    Args:
+        packages: The ``PackageBounds`` instances to index.
+
+    Example:
+        ```pycon
+        >>> from feu.version import PackageBounds, PackageBoundsIndex
+        >>> index = PackageBoundsIndex(
+        ...     [
+        ...         PackageBounds(
+        ...             name="numpy", lower="1.21", upper="2.0", section="project.dependencies"
+        ...         ),
+        ...         PackageBounds(
+        ...             name="torch", lower="2.0", upper=None, section="project.dependencies"
+        ...         ),
+        ...         PackageBounds(
+        ...             name="NumPy", lower="1.24", upper=None, section="dependency-groups.dev"
+        ...         ),
+        ...     ]
+        ... )
+        >>> index
+        PackageBoundsIndex(names=2, bounds=3)
+        >>> "numpy" in index
+        True
+        >>> index.get("numpy")
+        PackageBounds(name='numpy', lower='1.21', upper='2.0', section='project.dependencies')
+        >>> index.sections("numpy")
+        ('project.dependencies', 'dependency-groups.dev')
+
+        ```
+    """
+
+    __slots__ = ("_by_name", "_normalized_names", "_packages")
+
+    def __init__(self, packages: Iterable[PackageBounds]) -> None:
+        self._packages = tuple(packages)
+        self._normalized_names = tuple(normalize_package_name(p.name) for p in self._packages)
+        by_name: dict[str, list[PackageBounds]] = {}
+        for name, bounds in zip(self._normalized_names, self._packages):
+            by_name.setdefault(name, []).append(bounds)
+        self._by_name = {name: tuple(items) for name, items in by_name.items()}
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and normalize_package_name(name) in self._by_name
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackageBoundsIndex):
+            return NotImplemented
+        return self._packages == other._packages
+
+    def __hash__(self) -> int:
+        return hash(self._packages)
+
+    def __iter__(self) -> Iterator[PackageBounds]:
+        return iter(self._packages)
+
+    def __len__(self) -> int:
+        return len(self._packages)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(names={len(self._by_name)}, "
+            f"bounds={len(self._packages)})"
+        )
+
+    @property
+    def bounds(self) -> tuple[PackageBounds, ...]:
+        r"""All the indexed ``PackageBounds`` in their original order."""
+        return self._packages
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        r"""The normalized names of the indexed packages, in order of first
+        appearance."""
+        return tuple(self._by_name)
+
+    def get(self, name: str) -> PackageBounds:
+        r"""Return the first ``PackageBounds`` matching a package name.
+
+        Args:
+            name: The package name to look up. The name is normalized
+                before the lookup.
+
+        Returns:
+            The first ``PackageBounds`` whose name matches ``name``.
+
+        Raises:
+            ValueError: If no entry matches ``name``.
+
+        Example:
+            ```pycon
+            >>> from feu.version import PackageBounds, PackageBoundsIndex
+            >>> index = PackageBoundsIndex(
+            ...     [PackageBounds(name="scikit-learn", lower="1.0", upper=None, section="s")]
+            ... )
+            >>> index.get("Scikit_Learn")
+            PackageBounds(name='scikit-learn', lower='1.0', upper=None, section='s')
+
+            ```
+        """
+        items = self._by_name.get(normalize_package_name(name))
+        if not items:
+            msg = f"Package {name!r} not found in the provided sequence."
+            raise ValueError(msg)
+        return items[0]
+
+    def get_all(self, name: str) -> tuple[PackageBounds, ...]:
+        r"""Return all the ``PackageBounds`` matching a package name.
+
+        Args:
+            name: The package name to look up. The name is normalized
+                before the lookup.
+
+        Returns:
+            The matching ``PackageBounds`` in their original order, or
+                an empty tuple if the package is not indexed.
+
+        Example:
+            ```pycon
+            >>> from feu.version import PackageBounds, PackageBoundsIndex
+            >>> index = PackageBoundsIndex(
+            ...     [
+            ...         PackageBounds(name="numpy", lower="1.21", upper=None, section="a"),
+            ...         PackageBounds(name="numpy", lower=None, upper="2.0", section="b"),
+            ...     ]
+            ... )
+            >>> for bounds in index.get_all("numpy"):
+            ...     print(bounds)
+            ...
+            PackageBounds(name='numpy', lower='1.21', upper=None, section='a')
+            PackageBounds(name='numpy', lower=None, upper='2.0', section='b')
+            >>> index.get_all("torch")
+            ()
+
+            ```
+        """
+        return self._by_name.get(normalize_package_name(name), ())
+
+    def sections(self, name: str) -> tuple[str, ...]:
+        r"""Return the sections where a package is declared.
+
+        Args:
+            name: The package name to look up.
+
+        Returns:
+            The sections in their original order, or an empty tuple if
+                the package is not indexed.
+
+        Example:
+            ```pycon
+            >>> from feu.version import PackageBounds, PackageBoundsIndex
+            >>> index = PackageBoundsIndex(
+            ...     [
+            ...         PackageBounds(name="numpy", lower="1.21", upper=None, section="a"),
+            ...         PackageBounds(name="numpy", lower=None, upper="2.0", section="b"),
+            ...     ]
+            ... )
+            >>> index.sections("numpy")
+            ('a', 'b')
+
+            ```
+        """
+        return tuple(bounds.section for bounds in self.get_all(name))
+
+    def partition(self, names: Iterable[str]) -> tuple[list[PackageBounds], list[PackageBounds]]:
+        r"""Split the indexed ``PackageBounds`` into matched and unmatched
+        by name.
+
+        Args:
+            names: The package names to match against.
+
+        Returns:
+            A tuple of two lists, both in the original order. The first
+                list contains the ``PackageBounds`` whose name appears in
+                ``names``, and the second list contains the others.
+
+        Example:
+            ```pycon
+            >>> from feu.version import PackageBounds, PackageBoundsIndex
+            >>> index = PackageBoundsIndex(
+            ...     [
+            ...         PackageBounds(name="numpy", lower="1.21", upper=None, section="a"),
+            ...         PackageBounds(name="torch", lower="2.0", upper=None, section="a"),
+            ...     ]
+            ... )
+            >>> matched, unmatched = index.partition(["numpy"])
+            >>> matched
+            [PackageBounds(name='numpy', lower='1.21', upper=None, section='a')]
+            >>> unmatched
+            [PackageBounds(name='torch', lower='2.0', upper=None, section='a')]
+
+            ```
+        """
+        normalized_names = {normalize_package_name(n) for n in names}
+        if not normalized_names.intersection(self._by_name):
+            return [], list(self._packages)
+        matched, unmatched = [], []
+        for name, bounds in zip(self._normalized_names, self._packages):
+            if name in normalized_names:
+                matched.append(bounds)
+            else:
+                unmatched.append(bounds)
+        return matched, unmatched
+
+
 def get_package_bounds(
-    packages: Sequence[PackageBounds],
+    packages: Sequence[PackageBounds] | PackageBoundsIndex,
     name: str,
 ) -> PackageBounds:
     """Return the first ``PackageBounds`` matching a given package name.
@@ -50,7 +265,9 @@ def get_package_bounds(
     underscores as equivalent, following PEP 508 normalisation rules.
 
     Args:
-        packages: A sequence of ``PackageBounds`` instances to search.
+        packages: A sequence of ``PackageBounds`` instances to search,
+            or a ``PackageBoundsIndex``. Building the index once is
+            faster when looking up many packages.
         name: The package name to look up.
 
     Returns:
@@ -75,6 +292,8 @@ def get_package_bounds(
 
         ```
     """
+    if isinstance(packages, PackageBoundsIndex):
+        return packages.get(name)
     normalized = normalize_package_name(name)
     for bounds in packages:
         if normalize_package_name(bounds.name) == normalized:
@@ -108,14 +327,15 @@ def normalize_package_name(name: str) -> str:
 
 
 def partition_package_bounds(
-    packages: Sequence[PackageBounds],
+    packages: Sequence[PackageBounds] | PackageBoundsIndex,
     names: Sequence[str],
 ) -> tuple[list[PackageBounds], list[PackageBounds]]:
     """Split a sequence of ``PackageBounds`` into matched and unmatched
     by name.
 
     Args:
-        packages: A sequence of ``PackageBounds`` instances to filter.
+        packages: A sequence of ``PackageBounds`` instances to filter,
+            or a ``PackageBoundsIndex``.
         names: The package names to match against.
 
     Returns:
@@ -145,7 +365,6 @@ def partition_package_bounds(
 
         ```
     """
-    normalized_names = {normalize_package_name(n) for n in names}
-    matched = [p for p in packages if normalize_package_name(p.name) in normalized_names]
-    unmatched = [p for p in packages if normalize_package_name(p.name) not in normalized_names]
-    return matched, unmatched
+    if not isinstance(packages, PackageBoundsIndex):
+        packages = PackageBoundsIndex(packages)
+    return packages.partition(names)
@@ -8,18 +8,26 @@ __all__ = [
     "filter_range_versions",
     "filter_stable_versions",
     "filter_valid_versions",
+    "iter_every_n_versions",
+    "iter_last_n_versions",
+    "iter_range_versions",
+    "iter_stable_versions",
+    "iter_unique_versions",
+    "iter_valid_versions",
+    "latest_by_key",
     "latest_major_versions",
     "latest_minor_versions",
     "unique_versions",
 ]
 
-from contextlib import suppress
+from collections import deque
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from packaging.version import InvalidVersion, Version
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
 
 
 def filter_every_n_versions(versions: Sequence[str], n: int) -> list[str]:
@@ -54,10 +62,7 @@ def filter_every_n_versions(versions: Sequence[str], n: int) -> list[str]:
 
         ```
     """
-    if n < 1:
-        msg = f"n must be >= 1 but received {n}"
-        raise ValueError(msg)
-    return [v for i, v in enumerate(versions) if i % n == 0]
+    return list(iter_every_n_versions(versions, n))
 
 
 def filter_last_n_versions(versions: Sequence[str], n: int) -> list[str]:
@@ -95,6 +100,70 @@ def filter_last_n_versions(versions: Sequence[str], n: int) -> list[str]:
     return list(versions[-n:])
 
 
+def iter_every_n_versions(versions: Iterable[str], n: int) -> Iterator[str]:
+    r"""Lazily keep only every n-th version using **0-based indexing**.
+
+    This is the iterator version of ``filter_every_n_versions``. ``n``
+    is checked when the function is called, not when the iterator is
+    consumed.
+
+    Args:
+        versions: An iterable of version strings.
+        n: The interval for selecting versions. Must be >= 1.
+
+    Returns:
+        An iterator over every n-th version in ``versions``, starting
+            from index 0.
+
+    Raises:
+        ValueError: If ``n`` is less than 1.
+
+    Example:
+        ```pycon
+        >>> from feu.version import iter_every_n_versions
+        >>> list(iter_every_n_versions(iter(["1.0", "1.1", "1.2", "1.3", "1.5"]), n=2))
+        ['1.0', '1.2', '1.5']
+
+        ```
+    """
+    if n < 1:
+        msg = f"n must be >= 1 but received {n}"
+        raise ValueError(msg)
+    return islice(versions, 0, None, n)
+
+
+def iter_last_n_versions(versions: Iterable[str], n: int) -> Iterator[str]:
+    r"""Return an iterator over the last n versions of an iterable.
+
+    This is the iterator version of ``filter_last_n_versions``. The
+    input has to be consumed to find its end, so ``versions`` is read
+    when the function is called, and only the last ``n`` versions are
+    kept in memory.
+
+    Args:
+        versions: An iterable of version strings.
+        n: Number of versions to keep from the end. Must be > 0.
+
+    Returns:
+        An iterator over the last n versions, in order.
+
+    Raises:
+        ValueError: If ``n`` is less than or equal to 0.
+
+    Example:
+        ```pycon
+        >>> from feu.version import iter_last_n_versions
+        >>> list(iter_last_n_versions(iter(["1.0", "1.1", "1.2", "1.3"]), n=2))
+        ['1.2', '1.3']
+
+        ```
+    """
+    if n <= 0:
+        msg = f"n must be > 0 but received {n}"
+        raise ValueError(msg)
+    return iter(deque(versions, maxlen=n))
+
+
 def filter_range_versions(
     versions: Sequence[str], lower: str | None = None, upper: str | None = None
 ) -> list[str]:
@@ -125,15 +194,7 @@ def filter_range_versions(
 
         ```
     """
-    lower_v = Version(lower) if lower else None
-    upper_v = Version(upper) if upper else None
-
-    result = []
-    for v_str in versions:
-        v = Version(v_str)
-        if (lower_v is None or v >= lower_v) and (upper_v is None or v < upper_v):
-            result.append(v_str)
-    return result
+    return list(iter_range_versions(versions, lower=lower, upper=upper))
 
 
 def filter_stable_versions(versions: Sequence[str]) -> list[str]:
@@ -162,12 +223,7 @@ def filter_stable_versions(versions: Sequence[str]) -> list[str]:
 
         ```
     """
-    stable_versions = []
-    for v in versions:
-        parsed = Version(v)
-        if not (parsed.is_prerelease or parsed.is_postrelease or parsed.is_devrelease):
-            stable_versions.append(v)
-    return stable_versions
+    return list(iter_stable_versions(versions))
 
 
 def filter_valid_versions(versions: Sequence[str]) -> list[str]:
@@ -204,15 +260,155 @@ def filter_valid_versions(versions: Sequence[str]) -> list[str]:
 
         ```
     """
-    valid_versions = []
+    return list(iter_valid_versions(versions))
+
+
+def iter_range_versions(
+    versions: Iterable[str], lower: str | None = None, upper: str | None = None
+) -> Iterator[str]:
+    r"""Lazily keep only the versions within optional bounds.
+
+    This is the iterator version of ``filter_range_versions``. The
+    bounds are parsed when the function is called.
+
+    Args:
+        versions: An iterable of version strings.
+        lower: The lower version bound (inclusive).
+            If ``None``, no lower limit is applied.
+        upper: The upper version bound (exclusive).
+            If None, no upper limit is applied.
+
+    Returns:
+        An iterator over the version strings that fall within the
+            specified bounds.
+
+    Example:
+        ```pycon
+        >>> from feu.version import iter_range_versions
+        >>> list(iter_range_versions(["1.0.0", "1.2.0", "2.0.0"], lower="1.1.0", upper="2.0.0"))
+        ['1.2.0']
+
+        ```
+    """
+    lower_v = Version(lower) if lower else None
+    upper_v = Version(upper) if upper else None
+
+    def in_range(v_str: str) -> bool:
+        v = Version(v_str)
+        return (lower_v is None or v >= lower_v) and (upper_v is None or v < upper_v)
+
+    return filter(in_range, versions)
+
+
+def iter_stable_versions(versions: Iterable[str]) -> Iterator[str]:
+    r"""Lazily filter out pre-release, post-release, and dev-release
+    versions.
+
+    This is the iterator version of ``filter_stable_versions``.
+
+    Args:
+        versions: An iterable of version strings.
+
+    Returns:
+        An iterator over the stable version strings.
+
+    Example:
+        ```pycon
+        >>> from feu.version import iter_stable_versions
+        >>> list(iter_stable_versions(["1.0.0", "1.0.0a1", "2.0.0.dev1", "3.0.0"]))
+        ['1.0.0', '3.0.0']
+
+        ```
+    """
+    return filter(_is_stable_version, versions)
+
+
+def iter_unique_versions(versions: Iterable[str]) -> Iterator[str]:
+    r"""Lazily drop the duplicate versions while preserving order.
+
+    This is the iterator version of ``unique_versions``. Only the
+    versions already seen are kept in memory.
+
+    Args:
+        versions: An iterable of version strings.
+
+    Yields:
+        The unique version strings, in order of first occurrence.
+
+    Example:
+        ```pycon
+        >>> from feu.version import iter_unique_versions
+        >>> list(iter_unique_versions(["1.0.0", "1.0.1", "1.0.0", "1.2.0"]))
+        ['1.0.0', '1.0.1', '1.2.0']
+
+        ```
+    """
+    seen = set()
     for v in versions:
-        with suppress(InvalidVersion):
-            Version(v)
-            valid_versions.append(v)
-    return valid_versions
+        if v not in seen:
+            seen.add(v)
+            yield v
+
+
+def iter_valid_versions(versions: Iterable[str]) -> Iterator[str]:
+    r"""Lazily filter out the invalid version strings based on PEP 440.
+
+    This is the iterator version of ``filter_valid_versions``.
+
+    Args:
+        versions: An iterable of version strings.
+
+    Returns:
+        An iterator over the valid version strings.
+
+    Example:
+        ```pycon
+        >>> from feu.version import iter_valid_versions
+        >>> list(iter_valid_versions(["1.0.0", "not-a-version", "2"]))
+        ['1.0.0', '2']
+
+        ```
+    """
+    return filter(_is_valid_version, versions)
+
+
+def latest_by_key(
+    versions: Iterable[str | Version], key: Callable[[Version], Hashable]
+) -> list[str]:
+    r"""Return the latest version of each group of versions, in a
+    single pass.
+
+    It generalizes ``latest_major_versions`` and
+    ``latest_minor_versions`` to any grouping of the versions.
+
+    Args:
+        versions: An iterable of version strings or already parsed
+            versions.
+        key: The function that computes the group of a version.
+
+    Returns:
+        The latest version of each group, sorted by group.
 
+    Example:
+        ```pycon
+        >>> from packaging.version import Version
+        >>> from feu.version import latest_by_key
+        >>> latest_by_key(["1.0.0", Version("1.2.0"), "1.1.3", "2.0.1"], key=lambda v: v.major)
+        ['1.2.0', '2.0.1']
 
-def latest_major_versions(versions: Sequence[str]) -> list[str]:
+        ```
+    """
+    latest = {}
+    for version in versions:
+        v = version if isinstance(version, Version) else Version(version)
+        group = key(v)
+        current = latest.get(group)
+        if current is None or v > current:
+            latest[group] = v
+    return [str(latest[k]) for k in sorted(latest)]
+
+
+def latest_major_versions(versions: Iterable[str]) -> list[str]:
     r"""Return the latest version for each major version in a list of
     semantic versions.
 
@@ -221,8 +417,13 @@ def latest_major_versions(versions: Sequence[str]) -> list[str]:
     version number, and returns only the latest version from
     each major group (based on minor and patch numbers).
 
+    The versions are consumed in a single pass and only the latest
+    version of each group is kept in memory, so ``versions`` can be
+    any iterable, e.g. the output of ``iter_stable_versions``.
+
     Args:
-        versions: A list of version strings in semantic version format.
+        versions: An iterable of version strings in semantic version
+            format.
 
     Returns:
         A list containing the latest version for each major version,
@@ -237,16 +438,10 @@ def latest_major_versions(versions: Sequence[str]) -> list[str]:
 
         ```
     """
-    by_major = {}
-    for v_str in versions:
-        v = Version(v_str)
-        current = by_major.get(v.major)
-        if current is None or v > current:
-            by_major[v.major] = v
-    return [str(by_major[k]) for k in sorted(by_major)]
+    return latest_by_key(versions, key=lambda v: v.major)
 
 
-def latest_minor_versions(versions: Sequence[str]) -> list[str]:
+def latest_minor_versions(versions: Iterable[str]) -> list[str]:
     r"""Return the latest version for each minor version in a list of
     semantic versions.
 
@@ -255,8 +450,13 @@ def latest_minor_versions(versions: Sequence[str]) -> list[str]:
     major and minor version numbers, and returns only the latest
     version from each minor group (based on the patch number).
 
+    The versions are consumed in a single pass and only the latest
+    version of each group is kept in memory, so ``versions`` can be
+    any iterable, e.g. the output of ``iter_stable_versions``.
+
     Args:
-        versions: A list of version strings in semantic version format.
+        versions: An iterable of version strings in semantic version
+            format.
 
     Returns:
         A list containing the latest version for each minor version,
@@ -271,14 +471,7 @@ def latest_minor_versions(versions: Sequence[str]) -> list[str]:
 
         ```
     """
-    by_minor = {}
-    for v_str in versions:
-        v = Version(v_str)
-        key = (v.major, v.minor)
-        current = by_minor.get(key)
-        if current is None or v > current:
-            by_minor[key] = v
-    return [str(by_minor[k]) for k in sorted(by_minor)]
+    return latest_by_key(versions, key=lambda v: (v.major, v.minor))
 
 
 def unique_versions(versions: Sequence[str]) -> list[str]:
@@ -301,3 +494,32 @@ def unique_versions(versions: Sequence[str]) -> list[str]:
         ```
     """
     return list(dict.fromkeys(versions))
+
+
+def _is_stable_version(version: str) -> bool:
+    r"""Indicate if a version string is a stable release.
+
+    Args:
+        version: The version string.
+
+    Returns:
+        ``True`` if the version is not a pre, post or dev release.
+    """
+    parsed = Version(version)
+    return not (parsed.is_prerelease or parsed.is_postrelease or parsed.is_devrelease)
+
+
+def _is_valid_version(version: str) -> bool:
+    r"""Indicate if a version string is valid based on PEP 440.
+
+    Args:
+        version: The version string.
+
+    Returns:
+        ``True`` if the version can be parsed.
+    """
+    try:
+        Version(version)
+    except InvalidVersion:
+        return False
+    return True
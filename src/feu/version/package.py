@@ -3,6 +3,7 @@ r"""Contain functions to manage package versions."""
 from __future__ import annotations
 
 __all__ = [
+    "VersionReport",
     "fetch_latest_major_versions",
     "fetch_latest_major_versions_map",
     "fetch_latest_minor_versions",
@@ -10,19 +11,28 @@ __all__ = [
     "fetch_latest_stable_version",
     "fetch_latest_version",
     "fetch_sampled_latest_minor_versions",
+    "fetch_version_report",
     "fetch_versions",
 ]
 
-
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from packaging.version import InvalidVersion, Version
+
 from feu.version.comparison import latest_version, sort_versions
 from feu.version.filtering import (
     filter_every_n_versions,
     filter_last_n_versions,
-    filter_range_versions,
     filter_stable_versions,
     filter_valid_versions,
+    iter_range_versions,
+    iter_stable_versions,
+    iter_unique_versions,
+    iter_valid_versions,
+    latest_by_key,
     latest_major_versions,
     latest_minor_versions,
     unique_versions,
@@ -30,10 +40,13 @@ from feu.version.filtering import (
 from feu.version.pypi import fetch_pypi_versions
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Executor
 
     from feu.version import PackageBounds
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 def fetch_versions(
     package: str, lower: str | None = None, upper: str | None = None
@@ -58,12 +71,11 @@ def fetch_versions(
         ```
     """
     versions = fetch_pypi_versions(package)
-    versions = filter_valid_versions(versions)
-    versions = filter_stable_versions(versions)
-    versions = filter_range_versions(versions, lower=lower, upper=upper)
-    versions = unique_versions(versions)
-    versions = sort_versions(versions)
-    return tuple(versions)
+    versions = iter_valid_versions(versions)
+    versions = iter_stable_versions(versions)
+    versions = iter_range_versions(versions, lower=lower, upper=upper)
+    versions = iter_unique_versions(versions)
+    return tuple(sort_versions(versions))
 
 
 def fetch_latest_major_versions(
@@ -241,9 +253,126 @@ def fetch_latest_stable_version(package: str) -> str:
     return latest_version(versions)
 
 
+@dataclass(frozen=True)
+class VersionReport:
+    r"""Summary of the released versions of a package.
+
+    Attributes:
+        package: The package name.
+        latest: The latest valid version, or ``None`` if the package
+            has no valid version. The bounds are not applied, like
+            ``fetch_latest_version``.
+        latest_stable: The latest stable version, or ``None`` if the
+            package has no stable version. The bounds are not applied,
+            like ``fetch_latest_stable_version``.
+        stable_versions: The stable versions within the bounds, like
+            ``fetch_versions``.
+        latest_major_versions: The latest version for each major
+            version, like ``fetch_latest_major_versions``.
+        latest_minor_versions: The latest version for each minor
+            version, like ``fetch_latest_minor_versions``.
+        sampled_minor_versions: The sampled latest minor versions, like
+            ``fetch_sampled_latest_minor_versions``.
+    """
+
+    package: str
+    latest: str | None
+    latest_stable: str | None
+    stable_versions: tuple[str, ...]
+    latest_major_versions: tuple[str, ...]
+    latest_minor_versions: tuple[str, ...]
+    sampled_minor_versions: tuple[str, ...]
+
+
+def fetch_version_report(
+    package: str,
+    lower: str | None = None,
+    upper: str | None = None,
+    n: int = 1,
+    include_lower_bound: bool = False,
+) -> VersionReport:
+    r"""Get a summary of the released versions of a package.
+
+    The releases are fetched once and each version is parsed once, so
+    this is faster than calling ``fetch_latest_version``,
+    ``fetch_latest_stable_version``, ``fetch_versions``,
+    ``fetch_latest_major_versions``, ``fetch_latest_minor_versions``,
+    and ``fetch_sampled_latest_minor_versions`` one after the other.
+    Each field of the report matches the output of the corresponding
+    function.
+
+    Args:
+        package: The package name.
+        lower: The lower version bound (inclusive).
+            If ``None``, no lower limit is applied.
+        upper: The upper version bound (exclusive).
+            If ``None``, no upper limit is applied.
+        n: The sampling stride of the sampled minor versions.
+        include_lower_bound: Has the same meaning as in
+            ``fetch_latest_major_versions``,
+            ``fetch_latest_minor_versions``, and
+            ``fetch_sampled_latest_minor_versions``.
+
+    Returns:
+        The version report.
+
+    Raises:
+        ValueError: If ``n`` is less than 1.
+
+    Example:
+        ```pycon
+        >>> from feu.version import fetch_version_report
+        >>> report = fetch_version_report("requests", lower="2.28")  # doctest: +SKIP
+        >>> report.latest_minor_versions  # doctest: +SKIP
+
+        ```
+    """
+    if n < 1:
+        msg = f"n must be >= 1 but received {n}"
+        raise ValueError(msg)
+    lower_v = Version(lower) if lower else None
+    upper_v = Version(upper) if upper else None
+
+    latest = latest_stable = None
+    stable = []
+    for v_str in dict.fromkeys(fetch_pypi_versions(package)):
+        try:
+            v = Version(v_str)
+        except InvalidVersion:
+            continue
+        if latest is None or v > latest:
+            latest = v
+        if v.is_prerelease or v.is_postrelease or v.is_devrelease:
+            continue
+        if latest_stable is None or v > latest_stable:
+            latest_stable = v
+        if (lower_v is None or v >= lower_v) and (upper_v is None or v < upper_v):
+            stable.append((v, v_str))
+    stable.sort(key=lambda item: item[0])
+
+    majors = latest_by_key((v for v, _ in stable), key=lambda v: v.major)
+    minors = latest_by_key((v for v, _ in stable), key=lambda v: (v.major, v.minor))
+    sampled = minors[::n] + minors[-1:]
+    if include_lower_bound and lower is not None and minors:
+        sampled = [*sampled, minors[0]]
+    first = [stable[0][1]] if include_lower_bound and stable else []
+    return VersionReport(
+        package=package,
+        latest=None if latest is None else str(latest),
+        latest_stable=None if latest_stable is None else str(latest_stable),
+        stable_versions=tuple(v_str for _, v_str in stable),
+        latest_major_versions=tuple(sort_versions(unique_versions([*first, *majors]))),
+        latest_minor_versions=tuple(sort_versions(unique_versions([*first, *minors]))),
+        sampled_minor_versions=tuple(sort_versions(unique_versions(sampled))),
+    )
+
+
 def fetch_latest_major_versions_map(
     packages: Sequence[PackageBounds],
     include_lower_bound: bool = False,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+    raise_on_error: bool = True,
 ) -> dict[str, list[str]]:
     """Fetch the latest major versions for a sequence of packages.
 
@@ -254,6 +383,14 @@ def fetch_latest_major_versions_map(
     If a package appears more than once in ``packages`` (e.g. because it
     was found in multiple sections), the last entry wins.
 
+    The packages can be fetched concurrently by setting ``max_workers``
+    or ``executor``. The output is the same as a sequential fetch: the
+    keys follow the order of ``packages``. By default, the first
+    failure (in the order of ``packages``) is raised. If
+    ``raise_on_error`` is ``False``, a package whose fetch fails is
+    logged and left out of the output, without aborting the fetch of
+    the other packages.
+
     Args:
         packages: A sequence of ``PackageBounds`` instances, typically
             obtained from ``read_pyproject_dependencies`` or
@@ -262,6 +399,17 @@ def fetch_latest_major_versions_map(
             above each package's lower bound is included in its version
             list. Has no effect for packages whose lower bound is
             ``None``. Defaults to ``False``.
+        max_workers: The maximum number of threads used to fetch the
+            packages concurrently. ``1`` (default) fetches the packages
+            sequentially in the calling thread, and ``None`` uses the
+            ``ThreadPoolExecutor`` default. Ignored if ``executor`` is
+            specified.
+        executor: An optional executor used to fetch the packages
+            concurrently. The executor is not shut down by this
+            function.
+        raise_on_error: If ``True`` (default), the exception of a
+            failed fetch is raised. If ``False``, the failed packages
+            are logged and left out of the output.
 
     Returns:
         A dictionary mapping each package name to the list of latest major
@@ -272,22 +420,26 @@ def fetch_latest_major_versions_map(
         >>> from feu.version import fetch_latest_major_versions_map, read_pyproject_dependencies
         >>> bounds = read_pyproject_dependencies("pyproject.toml")  # doctest: +SKIP
         >>> versions = fetch_latest_major_versions_map(bounds)  # doctest: +SKIP
+        >>> versions = fetch_latest_major_versions_map(bounds, max_workers=8)  # doctest: +SKIP
 
         ```
     """
-    return {
-        bounds.name: list(
-            fetch_latest_major_versions(
-                bounds.name, lower=bounds.lower, include_lower_bound=include_lower_bound
-            )
-        )
-        for bounds in packages
-    }
+    return _fetch_versions_map(
+        fetch_latest_major_versions,
+        packages,
+        include_lower_bound=include_lower_bound,
+        max_workers=max_workers,
+        executor=executor,
+        raise_on_error=raise_on_error,
+    )
 
 
 def fetch_latest_minor_versions_map(
     packages: Sequence[PackageBounds],
     include_lower_bound: bool = False,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+    raise_on_error: bool = True,
 ) -> dict[str, list[str]]:
     """Fetch the latest minor versions for a sequence of packages.
 
@@ -298,6 +450,14 @@ def fetch_latest_minor_versions_map(
     If a package appears more than once in ``packages`` (e.g. because it
     was found in multiple sections), the last entry wins.
 
+    The packages can be fetched concurrently by setting ``max_workers``
+    or ``executor``. The output is the same as a sequential fetch: the
+    keys follow the order of ``packages``. By default, the first
+    failure (in the order of ``packages``) is raised. If
+    ``raise_on_error`` is ``False``, a package whose fetch fails is
+    logged and left out of the output, without aborting the fetch of
+    the other packages.
+
     Args:
         packages: A sequence of ``PackageBounds`` instances, typically
             obtained from ``read_pyproject_dependencies`` or
@@ -306,6 +466,17 @@ def fetch_latest_minor_versions_map(
             above each package's lower bound is included in its version
             list. Has no effect for packages whose lower bound is
             ``None``. Defaults to ``False``.
+        max_workers: The maximum number of threads used to fetch the
+            packages concurrently. ``1`` (default) fetches the packages
+            sequentially in the calling thread, and ``None`` uses the
+            ``ThreadPoolExecutor`` default. Ignored if ``executor`` is
+            specified.
+        executor: An optional executor used to fetch the packages
+            concurrently. The executor is not shut down by this
+            function.
+        raise_on_error: If ``True`` (default), the exception of a
+            failed fetch is raised. If ``False``, the failed packages
+            are logged and left out of the output.
 
     Returns:
         A dictionary mapping each package name to the list of latest minor
@@ -322,11 +493,48 @@ def fetch_latest_minor_versions_map(
 
         ```
     """
+    return _fetch_versions_map(
+        fetch_latest_minor_versions,
+        packages,
+        include_lower_bound=include_lower_bound,
+        max_workers=max_workers,
+        executor=executor,
+        raise_on_error=raise_on_error,
+    )
+
+
+def _fetch_versions_map(
+    fetch: Callable[..., Sequence[str]],
+    packages: Sequence[PackageBounds],
+    *,
+    include_lower_bound: bool,
+    max_workers: int | None,
+    executor: Executor | None,
+    raise_on_error: bool,
+) -> dict[str, list[str]]:
+    r"""Fetch the versions of each package, possibly concurrently, and
+    collect them into a dictionary following the order of
+    ``packages``."""
+
+    def _fetch(bounds: PackageBounds) -> list[str]:
+        return list(fetch(bounds.name, lower=bounds.lower, include_lower_bound=include_lower_bound))
+
+    def _try_fetch(bounds: PackageBounds) -> list[str] | None:
+        try:
+            return _fetch(bounds)
+        except Exception:
+            logger.exception("failed to fetch the versions of %s", bounds.name)
+            return None
+
+    fetch_one = _fetch if raise_on_error else _try_fetch
+
+    if executor is not None:
+        results = list(executor.map(fetch_one, packages))
+    elif max_workers == 1:
+        results = [fetch_one(bounds) for bounds in packages]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(fetch_one, packages))
     return {
-        bounds.name: list(
-            fetch_latest_minor_versions(
-                bounds.name, lower=bounds.lower, include_lower_bound=include_lower_bound
-            )
-        )
-        for bounds in packages
+        bounds.name: versions for bounds, versions in zip(packages, results) if versions is not None
     }
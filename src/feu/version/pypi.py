@@ -3,12 +3,18 @@ r"""Contain PyPI utility functions."""
 from __future__ import annotations
 
 __all__ = [
+    "ReleaseIndex",
+    "fetch_pypi_last_serial",
     "fetch_pypi_pinned_dependency_version",
+    "fetch_pypi_release_index",
     "fetch_pypi_requires_python",
+    "fetch_pypi_upload_times",
     "fetch_pypi_versions",
     "fetch_pypi_wheel_filenames",
 ]
 
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
 from datetime import date, datetime
 from functools import lru_cache
 
@@ -47,6 +53,75 @@ def _release_date(files: list[dict] | None) -> date | None:
     return min(datetime.fromisoformat(t.replace("Z", "+00:00")) for t in upload_times).date()
 
 
+def _last_upload_time(files: list[dict] | None) -> str | None:
+    r"""Get the upload time of the most recently uploaded file of a
+    release.
+
+    The time is returned as a UTC ISO 8601 string with a fixed
+    microsecond precision, so that two upload times can be compared as
+    strings.
+    """
+    upload_times = [
+        file["upload_time_iso_8601"] for file in (files or []) if file.get("upload_time_iso_8601")
+    ]
+    if not upload_times:
+        return None
+    return max(datetime.fromisoformat(t.replace("Z", "+00:00")) for t in upload_times).isoformat(
+        timespec="microseconds"
+    )
+
+
+@lru_cache
+def fetch_pypi_last_serial(package: str) -> int:
+    r"""Get the last serial of a package on PyPI.
+
+    The serial is a counter incremented by PyPI on every change to the
+    package (e.g. a new release, a new file, or a yanked release), so
+    two equal serials mean that the package did not change.
+
+    Args:
+        package: The package name.
+
+    Returns:
+        The last serial of the package.
+
+    Example:
+        ```pycon
+        >>> from feu.version import fetch_pypi_last_serial
+        >>> serial = fetch_pypi_last_serial("requests")  # doctest: +SKIP
+
+        ```
+    """
+    metadata = fetch_data(url=f"https://pypi.org/pypi/{package}/json", timeout=10)
+    return metadata["last_serial"]
+
+
+@lru_cache
+def fetch_pypi_upload_times(package: str) -> dict[str, str | None]:
+    r"""Get the upload time of the most recently uploaded file of each
+    release of a package on PyPI.
+
+    Args:
+        package: The package name.
+
+    Returns:
+        A dictionary mapping each release version string to the UTC
+            ISO 8601 upload time of its most recent file (e.g.
+            ``"2024-05-29T15:00:00.000000+00:00"``), or ``None`` if the
+            release has no files. The upload times have a fixed
+            format, so they can be compared as strings.
+
+    Example:
+        ```pycon
+        >>> from feu.version import fetch_pypi_upload_times
+        >>> mapping = fetch_pypi_upload_times("requests")  # doctest: +SKIP
+
+        ```
+    """
+    metadata = fetch_data(url=f"https://pypi.org/pypi/{package}/json", timeout=10)
+    return {version: _last_upload_time(files) for version, files in metadata["releases"].items()}
+
+
 @lru_cache
 def fetch_pypi_requires_python(package: str) -> dict[str, str | None]:
     r"""Get the ``requires_python`` specifier for each release of a
@@ -152,6 +227,116 @@ def fetch_pypi_pinned_dependency_version(package: str, version: str, dependency:
     return None
 
 
+@dataclass(frozen=True)
+class ReleaseIndex:
+    r"""Precomputed, date-sorted index of the releases of a package on
+    PyPI.
+
+    The index is built once per package from the PyPI JSON metadata, so
+    that the upload timestamps are parsed only once and any release-date
+    window query is answered by bisection instead of a scan of every
+    release.
+
+    Args:
+        versions: All the release version strings, in the order
+            returned by PyPI.
+        yanked: The release version strings that are yanked.
+        dated_versions: The release version strings that have at least
+            one uploaded file, sorted by release date.
+        dates: The release date of each entry in ``dated_versions``,
+            sorted in ascending order.
+
+    Example:
+        ```pycon
+        >>> from datetime import date
+        >>> from feu.version import ReleaseIndex
+        >>> index = ReleaseIndex(
+        ...     versions=("1.0.0", "1.1.0", "2.0.0"),
+        ...     yanked=frozenset(),
+        ...     dated_versions=("1.0.0", "1.1.0", "2.0.0"),
+        ...     dates=(date(2023, 6, 15), date(2024, 1, 10), date(2025, 1, 5)),
+        ... )
+        >>> index.between(start=date(2024, 1, 1))
+        ('1.1.0', '2.0.0')
+
+        ```
+    """
+
+    versions: tuple[str, ...]
+    yanked: frozenset[str]
+    dated_versions: tuple[str, ...]
+    dates: tuple[date, ...]
+
+    @classmethod
+    def from_releases(cls, releases: dict[str, list[dict] | None]) -> ReleaseIndex:
+        r"""Build the index from the ``releases`` field of the PyPI JSON
+        metadata.
+
+        Args:
+            releases: Mapping of release version string to its list of
+                files.
+
+        Returns:
+            The release index.
+        """
+        dated = []
+        for version, files in releases.items():
+            released = _release_date(files)
+            if released is not None:
+                dated.append((released, version))
+        dated.sort(key=lambda item: item[0])
+        return cls(
+            versions=tuple(releases),
+            yanked=frozenset(version for version, files in releases.items() if _is_yanked(files)),
+            dated_versions=tuple(version for _, version in dated),
+            dates=tuple(released for released, _ in dated),
+        )
+
+    def between(
+        self, start: date | str | None = None, end: date | str | None = None
+    ) -> tuple[str, ...]:
+        r"""Get the versions released within a date window.
+
+        Releases without any uploaded file have no release date, and
+        are never returned.
+
+        Args:
+            start: If specified, only the versions released on or
+                after this date are returned.
+            end: If specified, only the versions released on or before
+                this date are returned.
+
+        Returns:
+            The versions released within the window, sorted by release
+                date.
+        """
+        lo = 0 if start is None else bisect_left(self.dates, _to_date(start))
+        hi = len(self.dates) if end is None else bisect_right(self.dates, _to_date(end))
+        return self.dated_versions[lo:hi]
+
+
+@lru_cache
+def fetch_pypi_release_index(package: str) -> ReleaseIndex:
+    r"""Get the date-sorted release index of a package on PyPI.
+
+    Args:
+        package: The package name.
+
+    Returns:
+        The release index of the package.
+
+    Example:
+        ```pycon
+        >>> from feu.version import fetch_pypi_release_index
+        >>> index = fetch_pypi_release_index("requests")  # doctest: +SKIP
+        >>> versions = index.between(start="2024-01-01")  # doctest: +SKIP
+
+        ```
+    """
+    metadata = fetch_data(url=f"https://pypi.org/pypi/{package}/json", timeout=10)
+    return ReleaseIndex.from_releases(metadata["releases"])
+
+
 @lru_cache
 def fetch_pypi_versions(
     package: str,
@@ -192,22 +377,11 @@ def fetch_pypi_versions(
 
         ```
     """
-    metadata = fetch_data(url=f"https://pypi.org/pypi/{package}/json", timeout=10)
-    releases = metadata["releases"]
-    if ignore_yanked:
-        releases = {version: files for version, files in releases.items() if not _is_yanked(files)}
-    versions = releases.keys()
+    index = fetch_pypi_release_index(package)
     if start_date is not None or end_date is not None:
-        start = _to_date(start_date) if start_date is not None else None
-        end = _to_date(end_date) if end_date is not None else None
-        versions = []
-        for version, files in releases.items():
-            released = _release_date(files)
-            if released is None:
-                continue
-            if start is not None and released < start:
-                continue
-            if end is not None and released > end:
-                continue
-            versions.append(version)
+        versions = index.between(start=start_date, end=end_date)
+    else:
+        versions = index.versions
+    if ignore_yanked:
+        versions = [version for version in versions if version not in index.yanked]
     return tuple(sorted(versions, reverse=reverse))
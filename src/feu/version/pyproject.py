@@ -3,6 +3,7 @@ r"""Utilities for reading package version bounds from pyproject.toml."""
 from __future__ import annotations
 
 __all__ = [
+    "PyprojectDocument",
     "read_pyproject_dependencies",
     "read_pyproject_optional_dependencies",
     "read_pyproject_package_bounds",
@@ -10,6 +11,7 @@ __all__ = [
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from feu.version.bound import PackageBounds, normalize_package_name
 
@@ -20,6 +22,188 @@ else:  # pragma: no cover
 
 from packaging.requirements import Requirement
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+DEPENDENCIES_SECTION = "project.dependencies"
+OPTIONAL_DEPENDENCIES_PREFIX = "project.optional-dependencies."
+DEPENDENCY_GROUPS_PREFIX = "dependency-groups."
+
+
+class PyprojectDocument:
+    r"""Implement a parsed ``pyproject.toml`` document, indexed by
+    package name and section.
+
+    The TOML content and all the requirement strings are parsed once,
+    when the document is created. The bounds are then indexed by
+    normalized package name and by section, so the queries do not need
+    to re-read or re-parse the file.
+
+    The following standard sections are parsed, in this order:
+
+    - ``[project.dependencies]``
+    - ``[project.optional-dependencies.*]``
+    - ``[dependency-groups.*]``
+
+    Args:
+        bounds: The bounds of every dependency declared in the
+            document, in the order they appear in the file.
+        path: The path of the parsed file, if any.
+
+    Example:
+        ```pycon
+        >>> from feu.version import PyprojectDocument
+        >>> doc = PyprojectDocument.from_dict(
+        ...     {
+        ...         "project": {
+        ...             "dependencies": ["numpy>=1.21,<2.0"],
+        ...             "optional-dependencies": {"dev": ["pytest>=7.0"]},
+        ...         }
+        ...     }
+        ... )
+        >>> doc.dependencies()
+        [PackageBounds(name='numpy', lower='1.21', upper='2.0', section='project.dependencies')]
+        >>> doc.package_bounds("PyTest")
+        [PackageBounds(name='pytest', lower='7.0', upper=None, section='project.optional-dependencies.dev')]
+
+        ```
+    """
+
+    def __init__(self, bounds: Sequence[PackageBounds], path: Path | None = None) -> None:
+        self._bounds = tuple(bounds)
+        self._path = path
+        self._by_name: dict[str, list[PackageBounds]] = {}
+        self._by_section: dict[str, list[PackageBounds]] = {}
+        for item in self._bounds:
+            self._by_name.setdefault(normalize_package_name(item.name), []).append(item)
+            self._by_section.setdefault(item.section, []).append(item)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(path={self._path}, num_bounds={len(self._bounds)})"
+
+    @property
+    def bounds(self) -> tuple[PackageBounds, ...]:
+        r"""The bounds of every dependency, in file order."""
+        return self._bounds
+
+    @property
+    def path(self) -> Path | None:
+        r"""The path of the parsed file, or ``None`` if the document
+        was not read from a file."""
+        return self._path
+
+    @property
+    def sections(self) -> tuple[str, ...]:
+        r"""The sections with at least one dependency, in file
+        order."""
+        return tuple(self._by_section)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], path: Path | None = None) -> PyprojectDocument:
+        r"""Create a document from the already decoded TOML content.
+
+        Args:
+            data: The decoded TOML content.
+            path: The path of the file the content was read from, if
+                any.
+
+        Returns:
+            The parsed document.
+        """
+        bounds = _parse_dependencies(data)
+        bounds.extend(_parse_optional_dependencies(data))
+        bounds.extend(_parse_dependency_groups(data))
+        return cls(bounds, path=path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> PyprojectDocument:
+        r"""Read and parse a ``pyproject.toml`` file.
+
+        Args:
+            path: Path to the ``pyproject.toml`` file.
+
+        Returns:
+            The parsed document.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            tomllib.TOMLDecodeError: If the file is not valid TOML.
+        """
+        path = Path(path)
+        return cls.from_dict(_load_toml(path), path=path)
+
+    @classmethod
+    def load_many(cls, paths: Iterable[str | Path]) -> dict[Path, PyprojectDocument]:
+        r"""Read and parse several ``pyproject.toml`` files, e.g. all
+        the packages of a monorepo.
+
+        Args:
+            paths: The paths to the ``pyproject.toml`` files.
+
+        Returns:
+            A dictionary mapping each path to its parsed document, in
+                the order of ``paths``.
+
+        Raises:
+            FileNotFoundError: If a file does not exist.
+            tomllib.TOMLDecodeError: If a file is not valid TOML.
+        """
+        return {Path(path): cls.load(path) for path in paths}
+
+    def dependencies(self) -> list[PackageBounds]:
+        r"""Get the bounds of the packages defined in
+        ``[project.dependencies]``.
+
+        Returns:
+            A list of ``PackageBounds`` instances, in file order.
+        """
+        return list(self._by_section.get(DEPENDENCIES_SECTION, []))
+
+    def optional_dependencies(self) -> list[PackageBounds]:
+        r"""Get the bounds of the packages defined in all the groups of
+        ``[project.optional-dependencies]``.
+
+        Returns:
+            A list of ``PackageBounds`` instances, in file order.
+        """
+        return [
+            item
+            for section, items in self._by_section.items()
+            if section.startswith(OPTIONAL_DEPENDENCIES_PREFIX)
+            for item in items
+        ]
+
+    def section_bounds(self, section: str) -> list[PackageBounds]:
+        r"""Get the bounds of the packages defined in a section.
+
+        Args:
+            section: The section label, e.g.
+                ``'project.optional-dependencies.dev'``.
+
+        Returns:
+            A list of ``PackageBounds`` instances, in file order.
+                Returns an empty list if the section is absent or
+                empty.
+        """
+        return list(self._by_section.get(section, []))
+
+    def package_bounds(self, package: str) -> list[PackageBounds]:
+        r"""Get the bounds of a package in all the sections.
+
+        The package name comparison is case-insensitive and treats
+        hyphens and underscores as equivalent, following PEP 508
+        normalisation rules.
+
+        Args:
+            package: The name of the package to look up.
+
+        Returns:
+            A list of ``PackageBounds`` instances, one per occurrence
+                of the package across all sections. Returns an empty
+                list if the package is not found.
+        """
+        return list(self._by_name.get(normalize_package_name(package), []))
+
 
 def read_pyproject_dependencies(path: str | Path) -> list[PackageBounds]:
     """Read a ``pyproject.toml`` file and return the bounds for all
@@ -44,15 +228,9 @@ def read_pyproject_dependencies(path: str | Path) -> list[PackageBounds]:
             print(b.name, b.lower, b.upper)
         ```
     """
-    path = Path(path)
-    with path.open("rb") as f:
-        data = tomllib.load(f)
-
-    return [
-        bounds
-        for spec in data.get("project", {}).get("dependencies", [])
-        if (bounds := _parse_bounds_from_spec(spec, "project.dependencies")) is not None
-    ]
+    # Only the requested section is parsed, so a malformed requirement
+    # in another section does not raise
+    return _parse_dependencies(_load_toml(path))
 
 
 def read_pyproject_optional_dependencies(path: str | Path) -> list[PackageBounds]:
@@ -82,17 +260,7 @@ def read_pyproject_optional_dependencies(path: str | Path) -> list[PackageBounds
             print(b.name, b.section, b.lower, b.upper)
         ```
     """
-    path = Path(path)
-    with path.open("rb") as f:
-        data = tomllib.load(f)
-
-    return [
-        bounds
-        for group, specs in data.get("project", {}).get("optional-dependencies", {}).items()
-        for spec in specs
-        if (bounds := _parse_bounds_from_spec(spec, f"project.optional-dependencies.{group}"))
-        is not None
-    ]
+    return _parse_optional_dependencies(_load_toml(path))
 
 
 def read_pyproject_package_bounds(
@@ -131,39 +299,50 @@ def read_pyproject_package_bounds(
             print(b.section, b.lower, b.upper)
         ```
     """
-    path = Path(path)
-    with path.open("rb") as f:
-        data = tomllib.load(f)
-
-    normalized_package = normalize_package_name(package)
-    results: list[PackageBounds] = []
-
-    # [project.dependencies]
-    for spec in data.get("project", {}).get("dependencies", []):
-        bounds = _parse_bounds(spec, normalized_package, "project.dependencies")
-        if bounds is not None:
-            results.append(bounds)
-
-    # [project.optional-dependencies.*]
-    for group, specs in data.get("project", {}).get("optional-dependencies", {}).items():
-        for spec in specs:
-            bounds = _parse_bounds(
-                spec, normalized_package, f"project.optional-dependencies.{group}"
-            )
-            if bounds is not None:
-                results.append(bounds)
-
-    # [dependency-groups.*]
-    for group, entries in data.get("dependency-groups", {}).items():
-        for entry in entries:
-            if not isinstance(entry, str):
-                # Skip {include-group = "..."} dicts (PEP 735)
-                continue
-            bounds = _parse_bounds(entry, normalized_package, f"dependency-groups.{group}")
-            if bounds is not None:
-                results.append(bounds)
-
-    return results
+    return PyprojectDocument.load(path).package_bounds(package)
+
+
+def _load_toml(path: str | Path) -> dict[str, Any]:
+    r"""Read and decode a TOML file.
+
+    Args:
+        path: The path to the TOML file.
+
+    Returns:
+        The decoded TOML content.
+    """
+    with Path(path).open("rb") as f:
+        return tomllib.load(f)
+
+
+def _parse_dependencies(data: Mapping[str, Any]) -> list[PackageBounds]:
+    r"""Parse the bounds of ``[project.dependencies]``, in file order."""
+    return [
+        _parse_bounds_from_spec(spec, DEPENDENCIES_SECTION)
+        for spec in data.get("project", {}).get("dependencies", [])
+    ]
+
+
+def _parse_optional_dependencies(data: Mapping[str, Any]) -> list[PackageBounds]:
+    r"""Parse the bounds of all the groups of
+    ``[project.optional-dependencies]``, in file order."""
+    return [
+        _parse_bounds_from_spec(spec, f"{OPTIONAL_DEPENDENCIES_PREFIX}{group}")
+        for group, specs in data.get("project", {}).get("optional-dependencies", {}).items()
+        for spec in specs
+    ]
+
+
+def _parse_dependency_groups(data: Mapping[str, Any]) -> list[PackageBounds]:
+    r"""Parse the bounds of all the groups of ``[dependency-groups]``,
+    in file order."""
+    return [
+        _parse_bounds_from_spec(entry, f"{DEPENDENCY_GROUPS_PREFIX}{group}")
+        for group, entries in data.get("dependency-groups", {}).items()
+        for entry in entries
+        # Skip {include-group = "..."} dicts (PEP 735)
+        if isinstance(entry, str)
+    ]
 
 
 def _parse_bounds_from_spec(spec: str, section: str) -> PackageBounds:
@@ -186,24 +365,3 @@ def _parse_bounds_from_spec(spec: str, section: str) -> PackageBounds:
         None,
     )
     return PackageBounds(name=req.name, lower=lower, upper=upper, section=section)
-
-
-def _parse_bounds(
-    spec: str,
-    normalized_package: str,
-    section: str,
-) -> PackageBounds | None:
-    """Parse a PEP 508 dependency specifier and return bounds if it
-    matches the package.
-
-    Args:
-        spec: A PEP 508 dependency specifier string.
-        normalized_package: The normalized package name to match against.
-        section: The section label to include in the returned ``PackageBounds``.
-
-    Returns:
-        A ``PackageBounds`` instance if the specifier matches the package,
-        ``None`` otherwise.
-    """
-    bounds = _parse_bounds_from_spec(spec, section)
-    return bounds if normalize_package_name(bounds.name) == normalized_package else None
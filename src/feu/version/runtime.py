@@ -2,23 +2,259 @@ r"""Contain functions to manage package versions."""
 
 from __future__ import annotations
 
-__all__ = ["get_package_version", "get_python_major_minor"]
+__all__ = [
+    "InstalledDistributions",
+    "get_installed_distributions",
+    "get_package_version",
+    "get_package_versions",
+    "get_python_major_minor",
+]
 
+import logging
 import sys
 from functools import lru_cache
-from importlib.metadata import PackageNotFoundError, version
+from importlib.metadata import distributions
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from packaging.version import Version
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class InstalledDistributions:
+    r"""Snapshot of the distributions installed in the current
+    environment.
+
+    The environment is scanned once into a mapping from the normalized
+    distribution name to its version, so looking up an installed
+    distribution is a dictionary lookup, without any system call. When
+    a name is missing from the snapshot, the modification times of the
+    search path directories are compared to the ones recorded by the
+    last scan: installing a distribution changes the modification time
+    of its ``site-packages`` directory, and the snapshot is then
+    rebuilt. A distribution upgraded or removed after the scan is only
+    seen after an explicit ``refresh``.
+
+    Like ``importlib.metadata.version``, looking up a distribution
+    whose version is not a valid PEP 440 version raises
+    ``InvalidVersion``.
+
+    Names are normalized with PEP 503 rules, so ``"Scikit_Learn"`` and
+    ``"scikit-learn"`` refer to the same distribution. When a
+    distribution is installed several times, the first one on the search
+    path wins, like ``importlib.metadata.version``.
+
+    Args:
+        paths: The directories to scan. If ``None``, ``sys.path`` is
+            used, and changes to ``sys.path`` also invalidate the
+            snapshot.
+
+    Example:
+        ```pycon
+        >>> from feu.version import InstalledDistributions
+        >>> installed = InstalledDistributions()
+        >>> installed.get("pytest")
+        <Version('...')>
+        >>> installed.get("missing") is None
+        True
+        >>> "PyTest" in installed
+        True
+
+        ```
+    """
+
+    def __init__(self, paths: Sequence[str] | None = None) -> None:
+        self._paths = None if paths is None else tuple(paths)
+        self._fingerprint: tuple[tuple[str, int], ...] | None = None
+        self._versions: dict[str, Version] = {}
+        self._invalid: dict[str, str] = {}
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        name = canonicalize_name(name)
+        self._ensure_scanned((name,))
+        return name in self._versions or name in self._invalid
+
+    def __len__(self) -> int:
+        self._ensure_scanned(())
+        return len(self._versions)
+
+    def __repr__(self) -> str:
+        paths = "sys.path" if self._paths is None else len(self._paths)
+        return f"{self.__class__.__qualname__}(paths={paths})"
+
+    def get(self, name: str) -> Version | None:
+        r"""Get the version of an installed distribution.
+
+        Args:
+            name: The distribution name.
+
+        Returns:
+            The installed version, or ``None`` if the distribution is
+                not installed.
+
+        Raises:
+            InvalidVersion: If the installed version is not a valid
+                PEP 440 version.
+
+        Example:
+            ```pycon
+            >>> from feu.version import InstalledDistributions
+            >>> InstalledDistributions().get("pytest")
+            <Version('...')>
+
+            ```
+        """
+        name = canonicalize_name(name)
+        self._ensure_scanned((name,))
+        return self._get_version(name)
+
+    def get_many(self, names: Iterable[str]) -> dict[str, Version | None]:
+        r"""Get the versions of several installed distributions.
+
+        The staleness of the snapshot is checked at most once for all
+        the names, and only if one of them is missing.
+
+        Args:
+            names: The distribution names.
+
+        Returns:
+            A dictionary mapping each given name to its installed
+                version, or ``None`` if it is not installed.
+
+        Raises:
+            InvalidVersion: If the installed version of one of the
+                distributions is not a valid PEP 440 version.
+
+        Example:
+            ```pycon
+            >>> from feu.version import InstalledDistributions
+            >>> InstalledDistributions().get_many(["pytest", "missing"])
+            {'pytest': <Version('...')>, 'missing': None}
+
+            ```
+        """
+        keys = {name: canonicalize_name(name) for name in names}
+        self._ensure_scanned(keys.values())
+        return {name: self._get_version(key) for name, key in keys.items()}
+
+    def refresh(self) -> None:
+        r"""Rescan the environment, even if the snapshot is not stale.
+
+        Example:
+            ```pycon
+            >>> from feu.version import InstalledDistributions
+            >>> installed = InstalledDistributions()
+            >>> installed.refresh()
+
+            ```
+        """
+        paths = self._get_paths()
+        fingerprint = _compute_fingerprint(paths)
+        versions = {}
+        invalid = {}
+        for dist in distributions(path=list(paths)):
+            name = dist.metadata["Name"]
+            if not name:
+                continue
+            name = canonicalize_name(name)
+            if name in versions or name in invalid:
+                continue
+            try:
+                versions[name] = Version(dist.version)
+            except InvalidVersion:
+                logger.debug(f"the version of {name} is invalid: {dist.version}")
+                invalid[name] = dist.version
+        self._versions = versions
+        self._invalid = invalid
+        self._fingerprint = fingerprint
+
+    def to_dict(self) -> dict[str, Version]:
+        r"""Return the snapshot as a dictionary.
+
+        The distributions with an invalid version are not included.
+
+        Returns:
+            A dictionary mapping the normalized distribution names to
+                their installed versions.
+
+        Example:
+            ```pycon
+            >>> from feu.version import InstalledDistributions
+            >>> InstalledDistributions().to_dict()["pytest"]
+            <Version('...')>
+
+            ```
+        """
+        self._ensure_scanned(())
+        return dict(self._versions)
+
+    def _get_paths(self) -> tuple[str, ...]:
+        return tuple(sys.path) if self._paths is None else self._paths
+
+    def _ensure_scanned(self, names: Iterable[str]) -> None:
+        r"""Scan the environment if it was never scanned, or if one of
+        the normalized names is missing and the snapshot is stale."""
+        if self._fingerprint is None or (
+            any(name not in self._versions and name not in self._invalid for name in names)
+            and self._fingerprint != _compute_fingerprint(self._get_paths())
+        ):
+            self.refresh()
+
+    def _get_version(self, name: str) -> Version | None:
+        r"""Get the version of a normalized name from the snapshot."""
+        raw = self._invalid.get(name)
+        if raw is not None:
+            # Raise InvalidVersion, like a direct lookup of the version
+            return Version(raw)
+        return self._versions.get(name)
+
+
+def get_installed_distributions() -> InstalledDistributions:
+    r"""Return the snapshot of the distributions installed in the
+    current environment.
+
+    The snapshot is created on the first call and reused on all
+    subsequent calls (singleton pattern).
+
+    Returns:
+        A singleton ``InstalledDistributions`` scanning ``sys.path``.
+
+    Example:
+        ```pycon
+        >>> from feu.version import get_installed_distributions
+        >>> get_installed_distributions().get("pytest")
+        <Version('...')>
+
+        ```
+    """
+    if not hasattr(get_installed_distributions, "_installed"):
+        get_installed_distributions._installed = InstalledDistributions()
+    return get_installed_distributions._installed
 
 
 def get_package_version(package: str) -> Version | None:
     r"""Get the package version.
 
+    The version is read from the snapshot returned by
+    ``get_installed_distributions``.
+
     Args:
         package: The package name.
 
     Returns:
-        The package version.
+        The package version, or ``None`` if the package is not
+            installed.
+
+    Raises:
+        InvalidVersion: If the installed version is not a valid PEP
+            440 version.
 
     Example:
         ```pycon
@@ -28,10 +264,28 @@ def get_package_version(package: str) -> Version | None:
 
         ```
     """
-    try:
-        return Version(version(package))
-    except PackageNotFoundError:
-        return None
+    return get_installed_distributions().get(package)
+
+
+def get_package_versions(packages: Iterable[str]) -> dict[str, Version | None]:
+    r"""Get the versions of several packages.
+
+    Args:
+        packages: The package names.
+
+    Returns:
+        A dictionary mapping each package name to its version, or
+            ``None`` if the package is not installed.
+
+    Example:
+        ```pycon
+        >>> from feu.version import get_package_versions
+        >>> get_package_versions(["pytest", "missing"])
+        {'pytest': <Version('...')>, 'missing': None}
+
+        ```
+    """
+    return get_installed_distributions().get_many(packages)
 
 
 @lru_cache
@@ -49,3 +303,24 @@ def get_python_major_minor() -> str:
         ```
     """
     return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def _compute_fingerprint(paths: Sequence[str]) -> tuple[tuple[str, int], ...]:
+    r"""Compute the modification times of the search path directories.
+
+    Args:
+        paths: The search path entries. Entries that are not
+            directories (e.g. zip files that do not exist) are recorded
+            with a modification time of ``-1``.
+
+    Returns:
+        The ``(path, mtime_ns)`` pairs, in the order of ``paths``.
+    """
+    fingerprint = []
+    for path in paths:
+        try:
+            mtime_ns = Path(path or ".").stat().st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        fingerprint.append((path, mtime_ns))
+    return tuple(fingerprint)
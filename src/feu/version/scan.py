@@ -0,0 +1,377 @@
+r"""Contain utilities to scan the ``pyproject.toml`` files of a
+directory tree, e.g. a monorepo, and merge their package bounds."""
+
+from __future__ import annotations
+
+__all__ = [
+    "DEFAULT_EXCLUDED_DIRS",
+    "PyprojectScanner",
+    "find_pyproject_files",
+    "merge_package_bounds",
+    "scan_package_bounds",
+]
+
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from packaging.version import Version
+
+from feu.utils.io import load_json, save_json
+from feu.version.bound import PackageBounds, normalize_package_name
+from feu.version.pyproject import PyprojectDocument
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    import tomli as tomllib
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+DEFAULT_EXCLUDED_DIRS = frozenset(
+    {"__pycache__", "build", "dist", "node_modules", "site-packages", "venv"}
+)
+
+MERGE_MODES = ("tightest", "loosest")
+
+_CACHE_FORMAT_VERSION = 1
+
+
+class _CacheEntry(NamedTuple):
+    r"""Store the parsed bounds of one file, with the fingerprint used
+    to detect whether the file changed since it was parsed."""
+
+    mtime_ns: int
+    size: int
+    sha256: str
+    bounds: tuple[PackageBounds, ...] | None
+
+
+class PyprojectScanner:
+    r"""Implement a scanner that parses all the ``pyproject.toml`` files
+    of a directory tree in a thread or process pool.
+
+    The parsed bounds are cached per file, keyed by the file
+    modification time and size, then by the SHA-256 hash of its
+    content. A rescan only re-parses the files that changed since the
+    previous scan. The cache can be persisted to a JSON file, so that
+    incremental rescans also work across processes, e.g. CLI calls.
+
+    Args:
+        max_workers: The maximum number of workers used to parse the
+            files. ``1`` parses the files sequentially in the calling
+            thread, and ``None`` uses the executor default.
+        use_processes: If ``True``, the files are parsed in a process
+            pool instead of a thread pool.
+        exclude: The directory names that are not walked into. Hidden
+            directories (starting with ``.``) are never walked into.
+        cache_path: An optional path to a JSON file used to persist
+            the cache. The cache is loaded from this file if it
+            exists, and saved after every scan.
+
+    Example:
+        ```pycon
+        >>> import tempfile
+        >>> from pathlib import Path
+        >>> from feu.version import PyprojectScanner
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     path = Path(tmpdir).joinpath("pkg", "pyproject.toml")
+        ...     path.parent.mkdir()
+        ...     _ = path.write_text('[project]\ndependencies = ["numpy>=1.21,<2.0"]\n')
+        ...     scanner = PyprojectScanner(max_workers=1)
+        ...     docs = scanner.scan(tmpdir)
+        ...     [doc.dependencies() for doc in docs.values()]
+        ...
+        [[PackageBounds(name='numpy', lower='1.21', upper='2.0', section='project.dependencies')]]
+
+        ```
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        exclude: Iterable[str] = DEFAULT_EXCLUDED_DIRS,
+        cache_path: str | Path | None = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self._use_processes = use_processes
+        self._exclude = frozenset(exclude)
+        self._cache_path = Path(cache_path) if cache_path is not None else None
+        self._entries: dict[Path, _CacheEntry] = {}
+        if self._cache_path is not None and self._cache_path.is_file():
+            self._entries = _decode_cache(load_json(self._cache_path))
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(max_workers={self._max_workers}, "
+            f"use_processes={self._use_processes}, cache_path={self._cache_path})"
+        )
+
+    def scan(self, root: str | Path) -> dict[Path, PyprojectDocument]:
+        r"""Scan a directory tree and parse its ``pyproject.toml`` files.
+
+        Args:
+            root: The root directory to scan.
+
+        Returns:
+            A dictionary mapping the absolute path of each
+                ``pyproject.toml`` file to its parsed document, sorted
+                by path.
+
+        Raises:
+            tomllib.TOMLDecodeError: If a file is not valid TOML.
+        """
+        root = Path(root).resolve()
+        paths = find_pyproject_files(root, exclude=self._exclude)
+
+        stale: list[Path] = []
+        for path in paths:
+            entry = self._entries.get(path)
+            stat = path.stat()
+            if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+                stale.append(path)
+
+        previous = [self._entries[p].sha256 if p in self._entries else None for p in stale]
+        for path, entry in zip(stale, self._map(_read_entry, stale, previous)):
+            # A missing ``bounds`` means the content is unchanged, only the
+            # file metadata changed.
+            self._entries[path] = (
+                entry
+                if entry.bounds is not None
+                else entry._replace(bounds=self._entries[path].bounds)
+            )
+
+        found = set(paths)
+        self._entries = {
+            path: entry
+            for path, entry in self._entries.items()
+            if path in found or not path.is_relative_to(root)
+        }
+        if self._cache_path is not None:
+            save_json(_encode_cache(self._entries), self._cache_path, exist_ok=True)
+        return {path: PyprojectDocument(self._entries[path].bounds, path=path) for path in paths}
+
+    def _map(self, fn: Any, *iterables: Iterable[Any]) -> list[Any]:
+        r"""Apply a function to the items of the iterables, in the
+        configured pool."""
+        if self._max_workers == 1:
+            return list(map(fn, *iterables))
+        executor_cls = ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor
+        with executor_cls(max_workers=self._max_workers) as executor:
+            return list(executor.map(fn, *iterables))
+
+
+def find_pyproject_files(
+    root: str | Path, exclude: Iterable[str] = DEFAULT_EXCLUDED_DIRS
+) -> list[Path]:
+    r"""Find all the ``pyproject.toml`` files in a directory tree.
+
+    Args:
+        root: The root directory to walk.
+        exclude: The directory names that are not walked into. Hidden
+            directories (starting with ``.``) are never walked into.
+
+    Returns:
+        The sorted list of paths to the ``pyproject.toml`` files.
+
+    Example:
+        ```pycon
+        >>> from feu.version import find_pyproject_files
+        >>> paths = find_pyproject_files(".")  # doctest: +SKIP
+
+        ```
+    """
+    exclude = frozenset(exclude)
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in exclude]
+        if "pyproject.toml" in filenames:
+            paths.append(Path(dirpath).joinpath("pyproject.toml"))
+    return sorted(paths)
+
+
+def merge_package_bounds(
+    packages: Iterable[PackageBounds], mode: str = "tightest"
+) -> list[PackageBounds]:
+    r"""Merge the bounds of each package into a single envelope.
+
+    The packages are grouped by normalized name. In ``"tightest"``
+    mode, the merged bounds are the intersection of the bounds: the
+    highest lower bound and the lowest upper bound. In ``"loosest"``
+    mode, they are the union envelope: the lowest lower bound and the
+    highest upper bound, where a missing bound on any entry leaves the
+    merged bound unconstrained. A ``"tightest"`` merge of conflicting
+    bounds can produce a lower bound above the upper bound.
+
+    Args:
+        packages: The package bounds to merge.
+        mode: The merge mode, either ``"tightest"`` or ``"loosest"``.
+
+    Returns:
+        One ``PackageBounds`` per package, in order of first
+            occurrence. The name is the first name seen for the
+            package, and the section is the comma-separated list of
+            the merged sections.
+
+    Raises:
+        ValueError: If ``mode`` is not valid.
+
+    Example:
+        ```pycon
+        >>> from feu.version import PackageBounds, merge_package_bounds
+        >>> packages = [
+        ...     PackageBounds(name="numpy", lower="1.21", upper="2.0", section="a"),
+        ...     PackageBounds(name="NumPy", lower="1.24", upper=None, section="b"),
+        ... ]
+        >>> merge_package_bounds(packages)
+        [PackageBounds(name='numpy', lower='1.24', upper='2.0', section='a,b')]
+        >>> merge_package_bounds(packages, mode="loosest")
+        [PackageBounds(name='numpy', lower='1.21', upper=None, section='a,b')]
+
+        ```
+    """
+    if mode not in MERGE_MODES:
+        msg = f"Incorrect mode {mode!r}. The valid modes are: {MERGE_MODES}"
+        raise ValueError(msg)
+    groups: dict[str, list[PackageBounds]] = {}
+    for bounds in packages:
+        groups.setdefault(normalize_package_name(bounds.name), []).append(bounds)
+    tightest = mode == "tightest"
+    return [
+        PackageBounds(
+            name=items[0].name,
+            lower=_merge_bound(
+                [b.lower for b in items], pick=max if tightest else min, strict=not tightest
+            ),
+            upper=_merge_bound(
+                [b.upper for b in items], pick=min if tightest else max, strict=not tightest
+            ),
+            section=",".join(dict.fromkeys(b.section for b in items)),
+        )
+        for items in groups.values()
+    ]
+
+
+def scan_package_bounds(
+    root: str | Path,
+    mode: str = "tightest",
+    max_workers: int | None = None,
+    use_processes: bool = False,
+    cache_path: str | Path | None = None,
+) -> list[PackageBounds]:
+    r"""Scan the ``pyproject.toml`` files of a directory tree and merge
+    the bounds of each package across all the files.
+
+    Args:
+        root: The root directory to scan.
+        mode: The merge mode, either ``"tightest"`` or ``"loosest"``.
+            See ``merge_package_bounds``.
+        max_workers: The maximum number of workers used to parse the
+            files.
+        use_processes: If ``True``, the files are parsed in a process
+            pool instead of a thread pool.
+        cache_path: An optional path to a JSON file used to persist
+            the parsing cache across calls.
+
+    Returns:
+        One merged ``PackageBounds`` per package, in order of first
+            occurrence.
+
+    Raises:
+        ValueError: If ``mode`` is not valid.
+
+    Example:
+        ```pycon
+        >>> from feu.version import scan_package_bounds
+        >>> bounds = scan_package_bounds(".", mode="loosest")  # doctest: +SKIP
+
+        ```
+    """
+    if mode not in MERGE_MODES:
+        msg = f"Incorrect mode {mode!r}. The valid modes are: {MERGE_MODES}"
+        raise ValueError(msg)
+    scanner = PyprojectScanner(
+        max_workers=max_workers, use_processes=use_processes, cache_path=cache_path
+    )
+    documents = scanner.scan(root)
+    return merge_package_bounds(
+        (bounds for doc in documents.values() for bounds in doc.bounds), mode=mode
+    )
+
+
+def _merge_bound(values: list[str | None], pick: Any, strict: bool) -> str | None:
+    r"""Merge a list of optional version bounds.
+
+    Args:
+        values: The bounds to merge. ``None`` means unconstrained.
+        pick: The function used to pick the merged bound among the
+            defined bounds, i.e. ``min`` or ``max``.
+        strict: If ``True``, the merged bound is unconstrained as soon
+            as one of the bounds is unconstrained.
+
+    Returns:
+        The merged bound, or ``None`` if unconstrained.
+    """
+    defined = [value for value in values if value is not None]
+    if not defined or (strict and len(defined) < len(values)):
+        return None
+    return pick(defined, key=Version)
+
+
+def _read_entry(path: Path, previous_sha256: str | None) -> _CacheEntry:
+    r"""Read a ``pyproject.toml`` file and parse its bounds, unless its
+    content hash matches ``previous_sha256``.
+
+    This function is defined at module level so it can be sent to a
+    process pool.
+    """
+    stat = path.stat()
+    content = path.read_bytes()
+    sha256 = hashlib.sha256(content).hexdigest()
+    bounds = None
+    if sha256 != previous_sha256:
+        data = tomllib.loads(content.decode("utf-8"))
+        bounds = PyprojectDocument.from_dict(data, path=path).bounds
+    return _CacheEntry(mtime_ns=stat.st_mtime_ns, size=stat.st_size, sha256=sha256, bounds=bounds)
+
+
+def _encode_cache(entries: dict[Path, _CacheEntry]) -> dict[str, Any]:
+    r"""Encode the cache entries in a JSON-serializable format."""
+    return {
+        "version": _CACHE_FORMAT_VERSION,
+        "files": {
+            str(path): {
+                "mtime_ns": entry.mtime_ns,
+                "size": entry.size,
+                "sha256": entry.sha256,
+                "bounds": [[b.name, b.lower, b.upper, b.section] for b in entry.bounds or ()],
+            }
+            for path, entry in entries.items()
+        },
+    }
+
+
+def _decode_cache(data: dict[str, Any]) -> dict[Path, _CacheEntry]:
+    r"""Decode the cache entries from their JSON-serializable format.
+
+    A cache written in another format version is ignored.
+    """
+    if data.get("version") != _CACHE_FORMAT_VERSION:
+        return {}
+    return {
+        Path(path): _CacheEntry(
+            mtime_ns=entry["mtime_ns"],
+            size=entry["size"],
+            sha256=entry["sha256"],
+            bounds=tuple(
+                PackageBounds(name=name, lower=lower, upper=upper, section=section)
+                for name, lower, upper, section in entry["bounds"]
+            ),
+        )
+        for path, entry in data["files"].items()
+    }
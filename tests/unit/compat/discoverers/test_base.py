@@ -25,3 +25,19 @@ def test_base_compat_discoverer_subclass_can_be_instantiated() -> None:
 
     discoverer = StubDiscoverer()
     assert discoverer.discover("pkg", ()) == {}
+
+
+def test_base_compat_discoverer_discover_incremental_calls_discover() -> None:
+    class StubDiscoverer(BaseCompatDiscoverer):
+        def discover(self, pkg_name, targets) -> dict:  # noqa: ANN001, ARG002
+            return {"pkg": pkg_name}
+
+    assert StubDiscoverer().discover_incremental("pkg", (), baseline=None) == {"pkg": "pkg"}
+
+
+def test_base_compat_discoverer_dependencies_default() -> None:
+    class StubDiscoverer(BaseCompatDiscoverer):
+        def discover(self, pkg_name, targets) -> dict:  # noqa: ANN001, ARG002
+            return {}
+
+    assert StubDiscoverer().dependencies("pkg") == ()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from feu.compat.discoverers import CompatBaseline, CompatBitMatrix
+from feu.compat.discoverers.utils import group_into_ranges
+from feu.compat.registry import VersionRange
+from feu.compat.target import Target
+
+LINUX_311 = Target(python_version="3.11", os="linux", arch="x86_64")
+MACOS_311 = Target(python_version="3.11", os="macos", arch="arm64")
+VERSIONS = ["1.0.0", "1.1.0", "1.2.0", "2.0.0", "2.1.0"]
+
+
+@pytest.fixture
+def matrix() -> CompatBitMatrix:
+    return CompatBitMatrix.from_sets(
+        VERSIONS,
+        {LINUX_311: {"1.0.0", "1.1.0", "2.0.0", "2.1.0"}, MACOS_311: {"1.2.0"}},
+    )
+
+
+#####################################
+#     Tests for CompatBitMatrix     #
+#####################################
+
+
+def test_compat_bit_matrix_repr(matrix: CompatBitMatrix) -> None:
+    assert repr(matrix) == "CompatBitMatrix(versions=5, targets=2)"
+
+
+def test_compat_bit_matrix_versions(matrix: CompatBitMatrix) -> None:
+    assert matrix.versions == tuple(VERSIONS)
+
+
+def test_compat_bit_matrix_targets(matrix: CompatBitMatrix) -> None:
+    assert matrix.targets == (LINUX_311, MACOS_311)
+
+
+def test_compat_bit_matrix_bits(matrix: CompatBitMatrix) -> None:
+    assert matrix.bits(LINUX_311) == 0b11011
+    assert matrix.bits(MACOS_311) == 0b00100
+
+
+def test_compat_bit_matrix_bits_missing_target(matrix: CompatBitMatrix) -> None:
+    with pytest.raises(KeyError):
+        matrix.bits(Target(python_version="3.12", os="linux", arch="x86_64"))
+
+
+def test_compat_bit_matrix_init_ignores_extra_bits() -> None:
+    assert CompatBitMatrix(["1.0.0", "2.0.0"], {LINUX_311: 0b1110}).bits(LINUX_311) == 0b10
+
+
+def test_compat_bit_matrix_from_sets_ignores_unknown_versions() -> None:
+    matrix = CompatBitMatrix.from_sets(["1.0.0", "2.0.0"], {LINUX_311: ["0.5.0", "2.0.0"]})
+    assert matrix.bits(LINUX_311) == 0b10
+
+
+def test_compat_bit_matrix_from_sets_empty() -> None:
+    matrix = CompatBitMatrix.from_sets([], {LINUX_311: set()})
+    assert matrix.bits(LINUX_311) == 0
+    assert matrix.to_ranges() == {LINUX_311: []}
+
+
+def test_compat_bit_matrix_from_ranges() -> None:
+    matrix = CompatBitMatrix.from_ranges(
+        VERSIONS,
+        {
+            LINUX_311: [VersionRange(None, "1.1.0"), VersionRange("2.0.0", None)],
+            MACOS_311: [VersionRange("1.1.5", "1.9.0")],
+        },
+    )
+    assert matrix.bits(LINUX_311) == 0b11011
+    assert matrix.bits(MACOS_311) == 0b00100
+
+
+def test_compat_bit_matrix_from_ranges_outside_versions() -> None:
+    matrix = CompatBitMatrix.from_ranges(
+        VERSIONS, {LINUX_311: [VersionRange("0.1.0", "0.9.0"), VersionRange("3.0.0", None)]}
+    )
+    assert matrix.bits(LINUX_311) == 0
+
+
+def test_compat_bit_matrix_from_ranges_matches_baseline() -> None:
+    rng = random.Random(42)  # noqa: S311
+    versions = [f"{major}.{minor}.0" for major in range(5) for minor in range(8)]
+    for _ in range(50):
+        bounds = sorted(rng.sample(versions, 6), key=lambda v: tuple(map(int, v.split("."))))
+        ranges = [
+            VersionRange(None if rng.random() < 0.2 else low, None if rng.random() < 0.2 else high)
+            for low, high in zip(bounds[::2], bounds[1::2])
+        ]
+        matrix = CompatBitMatrix.from_ranges(versions, {LINUX_311: ranges})
+        baseline = CompatBaseline({LINUX_311: ranges}, processed_versions=versions)
+        assert matrix.compatible_versions(LINUX_311) == [
+            version for version in versions if baseline.is_compatible(version, LINUX_311)
+        ]
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [("1.0.0", True), ("1.2.0", False), ("2.1.0", True), ("3.0.0", False)],
+)
+def test_compat_bit_matrix_is_compatible(
+    matrix: CompatBitMatrix, version: str, expected: bool
+) -> None:
+    assert matrix.is_compatible(version, LINUX_311) == expected
+
+
+def test_compat_bit_matrix_compatible_versions(matrix: CompatBitMatrix) -> None:
+    assert matrix.compatible_versions(LINUX_311) == ["1.0.0", "1.1.0", "2.0.0", "2.1.0"]
+
+
+def test_compat_bit_matrix_ranges(matrix: CompatBitMatrix) -> None:
+    assert matrix.ranges(LINUX_311) == [
+        VersionRange("1.0.0", "1.1.0"),
+        VersionRange("2.0.0", None),
+    ]
+    assert matrix.ranges(MACOS_311) == [VersionRange("1.2.0", "1.2.0")]
+
+
+def test_compat_bit_matrix_ranges_latest(matrix: CompatBitMatrix) -> None:
+    assert matrix.ranges(LINUX_311, latest="3.0.0") == [
+        VersionRange("1.0.0", "1.1.0"),
+        VersionRange("2.0.0", "2.1.0"),
+    ]
+
+
+def test_compat_bit_matrix_ranges_matches_group_into_ranges() -> None:
+    rng = random.Random(42)  # noqa: S311
+    versions = [f"1.{minor}.0" for minor in range(70)]
+    for _ in range(200):
+        compatible = {version for version in versions if rng.random() < 0.6}
+        matrix = CompatBitMatrix.from_sets(versions, {LINUX_311: compatible})
+        assert matrix.ranges(LINUX_311) == group_into_ranges(versions, compatible, versions[-1])
+
+
+def test_compat_bit_matrix_to_ranges(matrix: CompatBitMatrix) -> None:
+    assert matrix.to_ranges() == {
+        LINUX_311: [VersionRange("1.0.0", "1.1.0"), VersionRange("2.0.0", None)],
+        MACOS_311: [VersionRange("1.2.0", "1.2.0")],
+    }
+
+
+def test_compat_bit_matrix_to_ranges_round_trip(matrix: CompatBitMatrix) -> None:
+    assert CompatBitMatrix.from_ranges(VERSIONS, matrix.to_ranges()) == matrix
+
+
+def test_compat_bit_matrix_and(matrix: CompatBitMatrix) -> None:
+    other = CompatBitMatrix(VERSIONS, {LINUX_311: 0b00011, MACOS_311: 0b11111})
+    assert (matrix & other) == CompatBitMatrix(VERSIONS, {LINUX_311: 0b00011, MACOS_311: 0b00100})
+
+
+def test_compat_bit_matrix_or(matrix: CompatBitMatrix) -> None:
+    other = CompatBitMatrix(VERSIONS, {LINUX_311: 0b00100, MACOS_311: 0b00001})
+    assert (matrix | other) == CompatBitMatrix(VERSIONS, {LINUX_311: 0b11111, MACOS_311: 0b00101})
+
+
+def test_compat_bit_matrix_or_different_versions(matrix: CompatBitMatrix) -> None:
+    with pytest.raises(ValueError, match=r"The matrices must have the same versions"):
+        matrix | CompatBitMatrix(VERSIONS[:-1], {LINUX_311: 0, MACOS_311: 0})
+
+
+def test_compat_bit_matrix_and_different_targets(matrix: CompatBitMatrix) -> None:
+    with pytest.raises(ValueError, match=r"The matrices must have the same targets"):
+        matrix & CompatBitMatrix(VERSIONS, {LINUX_311: 0})
+
+
+def test_compat_bit_matrix_select(matrix: CompatBitMatrix) -> None:
+    other = CompatBitMatrix(VERSIONS, {LINUX_311: 0b00100, MACOS_311: 0b11011})
+    mask = matrix.version_mask(["1.0.0", "1.1.0", "1.2.0"])
+    assert matrix.select(mask, other) == CompatBitMatrix(
+        VERSIONS, {LINUX_311: 0b00011, MACOS_311: 0b11100}
+    )
+
+
+def test_compat_bit_matrix_version_mask(matrix: CompatBitMatrix) -> None:
+    assert matrix.version_mask(["1.1.0", "2.1.0", "9.9.9"]) == 0b10010
+
+
+def test_compat_bit_matrix_eq_other_type(matrix: CompatBitMatrix) -> None:
+    assert matrix != "matrix"
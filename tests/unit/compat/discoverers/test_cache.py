@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+import feu
+from feu.compat.discoverers import (
+    BaseCompatDiscoverer,
+    CachedCompatDiscoverer,
+    CompatBaseline,
+    CompatDiscoverer,
+    JaxCompatDiscoverer,
+)
+from feu.compat.registry import VersionRange
+from feu.compat.target import Target
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+LINUX_311 = Target(python_version="3.11", os="linux", arch="x86_64")
+FREE_THREADED_314 = Target(python_version="3.14", free_threaded=True, os="linux", arch="x86_64")
+
+
+class FakeCompatDiscoverer(BaseCompatDiscoverer):
+    r"""Implement a discoverer that counts its discoveries."""
+
+    def __init__(self, fingerprint: str | None = "abc") -> None:
+        self.metadata_fingerprint = fingerprint
+        self.num_calls = 0
+
+    def discover(
+        self,
+        pkg_name: str,  # noqa: ARG002
+        targets: Sequence[Target],
+    ) -> dict[Target, list[VersionRange]]:
+        self.num_calls += 1
+        return {
+            target: [VersionRange("1.0.0", "1.2.0"), VersionRange("2.0.0", None)]
+            for target in targets
+        }
+
+    def fingerprint(self, pkg_name: str) -> str | None:  # noqa: ARG002
+        return self.metadata_fingerprint
+
+
+class OtherCompatDiscoverer(FakeCompatDiscoverer):
+    r"""Implement another discoverer class with the same behavior."""
+
+
+EXPECTED = {
+    LINUX_311: [VersionRange("1.0.0", "1.2.0"), VersionRange("2.0.0", None)],
+    FREE_THREADED_314: [VersionRange("1.0.0", "1.2.0"), VersionRange("2.0.0", None)],
+}
+
+
+############################################
+#     Tests for CachedCompatDiscoverer     #
+############################################
+
+
+def test_cached_compat_discoverer_repr(tmp_path: Path) -> None:
+    assert repr(CachedCompatDiscoverer(CompatDiscoverer(), cache_dir=tmp_path)) == (
+        f"CachedCompatDiscoverer(discoverer=CompatDiscoverer(), cache_dir={tmp_path})"
+    )
+
+
+def test_cached_compat_discoverer_discoverer(tmp_path: Path) -> None:
+    inner = FakeCompatDiscoverer()
+    assert CachedCompatDiscoverer(inner, cache_dir=tmp_path).discoverer is inner
+
+
+def test_cached_compat_discoverer_dependencies(tmp_path: Path) -> None:
+    discoverer = CachedCompatDiscoverer(JaxCompatDiscoverer(), cache_dir=tmp_path)
+    assert discoverer.dependencies("jax") == ("jaxlib",)
+
+
+def test_cached_compat_discoverer_fingerprint(tmp_path: Path) -> None:
+    discoverer = CachedCompatDiscoverer(FakeCompatDiscoverer(), cache_dir=tmp_path)
+    assert discoverer.fingerprint("pkg") == "abc"
+
+
+def test_cached_compat_discoverer_discover_miss(tmp_path: Path) -> None:
+    inner = FakeCompatDiscoverer()
+    discoverer = CachedCompatDiscoverer(inner, cache_dir=tmp_path)
+    assert discoverer.discover("pkg", (LINUX_311, FREE_THREADED_314)) == EXPECTED
+    assert inner.num_calls == 1
+    assert discoverer.cache_path("pkg", (LINUX_311, FREE_THREADED_314)).is_file()
+
+
+def test_cached_compat_discoverer_discover_hit(tmp_path: Path) -> None:
+    inner = FakeCompatDiscoverer()
+    discoverer = CachedCompatDiscoverer(inner, cache_dir=tmp_path)
+    discoverer.discover("pkg", (LINUX_311, FREE_THREADED_314))
+    compat = CachedCompatDiscoverer(inner, cache_dir=tmp_path).discover(
+        "pkg", (LINUX_311, FREE_THREADED_314)
+    )
+    assert compat == EXPECTED
+    assert list(compat) == [LINUX_311, FREE_THREADED_314]
+    assert inner.num_calls == 1
+
+
+def test_cached_compat_discoverer_discover_hit_interns_targets(tmp_path: Path) -> None:
+    discoverer = CachedCompatDiscoverer(FakeCompatDiscoverer(), cache_dir=tmp_path)
+    discoverer.discover("pkg", (LINUX_311,))
+    target = next(iter(discoverer.discover("pkg", (LINUX_311,))))
+    assert target is Target.of(python_version="3.11", os="linux", arch="x86_64")
+
+
+def test_cached_compat_discoverer_discover_fingerprint_changed(tmp_path: Path) -> None:
+    inner = FakeCompatDiscoverer()
+    discoverer = CachedCompatDiscoverer(inner, cache_dir=tmp_path)
+    discoverer.discover("pkg", (LINUX_311,))
+    inner.metadata_fingerprint = "def"
+    discoverer.discover("pkg", (LINUX_311,))
+    assert inner.num_calls == 2
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_cached_compat_discoverer_discover_without_fingerprint(tmp_path: Path) -> None:
+    inner = FakeCompatDiscoverer(fingerprint=None)
+    discoverer = CachedCompatDiscoverer(inner, cache_dir=tmp_path)
+    assert discoverer.cache_path("pkg", (LINUX_311,)) is None
+    discoverer.discover("pkg", (LINUX_311,))
+    discoverer.discover("pkg", (LINUX_311,))
+    assert inner.num_calls == 2
+    assert not tmp_path.exists() or not list(tmp_path.iterdir())
+
+
+def test_cached_compat_discoverer_discover_creates_cache_dir(tmp_path: Path) -> None:
+    cache_dir = tmp_path.joinpath("cache", "discovery")
+    CachedCompatDiscoverer(FakeCompatDiscoverer(), cache_dir=cache_dir).discover(
+        "pkg", (LINUX_311,)
+    )
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        json.dumps({"format_version": 0, "compat": []}),
+        json.dumps({"compat": []}),
+        json.dumps({"format_version": 1, "compat": [["3.11"]]}),
+    ],
+)
+def test_cached_compat_discoverer_discover_invalid_cache_file(tmp_path: Path, content: str) -> None:
+    inner = FakeCompatDiscoverer()
+    discoverer = CachedCompatDiscoverer(inner, cache_dir=tmp_path)
+    path = discoverer.cache_path("pkg", (LINUX_311,))
+    path.write_text(content)
+    assert discoverer.discover("pkg", (LINUX_311,)) == {LINUX_311: EXPECTED[LINUX_311]}
+    assert inner.num_calls == 1
+    # The invalid file is replaced by the new discovery
+    assert json.loads(path.read_text())["format_version"] == 1
+
+
+def test_cached_compat_discoverer_discover_incremental(tmp_path: Path) -> None:
+    inner = FakeCompatDiscoverer()
+    discoverer = CachedCompatDiscoverer(inner, cache_dir=tmp_path)
+    baseline = CompatBaseline({LINUX_311: []}, processed_versions=["1.0.0"])
+    assert discoverer.discover_incremental("pkg", (LINUX_311,), baseline) == {
+        LINUX_311: EXPECTED[LINUX_311]
+    }
+    assert discoverer.discover_incremental("pkg", (LINUX_311,), None) == {
+        LINUX_311: EXPECTED[LINUX_311]
+    }
+    assert inner.num_calls == 1
+
+
+def test_cached_compat_discoverer_cache_path_depends_on_targets(tmp_path: Path) -> None:
+    discoverer = CachedCompatDiscoverer(FakeCompatDiscoverer(), cache_dir=tmp_path)
+    path = discoverer.cache_path("pkg", (LINUX_311,))
+    assert path.parent == tmp_path
+    assert path.suffix == ".json"
+    assert path == discoverer.cache_path("pkg", (LINUX_311,))
+    assert path != discoverer.cache_path("pkg", (LINUX_311, FREE_THREADED_314))
+    assert path != discoverer.cache_path("pkg2", (LINUX_311,))
+
+
+def test_cached_compat_discoverer_cache_path_depends_on_discoverer_class(tmp_path: Path) -> None:
+    assert CachedCompatDiscoverer(FakeCompatDiscoverer(), cache_dir=tmp_path).cache_path(
+        "pkg", (LINUX_311,)
+    ) != CachedCompatDiscoverer(OtherCompatDiscoverer(), cache_dir=tmp_path).cache_path(
+        "pkg", (LINUX_311,)
+    )
+
+
+def test_cached_compat_discoverer_cache_path_depends_on_feu_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    discoverer = CachedCompatDiscoverer(FakeCompatDiscoverer(), cache_dir=tmp_path)
+    path = discoverer.cache_path("pkg", (LINUX_311,))
+    monkeypatch.setattr(feu, "__version__", "999.0.0")
+    assert path != discoverer.cache_path("pkg", (LINUX_311,))
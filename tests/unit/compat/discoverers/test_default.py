@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import itertools
+import random
 from unittest.mock import patch
 
+import pytest
+from packaging.version import Version
+
 from feu.compat.discoverers import CompatDiscoverer
+from feu.compat.discoverers.default import _find_compatible_versions
+from feu.compat.discoverers.utils import WheelTagIndex
 from feu.compat.registry import VersionRange
 from feu.compat.target import Target
+from feu.compat.wheel_tags import WheelTags
 
 MODULE = "feu.compat.discoverers.default"
 
@@ -13,6 +21,19 @@ def test_compat_discoverer_repr() -> None:
     assert repr(CompatDiscoverer()) == "CompatDiscoverer()"
 
 
+def test_compat_discoverer_fingerprint() -> None:
+    wheel_filenames = {"1.0.0": ("pkg-1.0.0-py3-none-any.whl",)}
+    requires_python = {"1.0.0": ">=3.9"}
+    with (
+        patch(f"{MODULE}.fetch_pypi_wheel_filenames", return_value=wheel_filenames),
+        patch(f"{MODULE}.fetch_pypi_requires_python", return_value=requires_python),
+    ):
+        fingerprint = CompatDiscoverer().fingerprint("pkg")
+        assert fingerprint == CompatDiscoverer().fingerprint("pkg")
+        requires_python["1.0.0"] = ">=3.10"
+        assert fingerprint != CompatDiscoverer().fingerprint("pkg")
+
+
 @patch(
     f"{MODULE}.fetch_pypi_wheel_filenames",
     lambda *_args: {
@@ -217,3 +238,69 @@ def test_discover_sdist_only_version_without_pure_python_wheel_is_incompatible()
     linux_311 = Target(python_version="3.11", os="linux", arch="x86_64")
     compat = CompatDiscoverer().discover("pkg", targets=(linux_311,))
     assert compat == {linux_311: [VersionRange("1.0.0", "1.0.0"), VersionRange("2.0.0", None)]}
+
+
+def is_target_compatible_reference(
+    wanted: WheelTags,
+    tags: set[WheelTags],
+    python_compatible: bool,
+    treat_sdist_as_pure_python: bool,
+) -> bool:
+    # Tag-by-tag reference of the matching rules of _find_compatible_versions
+    if not tags:
+        return treat_sdist_as_pure_python and python_compatible
+    for tag in tags:
+        if tag.os is not None and tag.os != wanted.os:
+            continue
+        if tag.arch is not None and tag.arch != wanted.arch:
+            continue
+        if tag.python_version is None:
+            if python_compatible:
+                return True
+            continue
+        if tag.free_threaded != wanted.free_threaded:
+            continue
+        if tag.abi3:
+            if Version(wanted.python_version) < Version(tag.python_version):
+                continue
+            return True
+        if tag.python_version != wanted.python_version:
+            continue
+        return True
+    return False
+
+
+@pytest.mark.parametrize("treat_sdist_as_pure_python", [False, True])
+def test_find_compatible_versions_matches_reference(treat_sdist_as_pure_python: bool) -> None:
+    rng = random.Random(42)  # noqa: S311
+    values = list(
+        itertools.product(
+            [None, "3.9", "3.10", "3.11", "3.12"],
+            [False, True],
+            [None, "linux", "macos"],
+            [None, "x86_64", "arm64"],
+            [False, True],
+        )
+    )
+    tags_by_version = {
+        f"1.{i}.0": {WheelTags(*rng.choice(values)) for _ in range(rng.randint(0, 4))}
+        for i in range(60)
+    }
+    python_compatible_versions = {version for version in tags_by_version if rng.random() < 0.5}
+    index = WheelTagIndex(tags_by_version)
+    for python_version, free_threaded, os, arch in itertools.product(
+        ["3.9", "3.11", "3.13"], [False, True], ["linux", "macos"], ["x86_64", "arm64"]
+    ):
+        wanted = WheelTags(python_version, free_threaded, os, arch)
+        assert _find_compatible_versions(
+            index, wanted, python_compatible_versions, treat_sdist_as_pure_python
+        ) == {
+            version
+            for version, tags in tags_by_version.items()
+            if is_target_compatible_reference(
+                wanted,
+                tags,
+                version in python_compatible_versions,
+                treat_sdist_as_pure_python,
+            )
+        }
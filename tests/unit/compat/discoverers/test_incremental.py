@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import pytest
+
+from feu.compat.discoverers import CompatBaseline, DiscoveryWatermark
+from feu.compat.registry import VersionRange
+from feu.compat.target import Target
+
+LINUX_311 = Target(python_version="3.11", os="linux", arch="x86_64")
+MACOS_311 = Target(python_version="3.11", os="macos", arch="arm64")
+
+########################################
+#     Tests for DiscoveryWatermark     #
+########################################
+
+
+def test_discovery_watermark_from_upload_times() -> None:
+    assert DiscoveryWatermark.from_upload_times(
+        serial=42,
+        upload_times={
+            "1.0.0": "2023-06-15T00:00:00.000000+00:00",
+            "2.0.0rc1": "2024-07-01T00:00:00.000000+00:00",
+            "1.1.0": "2024-01-10T00:00:00.000000+00:00",
+            "1.2.0": None,
+        },
+        versions=["1.0.0", "1.1.0", "1.2.0"],
+    ) == DiscoveryWatermark(
+        serial=42, last_version="1.2.0", last_upload="2024-07-01T00:00:00.000000+00:00"
+    )
+
+
+def test_discovery_watermark_from_upload_times_dependency_serials() -> None:
+    watermark = DiscoveryWatermark.from_upload_times(
+        serial=42, upload_times={}, versions=[], dependency_serials=[("jaxlib", 7)]
+    )
+    assert watermark.dependency_serials == (("jaxlib", 7),)
+
+
+def test_discovery_watermark_dependency_serials_default() -> None:
+    assert (
+        DiscoveryWatermark(serial=42, last_version=None, last_upload=None).dependency_serials == ()
+    )
+
+
+def test_discovery_watermark_from_upload_times_empty() -> None:
+    assert DiscoveryWatermark.from_upload_times(
+        serial=42, upload_times={}, versions=[]
+    ) == DiscoveryWatermark(serial=42, last_version=None, last_upload=None)
+
+
+@pytest.mark.parametrize(
+    ("upload_time", "expected"),
+    [
+        ("2024-01-10T00:00:00.000000+00:00", True),
+        ("2024-06-01T00:00:00.000000+00:00", True),
+        ("2024-06-01T00:00:00.000001+00:00", False),
+        (None, False),
+    ],
+)
+def test_discovery_watermark_is_processed(upload_time: str | None, expected: bool) -> None:
+    watermark = DiscoveryWatermark(
+        serial=42, last_version="2.0.0", last_upload="2024-06-01T00:00:00.000000+00:00"
+    )
+    assert watermark.is_processed(upload_time) == expected
+
+
+def test_discovery_watermark_is_processed_no_upload() -> None:
+    watermark = DiscoveryWatermark(serial=42, last_version=None, last_upload=None)
+    assert not watermark.is_processed("2024-01-10T00:00:00.000000+00:00")
+
+
+####################################
+#     Tests for CompatBaseline     #
+####################################
+
+
+def test_compat_baseline_repr() -> None:
+    assert (
+        repr(CompatBaseline({LINUX_311: []}, processed_versions=["1.0.0", "1.1.0"]))
+        == "CompatBaseline(targets=1, processed_versions=2)"
+    )
+
+
+def test_compat_baseline_processed_versions() -> None:
+    baseline = CompatBaseline({LINUX_311: []}, processed_versions=["1.0.0", "1.1.0", "1.0.0"])
+    assert baseline.processed_versions == frozenset({"1.0.0", "1.1.0"})
+
+
+def test_compat_baseline_is_processed() -> None:
+    baseline = CompatBaseline({LINUX_311: []}, processed_versions=["1.0.0"])
+    assert baseline.is_processed("1.0.0")
+    assert not baseline.is_processed("2.0.0")
+
+
+def test_compat_baseline_ranges() -> None:
+    ranges = [VersionRange("1.0.0", "1.2.0")]
+    assert CompatBaseline({LINUX_311: ranges}, processed_versions=[]).ranges(LINUX_311) == ranges
+
+
+def test_compat_baseline_ranges_missing_target() -> None:
+    baseline = CompatBaseline({LINUX_311: []}, processed_versions=[])
+    with pytest.raises(KeyError):
+        baseline.ranges(MACOS_311)
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [
+        ("0.9.0", False),
+        ("1.0.0", True),
+        ("1.0.5", True),
+        ("1.1.0", True),
+        ("1.5.0", False),
+        ("2.0.0", True),
+        ("3.0.0", True),
+    ],
+)
+def test_compat_baseline_is_compatible(version: str, expected: bool) -> None:
+    baseline = CompatBaseline(
+        {LINUX_311: [VersionRange("1.0.0", "1.1.0"), VersionRange("2.0.0", None)]},
+        processed_versions=[],
+    )
+    assert baseline.is_compatible(version, LINUX_311) == expected
+
+
+def test_compat_baseline_is_compatible_unbounded_min() -> None:
+    baseline = CompatBaseline({LINUX_311: [VersionRange(None, "1.1.0")]}, processed_versions=[])
+    assert baseline.is_compatible("0.1.0", LINUX_311)
+    assert not baseline.is_compatible("1.2.0", LINUX_311)
+
+
+def test_compat_baseline_is_compatible_no_ranges() -> None:
+    baseline = CompatBaseline({LINUX_311: []}, processed_versions=[])
+    assert not baseline.is_compatible("1.0.0", LINUX_311)
+
+
+def test_compat_baseline_is_compatible_missing_target() -> None:
+    baseline = CompatBaseline({LINUX_311: []}, processed_versions=[])
+    with pytest.raises(KeyError):
+        baseline.is_compatible("1.0.0", MACOS_311)
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from feu.compat.discoverers import (
     BaseCompatDiscoverer,
     CompatDiscovererRegistry,
+    DiscoveryWatermark,
     discover_compat_targets,
+    discover_compat_targets_incremental,
     get_default_registry,
     register_discoverers,
 )
@@ -19,6 +23,7 @@ if TYPE_CHECKING:
     from collections.abc import Generator
 
 MODULE = "feu.compat.discoverers.default"
+INTERFACE = "feu.compat.discoverers.interface"
 
 
 @pytest.fixture(autouse=True)
@@ -36,6 +41,64 @@ class StubCompatDiscoverer(BaseCompatDiscoverer):
         return {target: [VersionRange("42.0.0", None)] for target in targets}
 
 
+class TargetCompatDiscoverer(BaseCompatDiscoverer):
+    r"""Implement a discoverer whose ranges depend on the target, and
+    that records the targets of each discovery."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def discover(self, pkg_name, targets) -> dict:  # noqa: ANN001, ARG002
+        self.calls.append(tuple(targets))
+        return {target: [VersionRange(f"{target.python_version}.0", None)] for target in targets}
+
+
+class DependentCompatDiscoverer(StubCompatDiscoverer):
+    def __init__(self) -> None:
+        self.baselines = []
+
+    def discover_incremental(self, pkg_name, targets, baseline) -> dict:  # noqa: ANN001
+        self.baselines.append(baseline)
+        return self.discover(pkg_name, targets)
+
+    def dependencies(self, pkg_name: str) -> tuple[str, ...]:  # noqa: ARG002
+        return ("stub-core",)
+
+
+LINUX_311 = Target(python_version="3.11", os="linux", arch="x86_64")
+MACOS_311 = Target(python_version="3.11", os="macos", arch="arm64")
+
+WHEELS = {
+    "1.0.0": ("pkg-1.0.0-cp311-cp311-manylinux_2_17_x86_64.whl",),
+    "1.1.0": ("pkg-1.1.0-cp311-cp311-manylinux_2_17_x86_64.whl",),
+    "1.2.0": (
+        "pkg-1.2.0-cp311-cp311-manylinux_2_17_x86_64.whl",
+        "pkg-1.2.0-cp311-cp311-macosx_11_0_arm64.whl",
+    ),
+}
+UPLOAD_TIMES = {
+    "1.0.0": "2023-01-01T00:00:00.000000+00:00",
+    "1.1.0": "2023-06-01T00:00:00.000000+00:00",
+    "1.2.0": "2024-01-01T00:00:00.000000+00:00",
+}
+# New release and backport released after the previous discovery
+NEW_WHEELS = WHEELS | {
+    "1.1.1": ("pkg-1.1.1-cp311-cp311-macosx_11_0_arm64.whl",),
+    "2.0.0": ("pkg-2.0.0-cp311-cp311-macosx_11_0_arm64.whl",),
+}
+NEW_UPLOAD_TIMES = UPLOAD_TIMES | {
+    "1.1.1": "2024-02-01T00:00:00.000000+00:00",
+    "2.0.0": "2024-03-01T00:00:00.000000+00:00",
+}
+WATERMARK = DiscoveryWatermark(
+    serial=10, last_version="1.2.0", last_upload="2024-01-01T00:00:00.000000+00:00"
+)
+PREVIOUS = {
+    LINUX_311: [VersionRange("1.0.0", None)],
+    MACOS_311: [VersionRange("1.2.0", None)],
+}
+
+
 ##############################################
 #     Tests for discover_compat_targets      #
 ##############################################
@@ -58,6 +121,145 @@ def test_discover_compat_targets_uses_registered_discoverer() -> None:
     assert compat == {linux_311: [VersionRange("42.0.0", None)]}
 
 
+TARGETS = tuple(
+    Target(python_version=python_version, os=os, arch="x86_64")
+    for python_version in ("3.10", "3.11", "3.12")
+    for os in ("linux", "windows")
+)
+EXPECTED = {target: [VersionRange(f"{target.python_version}.0", None)] for target in TARGETS}
+
+
+def test_discover_compat_targets_single_call_by_default() -> None:
+    discoverer = TargetCompatDiscoverer()
+    register_discoverers({"target_pkg": discoverer})
+    assert discover_compat_targets("target_pkg", targets=TARGETS) == EXPECTED
+    assert discoverer.calls == [TARGETS]
+
+
+def test_discover_compat_targets_max_workers() -> None:
+    discoverer = TargetCompatDiscoverer()
+    register_discoverers({"target_pkg": discoverer})
+    compat = discover_compat_targets("target_pkg", targets=TARGETS, max_workers=4)
+    assert compat == EXPECTED
+    assert list(compat) == list(TARGETS)
+    assert set(discoverer.calls) == {TARGETS[0::4], TARGETS[1::4], TARGETS[2::4], TARGETS[3::4]}
+
+
+def test_discover_compat_targets_max_workers_more_than_targets() -> None:
+    discoverer = TargetCompatDiscoverer()
+    register_discoverers({"target_pkg": discoverer})
+    compat = discover_compat_targets("target_pkg", targets=TARGETS[:2], max_workers=8)
+    assert list(compat) == list(TARGETS[:2])
+    assert len(discoverer.calls) == 2
+
+
+def test_discover_compat_targets_executor() -> None:
+    register_discoverers({"target_pkg": TargetCompatDiscoverer()})
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        compat = discover_compat_targets(
+            "target_pkg", targets=TARGETS, max_workers=3, executor=executor
+        )
+    assert compat == EXPECTED
+    assert list(compat) == list(TARGETS)
+
+
+def test_discover_compat_targets_process_pool() -> None:
+    register_discoverers({"target_pkg": TargetCompatDiscoverer()})
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        compat = discover_compat_targets(
+            "target_pkg", targets=TARGETS, max_workers=2, executor=executor
+        )
+    assert compat == EXPECTED
+    assert list(compat) == list(TARGETS)
+
+
+def test_discover_compat_targets_incorrect_max_workers() -> None:
+    with pytest.raises(ValueError, match=r"max_workers must be at least 1"):
+        discover_compat_targets("pkg", targets=TARGETS, max_workers=0)
+
+
+#########################################################
+#     Tests for discover_compat_targets_incremental     #
+#########################################################
+
+
+@patch(f"{MODULE}.fetch_pypi_wheel_filenames", lambda *_args: WHEELS)
+@patch(f"{INTERFACE}.fetch_pypi_upload_times", lambda *_args: UPLOAD_TIMES)
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", lambda *_args: 10)
+def test_discover_compat_targets_incremental_without_previous() -> None:
+    assert discover_compat_targets_incremental("pkg", targets=(LINUX_311, MACOS_311)) == (
+        PREVIOUS,
+        WATERMARK,
+    )
+
+
+@patch(f"{INTERFACE}.fetch_pypi_upload_times")
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", lambda *_args: 10)
+def test_discover_compat_targets_incremental_unchanged_serial(fetch_upload_times: Mock) -> None:
+    with patch(f"{MODULE}.fetch_pypi_wheel_filenames") as fetch_wheels:
+        compat, watermark = discover_compat_targets_incremental(
+            "pkg", previous=PREVIOUS, watermark=WATERMARK, targets=(LINUX_311,)
+        )
+    assert compat == {LINUX_311: [VersionRange("1.0.0", None)]}
+    assert watermark is WATERMARK
+    fetch_upload_times.assert_not_called()
+    fetch_wheels.assert_not_called()
+
+
+@patch(f"{MODULE}.fetch_pypi_wheel_filenames", lambda *_args: NEW_WHEELS)
+@patch(f"{INTERFACE}.fetch_pypi_upload_times", lambda *_args: NEW_UPLOAD_TIMES)
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", lambda *_args: 12)
+def test_discover_compat_targets_incremental_new_releases() -> None:
+    targets = (LINUX_311, MACOS_311)
+    compat, watermark = discover_compat_targets_incremental(
+        "pkg", previous=PREVIOUS, watermark=WATERMARK, targets=targets
+    )
+    assert compat == {
+        LINUX_311: [VersionRange("1.0.0", "1.1.0"), VersionRange("1.2.0", "1.2.0")],
+        MACOS_311: [VersionRange("1.1.1", None)],
+    }
+    assert compat == discover_compat_targets("pkg", targets=targets)
+    assert watermark == DiscoveryWatermark(
+        serial=12, last_version="2.0.0", last_upload="2024-03-01T00:00:00.000000+00:00"
+    )
+
+
+@patch(f"{MODULE}.fetch_pypi_wheel_filenames", lambda *_args: NEW_WHEELS)
+@patch(f"{INTERFACE}.fetch_pypi_upload_times", lambda *_args: NEW_UPLOAD_TIMES)
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", lambda *_args: 12)
+def test_discover_compat_targets_incremental_reads_processed_releases_from_previous() -> None:
+    # The previous ranges are trusted for the releases already processed
+    compat, _ = discover_compat_targets_incremental(
+        "pkg",
+        previous={LINUX_311: [], MACOS_311: PREVIOUS[MACOS_311]},
+        watermark=WATERMARK,
+        targets=(LINUX_311,),
+    )
+    assert compat == {LINUX_311: []}
+
+
+@patch(f"{MODULE}.fetch_pypi_wheel_filenames", lambda *_args: NEW_WHEELS)
+@patch(f"{INTERFACE}.fetch_pypi_upload_times", lambda *_args: NEW_UPLOAD_TIMES)
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", lambda *_args: 12)
+def test_discover_compat_targets_incremental_new_target() -> None:
+    targets = (LINUX_311, MACOS_311)
+    compat, _ = discover_compat_targets_incremental(
+        "pkg", previous={LINUX_311: PREVIOUS[LINUX_311]}, watermark=WATERMARK, targets=targets
+    )
+    assert compat == discover_compat_targets("pkg", targets=targets)
+
+
+@patch(f"{INTERFACE}.fetch_pypi_upload_times", lambda *_args: UPLOAD_TIMES)
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", lambda *_args: 11)
+def test_discover_compat_targets_incremental_default_discover() -> None:
+    register_discoverers({"stub_pkg": StubCompatDiscoverer()})
+    compat, watermark = discover_compat_targets_incremental(
+        "stub_pkg", previous=PREVIOUS, watermark=WATERMARK, targets=(LINUX_311,)
+    )
+    assert compat == {LINUX_311: [VersionRange("42.0.0", None)]}
+    assert watermark.serial == 11
+
+
 ##########################################
 #     Tests for register_discoverers     #
 ##########################################
@@ -92,6 +294,18 @@ def test_get_default_registry_returns_singleton() -> None:
     assert get_default_registry() is get_default_registry()
 
 
+def test_get_default_registry_concurrent_calls_create_one_registry() -> None:
+    barrier = threading.Barrier(8)
+
+    def get_registry(_: int) -> CompatDiscovererRegistry:
+        barrier.wait()
+        return get_default_registry()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        registries = list(executor.map(get_registry, range(8)))
+    assert all(registry is registries[0] for registry in registries)
+
+
 def test_get_default_registry_singleton_persists_modifications() -> None:
     registry1 = get_default_registry()
     assert not registry1.has_discoverer("stub_pkg")
@@ -100,3 +314,73 @@ def test_get_default_registry_singleton_persists_modifications() -> None:
     registry2 = get_default_registry()
     assert registry1 is registry2
     assert registry2.has_discoverer("stub_pkg")
+
+
+@patch(f"{INTERFACE}.fetch_pypi_upload_times", lambda *_args: UPLOAD_TIMES)
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", {"stub_pkg": 10, "stub-core": 5}.__getitem__)
+def test_discover_compat_targets_incremental_dependency_serials() -> None:
+    register_discoverers({"stub_pkg": DependentCompatDiscoverer()})
+    _, watermark = discover_compat_targets_incremental("stub_pkg", targets=(LINUX_311,))
+    assert watermark.serial == 10
+    assert watermark.dependency_serials == (("stub-core", 5),)
+
+
+@patch(f"{INTERFACE}.fetch_pypi_upload_times")
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", {"stub_pkg": 10, "stub-core": 5}.__getitem__)
+def test_discover_compat_targets_incremental_unchanged_dependencies(
+    fetch_upload_times: Mock,
+) -> None:
+    discoverer = DependentCompatDiscoverer()
+    register_discoverers({"stub_pkg": discoverer})
+    watermark = DiscoveryWatermark(
+        serial=10, last_version="1.2.0", last_upload=None, dependency_serials=(("stub-core", 5),)
+    )
+    compat, new_watermark = discover_compat_targets_incremental(
+        "stub_pkg", previous=PREVIOUS, watermark=watermark, targets=(LINUX_311,)
+    )
+    assert compat == {LINUX_311: PREVIOUS[LINUX_311]}
+    assert new_watermark is watermark
+    assert discoverer.baselines == []
+    fetch_upload_times.assert_not_called()
+
+
+@patch(f"{INTERFACE}.fetch_pypi_upload_times", lambda *_args: UPLOAD_TIMES)
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", {"stub_pkg": 11, "stub-core": 5}.__getitem__)
+def test_discover_compat_targets_incremental_package_changed() -> None:
+    discoverer = DependentCompatDiscoverer()
+    register_discoverers({"stub_pkg": discoverer})
+    watermark = DiscoveryWatermark(
+        serial=10,
+        last_version="1.2.0",
+        last_upload="2023-06-01T00:00:00.000000+00:00",
+        dependency_serials=(("stub-core", 5),),
+    )
+    discover_compat_targets_incremental(
+        "stub_pkg", previous=PREVIOUS, watermark=watermark, targets=(LINUX_311,)
+    )
+    (baseline,) = discoverer.baselines
+    assert baseline.processed_versions == {"1.0.0", "1.1.0"}
+
+
+@pytest.mark.parametrize("dependency_serials", [(("stub-core", 4),), ()])
+@patch(f"{INTERFACE}.fetch_pypi_upload_times", lambda *_args: UPLOAD_TIMES)
+@patch(f"{INTERFACE}.fetch_pypi_last_serial", {"stub_pkg": 10, "stub-core": 5}.__getitem__)
+def test_discover_compat_targets_incremental_dependency_changed(
+    dependency_serials: tuple[tuple[str, int], ...],
+) -> None:
+    # Only the dependency changed, so the previous ranges of the processed
+    # releases may be stale and every release is discovered again
+    discoverer = DependentCompatDiscoverer()
+    register_discoverers({"stub_pkg": discoverer})
+    watermark = DiscoveryWatermark(
+        serial=10,
+        last_version="1.2.0",
+        last_upload="2024-01-01T00:00:00.000000+00:00",
+        dependency_serials=dependency_serials,
+    )
+    compat, new_watermark = discover_compat_targets_incremental(
+        "stub_pkg", previous=PREVIOUS, watermark=watermark, targets=(LINUX_311,)
+    )
+    assert compat == {LINUX_311: [VersionRange("42.0.0", None)]}
+    assert discoverer.baselines == [None]
+    assert new_watermark.dependency_serials == (("stub-core", 5),)
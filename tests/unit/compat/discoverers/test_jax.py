@@ -24,6 +24,18 @@ def _fetch(jax_wheels: dict, jaxlib_wheels: dict) -> Callable[[str], dict]:
     return fetch
 
 
+def test_jax_compat_discoverer_dependencies() -> None:
+    assert JaxCompatDiscoverer().dependencies("jax") == ("jaxlib",)
+
+
+def test_jax_compat_discoverer_fingerprint_depends_on_jaxlib() -> None:
+    wheel_filenames = {"jax": {"0.4.0": ("jax-0.4.0-py3-none-any.whl",)}, "jaxlib": {}}
+    with patch(f"{MODULE}.fetch_pypi_wheel_filenames", wheel_filenames.__getitem__):
+        fingerprint = JaxCompatDiscoverer().fingerprint("jax")
+        wheel_filenames["jaxlib"] = {"0.4.0": ("jaxlib-0.4.0-cp311-cp311-win_amd64.whl",)}
+        assert fingerprint != JaxCompatDiscoverer().fingerprint("jax")
+
+
 @patch(
     f"{MODULE}.fetch_pypi_wheel_filenames",
     _fetch(
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock, patch
+
+from feu.compat.discoverers import PolarsCompatDiscoverer
+from feu.compat.registry import VersionRange
+from feu.compat.target import Target
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MODULE = "feu.compat.discoverers.polars"
+
+LINUX_311 = Target(python_version="3.11", os="linux", arch="x86_64")
+
+
+def test_polars_compat_discoverer_repr() -> None:
+    assert repr(PolarsCompatDiscoverer()) == "PolarsCompatDiscoverer()"
+
+
+def test_polars_compat_discoverer_dependencies() -> None:
+    assert PolarsCompatDiscoverer().dependencies("polars") == ("polars-runtime-32",)
+
+
+def _fetch_wheels(polars_wheels: dict, runtime_wheels: dict) -> Callable[[str], dict]:
+    def fetch(pkg_name: str) -> dict:
+        return polars_wheels if pkg_name == "polars" else runtime_wheels
+
+    return fetch
+
+
+@patch(
+    f"{MODULE}.fetch_pypi_wheel_filenames",
+    _fetch_wheels(
+        polars_wheels={
+            "1.33.1": ("polars-1.33.1-cp39-abi3-manylinux_2_17_x86_64.manylinux2014_x86_64.whl",),
+        },
+        runtime_wheels={},
+    ),
+)
+def test_discover_matches_platform_wheel_directly() -> None:
+    compat = PolarsCompatDiscoverer().discover("polars", targets=(LINUX_311,))
+    assert compat == {LINUX_311: [VersionRange("1.33.1", None)]}
+
+
+@patch(f"{MODULE}.fetch_pypi_pinned_dependency_version", Mock(return_value="1.34.0"))
+@patch(
+    f"{MODULE}.fetch_pypi_wheel_filenames",
+    _fetch_wheels(
+        polars_wheels={"1.34.0": ("polars-1.34.0-py3-none-any.whl",)},
+        runtime_wheels={
+            "1.34.0": (
+                "polars_runtime_32-1.34.0-cp39-abi3-manylinux_2_17_x86_64.manylinux2014_x86_64.whl",
+            ),
+        },
+    ),
+)
+def test_discover_matches_pinned_runtime_wheel() -> None:
+    compat = PolarsCompatDiscoverer().discover("polars", targets=(LINUX_311,))
+    assert compat == {LINUX_311: [VersionRange("1.34.0", None)]}
+
+
+@patch(
+    f"{MODULE}.fetch_pypi_wheel_filenames",
+    _fetch_wheels(polars_wheels={"0.13.30": ()}, runtime_wheels={}),
+)
+def test_discover_release_without_wheels_skips_pin() -> None:
+    fetch_pin = Mock()
+    with patch(f"{MODULE}.fetch_pypi_pinned_dependency_version", fetch_pin):
+        compat = PolarsCompatDiscoverer().discover("polars", targets=(LINUX_311,))
+    assert compat == {LINUX_311: []}
+    fetch_pin.assert_not_called()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from feu.compat.discoverers import PydanticCompatDiscoverer
+from feu.compat.discoverers import CompatBaseline, PydanticCompatDiscoverer
 from feu.compat.registry import VersionRange
 from feu.compat.target import Target
 
@@ -17,6 +17,10 @@ def test_pydantic_compat_discoverer_repr() -> None:
     assert repr(PydanticCompatDiscoverer()) == "PydanticCompatDiscoverer()"
 
 
+def test_pydantic_compat_discoverer_dependencies() -> None:
+    assert PydanticCompatDiscoverer().dependencies("pydantic") == ("pydantic-core",)
+
+
 def _fetch_wheels(pydantic_wheels: dict, core_wheels: dict) -> Callable[[str], dict]:
     def fetch(pkg_name: str) -> dict:
         return pydantic_wheels if pkg_name == "pydantic" else core_wheels
@@ -115,6 +119,19 @@ def test_discover_v2_no_pin_found() -> None:
     assert compat == {linux_311: []}
 
 
+@patch(
+    f"{MODULE}.fetch_pypi_wheel_filenames",
+    _fetch_wheels(pydantic_wheels={"2.9.0": ()}, core_wheels={}),
+)
+def test_discover_release_without_wheels_skips_pin() -> None:
+    linux_311 = Target(python_version="3.11", os="linux", arch="x86_64")
+    fetch_pin = Mock()
+    with patch(f"{MODULE}.fetch_pypi_pinned_dependency_version", fetch_pin):
+        compat = PydanticCompatDiscoverer().discover("pydantic", targets=(linux_311,))
+    assert compat == {linux_311: []}
+    fetch_pin.assert_not_called()
+
+
 @patch(f"{MODULE}.fetch_pypi_pinned_dependency_version", _fetch_pin({"2.9.0": "2.23.2"}))
 @patch(
     f"{MODULE}.fetch_pypi_wheel_filenames",
@@ -201,3 +218,32 @@ def test_discover_empty() -> None:
     linux_311 = Target(python_version="3.11", os="linux", arch="x86_64")
     compat = PydanticCompatDiscoverer().discover("pydantic", targets=(linux_311,))
     assert compat == {linux_311: []}
+
+
+@patch(
+    f"{MODULE}.fetch_pypi_wheel_filenames",
+    _fetch_wheels(
+        pydantic_wheels={
+            "2.0.0": ("pydantic-2.0.0-py3-none-any.whl",),
+            "2.12.0": ("pydantic-2.12.0-py3-none-any.whl",),
+        },
+        core_wheels={
+            "2.41.1": (
+                "pydantic_core-2.41.1-cp311-cp311-manylinux_2_17_x86_64.manylinux2014_x86_64.whl",
+            ),
+        },
+    ),
+)
+def test_discover_incremental_only_fetches_new_pins() -> None:
+    linux_311 = Target(python_version="3.11", os="linux", arch="x86_64")
+    baseline = CompatBaseline(
+        {linux_311: [VersionRange("2.0.0", None)]}, processed_versions=["2.0.0"]
+    )
+    with patch(
+        f"{MODULE}.fetch_pypi_pinned_dependency_version", return_value="2.41.1"
+    ) as fetch_pin:
+        compat = PydanticCompatDiscoverer().discover_incremental(
+            "pydantic", targets=(linux_311,), baseline=baseline
+        )
+    fetch_pin.assert_called_once_with("pydantic", "2.12.0", "pydantic-core")
+    assert compat == {linux_311: [VersionRange("2.0.0", None)]}
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from feu.compat.discoverers import (
     BaseCompatDiscoverer,
+    CachedCompatDiscoverer,
     CompatDiscoverer,
     CompatDiscovererRegistry,
 )
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class StubCompatDiscoverer(BaseCompatDiscoverer):
     def discover(self, pkg_name, targets) -> dict:  # noqa: ANN001, ARG002
@@ -50,6 +56,36 @@ def test_compat_discoverer_registry_find_discoverer_default() -> None:
     assert isinstance(discoverer, CompatDiscoverer)
 
 
+def test_compat_discoverer_registry_cache_dir_default() -> None:
+    assert CompatDiscovererRegistry().cache_dir is None
+
+
+def test_compat_discoverer_registry_find_discoverer_with_cache_dir(tmp_path: Path) -> None:
+    discoverer = StubCompatDiscoverer()
+    registry = CompatDiscovererRegistry({"my_pkg": discoverer}, cache_dir=tmp_path)
+    cached = registry.find_discoverer("my_pkg")
+    assert isinstance(cached, CachedCompatDiscoverer)
+    assert cached.discoverer is discoverer
+    assert cached.cache_path("my_pkg", ()) is None
+    assert isinstance(registry.find_discoverer("other_pkg").discoverer, CompatDiscoverer)
+
+
+def test_compat_discoverer_registry_set_cache_dir(tmp_path: Path) -> None:
+    registry = CompatDiscovererRegistry()
+    registry.set_cache_dir(tmp_path)
+    assert registry.cache_dir == tmp_path
+    assert isinstance(registry.find_discoverer("my_pkg"), CachedCompatDiscoverer)
+    registry.set_cache_dir(None)
+    assert registry.cache_dir is None
+    assert isinstance(registry.find_discoverer("my_pkg"), CompatDiscoverer)
+
+
+def test_compat_discoverer_registry_set_cache_dir_str(tmp_path: Path) -> None:
+    registry = CompatDiscovererRegistry()
+    registry.set_cache_dir(str(tmp_path))
+    assert registry.cache_dir == tmp_path
+
+
 def test_compat_discoverer_registry_register_new_package() -> None:
     registry = CompatDiscovererRegistry()
     discoverer = StubCompatDiscoverer()
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import itertools
+import random
+
+from feu.compat.discoverers import CompatBaseline
 from feu.compat.discoverers.utils import (
+    WheelTagIndex,
     build_compat_ranges,
+    build_compat_ranges_from_sets,
     build_tags_by_version,
+    fingerprint_metadata,
     group_into_ranges,
     sort_stable_versions,
     tags_match_exactly,
@@ -83,6 +90,111 @@ def test_build_tags_by_version_ignores_version_with_no_filenames() -> None:
     assert build_tags_by_version({"1.0.0": ()}) == {"1.0.0": set()}
 
 
+###################################
+#     Tests for WheelTagIndex     #
+###################################
+
+LINUX = WheelTags(python_version="3.11", free_threaded=False, os="linux", arch="x86_64")
+TAGS_BY_VERSION = {
+    "1.0.0": {WheelTags("3.11", False, "linux", "x86_64")},
+    "1.1.0": {WheelTags("3.9", False, "linux", "x86_64", abi3=True)},
+    "1.2.0": {WheelTags("3.12", False, "linux", "x86_64", abi3=True)},
+    "1.3.0": {WheelTags("3.11", True, "linux", "x86_64")},
+    "1.4.0": {WheelTags("3.11", False, None, None)},
+    "1.5.0": {WheelTags(None, False, None, None)},
+    "1.6.0": {WheelTags(None, False, "macos", "arm64")},
+    "1.7.0": set(),
+}
+
+
+def test_wheel_tag_index_repr() -> None:
+    assert repr(WheelTagIndex(TAGS_BY_VERSION)) == "WheelTagIndex(keys=7)"
+
+
+def test_wheel_tag_index_len() -> None:
+    assert len(WheelTagIndex(TAGS_BY_VERSION)) == 7
+
+
+def test_wheel_tag_index_empty() -> None:
+    index = WheelTagIndex({})
+    assert len(index) == 0
+    assert not index.has_pure_python_wheels
+    assert index.exact_matches(LINUX) == set()
+    assert index.pure_python_versions() == set()
+
+
+def test_wheel_tag_index_has_pure_python_wheels() -> None:
+    assert WheelTagIndex(TAGS_BY_VERSION).has_pure_python_wheels
+
+
+def test_wheel_tag_index_has_pure_python_wheels_false() -> None:
+    assert not WheelTagIndex({"1.0.0": {LINUX}}).has_pure_python_wheels
+
+
+def test_wheel_tag_index_untagged_versions() -> None:
+    assert WheelTagIndex(TAGS_BY_VERSION).untagged_versions == frozenset({"1.7.0"})
+
+
+def test_wheel_tag_index_exact_matches() -> None:
+    assert WheelTagIndex(TAGS_BY_VERSION).exact_matches(LINUX) == {"1.0.0", "1.1.0"}
+
+
+def test_wheel_tag_index_exact_matches_free_threaded() -> None:
+    wanted = WheelTags(python_version="3.11", free_threaded=True, os="linux", arch="x86_64")
+    assert WheelTagIndex(TAGS_BY_VERSION).exact_matches(wanted) == {"1.3.0"}
+
+
+def test_wheel_tag_index_exact_matches_abi3_later_python() -> None:
+    wanted = WheelTags(python_version="3.13", free_threaded=False, os="linux", arch="x86_64")
+    assert WheelTagIndex(TAGS_BY_VERSION).exact_matches(wanted) == {"1.1.0", "1.2.0"}
+
+
+def test_wheel_tag_index_exact_matches_none_vs_none() -> None:
+    wanted = WheelTags(python_version=None, free_threaded=False, os=None, arch=None)
+    assert WheelTagIndex(TAGS_BY_VERSION).exact_matches(wanted) == {"1.5.0"}
+
+
+def test_wheel_tag_index_matches_any_platform() -> None:
+    assert WheelTagIndex(TAGS_BY_VERSION).matches(LINUX) == {"1.0.0", "1.1.0", "1.4.0"}
+
+
+def test_wheel_tag_index_matches_no_python_version() -> None:
+    wanted = WheelTags(python_version=None, free_threaded=False, os=None, arch=None)
+    assert WheelTagIndex(TAGS_BY_VERSION).matches(wanted) == set()
+
+
+def test_wheel_tag_index_pure_python_versions() -> None:
+    assert WheelTagIndex(TAGS_BY_VERSION).pure_python_versions() == {"1.5.0", "1.6.0"}
+
+
+def test_wheel_tag_index_pure_python_versions_wanted() -> None:
+    assert WheelTagIndex(TAGS_BY_VERSION).pure_python_versions(LINUX) == {"1.5.0"}
+
+
+def test_wheel_tag_index_exact_matches_random() -> None:
+    rng = random.Random(42)  # noqa: S311
+    values = list(
+        itertools.product(
+            [None, "3.9", "3.10", "3.11", "3.12"],
+            [False, True],
+            [None, "linux", "macos"],
+            [None, "x86_64", "arm64"],
+            [False, True],
+        )
+    )
+    tags_by_version = {
+        f"1.{i}.0": {WheelTags(*rng.choice(values)) for _ in range(rng.randint(0, 5))}
+        for i in range(50)
+    }
+    index = WheelTagIndex(tags_by_version)
+    for wanted in (WheelTags(*value[:4]) for value in values):
+        assert index.exact_matches(wanted) == {
+            version
+            for version, tags in tags_by_version.items()
+            if any(tags_match_exactly(tag, wanted) for tag in tags)
+        }
+
+
 ##############################################
 #     Tests for target_to_wheel_tags     #
 ##############################################
@@ -168,6 +280,20 @@ def test_tags_match_exactly_abi3_does_not_match_earlier_python_version() -> None
     assert not tags_match_exactly(tag, wanted)
 
 
+def test_tags_match_exactly_abi3_compares_python_versions_numerically() -> None:
+    tag = WheelTags(python_version="3.9", free_threaded=False, os="linux", arch="x86_64", abi3=True)
+    wanted = WheelTags(python_version="3.10", free_threaded=False, os="linux", arch="x86_64")
+    assert tags_match_exactly(tag, wanted)
+
+
+def test_tags_match_exactly_abi3_later_python_does_not_match_two_digit_minor() -> None:
+    tag = WheelTags(
+        python_version="3.10", free_threaded=False, os="linux", arch="x86_64", abi3=True
+    )
+    wanted = WheelTags(python_version="3.9", free_threaded=False, os="linux", arch="x86_64")
+    assert not tags_match_exactly(tag, wanted)
+
+
 def test_tags_match_exactly_abi3_does_not_match_free_threaded_target() -> None:
     tag = WheelTags(python_version="3.9", free_threaded=False, os="linux", arch="x86_64", abi3=True)
     wanted = WheelTags(python_version="3.13", free_threaded=True, os="linux", arch="x86_64")
@@ -299,3 +425,126 @@ def test_build_compat_ranges_predicate_receives_wanted_wheel_tags() -> None:
 
     build_compat_ranges(["1.0.0"], "1.0.0", [target], is_compatible)
     assert seen == [WheelTags(python_version="3.11", free_threaded=True, os="linux", arch="x86_64")]
+
+
+def test_build_compat_ranges_baseline_only_evaluates_unprocessed_versions() -> None:
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    baseline = CompatBaseline(
+        {target: [VersionRange("1.0.0", None)]}, processed_versions=["1.0.0", "1.1.0"]
+    )
+    seen: list[str] = []
+
+    def is_compatible(version: str, _target: Target, _wanted: WheelTags) -> bool:
+        seen.append(version)
+        return True
+
+    result = build_compat_ranges(
+        ["1.0.0", "1.1.0", "2.0.0"], "2.0.0", [target], is_compatible, baseline
+    )
+    assert result == {target: [VersionRange("1.0.0", None)]}
+    assert seen == ["2.0.0"]
+
+
+def test_build_compat_ranges_baseline_closes_open_range() -> None:
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    baseline = CompatBaseline(
+        {target: [VersionRange("1.0.0", None)]}, processed_versions=["1.0.0", "1.1.0"]
+    )
+    result = build_compat_ranges(
+        ["1.0.0", "1.1.0", "2.0.0"],
+        "2.0.0",
+        [target],
+        lambda _version, _target, _wanted: False,
+        baseline,
+    )
+    assert result == {target: [VersionRange("1.0.0", "1.1.0")]}
+
+
+def test_build_compat_ranges_baseline_splits_range_on_backport() -> None:
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    baseline = CompatBaseline(
+        {target: [VersionRange("1.0.0", "1.1.0"), VersionRange("2.0.0", None)]},
+        processed_versions=["1.0.0", "1.1.0", "2.0.0"],
+    )
+    result = build_compat_ranges(
+        ["1.0.0", "1.1.0", "1.2.0", "2.0.0"],
+        "2.0.0",
+        [target],
+        lambda _version, _target, _wanted: False,
+        baseline,
+    )
+    assert result == {target: [VersionRange("1.0.0", "1.1.0"), VersionRange("2.0.0", None)]}
+
+
+#####################################################
+#     Tests for build_compat_ranges_from_sets     #
+#####################################################
+
+
+def test_build_compat_ranges_from_sets() -> None:
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    result = build_compat_ranges_from_sets(
+        ["1.0.0", "1.1.0", "2.0.0"],
+        "2.0.0",
+        [target],
+        lambda _target, _wanted: {"1.0.0", "2.0.0", "3.0.0"},
+    )
+    assert result == {target: [VersionRange("1.0.0", "1.0.0"), VersionRange("2.0.0", None)]}
+
+
+def test_build_compat_ranges_from_sets_empty_targets() -> None:
+    assert build_compat_ranges_from_sets(["1.0.0"], "1.0.0", [], lambda *_args: {"1.0.0"}) == {}
+
+
+def test_build_compat_ranges_from_sets_receives_wanted_wheel_tags() -> None:
+    target = Target(python_version="3.11", free_threaded=True, os="linux", arch="x86_64")
+    seen: list[tuple[Target, WheelTags]] = []
+
+    def compatible_versions(target: Target, wanted: WheelTags) -> set[str]:
+        seen.append((target, wanted))
+        return set()
+
+    build_compat_ranges_from_sets(["1.0.0"], "1.0.0", [target], compatible_versions)
+    assert seen == [(target, WheelTags("3.11", True, "linux", "x86_64"))]
+
+
+def test_build_compat_ranges_from_sets_baseline() -> None:
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    baseline = CompatBaseline(
+        {target: [VersionRange("1.0.0", "1.0.0")]}, processed_versions=["1.0.0", "1.1.0"]
+    )
+    result = build_compat_ranges_from_sets(
+        ["1.0.0", "1.1.0", "2.0.0"],
+        "2.0.0",
+        [target],
+        lambda _target, _wanted: {"1.1.0", "2.0.0"},
+        baseline,
+    )
+    assert result == {target: [VersionRange("1.0.0", "1.0.0"), VersionRange("2.0.0", None)]}
+
+
+##########################################
+#     Tests for fingerprint_metadata     #
+##########################################
+
+
+def test_fingerprint_metadata_deterministic() -> None:
+    assert fingerprint_metadata({"1.0.0": ("a.whl",)}, ">=3.9") == fingerprint_metadata(
+        {"1.0.0": ["a.whl"]}, ">=3.9"
+    )
+
+
+def test_fingerprint_metadata_ignores_key_order() -> None:
+    assert fingerprint_metadata({"1.0.0": [], "2.0.0": []}) == fingerprint_metadata(
+        {"2.0.0": [], "1.0.0": []}
+    )
+
+
+def test_fingerprint_metadata_changes_with_metadata() -> None:
+    fingerprint = fingerprint_metadata({"1.0.0": ["a.whl"]})
+    assert fingerprint != fingerprint_metadata({"1.0.0": ["a.whl"], "1.1.0": ["b.whl"]})
+    assert fingerprint != fingerprint_metadata({"1.0.0": ["a.whl"]}, {"1.0.0": ">=3.9"})
+
+
+def test_fingerprint_metadata_hexdigest() -> None:
+    assert len(fingerprint_metadata()) == 64
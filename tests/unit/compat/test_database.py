@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import importlib
+import json
+import pkgutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from feu.compat import discovered
+from feu.compat.database import FORMAT_VERSION, CompatDatabase
+from feu.compat.discovered import DATABASE_PATH, load_discovered
+from feu.compat.discoverers import DiscoveryWatermark
+from feu.compat.registry import CompatRegistry, VersionRange
+from feu.compat.target import Target
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MODULE = "feu.compat.database"
+
+T310 = Target(python_version="3.10")
+T311 = Target(python_version="3.11")
+T311_LINUX = Target(python_version="3.11", os="linux", arch="x86_64")
+
+MAPPING = {
+    "numpy": {
+        T310: [VersionRange("1.21.2", "2.2.6")],
+        T311: [VersionRange("1.23.2", None)],
+    },
+    "pandas": {
+        T311: [VersionRange("1.5.0", None)],
+        T311_LINUX: [VersionRange(None, "1.0.0"), VersionRange("1.5.0", "2.2.3")],
+    },
+    "torch": {
+        T310: [VersionRange("1.21.2", "2.2.6")],
+    },
+}
+
+
+@pytest.fixture
+def database() -> CompatDatabase:
+    return CompatDatabase.from_mapping(MAPPING)
+
+
+####################################
+#     Tests for CompatDatabase     #
+####################################
+
+
+def test_compat_database_repr(database: CompatDatabase) -> None:
+    assert repr(database) == "CompatDatabase(packages=3, targets=3, versions=6, ranges=4)"
+
+
+def test_compat_database_contains(database: CompatDatabase) -> None:
+    assert "numpy" in database
+    assert "missing" not in database
+
+
+def test_compat_database_iter(database: CompatDatabase) -> None:
+    assert list(database) == ["numpy", "pandas", "torch"]
+
+
+def test_compat_database_len(database: CompatDatabase) -> None:
+    assert len(database) == 3
+
+
+def test_compat_database_len_empty() -> None:
+    assert len(CompatDatabase.from_mapping({})) == 0
+
+
+def test_compat_database_unsupported_format() -> None:
+    with pytest.raises(ValueError, match=r"Unsupported compatibility database format"):
+        CompatDatabase({"format_version": 0})
+
+
+def test_compat_database_from_mapping_interns_tables(database: CompatDatabase) -> None:
+    data = database.to_dict()
+    assert data["targets"] == [
+        ["3.10", False, None, None],
+        ["3.11", False, None, None],
+        ["3.11", False, "linux", "x86_64"],
+    ]
+    assert data["versions"] == ["1.21.2", "2.2.6", "1.23.2", "1.5.0", "1.0.0", "2.2.3"]
+    assert data["ranges"] == [[0, 1], [2, -1], [3, -1], [-1, 4, 3, 5]]
+    # numpy and torch share the same range list for 3.10
+    assert data["packages"]["torch"] == [[0, 0]]
+
+
+def test_compat_database_decode(database: CompatDatabase) -> None:
+    for pkg_name, compat in MAPPING.items():
+        assert database.decode(pkg_name) == compat
+
+
+def test_compat_database_decode_reuses_targets(database: CompatDatabase) -> None:
+    assert next(iter(database.decode("numpy"))) is next(iter(database.decode("torch")))
+
+
+def test_compat_database_decode_reuses_version_ranges(database: CompatDatabase) -> None:
+    assert database.decode("numpy")[T310][0] is database.decode("torch")[T310][0]
+
+
+def test_compat_database_decode_returns_new_lists(database: CompatDatabase) -> None:
+    database.decode("numpy")[T310].clear()
+    assert database.decode("numpy") == MAPPING["numpy"]
+
+
+def test_compat_database_decode_empty_ranges() -> None:
+    database = CompatDatabase.from_mapping({"numpy": {T311: []}})
+    assert database.decode("numpy") == {T311: []}
+
+
+def test_compat_database_decode_missing(database: CompatDatabase) -> None:
+    with pytest.raises(KeyError):
+        database.decode("missing")
+
+
+def test_compat_database_register(database: CompatDatabase) -> None:
+    registry = CompatRegistry()
+    database.register(registry)
+    assert registry.is_valid_version("numpy", "2.0.0", T311)
+    assert not registry.is_valid_version("pandas", "1.2.0", T311_LINUX)
+    assert registry.state == MAPPING
+
+
+def test_compat_database_register_is_lazy(database: CompatDatabase) -> None:
+    registry = CompatRegistry()
+    with patch.object(database, "decode", wraps=database.decode) as mock:
+        database.register(registry)
+        mock.assert_not_called()
+        assert registry.is_valid_version("numpy", "2.0.0", T311)
+    mock.assert_called_once_with("numpy")
+
+
+def test_compat_database_save_load(database: CompatDatabase, tmp_path: Path) -> None:
+    path = tmp_path / "compat.json"
+    database.save(path)
+    loaded = CompatDatabase.load(path)
+    assert loaded.to_dict() == database.to_dict()
+    assert loaded.decode("pandas") == MAPPING["pandas"]
+
+
+def test_compat_database_to_dict(database: CompatDatabase) -> None:
+    data = database.to_dict()
+    assert data["format_version"] == FORMAT_VERSION
+    assert data["packages"] == {
+        "numpy": [[0, 0], [1, 1]],
+        "pandas": [[1, 2], [2, 3]],
+        "torch": [[0, 0]],
+    }
+
+
+def test_compat_database_to_json(database: CompatDatabase) -> None:
+    content = database.to_json()
+    assert json.loads(content) == database.to_dict()
+    assert '    "numpy":[[0,0],[1,1]],\n' in content
+
+
+def test_compat_database_to_json_empty() -> None:
+    assert json.loads(CompatDatabase.from_mapping({}).to_json()) == {
+        "format_version": FORMAT_VERSION,
+        "targets": [],
+        "versions": [],
+        "ranges": [],
+        "packages": {},
+    }
+
+
+#####################################
+#     Tests for load_discovered     #
+#####################################
+
+
+def test_load_discovered() -> None:
+    database = load_discovered()
+    assert "numpy" in database
+    assert database.decode("numpy")
+
+
+def test_load_discovered_is_normalized() -> None:
+    # The stored file is the canonical serialization of its content
+    database = load_discovered()
+    assert DATABASE_PATH.read_text() == database.to_json()
+
+
+def test_load_discovered_has_releases() -> None:
+    database = load_discovered()
+    assert [pkg_name for pkg_name in database if not database.releases(pkg_name)] == []
+
+
+@pytest.mark.parametrize(
+    "module_name", [module_info.name for module_info in pkgutil.iter_modules(discovered.__path__)]
+)
+def test_deprecated_discovered_module(module_name: str) -> None:
+    module = importlib.import_module(f"feu.compat.discovered.{module_name}")
+    with pytest.warns(DeprecationWarning, match=r"load_discovered\(\).decode"):
+        compat = module.compat()
+    assert compat
+    assert compat == load_discovered().decode(module.PKG_NAME)
+
+
+def test_compat_database_watermark() -> None:
+    watermark = DiscoveryWatermark(
+        serial=42, last_version="2.0.0", last_upload="2024-06-01T00:00:00.000000+00:00"
+    )
+    database = CompatDatabase.from_mapping(MAPPING, watermarks={"numpy": watermark})
+    assert database.watermark("numpy") == watermark
+    assert database.watermark("pandas") is None
+
+
+def test_compat_database_watermark_missing(database: CompatDatabase) -> None:
+    assert database.watermark("numpy") is None
+    assert "watermarks" not in database.to_dict()
+
+
+def test_compat_database_watermark_save_load(tmp_path: Path) -> None:
+    watermark = DiscoveryWatermark(serial=42, last_version=None, last_upload=None)
+    path = tmp_path / "compat.json"
+    CompatDatabase.from_mapping(MAPPING, watermarks={"torch": watermark}).save(path)
+    content = path.read_text()
+    assert '    "torch":[42,null,null]\n' in content
+    assert CompatDatabase.load(path).watermark("torch") == watermark
+
+
+def test_compat_database_watermark_dependency_serials_save_load(tmp_path: Path) -> None:
+    watermark = DiscoveryWatermark(
+        serial=42, last_version="0.4.30", last_upload=None, dependency_serials=(("jaxlib", 7),)
+    )
+    path = tmp_path / "compat.json"
+    CompatDatabase.from_mapping(MAPPING, watermarks={"jax": watermark}).save(path)
+    assert '    "jax":[42,"0.4.30",null,{"jaxlib":7}]\n' in path.read_text()
+    assert CompatDatabase.load(path).watermark("jax") == watermark
+
+
+def test_compat_database_releases() -> None:
+    database = CompatDatabase.from_mapping(
+        MAPPING, releases={"numpy": ["1.21.2", "1.22.0", "1.23.2", "2.2.6"]}
+    )
+    assert database.releases("numpy") == ["1.21.2", "1.22.0", "1.23.2", "2.2.6"]
+    assert database.releases("pandas") is None
+
+
+def test_compat_database_releases_share_versions() -> None:
+    database = CompatDatabase.from_mapping(MAPPING, releases={"numpy": ["1.21.2", "1.22.0"]})
+    versions = database.to_dict()["versions"]
+    assert versions.count("1.21.2") == 1
+    assert versions[-1] == "1.22.0"
+
+
+def test_compat_database_releases_missing(database: CompatDatabase) -> None:
+    assert database.releases("numpy") is None
+    assert "releases" not in database.to_dict()
+
+
+def test_compat_database_releases_save_load(tmp_path: Path) -> None:
+    path = tmp_path / "compat.json"
+    CompatDatabase.from_mapping(
+        MAPPING,
+        watermarks={"torch": DiscoveryWatermark(serial=42, last_version=None, last_upload=None)},
+        releases={"torch": ["1.21.2", "2.2.6"]},
+    ).save(path)
+    content = path.read_text()
+    assert '    "torch":[0,1]\n' in content
+    loaded = CompatDatabase.load(path)
+    assert loaded.releases("torch") == ["1.21.2", "2.2.6"]
+    assert loaded.watermark("torch").serial == 42
+
+
+def test_compat_database_register_releases() -> None:
+    database = CompatDatabase.from_mapping(
+        MAPPING, releases={"numpy": ["1.21.2", "1.22.0", "1.23.2", "2.2.6", "2.3.0"]}
+    )
+    registry = CompatRegistry()
+    database.register(registry)
+    releases = registry.get_compatible_releases("numpy", T310)
+    assert releases.oldest == "1.21.2"
+    assert releases.latest == "2.2.6"
+    assert registry.get_compatible_releases("pandas", T310) is None
+
+
+def fake_upload_times(pkg_name: str) -> dict[str, str | None]:
+    return {
+        "1.0.0": "2024-01-01T00:00:00.000000+00:00",
+        "2.0.0rc1": "2024-02-01T00:00:00.000000+00:00",
+        "1.1.0": "2024-03-01T00:00:00.000000+00:00",
+        "1.2.0": None,
+        pkg_name: None,
+    }
+
+
+@pytest.fixture
+def _fake_upload_times() -> None:
+    with patch(f"{MODULE}.fetch_pypi_upload_times", side_effect=fake_upload_times):
+        yield
+
+
+def fake_discover(
+    pkg_name: str,
+    previous: dict | None,
+    watermark: DiscoveryWatermark | None,
+    targets: tuple[Target, ...],
+) -> tuple[dict, DiscoveryWatermark]:
+    # Finish the packages out of order when they are discovered concurrently
+    time.sleep(0.01 * (3 - list(MAPPING).index(pkg_name)))
+    serial = 0 if watermark is None else watermark.serial + 1
+    compat = previous if previous is not None else {target: [] for target in targets}
+    return compat, DiscoveryWatermark(serial=serial, last_version=pkg_name, last_upload=None)
+
+
+@pytest.mark.usefixtures("_fake_upload_times")
+@pytest.mark.parametrize("max_workers", [1, 2, None])
+def test_compat_database_discover(max_workers: int | None) -> None:
+    with patch(f"{MODULE}.discover_compat_targets_incremental", side_effect=fake_discover):
+        database = CompatDatabase.discover(
+            ["torch", "numpy", "pandas"], targets=(T311,), max_workers=max_workers
+        )
+    assert list(database) == ["torch", "numpy", "pandas"]
+    assert database.decode("numpy") == {T311: []}
+    assert database.watermark("pandas") == DiscoveryWatermark(
+        serial=0, last_version="pandas", last_upload=None
+    )
+    assert database.releases("torch") == ["1.0.0", "1.1.0"]
+
+
+@pytest.mark.usefixtures("_fake_upload_times")
+def test_compat_database_discover_executor() -> None:
+    with (
+        patch(f"{MODULE}.discover_compat_targets_incremental", side_effect=fake_discover),
+        ThreadPoolExecutor(max_workers=3) as executor,
+    ):
+        database = CompatDatabase.discover(list(MAPPING), targets=(T311,), executor=executor)
+    assert list(database) == ["numpy", "pandas", "torch"]
+
+
+@pytest.mark.usefixtures("_fake_upload_times")
+def test_compat_database_discover_previous() -> None:
+    previous = CompatDatabase.from_mapping(
+        MAPPING, watermarks={"numpy": DiscoveryWatermark(7, "2.0.0", None)}
+    )
+    with patch(f"{MODULE}.discover_compat_targets_incremental", side_effect=fake_discover) as mock:
+        database = CompatDatabase.discover(
+            ["numpy", "pandas"], targets=(T311,), previous=previous, max_workers=2
+        )
+    assert mock.call_args_list[0].kwargs["previous"] == MAPPING["numpy"]
+    assert database.decode("numpy") == MAPPING["numpy"]
+    assert database.decode("pandas") == MAPPING["pandas"]
+    assert database.watermark("numpy").serial == 8
+    assert database.watermark("pandas").serial == 0
+
+
+def test_compat_database_discover_unchanged_reuses_releases() -> None:
+    watermark = DiscoveryWatermark(7, "2.0.0", None)
+    previous = CompatDatabase.from_mapping(
+        MAPPING, watermarks={"numpy": watermark}, releases={"numpy": ["1.21.2", "2.0.0"]}
+    )
+    with (
+        patch(
+            f"{MODULE}.discover_compat_targets_incremental",
+            return_value=(MAPPING["numpy"], watermark),
+        ),
+        patch(f"{MODULE}.fetch_pypi_upload_times") as upload_times,
+    ):
+        database = CompatDatabase.discover(["numpy"], targets=(T310, T311), previous=previous)
+    upload_times.assert_not_called()
+    assert database.releases("numpy") == ["1.21.2", "2.0.0"]
+
+
+def test_compat_database_discover_empty() -> None:
+    assert len(CompatDatabase.discover([])) == 0
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
 
 import pytest
 
+from feu.compat.database import CompatDatabase
 from feu.compat.interface import (
     find_closest_version,
+    get_compatible_releases,
     get_default_registry,
     is_valid_version,
     register_compat,
 )
-from feu.compat.registry import CompatRegistry, VersionRange
+from feu.compat.registry import CompatibleReleases, CompatRegistry, VersionRange
 from feu.compat.target import Target
 
 T311 = Target(python_version="3.11")
@@ -41,6 +46,28 @@ def test_get_default_registry_is_singleton() -> None:
     assert registry1 is registry2
 
 
+def test_get_default_registry_concurrent_calls_create_one_registry() -> None:
+    def slow_register_discovered(registry: CompatRegistry) -> None:
+        time.sleep(0.01)
+        registry.register_many({"numpy": {T311: [VersionRange("0.0.1", None)]}})
+
+    barrier = threading.Barrier(8)
+
+    def get_registry(_: int) -> CompatRegistry:
+        barrier.wait()
+        return get_default_registry()
+
+    with (
+        patch(
+            "feu.compat.interface.register_discovered", side_effect=slow_register_discovered
+        ) as mock,
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        registries = list(executor.map(get_registry, range(8)))
+    mock.assert_called_once()
+    assert all(registry is registries[0] for registry in registries)
+
+
 def test_get_default_registry_not_populated_with_defaults() -> None:
     # register_defaults is currently disabled, so the human-curated defaults
     # must not be present in the registry.
@@ -59,6 +86,29 @@ def test_get_default_registry_uses_discovered() -> None:
     assert registry.get_config(pkg_name="numpy", target=T311) == [VersionRange("0.0.1", None)]
 
 
+def test_get_default_registry_loads_discovered_lazily() -> None:
+    with patch.object(
+        CompatDatabase, "decode", autospec=True, side_effect=CompatDatabase.decode
+    ) as mock:
+        registry = get_default_registry()
+        mock.assert_not_called()
+        registry.is_valid_version("numpy", "2.0.2", T311)
+        registry.is_valid_version("numpy", "2.0.2", T311)
+    assert [c.args[1] for c in mock.call_args_list] == ["numpy"]
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    assert registry.get_config(pkg_name="numpy", target=target) != []
+
+
+def test_get_default_registry_loads_discovered_normalized_name() -> None:
+    registry = get_default_registry()
+    assert registry.is_valid_version("scikit-learn", "1.0.0", T311) in (True, False)
+    assert "scikit-learn" in registry.state
+
+
+def test_get_default_registry_state_loads_all_discovered() -> None:
+    assert {"numpy", "scikit-learn", "torch"}.issubset(get_default_registry().state)
+
+
 #################################
 #     Tests for register_compat #
 #################################
@@ -100,6 +150,30 @@ def test_find_closest_version_ignores_disabled_defaults() -> None:
     assert find_closest_version(pkg_name="numpy", pkg_version="0.1.0", target=T311) == "0.1.0"
 
 
+#############################################
+#     Tests for get_compatible_releases     #
+#############################################
+
+
+def test_get_compatible_releases_delegates_to_default_registry() -> None:
+    releases = CompatibleReleases(oldest="1.0.0", latest="2.0.0", latest_per_minor=("2.0.0",))
+    with patch.object(
+        CompatRegistry, "get_compatible_releases", return_value=releases
+    ) as mock_releases:
+        assert get_compatible_releases(pkg_name="numpy", target=T311) == releases
+    mock_releases.assert_called_once_with(pkg_name="numpy", target=T311)
+
+
+def test_get_compatible_releases_default_registry_offline() -> None:
+    releases = get_compatible_releases(
+        pkg_name="numpy", target=Target(python_version="3.11", os="linux", arch="x86_64")
+    )
+    assert releases is not None
+    assert releases.oldest == "1.23.2"
+    assert releases.latest is not None
+    assert releases.latest in releases.latest_per_minor
+
+
 ##################################
 #     Tests for is_valid_version #
 ##################################
@@ -4,7 +4,14 @@ from unittest.mock import patch
 
 import pytest
 
-from feu.compat.matrix import DEFAULT_TARGETS, is_compatible, show_compat_targets
+from feu.compat.matrix import (
+    DEFAULT_PYTHON_VERSIONS,
+    DEFAULT_TARGETS,
+    _parse_specifier_set,
+    build_requires_python_table,
+    is_compatible,
+    show_compat_targets,
+)
 from feu.compat.registry import VersionRange
 from feu.compat.target import Target
 from feu.testing import rich_available
@@ -23,6 +30,47 @@ def test_default_targets_shape() -> None:
     assert all(target.os is not None and target.arch is not None for target in DEFAULT_TARGETS)
 
 
+#################################################
+#     Tests for build_requires_python_table     #
+#################################################
+
+
+def test_build_requires_python_table() -> None:
+    assert build_requires_python_table([">=3.10", None, "<3.10", ">=3.10"], ["3.9", "3.10"]) == {
+        (">=3.10", "3.9"): False,
+        (">=3.10", "3.10"): True,
+        (None, "3.9"): True,
+        (None, "3.10"): True,
+        ("<3.10", "3.9"): True,
+        ("<3.10", "3.10"): False,
+    }
+
+
+def test_build_requires_python_table_default_python_versions() -> None:
+    table = build_requires_python_table([">=3.12"])
+    assert len(table) == len(DEFAULT_PYTHON_VERSIONS)
+    assert table[(">=3.12", "3.11")] is False
+    assert table[(">=3.12", "3.12")] is True
+
+
+def test_build_requires_python_table_invalid_specifier() -> None:
+    assert build_requires_python_table(["invalid-specifier"], ["3.11"]) == {
+        ("invalid-specifier", "3.11"): True
+    }
+
+
+def test_build_requires_python_table_empty() -> None:
+    assert build_requires_python_table([], ["3.11"]) == {}
+
+
+def test_build_requires_python_table_matches_is_compatible() -> None:
+    specs = [None, "", ">=3.9", ">=3.11,<3.13", "!=3.12.*", "~=3.10", "invalid-specifier"]
+    table = build_requires_python_table(specs)
+    for spec in specs:
+        for python_version in DEFAULT_PYTHON_VERSIONS:
+            assert table[(spec, python_version)] == is_compatible(spec, python_version)
+
+
 ####################################
 #     Tests for is_compatible     #
 ####################################
@@ -48,6 +96,15 @@ def test_is_compatible_invalid_specifier() -> None:
     assert is_compatible("invalid-specifier", "3.11") is True
 
 
+def test_is_compatible_parses_specifier_once() -> None:
+    _parse_specifier_set.cache_clear()
+    for python_version in DEFAULT_PYTHON_VERSIONS:
+        is_compatible(">=3.10,<3.14", python_version)
+    info = _parse_specifier_set.cache_info()
+    assert info.misses == 1
+    assert info.hits == len(DEFAULT_PYTHON_VERSIONS) - 1
+
+
 #########################################
 #     Tests for show_compat_targets     #
 #########################################
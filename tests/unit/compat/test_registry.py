@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+from unittest.mock import Mock
+
 import pytest
 from packaging.version import Version
 
-from feu.compat.registry import CompatRegistry, UnsupportedVersionError, VersionRange
+from feu.compat.registry import (
+    CompatibleReleases,
+    CompatRegistry,
+    UnsupportedVersionError,
+    VersionRange,
+)
 from feu.compat.target import Target
 
 T311 = Target(python_version="3.11")
@@ -32,11 +45,65 @@ def test_compat_registry_init_copies_state() -> None:
     assert "torch" not in state
 
 
+def test_compat_registry_init_copies_ranges() -> None:
+    ranges = [VersionRange("1.0.0", None)]
+    registry = CompatRegistry({"numpy": {T311: ranges}})
+    ranges.append(VersionRange(None, "0.5.0"))
+    assert registry.get_config("numpy", T311) == [VersionRange("1.0.0", None)]
+
+
+def test_compat_registry_init_shares_targets_and_ranges() -> None:
+    version_range = VersionRange("1.0.0", None)
+    registry = CompatRegistry({"numpy": {T311: [version_range]}})
+    ((target, ranges),) = registry.state["numpy"].items()
+    assert target is T311
+    assert ranges[0] is version_range
+
+
+def test_compat_registry_compiled_ranges_are_shared() -> None:
+    registry = CompatRegistry(
+        {"numpy": {T310: [VersionRange("1.0.0", None)], T311: [VersionRange("1.0.0", None)]}}
+    )
+    assert registry._resolve_compiled("numpy", T310) is registry._resolve_compiled("numpy", T311)
+
+
+def test_compat_registry_compiled_ranges_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("feu.compat.registry._MAX_COMPILED_RANGES", 4)
+    registry = CompatRegistry()
+    for i in range(10):
+        registry.register("numpy", T311, ranges=[VersionRange(f"1.{i}.0", None)], exist_ok=True)
+        registry.register("torch", T311, ranges=[VersionRange("2.0.0", None)], exist_ok=True)
+    assert len(registry._compiled) == 4
+    # The most recently used range lists are kept
+    assert (VersionRange("2.0.0", None),) in registry._compiled
+    assert registry.is_valid_version("numpy", "1.9.0", T311)
+    assert not registry.is_valid_version("numpy", "1.8.0", T311)
+    assert registry.is_valid_version("torch", "2.1.0", T311)
+
+
 def test_compat_registry_repr() -> None:
     registry = CompatRegistry()
     assert repr(registry).startswith("CompatRegistry(")
 
 
+def test_compat_registry_repr_does_not_call_loaders() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", None)]}})
+    loader = Mock(return_value={"torch": {T311: [VersionRange("2.0.0", None)]}})
+    registry.register_loader("torch", loader)
+    assert repr(registry) == "CompatRegistry(\n  (loaded): ['numpy']\n  (pending): ['torch']\n)"
+    loader.assert_not_called()
+    registry.is_valid_version("torch", "2.1.0", T311)
+    assert repr(registry) == "CompatRegistry(\n  (loaded): ['numpy', 'torch']\n  (pending): []\n)"
+
+
+def test_compat_registry_repr_overlay() -> None:
+    overlay = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", None)]}}).overlay()
+    assert repr(overlay) == (
+        "CompatRegistry(\n  (loaded): []\n  (pending): []\n"
+        "  (base): CompatRegistry(\n    (loaded): ['numpy']\n    (pending): []\n  )\n)"
+    )
+
+
 def test_compat_registry_str() -> None:
     registry = CompatRegistry()
     assert str(registry).startswith("CompatRegistry(")
@@ -129,6 +196,24 @@ def test_compat_registry_get_config() -> None:
     assert registry.get_config(pkg_name="my_package", target=T311) == [VersionRange("1.0.0", None)]
 
 
+def test_compat_registry_get_config_returns_copy() -> None:
+    registry = CompatRegistry()
+    registry.register("my_package", T311, ranges=[VersionRange("1.0.0", None)])
+    registry.get_config(pkg_name="my_package", target=T311).clear()
+    assert registry.get_config(pkg_name="my_package", target=T311) == [VersionRange("1.0.0", None)]
+
+
+def test_compat_registry_identical_ranges() -> None:
+    registry = CompatRegistry()
+    registry.register("numpy", T310, ranges=[VersionRange("1.0.0", "2.0.0")])
+    registry.register("numpy", T311, ranges=[VersionRange("1.0.0", "2.0.0")])
+    registry.register("numpy", T311, ranges=[VersionRange("1.5.0", None)], exist_ok=True)
+    assert registry.get_config("numpy", T310) == [VersionRange("1.0.0", "2.0.0")]
+    assert registry.get_config("numpy", T311) == [VersionRange("1.5.0", None)]
+    assert registry.is_valid_version("numpy", "1.2.0", T310)
+    assert not registry.is_valid_version("numpy", "1.2.0", T311)
+
+
 def test_compat_registry_get_config_empty_registry() -> None:
     registry = CompatRegistry()
     assert registry.get_config(pkg_name="my_package", target=T311) == []
@@ -446,3 +531,795 @@ def test_compat_registry_is_valid_version_unsupported_false() -> None:
     registry = CompatRegistry()
     registry.register("my_package", T315, ranges=[])
     assert not registry.is_valid_version(pkg_name="my_package", pkg_version="2.0.0", target=T315)
+
+
+####################################
+#     Tests for register_loader    #
+####################################
+
+
+def test_compat_registry_register_loader_is_lazy() -> None:
+    loader = Mock(return_value={"my_package": {T311: [VersionRange("1.0.0", None)]}})
+    registry = CompatRegistry()
+    registry.register_loader("my_package", loader)
+    loader.assert_not_called()
+    assert registry.get_config("my_package", T311) == [VersionRange("1.0.0", None)]
+    assert registry.is_valid_version("my_package", "1.2.0", T311)
+    loader.assert_called_once_with()
+
+
+def test_compat_registry_register_loader_other_package_not_loaded() -> None:
+    loader = Mock(return_value={"my_package": {T311: [VersionRange("1.0.0", None)]}})
+    registry = CompatRegistry()
+    registry.register_loader("my_package", loader)
+    assert registry.get_config("other_package", T311) == []
+    loader.assert_not_called()
+
+
+def test_compat_registry_register_loader_normalized_name() -> None:
+    loader = Mock(return_value={"my-package": {T311: [VersionRange("1.0.0", None)]}})
+    registry = CompatRegistry()
+    registry.register_loader("my_package", loader)
+    assert registry.get_config("My-Package", T311) == []
+    loader.assert_called_once_with()
+    assert registry.get_config("my-package", T311) == [VersionRange("1.0.0", None)]
+
+
+def test_compat_registry_register_loader_exist_ok_false() -> None:
+    registry = CompatRegistry()
+    registry.register_loader("my_package", Mock())
+    with pytest.raises(RuntimeError, match=r"A loader is already registered"):
+        registry.register_loader("my_package", Mock())
+
+
+def test_compat_registry_register_loader_exist_ok_true() -> None:
+    registry = CompatRegistry()
+    registry.register_loader("my_package", Mock())
+    registry.register_loader(
+        "my_package",
+        Mock(return_value={"my_package": {T311: [VersionRange("2.0.0", None)]}}),
+        exist_ok=True,
+    )
+    assert registry.get_config("my_package", T311) == [VersionRange("2.0.0", None)]
+
+
+def test_compat_registry_register_loader_loaded_before_register() -> None:
+    registry = CompatRegistry()
+    registry.register_loader(
+        "my_package", lambda: {"my_package": {T311: [VersionRange("1.0.0", None)]}}
+    )
+    with pytest.raises(RuntimeError, match=r"already registered"):
+        registry.register("my_package", T311, ranges=[VersionRange("2.0.0", None)])
+
+
+def test_compat_registry_register_loader_loaded_entries_registered_first() -> None:
+    registry = CompatRegistry()
+    registry.register_loader(
+        "my_package",
+        lambda: {
+            "my_package": {Target(python_version="3.11", os="linux"): [VersionRange("1.0.0", None)]}
+        },
+    )
+    registry.register(
+        "my_package",
+        Target(python_version="3.11", arch="x86_64"),
+        ranges=[VersionRange("2.0.0", None)],
+    )
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    assert registry.get_config("my_package", target) == [VersionRange("2.0.0", None)]
+
+
+def test_compat_registry_register_loader_state_loads_all() -> None:
+    registry = CompatRegistry()
+    registry.register_loader("a", lambda: {"a": {T311: [VersionRange("1.0.0", None)]}})
+    registry.register_loader("b", lambda: {"b": {T310: []}})
+    assert registry.state == {"a": {T311: [VersionRange("1.0.0", None)]}, "b": {T310: []}}
+
+
+#######################################
+#     Tests for is_valid_versions     #
+#######################################
+
+
+def test_compat_registry_is_valid_versions() -> None:
+    registry = CompatRegistry()
+    registry.register(
+        "my_package",
+        T311,
+        ranges=[VersionRange("1.0.0", "1.5.0"), VersionRange("2.0.0", None)],
+    )
+    assert registry.is_valid_versions(
+        "my_package", ["0.9.0", "1.2.0", "1.8.0", "2.0.0", "3.0.0"], T311
+    ) == {"0.9.0": False, "1.2.0": True, "1.8.0": False, "2.0.0": True, "3.0.0": True}
+
+
+def test_compat_registry_is_valid_versions_unconfigured() -> None:
+    assert CompatRegistry().is_valid_versions("my_package", ["1.0.0", "2.0.0"], T311) == {
+        "1.0.0": True,
+        "2.0.0": True,
+    }
+
+
+def test_compat_registry_is_valid_versions_unsupported() -> None:
+    registry = CompatRegistry()
+    registry.register("my_package", T315, ranges=[])
+    assert registry.is_valid_versions("my_package", ["1.0.0", "2.0.0"], T315) == {
+        "1.0.0": False,
+        "2.0.0": False,
+    }
+
+
+def test_compat_registry_is_valid_versions_empty() -> None:
+    registry = CompatRegistry()
+    registry.register("my_package", T311, ranges=[VersionRange("1.0.0", None)])
+    assert registry.is_valid_versions("my_package", [], T311) == {}
+
+
+def test_compat_registry_is_valid_versions_iterator() -> None:
+    registry = CompatRegistry()
+    registry.register("my_package", T311, ranges=[VersionRange("1.0.0", None)])
+    assert registry.is_valid_versions("my_package", iter(["0.1.0", "1.1.0"]), T311) == {
+        "0.1.0": False,
+        "1.1.0": True,
+    }
+
+
+###########################################
+#     Tests for find_closest_versions     #
+###########################################
+
+
+def test_compat_registry_find_closest_versions() -> None:
+    registry = CompatRegistry()
+    registry.register("my_package", T310, ranges=[VersionRange("1.0.0", "1.5.0")])
+    registry.register(
+        "my_package",
+        T311,
+        ranges=[VersionRange("1.2.0", "1.5.0"), VersionRange("2.0.0", None)],
+    )
+    assert registry.find_closest_versions(
+        "my_package", ["0.9.0", "1.3.0", "1.8.0", "3.0.0"], [T310, T311, T315]
+    ) == {
+        T310: {"0.9.0": "1.0.0", "1.3.0": "1.3.0", "1.8.0": "1.5.0", "3.0.0": "1.5.0"},
+        T311: {"0.9.0": "1.2.0", "1.3.0": "1.3.0", "1.8.0": "2.0.0", "3.0.0": "3.0.0"},
+        T315: {"0.9.0": "0.9.0", "1.3.0": "1.3.0", "1.8.0": "1.8.0", "3.0.0": "3.0.0"},
+    }
+
+
+def test_compat_registry_find_closest_versions_no_targets() -> None:
+    assert CompatRegistry().find_closest_versions("my_package", ["1.0.0"], []) == {}
+
+
+def test_compat_registry_find_closest_versions_unsupported_raises() -> None:
+    registry = CompatRegistry()
+    registry.register("my_package", T315, ranges=[])
+    with pytest.raises(UnsupportedVersionError, match=r"No version of package my_package"):
+        registry.find_closest_versions("my_package", ["1.0.0"], [T311, T315])
+
+
+##############################
+#     Tests for the index    #
+##############################
+
+
+def resolve_ranges_linear(
+    state: dict[Target, list[VersionRange]], lookup: Target
+) -> list[VersionRange] | None:
+    # Reference implementation: scan every entry and keep the most specific
+    # match, the most recently registered one winning ties.
+    best, best_specificity = None, -1
+    for target, ranges in state.items():
+        if (target.python_version, target.free_threaded) != (
+            lookup.python_version,
+            lookup.free_threaded,
+        ):
+            continue
+        if target.os is not None and target.os != lookup.os:
+            continue
+        if target.arch is not None and target.arch != lookup.arch:
+            continue
+        specificity = (target.os is not None) + (target.arch is not None)
+        if specificity >= best_specificity:
+            best, best_specificity = ranges, specificity
+    return best
+
+
+def is_valid_version_linear(ranges: list[VersionRange], version: str) -> bool:
+    return any(
+        (r.min is None or Version(r.min) <= Version(version))
+        and (r.max is None or Version(version) <= Version(r.max))
+        for r in ranges
+    )
+
+
+def test_compat_registry_index_built_from_initial_state() -> None:
+    registry = CompatRegistry(
+        {
+            "my_package": {
+                Target(python_version="3.11", os="linux"): [VersionRange("1.0.0", None)],
+                Target(python_version="3.11", arch="x86_64"): [VersionRange("2.0.0", None)],
+            }
+        }
+    )
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    assert registry.get_config(pkg_name="my_package", target=target) == [
+        VersionRange("2.0.0", None)
+    ]
+
+
+def test_compat_registry_index_overwrite_keeps_registration_order() -> None:
+    registry = CompatRegistry()
+    linux = Target(python_version="3.11", os="linux")
+    registry.register("my_package", linux, ranges=[VersionRange("1.0.0", None)])
+    registry.register(
+        "my_package",
+        Target(python_version="3.11", arch="x86_64"),
+        ranges=[VersionRange("2.0.0", None)],
+    )
+    # Overwriting an entry does not make it the most recently registered one,
+    # like its key in the state dictionary.
+    registry.register("my_package", linux, ranges=[VersionRange("3.0.0", None)], exist_ok=True)
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    assert registry.get_config(pkg_name="my_package", target=target) == [
+        VersionRange("2.0.0", None)
+    ]
+    assert registry.get_config(pkg_name="my_package", target=linux) == [VersionRange("3.0.0", None)]
+
+
+def test_compat_registry_index_updated_on_register() -> None:
+    registry = CompatRegistry()
+    registry.register("my_package", T311, ranges=[VersionRange("1.0.0", "2.0.0")])
+    assert not registry.is_valid_version("my_package", "3.0.0", T311)
+    registry.register("my_package", T311, ranges=[VersionRange("1.0.0", None)], exist_ok=True)
+    assert registry.is_valid_version("my_package", "3.0.0", T311)
+
+
+def test_compat_registry_is_valid_version_overlapping_ranges() -> None:
+    registry = CompatRegistry()
+    registry.register(
+        "my_package",
+        T311,
+        ranges=[VersionRange("1.0.0", "3.0.0"), VersionRange("1.5.0", "2.0.0")],
+    )
+    assert registry.is_valid_version("my_package", "2.5.0", T311)
+    assert not registry.is_valid_version("my_package", "3.5.0", T311)
+
+
+def test_compat_registry_is_valid_version_unbounded_min_ranges() -> None:
+    registry = CompatRegistry()
+    registry.register(
+        "my_package",
+        T311,
+        ranges=[VersionRange("3.0.0", None), VersionRange(None, "1.0.0")],
+    )
+    assert registry.is_valid_version("my_package", "0.5.0", T311)
+    assert not registry.is_valid_version("my_package", "2.0.0", T311)
+    assert registry.find_closest_version("my_package", "2.0.0", T311) == "3.0.0"
+
+
+def test_compat_registry_get_version_ranges_returns_copy() -> None:
+    registry = CompatRegistry()
+    registry.register("my_package", T311, ranges=[VersionRange("1.0.0", None)])
+    registry.get_version_ranges("my_package", T311).clear()
+    assert registry.get_version_ranges("my_package", T311) == [(Version("1.0.0"), None)]
+
+
+def test_compat_registry_index_matches_linear_scan() -> None:
+    rng = random.Random(42)  # noqa: S311
+    keys = list(product([None, "linux", "macos"], [None, "x86_64", "arm64"]))
+    versions = [f"{major}.{minor}.0" for major in range(1, 4) for minor in range(4)]
+    for _ in range(50):
+        registry = CompatRegistry()
+        for os, arch in rng.sample(keys, rng.randint(1, len(keys))):
+            bounds = sorted(rng.sample(versions, 4), key=Version)
+            ranges = [
+                VersionRange(rng.choice([None, bounds[0]]), bounds[1]),
+                VersionRange(bounds[2], rng.choice([None, bounds[3]])),
+            ][: rng.randint(0, 2)]
+            registry.register(
+                "my_package", Target(python_version="3.11", os=os, arch=arch), ranges=ranges
+            )
+        for os, arch in keys:
+            lookup = Target(python_version="3.11", os=os, arch=arch)
+            expected = resolve_ranges_linear(registry.state["my_package"], lookup)
+            assert registry.get_config("my_package", lookup) == (expected or [])
+            assert registry.is_unsupported("my_package", lookup) == (expected == [])
+            for version in versions:
+                assert registry.is_valid_version("my_package", version, lookup) == (
+                    expected is None or is_valid_version_linear(expected, version)
+                )
+            assert registry.is_valid_versions("my_package", versions, lookup) == {
+                version: registry.is_valid_version("my_package", version, lookup)
+                for version in versions
+            }
+            if expected != []:
+                assert registry.find_closest_versions("my_package", versions, [lookup]) == {
+                    lookup: {
+                        version: registry.find_closest_version("my_package", version, lookup)
+                        for version in versions
+                    }
+                }
+
+
+#########################################
+#     Tests for targets_for_version     #
+#########################################
+
+
+def test_compat_registry_targets_for_version() -> None:
+    registry = CompatRegistry(
+        {
+            "numpy": {
+                T310: [VersionRange("1.0.0", "1.5.0")],
+                T311: [VersionRange("1.2.0", None)],
+                T315: [],
+            }
+        }
+    )
+    assert registry.targets_for_version("numpy", "0.5.0") == []
+    assert registry.targets_for_version("numpy", "1.0.0") == [T310]
+    assert registry.targets_for_version("numpy", "1.2.0") == [T310, T311]
+    assert registry.targets_for_version("numpy", "1.5.0") == [T310, T311]
+    assert registry.targets_for_version("numpy", "1.5.1") == [T311]
+
+
+def test_compat_registry_targets_for_version_targets() -> None:
+    registry = CompatRegistry(
+        {"numpy": {T310: [VersionRange("1.0.0", "1.5.0")], T315: [], T311: []}}
+    )
+    t312 = Target(python_version="3.12")
+    assert registry.targets_for_version("numpy", "1.2.0", [t312, T315, T310]) == [t312, T310]
+
+
+def test_compat_registry_targets_for_version_unknown_package() -> None:
+    registry = CompatRegistry()
+    assert registry.targets_for_version("numpy", "1.2.0") == []
+    assert registry.targets_for_version("numpy", "1.2.0", [T310, T311]) == [T310, T311]
+
+
+def test_compat_registry_targets_for_version_overlapping_ranges() -> None:
+    registry = CompatRegistry(
+        {
+            "numpy": {
+                T311: [
+                    VersionRange("1.0.0", "2.0.0"),
+                    VersionRange("1.5.0", "1.8.0"),
+                    VersionRange(None, "1.2.0"),
+                ]
+            }
+        }
+    )
+    assert registry.targets_for_version("numpy", "0.1.0") == [T311]
+    assert registry.targets_for_version("numpy", "1.8.0") == [T311]
+    assert registry.targets_for_version("numpy", "1.9.0") == [T311]
+    assert registry.targets_for_version("numpy", "2.0.1") == []
+
+
+def test_compat_registry_targets_for_version_wildcards() -> None:
+    linux = Target(python_version="3.11", os="linux", arch="x86_64")
+    macos = Target(python_version="3.11", os="macos", arch="arm64")
+    registry = CompatRegistry(
+        {
+            "numpy": {
+                T311: [VersionRange("1.0.0", None)],
+                Target(python_version="3.11", os="macos"): [VersionRange("1.5.0", None)],
+            }
+        }
+    )
+    assert registry.targets_for_version("numpy", "1.2.0", [linux, macos]) == [linux]
+    assert registry.targets_for_version("numpy", "1.5.0", [linux, macos]) == [linux, macos]
+
+
+def test_compat_registry_targets_for_version_normalized_bounds() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0", "2.0")]}})
+    assert registry.targets_for_version("numpy", "2.0.0") == [T311]
+    assert registry.targets_for_version("numpy", "2.0.0.post1") == []
+
+
+def test_compat_registry_targets_for_version_updated_on_register() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", None)]}})
+    assert registry.targets_for_version("numpy", "1.2.0") == [T311]
+    registry.register("numpy", T310, ranges=[VersionRange("1.1.0", None)])
+    assert registry.targets_for_version("numpy", "1.2.0") == [T311, T310]
+    registry.register("numpy", T311, ranges=[], exist_ok=True)
+    assert registry.targets_for_version("numpy", "1.2.0") == [T310]
+
+
+def test_compat_registry_targets_for_version_loader() -> None:
+    registry = CompatRegistry()
+    registry.register_loader("numpy", lambda: {"numpy": {T311: [VersionRange("1.0.0", None)]}})
+    assert registry.targets_for_version("numpy", "1.2.0") == [T311]
+
+
+def test_compat_registry_targets_for_version_overlay() -> None:
+    registry = CompatRegistry(
+        {"numpy": {T310: [VersionRange("1.0.0", None)], T311: [VersionRange("1.0.0", None)]}}
+    )
+    overlay = registry.overlay({"numpy": {T311: [], T315: [VersionRange("1.0.0", None)]}})
+    assert overlay.targets_for_version("numpy", "1.2.0") == [T310, T315]
+    registry.register("numpy", T310, ranges=[], exist_ok=True)
+    assert overlay.targets_for_version("numpy", "1.2.0") == [T315]
+
+
+def test_compat_registry_targets_for_version_matches_is_valid_version() -> None:
+    rng = random.Random(42)  # noqa: S311
+    versions = [f"1.{minor}.{micro}" for minor in range(10) for micro in range(3)]
+    targets = [
+        Target(python_version=f"3.{minor}", os=os, arch=arch)
+        for minor in range(10, 13)
+        for os, arch in product(("linux", "macos", None), ("x86_64", "arm64", None))
+    ]
+    for _ in range(20):
+        registry = CompatRegistry()
+        for target in rng.sample(targets, 15):
+            bounds = sorted(rng.sample(versions, 4), key=Version)
+            ranges = [
+                VersionRange(
+                    None if rng.random() < 0.2 else low, None if rng.random() < 0.2 else high
+                )
+                for low, high in zip(bounds[::2], bounds[1::2])
+                if rng.random() < 0.8
+            ]
+            registry.register("numpy", target, ranges=ranges)
+        for version in [*versions, "0.1.0", "2.0.0"]:
+            assert registry.targets_for_version("numpy", version, targets) == [
+                target for target in targets if registry.is_valid_version("numpy", version, target)
+            ]
+
+
+#############################################
+#     Tests for get_compatible_releases     #
+#############################################
+
+RELEASES = ["1.0.0", "1.0.1", "1.1.0", "1.1.2", "1.2.0", "2.0.0", "2.0.1", "2.1.0"]
+
+
+def test_compat_registry_get_compatible_releases() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.1", "2.0.0")]}})
+    registry.register_releases("numpy", RELEASES)
+    assert registry.get_compatible_releases("numpy", T311) == CompatibleReleases(
+        oldest="1.0.1", latest="2.0.0", latest_per_minor=("1.0.1", "1.1.2", "1.2.0", "2.0.0")
+    )
+
+
+def test_compat_registry_get_compatible_releases_several_ranges() -> None:
+    registry = CompatRegistry(
+        {"numpy": {T311: [VersionRange("2.0.1", None), VersionRange(None, "1.1.0")]}}
+    )
+    registry.register_releases("numpy", reversed(RELEASES))
+    assert registry.get_compatible_releases("numpy", T311) == CompatibleReleases(
+        oldest="1.0.0", latest="2.1.0", latest_per_minor=("1.0.1", "1.1.0", "2.0.1", "2.1.0")
+    )
+
+
+def test_compat_registry_get_compatible_releases_unsupported() -> None:
+    registry = CompatRegistry({"numpy": {T311: []}})
+    registry.register_releases("numpy", RELEASES)
+    assert registry.get_compatible_releases("numpy", T311) == CompatibleReleases(
+        oldest=None, latest=None, latest_per_minor=()
+    )
+
+
+def test_compat_registry_get_compatible_releases_unconfigured() -> None:
+    registry = CompatRegistry({"numpy": {T311: []}})
+    registry.register_releases("numpy", RELEASES)
+    assert registry.get_compatible_releases("numpy", T310) == CompatibleReleases(
+        oldest="1.0.0",
+        latest="2.1.0",
+        latest_per_minor=("1.0.1", "1.1.2", "1.2.0", "2.0.1", "2.1.0"),
+    )
+
+
+def test_compat_registry_get_compatible_releases_missing_releases() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.1", "2.0.0")]}})
+    assert registry.get_compatible_releases("numpy", T311) is None
+
+
+def test_compat_registry_get_compatible_releases_wildcards() -> None:
+    linux = Target(python_version="3.11", os="linux", arch="x86_64")
+    registry = CompatRegistry(
+        {
+            "numpy": {
+                T311: [VersionRange("1.0.0", None)],
+                Target(python_version="3.11", os="linux"): [VersionRange("1.2.0", "2.0.1")],
+            }
+        }
+    )
+    registry.register_releases("numpy", RELEASES)
+    assert registry.get_compatible_releases("numpy", linux).oldest == "1.2.0"
+    assert registry.get_compatible_releases("numpy", linux).latest == "2.0.1"
+    assert registry.get_compatible_releases("numpy", T311).latest == "2.1.0"
+
+
+def test_compat_registry_get_compatible_releases_matches_is_valid_version() -> None:
+    registry = CompatRegistry(
+        {"numpy": {T311: [VersionRange("1.0.1", "1.1.0"), VersionRange("1.2.0", "2.0.0")]}}
+    )
+    registry.register_releases("numpy", RELEASES)
+    compatible = [v for v in RELEASES if registry.is_valid_version("numpy", v, T311)]
+    releases = registry.get_compatible_releases("numpy", T311)
+    assert (releases.oldest, releases.latest) == (compatible[0], compatible[-1])
+
+
+def test_compat_registry_get_compatible_releases_is_memoized() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.1", "2.0.0")]}})
+    registry.register_releases("numpy", RELEASES)
+    first = registry.get_compatible_releases("numpy", T311)
+    assert registry.get_compatible_releases("numpy", T311) is first
+
+
+def test_compat_registry_get_compatible_releases_concurrent_first_lookup() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.1", "2.0.0")]}})
+    registry.register_releases("numpy", RELEASES)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: registry.get_compatible_releases("numpy", T311), range(32))
+        )
+    assert all(releases is results[0] for releases in results)
+
+
+def test_compat_registry_get_compatible_releases_updated_on_register() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.1", "2.0.0")]}})
+    registry.register_releases("numpy", RELEASES)
+    assert registry.get_compatible_releases("numpy", T311).latest == "2.0.0"
+    registry.register("numpy", T311, ranges=[VersionRange("1.0.1", None)], exist_ok=True)
+    assert registry.get_compatible_releases("numpy", T311).latest == "2.1.0"
+    registry.register_releases("numpy", [*RELEASES, "2.2.0"], exist_ok=True)
+    assert registry.get_compatible_releases("numpy", T311).latest == "2.2.0"
+
+
+def test_compat_registry_register_releases_duplicate() -> None:
+    registry = CompatRegistry()
+    registry.register_releases("numpy", RELEASES)
+    with pytest.raises(RuntimeError, match=r"The releases of package numpy are already registered"):
+        registry.register_releases("numpy", RELEASES)
+
+
+def test_compat_registry_get_compatible_releases_loader() -> None:
+    registry = CompatRegistry()
+    registry.register_loader("numpy", lambda: {"numpy": {T311: [VersionRange("1.1.0", None)]}})
+    registry.register_releases("numpy", RELEASES)
+    assert registry.get_compatible_releases("numpy", T311).oldest == "1.1.0"
+
+
+def test_compat_registry_get_compatible_releases_overlay() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.1", "2.0.0")]}})
+    registry.register_releases("numpy", RELEASES)
+    overlay = registry.overlay({"numpy": {T311: [VersionRange("1.1.0", "1.2.0")]}})
+    assert overlay.get_compatible_releases("numpy", T311).latest == "1.2.0"
+    overlay.register_releases("numpy", ["1.1.0", "1.1.5"])
+    assert overlay.get_compatible_releases("numpy", T311).latest == "1.1.5"
+    assert registry.get_compatible_releases("numpy", T311).latest == "2.0.0"
+
+
+##########################################
+#     Tests for CompatRegistry.overlay    #
+##########################################
+
+
+def test_compat_registry_overlay_empty() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", "2.0.0")]}})
+    overlay = registry.overlay()
+    assert overlay.state == {"numpy": {T311: [VersionRange("1.0.0", "2.0.0")]}}
+    assert overlay.get_config("numpy", T311) == [VersionRange("1.0.0", "2.0.0")]
+
+
+def test_compat_registry_overlay_takes_precedence() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", "2.0.0")]}})
+    overlay = registry.overlay({"numpy": {T311: [VersionRange("2.0.0", None)]}})
+    assert overlay.get_config("numpy", T311) == [VersionRange("2.0.0", None)]
+    assert overlay.find_closest_version("numpy", "1.5.0", T311) == "2.0.0"
+    assert registry.find_closest_version("numpy", "1.5.0", T311) == "1.5.0"
+
+
+def test_compat_registry_overlay_falls_through() -> None:
+    registry = CompatRegistry(
+        {
+            "numpy": {T311: [VersionRange("1.0.0", "2.0.0")], T310: []},
+            "torch": {T311: [VersionRange("2.0.0", None)]},
+        }
+    )
+    overlay = registry.overlay({"numpy": {T315: [VersionRange("2.3.0", None)]}})
+    assert overlay.get_config("numpy", T311) == [VersionRange("1.0.0", "2.0.0")]
+    assert overlay.is_unsupported("numpy", T310)
+    assert overlay.get_config("numpy", T315) == [VersionRange("2.3.0", None)]
+    assert overlay.is_valid_version("torch", "1.0.0", T311) is False
+    assert overlay.is_valid_version("pandas", "1.0.0", T311) is True
+
+
+def test_compat_registry_overlay_most_specific_entry_of_overlay_wins() -> None:
+    linux = Target(python_version="3.11", os="linux", arch="x86_64")
+    registry = CompatRegistry({"numpy": {linux: [VersionRange("1.0.0", "2.0.0")]}})
+    overlay = registry.overlay({"numpy": {T311: [VersionRange("2.0.0", None)]}})
+    assert overlay.get_config("numpy", linux) == [VersionRange("2.0.0", None)]
+
+
+def test_compat_registry_overlay_state() -> None:
+    registry = CompatRegistry(
+        {
+            "numpy": {T311: [VersionRange("1.0.0", "2.0.0")], T310: []},
+            "torch": {T311: [VersionRange("2.0.0", None)]},
+        }
+    )
+    overlay = registry.overlay(
+        {"numpy": {T311: [VersionRange("2.0.0", None)]}, "pandas": {T311: []}}
+    )
+    assert overlay.state == {
+        "numpy": {T311: [VersionRange("2.0.0", None)], T310: []},
+        "torch": {T311: [VersionRange("2.0.0", None)]},
+        "pandas": {T311: []},
+    }
+    assert registry.state == {
+        "numpy": {T311: [VersionRange("1.0.0", "2.0.0")], T310: []},
+        "torch": {T311: [VersionRange("2.0.0", None)]},
+    }
+
+
+def test_compat_registry_overlay_register_does_not_modify_base() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", "2.0.0")]}})
+    overlay = registry.overlay()
+    overlay.register("numpy", T311, ranges=[VersionRange("2.0.0", None)])
+    overlay.register("torch", T311, ranges=[])
+    assert overlay.get_config("numpy", T311) == [VersionRange("2.0.0", None)]
+    assert overlay.is_unsupported("torch", T311)
+    assert registry.state == {"numpy": {T311: [VersionRange("1.0.0", "2.0.0")]}}
+
+
+def test_compat_registry_overlay_sees_base_registrations() -> None:
+    registry = CompatRegistry()
+    overlay = registry.overlay()
+    registry.register("numpy", T311, ranges=[VersionRange("1.0.0", "2.0.0")])
+    assert overlay.get_config("numpy", T311) == [VersionRange("1.0.0", "2.0.0")]
+
+
+def test_compat_registry_overlay_base_loader() -> None:
+    registry = CompatRegistry()
+    loader = Mock(return_value={"numpy": {T311: [VersionRange("1.0.0", "2.0.0")]}})
+    registry.register_loader("numpy", loader)
+    overlay = registry.overlay({"torch": {T311: []}})
+    assert overlay.get_config("numpy", T311) == [VersionRange("1.0.0", "2.0.0")]
+    assert registry.get_config("numpy", T311) == [VersionRange("1.0.0", "2.0.0")]
+    loader.assert_called_once_with()
+
+
+def test_compat_registry_overlay_nested() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", None)]}})
+    overlay = registry.overlay({"numpy": {T310: [VersionRange("1.5.0", None)]}})
+    nested = overlay.overlay({"numpy": {T311: [VersionRange("2.0.0", None)]}})
+    assert nested.get_config("numpy", T311) == [VersionRange("2.0.0", None)]
+    assert nested.get_config("numpy", T310) == [VersionRange("1.5.0", None)]
+    assert overlay.get_config("numpy", T311) == [VersionRange("1.0.0", None)]
+
+
+def test_compat_registry_overlay_copies_mapping() -> None:
+    mapping = {"numpy": {T311: [VersionRange("2.0.0", None)]}}
+    overlay = CompatRegistry().overlay(mapping)
+    mapping["numpy"][T311].append(VersionRange("0.1.0", "0.2.0"))
+    assert overlay.get_config("numpy", T311) == [VersionRange("2.0.0", None)]
+
+
+##########################################
+#     Tests for CompatRegistry threads    #
+##########################################
+
+
+@pytest.fixture
+def _fast_thread_switching() -> None:
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_compat_registry_register_many_is_atomic() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", None)]}})
+    with pytest.raises(RuntimeError, match=r"is already registered"):
+        registry.register_many(
+            {
+                "torch": {T311: [VersionRange("2.0.0", None)]},
+                "numpy": {T311: [VersionRange("2.0.0", None)]},
+            }
+        )
+    assert registry.state == {"numpy": {T311: [VersionRange("1.0.0", None)]}}
+
+
+def test_compat_registry_state_is_snapshot() -> None:
+    registry = CompatRegistry({"numpy": {T311: [VersionRange("1.0.0", None)]}})
+    state = registry.state
+    registry.register("numpy", T310, ranges=[VersionRange("1.0.0", None)])
+    registry.register("torch", T311, ranges=[VersionRange("2.0.0", None)])
+    assert state == {"numpy": {T311: [VersionRange("1.0.0", None)]}}
+    assert registry.state == {
+        "numpy": {T311: [VersionRange("1.0.0", None)], T310: [VersionRange("1.0.0", None)]},
+        "torch": {T311: [VersionRange("2.0.0", None)]},
+    }
+
+
+def test_compat_registry_register_loader_failure_keeps_loader() -> None:
+    registry = CompatRegistry()
+    loader = Mock(side_effect=[ValueError("boom"), {"numpy": {T311: []}}])
+    registry.register_loader("numpy", loader)
+    with pytest.raises(ValueError, match=r"boom"):
+        registry.get_config("numpy", T311)
+    assert registry.is_unsupported("numpy", T311)
+    assert loader.call_count == 2
+
+
+@pytest.mark.usefixtures("_fast_thread_switching")
+def test_compat_registry_concurrent_register_and_lookup() -> None:
+    targets = [
+        Target(python_version=f"3.{minor}", os=os, arch=arch)
+        for minor in range(9, 15)
+        for os in ("linux", "macos", "windows")
+        for arch in ("x86_64", "arm64")
+    ]
+    pkg_names = [f"pkg{i}" for i in range(40)]
+    registry = CompatRegistry()
+    done = threading.Event()
+
+    def write(pkg_name: str) -> None:
+        registry.register_many(
+            {pkg_name: {target: [VersionRange("1.0.0", None)] for target in targets}}
+        )
+
+    def read() -> int:
+        num_checks = 0
+        while not done.is_set() or num_checks == 0:
+            for pkg_name, compat in registry.state.items():
+                # A package is never partially registered
+                assert len(compat) == len(targets), pkg_name
+            for pkg_name in pkg_names:
+                if registry.get_config(pkg_name, targets[-1]):
+                    # The entries registered with the last target stay visible
+                    assert registry.is_valid_version(pkg_name, "1.2.0", targets[0])
+                    assert registry.find_closest_version(pkg_name, "0.5.0", targets[0]) == "1.0.0"
+            num_checks += 1
+        return num_checks
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        readers = [executor.submit(read) for _ in range(4)]
+        writers = [executor.submit(write, pkg_name) for pkg_name in pkg_names]
+        for writer in writers:
+            writer.result()
+        done.set()
+        assert all(reader.result() > 0 for reader in readers)
+    assert sorted(registry.state) == sorted(pkg_names)
+    assert all(len(compat) == len(targets) for compat in registry.state.values())
+
+
+@pytest.mark.usefixtures("_fast_thread_switching")
+def test_compat_registry_concurrent_register_same_package() -> None:
+    registry = CompatRegistry()
+    targets = [Target(python_version=f"3.{minor}") for minor in range(9, 15)]
+
+    def write(i: int) -> None:
+        registry.register_many(
+            {"numpy": {target: [VersionRange(f"{i}.0.0", None)] for target in targets}},
+            exist_ok=True,
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, range(50)))
+    # The last registration overwrites all the targets
+    ranges = {tuple(registry.get_config("numpy", target)) for target in targets}
+    assert len(ranges) == 1
+
+
+@pytest.mark.usefixtures("_fast_thread_switching")
+def test_compat_registry_concurrent_loader_called_once() -> None:
+    def slow_loader() -> dict[str, dict[Target, list[VersionRange]]]:
+        time.sleep(0.01)
+        return {"numpy": {T311: [VersionRange("1.0.0", None)]}}
+
+    loader = Mock(side_effect=slow_loader)
+    registry = CompatRegistry()
+    registry.register_loader("numpy", loader)
+    barrier = threading.Barrier(8)
+
+    def read() -> bool:
+        barrier.wait()
+        return registry.is_valid_version("numpy", "1.2.0", T311)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(lambda _: read(), range(8)))
+    loader.assert_called_once_with()
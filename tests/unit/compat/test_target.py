@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import dataclasses
+import pickle
 from unittest.mock import Mock, patch
 
 import pytest
@@ -41,6 +43,87 @@ def test_target_used_as_dict_key() -> None:
     assert mapping[Target(python_version="3.11")] == "value"
 
 
+def test_target_python_ordinal() -> None:
+    assert Target(python_version="3.10").python_ordinal == (3, 10)
+    assert (
+        Target(python_version="3.9").python_ordinal < Target(python_version="3.10").python_ordinal
+    )
+
+
+def test_target_python_ordinal_not_in_repr() -> None:
+    assert repr(Target(python_version="3.11")) == (
+        "Target(python_version='3.11', free_threaded=False, os=None, arch=None)"
+    )
+
+
+def test_target_fields() -> None:
+    assert [f.name for f in dataclasses.fields(Target)] == [
+        "python_version",
+        "free_threaded",
+        "os",
+        "arch",
+    ]
+
+
+def test_target_asdict() -> None:
+    assert dataclasses.asdict(Target(python_version="3.11", os="linux")) == {
+        "python_version": "3.11",
+        "free_threaded": False,
+        "os": "linux",
+        "arch": None,
+    }
+
+
+def test_target_astuple() -> None:
+    assert dataclasses.astuple(Target(python_version="3.11", os="linux")) == (
+        "3.11",
+        False,
+        "linux",
+        None,
+    )
+
+
+def test_target_is_frozen() -> None:
+    target = Target(python_version="3.11")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        target.python_version = "3.12"
+
+
+def test_target_hash_is_cached() -> None:
+    target = Target(python_version="3.11", os="linux", arch="x86_64")
+    assert hash(target) == hash(("3.11", False, "linux", "x86_64"))
+
+
+def test_target_slots() -> None:
+    assert not hasattr(Target(python_version="3.11"), "__dict__")
+
+
+def test_target_pickle() -> None:
+    target = Target(python_version="3.11", free_threaded=True, os="linux", arch="arm64")
+    loaded = pickle.loads(pickle.dumps(target))  # noqa: S301
+    assert loaded == target
+    assert hash(loaded) == hash(target)
+    assert loaded is Target.of("3.11", free_threaded=True, os="linux", arch="arm64")
+
+
+def test_target_of() -> None:
+    assert Target.of("3.11", os="linux", arch="x86_64") == Target(
+        python_version="3.11", os="linux", arch="x86_64"
+    )
+
+
+def test_target_of_is_interned() -> None:
+    assert Target.of("3.12", free_threaded=True) is Target.of(
+        python_version="3.12", free_threaded=True
+    )
+    assert Target.of("3.12") is not Target.of("3.12", free_threaded=True)
+
+
+def test_target_of_invalid_os() -> None:
+    with pytest.raises(ValueError, match="invalid os"):
+        Target.of("3.11", os="solaris")
+
+
 def test_target_invalid_python_version_free_threaded_suffix() -> None:
     with pytest.raises(ValueError, match="invalid python_version"):
         Target(python_version="3.14t")
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import dataclasses
+import pickle
+
 import pytest
 
 from feu.compat.wheel_tags import (
@@ -7,6 +10,7 @@ from feu.compat.wheel_tags import (
     parse_arch,
     parse_os,
     parse_pure_python_tag,
+    parse_python_ordinal,
     parse_python_tag,
     parse_wheel_filename,
 )
@@ -109,6 +113,31 @@ def test_parse_wheel_filename_too_few_components_returns_empty() -> None:
     assert parse_wheel_filename("numpy-2.3.0-cp312-cp312.whl") == []
 
 
+def test_parse_wheel_filename_build_tag() -> None:
+    assert parse_wheel_filename("numpy-2.3.0-1-cp312-cp312-macosx_11_0_arm64.whl") == [
+        WheelTags(python_version="3.12", free_threaded=False, os="macos", arch="arm64")
+    ]
+
+
+def test_parse_wheel_filename_empty_components() -> None:
+    assert parse_wheel_filename("numpy--cp312-cp312-macosx_11_0_arm64.whl") == [
+        WheelTags(python_version="3.12", free_threaded=False, os="macos", arch="arm64")
+    ]
+
+
+def test_parse_wheel_filename_interns_tags() -> None:
+    (tags1,) = parse_wheel_filename("numpy-2.3.0-cp312-cp312-manylinux_2_17_x86_64.whl")
+    (tags2,) = parse_wheel_filename("numpy-2.3.1-cp312-cp312-manylinux_2_28_x86_64.whl")
+    assert tags1 is tags2
+
+
+def test_parse_wheel_filename_returns_new_list() -> None:
+    filename = "numpy-2.3.0-cp312-cp312-macosx_11_0_arm64.whl"
+    tags = parse_wheel_filename(filename)
+    tags.clear()
+    assert len(parse_wheel_filename(filename)) == 1
+
+
 def test_wheel_tags_is_frozen_and_comparable() -> None:
     a = WheelTags(python_version="3.11", free_threaded=False, os="linux", arch="x86_64")
     b = WheelTags(python_version="3.11", free_threaded=False, os="linux", arch="x86_64")
@@ -117,6 +146,80 @@ def test_wheel_tags_is_frozen_and_comparable() -> None:
         a.os = "macos"  # type: ignore[misc]
 
 
+def test_wheel_tags_hash() -> None:
+    a = WheelTags(python_version="3.11", free_threaded=False, os="linux", arch="x86_64")
+    b = WheelTags(python_version="3.11", free_threaded=False, os="linux", arch="x86_64")
+    c = WheelTags(python_version="3.11", free_threaded=False, os="linux", arch="x86_64", abi3=True)
+    assert hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+
+
+def test_wheel_tags_pickle() -> None:
+    tags = WheelTags("3.11", True, "linux", "x86_64", abi3=True)
+    loaded = pickle.loads(pickle.dumps(tags))  # noqa: S301
+    assert loaded == tags
+    assert hash(loaded) == hash(tags)
+    assert loaded.python_ordinal == (3, 11)
+
+
+def test_wheel_tags_slots() -> None:
+    assert not hasattr(WheelTags("3.11", False, "linux", "x86_64"), "__dict__")
+
+
+def test_wheel_tags_python_ordinal() -> None:
+    assert WheelTags("3.9", False, "linux", "x86_64").python_ordinal == (3, 9)
+
+
+def test_wheel_tags_python_ordinal_pure_python() -> None:
+    assert WheelTags(None, False, None, None).python_ordinal is None
+
+
+def test_wheel_tags_fields() -> None:
+    assert [f.name for f in dataclasses.fields(WheelTags)] == [
+        "python_version",
+        "free_threaded",
+        "os",
+        "arch",
+        "abi3",
+    ]
+
+
+def test_wheel_tags_astuple() -> None:
+    assert dataclasses.astuple(WheelTags("3.9", False, "linux", "x86_64")) == (
+        "3.9",
+        False,
+        "linux",
+        "x86_64",
+        False,
+    )
+
+
+def test_wheel_tags_python_ordinal_not_in_repr() -> None:
+    assert "python_ordinal" not in repr(WheelTags("3.9", False, "linux", "x86_64"))
+
+
+#################################################
+#     Tests for parse_python_ordinal            #
+#################################################
+
+
+@pytest.mark.parametrize(
+    ("python_version", "expected"),
+    [("3.9", (3, 9)), ("3.10", (3, 10)), ("3.14", (3, 14)), ("2.7", (2, 7)), ("3.12.1", (3, 12))],
+)
+def test_parse_python_ordinal(python_version: str, expected: tuple[int, int]) -> None:
+    assert parse_python_ordinal(python_version) == expected
+
+
+@pytest.mark.parametrize("python_version", [None, "", "3", "py3", "3.x"])
+def test_parse_python_ordinal_invalid_returns_none(python_version: str | None) -> None:
+    assert parse_python_ordinal(python_version) is None
+
+
+def test_parse_python_ordinal_ordering() -> None:
+    assert parse_python_ordinal("3.9") < parse_python_ordinal("3.10")
+
+
 #################################################
 #     Tests for parse_python_tag               #
 #################################################
@@ -165,7 +165,9 @@ def test_get_installable_versions_start_date() -> None:
 
 def test_get_installable_versions_filters_incompatible() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.side_effect = lambda **kwargs: kwargs["pkg_version"] != "1.1.0"
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: {
+        version: version != "1.1.0" for version in kwargs["pkg_versions"]
+    }
     with (
         patch(
             "feu.install.utils.fetch_pypi_versions",
@@ -177,6 +179,11 @@ def test_get_installable_versions_filters_incompatible() -> None:
             "1.0.0",
             "2.0.0",
         ]
+    registry_mock.is_valid_versions.assert_called_once_with(
+        pkg_name="my_package",
+        pkg_versions=["1.0.0", "1.1.0", "2.0.0"],
+        target=Target(python_version="3.11"),
+    )
 
 
 ######################################
@@ -186,7 +193,9 @@ def test_get_installable_versions_filters_incompatible() -> None:
 
 def test_install_all_versions_pip() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.return_value = True
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: dict.fromkeys(
+        kwargs["pkg_versions"], True
+    )
     with (
         patch(
             "feu.install.utils.fetch_pypi_versions",
@@ -208,7 +217,9 @@ def test_install_all_versions_pip() -> None:
 
 def test_install_all_versions_start_date() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.return_value = True
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: dict.fromkeys(
+        kwargs["pkg_versions"], True
+    )
     fetch_mock = Mock(return_value=("1.0.0", "1.1.0"))
     with (
         patch("feu.install.utils.fetch_pypi_versions", fetch_mock),
@@ -226,7 +237,9 @@ def test_install_all_versions_start_date() -> None:
 
 def test_install_all_versions_with_extras() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.return_value = True
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: dict.fromkeys(
+        kwargs["pkg_versions"], True
+    )
     with (
         patch(
             "feu.install.utils.fetch_pypi_versions",
@@ -246,7 +259,9 @@ def test_install_all_versions_with_extras() -> None:
 
 def test_install_all_versions_partial_failure() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.return_value = True
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: dict.fromkeys(
+        kwargs["pkg_versions"], True
+    )
     with (
         patch(
             "feu.install.utils.fetch_pypi_versions",
@@ -268,7 +283,9 @@ def test_install_all_versions_partial_failure() -> None:
 
 def test_install_all_versions_all_fail() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.return_value = True
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: dict.fromkeys(
+        kwargs["pkg_versions"], True
+    )
     with (
         patch(
             "feu.install.utils.fetch_pypi_versions",
@@ -295,7 +312,9 @@ def test_install_all_versions_all_fail() -> None:
 
 def test_install_packages_all_versions() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.return_value = True
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: dict.fromkeys(
+        kwargs["pkg_versions"], True
+    )
     with (
         patch(
             "feu.install.utils.fetch_pypi_versions",
@@ -320,7 +339,9 @@ def test_install_packages_all_versions() -> None:
 
 def test_install_packages_all_versions_start_date() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.return_value = True
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: dict.fromkeys(
+        kwargs["pkg_versions"], True
+    )
     fetch_mock = Mock(return_value=("1.0.0",))
     with (
         patch("feu.install.utils.fetch_pypi_versions", fetch_mock),
@@ -341,7 +362,9 @@ def test_install_packages_all_versions_start_date() -> None:
 
 def test_install_packages_all_versions_with_failure() -> None:
     registry_mock = Mock()
-    registry_mock.is_valid_version.return_value = True
+    registry_mock.is_valid_versions.side_effect = lambda **kwargs: dict.fromkeys(
+        kwargs["pkg_versions"], True
+    )
     with (
         patch(
             "feu.install.utils.fetch_pypi_versions",
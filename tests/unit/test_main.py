@@ -2,13 +2,22 @@ from __future__ import annotations
 
 from unittest.mock import Mock, patch
 
+import pytest
 from click.testing import CliRunner
+from packaging.version import Version
 
-from feu.__main__ import check_valid_version, find_closest_version, install
-from feu.compat import Target, UnsupportedVersionError
+from feu.__main__ import (
+    check_valid_version,
+    find_closest_version,
+    install,
+    latest_compatible,
+    scan_bounds,
+)
+from feu.compat import CompatibleReleases, Target, UnsupportedVersionError
 from feu.testing import click_available
 from feu.utils.installer import InstallerSpec
 from feu.utils.package import PackageSpec
+from feu.version import PackageBounds
 
 #############################
 #     Tests for install     #
@@ -275,3 +284,156 @@ def test_check_valid_version_default_options() -> None:
             "pkg_version": "2.0.2",
             "target": Target(python_version="3.12", free_threaded=False, os="macos", arch="arm64"),
         }
+
+
+#######################################
+#     Tests for latest_compatible     #
+#######################################
+
+RELEASES = CompatibleReleases(
+    oldest="1.8.0", latest="2.5.1", latest_per_minor=("1.8.1", "2.4.1", "2.5.1")
+)
+TARGET_OPTIONS = ["--python-version", "3.9", "--os", "windows", "--arch", "x86_64"]
+
+
+@click_available
+def test_latest_compatible() -> None:
+    runner = CliRunner()
+    mock = Mock(return_value=RELEASES)
+    with patch("feu.__main__.get_compatible_releases", mock):
+        result = runner.invoke(latest_compatible, ["--pkg-name", "torch", *TARGET_OPTIONS])
+        assert result.exit_code == 0
+        assert result.output.strip() == "2.5.1"
+        assert mock.call_args.kwargs == {
+            "pkg_name": "torch",
+            "target": Target(python_version="3.9", os="windows", arch="x86_64"),
+        }
+
+
+@click_available
+def test_latest_compatible_oldest() -> None:
+    runner = CliRunner()
+    with patch("feu.__main__.get_compatible_releases", Mock(return_value=RELEASES)):
+        result = runner.invoke(
+            latest_compatible, ["--pkg-name", "torch", "--mode", "oldest", *TARGET_OPTIONS]
+        )
+        assert result.exit_code == 0
+        assert result.output.strip() == "1.8.0"
+
+
+@click_available
+def test_latest_compatible_per_minor() -> None:
+    runner = CliRunner()
+    with patch("feu.__main__.get_compatible_releases", Mock(return_value=RELEASES)):
+        result = runner.invoke(
+            latest_compatible, ["--pkg-name", "torch", "--mode", "per-minor", *TARGET_OPTIONS]
+        )
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["1.8.1", "2.4.1", "2.5.1"]
+
+
+@click_available
+def test_latest_compatible_default_registry() -> None:
+    runner = CliRunner()
+    result = runner.invoke(
+        latest_compatible,
+        ["--pkg-name", "numpy", "--python-version", "3.11", "--os", "linux", "--arch", "x86_64"],
+    )
+    assert result.exit_code == 0
+    assert Version(result.output.strip()) >= Version("2.0.0")
+
+
+@click_available
+@pytest.mark.parametrize("mode", ["latest", "oldest", "per-minor"])
+def test_latest_compatible_no_compatible_release(mode: str) -> None:
+    runner = CliRunner()
+    releases = CompatibleReleases(oldest=None, latest=None, latest_per_minor=())
+    with patch("feu.__main__.get_compatible_releases", Mock(return_value=releases)):
+        result = runner.invoke(
+            latest_compatible, ["--pkg-name", "torch", "--mode", mode, *TARGET_OPTIONS]
+        )
+        assert result.exit_code == 1
+        assert "no release of torch is compatible with 3.9/windows/x86_64" in result.output
+
+
+@click_available
+def test_latest_compatible_unknown_releases() -> None:
+    runner = CliRunner()
+    with patch("feu.__main__.get_compatible_releases", Mock(return_value=None)):
+        result = runner.invoke(latest_compatible, ["--pkg-name", "torch", *TARGET_OPTIONS])
+        assert result.exit_code == 1
+        assert "no compatible release data for torch/3.9/windows/x86_64" in result.output
+
+
+@click_available
+def test_latest_compatible_unknown_releases_free_threaded() -> None:
+    runner = CliRunner()
+    with patch("feu.__main__.get_compatible_releases", Mock(return_value=None)):
+        result = runner.invoke(
+            latest_compatible,
+            ["--pkg-name", "torch", "--python-version", "3.14", "--free-threaded", "true"],
+        )
+        assert result.exit_code == 1
+        assert "no compatible release data for torch/3.14t/" in result.output
+
+
+@click_available
+def test_latest_compatible_incorrect_mode() -> None:
+    runner = CliRunner()
+    with patch("feu.__main__.get_compatible_releases") as mock:
+        result = runner.invoke(latest_compatible, ["--pkg-name", "torch", "--mode", "newest"])
+    assert result.exit_code == 2
+    assert "Invalid value for '-m' / '--mode'" in result.output
+    assert "'newest' is not one of 'latest', 'oldest', 'per-minor'" in result.output
+    mock.assert_not_called()
+
+
+#################################
+#     Tests for scan_bounds     #
+#################################
+
+
+@click_available
+def test_scan_bounds() -> None:
+    runner = CliRunner()
+    mock = Mock(
+        return_value=[
+            PackageBounds(name="numpy", lower="1.21", upper="2.0", section="project.dependencies"),
+            PackageBounds(name="torch", lower="2.0", upper=None, section="project.dependencies"),
+            PackageBounds(name="requests", lower=None, upper=None, section="project.dependencies"),
+        ]
+    )
+    with patch("feu.__main__.scan_package_bounds", mock):
+        result = runner.invoke(scan_bounds, ["--root", "repo"])
+        assert result.exit_code == 0
+        assert result.output.splitlines() == ["numpy>=1.21,<2.0", "torch>=2.0", "requests"]
+        mock.assert_called_once_with(
+            "repo", mode="tightest", max_workers=None, use_processes=False, cache_path=None
+        )
+
+
+@click_available
+def test_scan_bounds_options() -> None:
+    runner = CliRunner()
+    mock = Mock(return_value=[])
+    with patch("feu.__main__.scan_package_bounds", mock):
+        result = runner.invoke(
+            scan_bounds,
+            ["--mode", "loosest", "--max-workers", "4", "--processes", "--cache-path", "c.json"],
+        )
+        assert result.exit_code == 0
+        assert result.output == ""
+        mock.assert_called_once_with(
+            ".", mode="loosest", max_workers=4, use_processes=True, cache_path="c.json"
+        )
+
+
+@click_available
+def test_scan_bounds_incorrect_mode() -> None:
+    runner = CliRunner()
+    with patch("feu.__main__.scan_package_bounds") as mock:
+        result = runner.invoke(scan_bounds, ["--mode", "tighest"])
+    assert result.exit_code == 2
+    assert "Invalid value for '-m' / '--mode'" in result.output
+    assert "'tighest' is not one of 'tightest', 'loosest'" in result.output
+    mock.assert_not_called()
@@ -6,6 +6,7 @@ import pytest
 
 from feu.version import (
     PackageBounds,
+    PackageBoundsIndex,
     get_package_bounds,
     normalize_package_name,
     partition_package_bounds,
@@ -63,11 +64,136 @@ def test_package_bounds_is_immutable() -> None:
         bounds.lower = "1.0"  # type: ignore[misc]
 
 
+########################################
+#     Tests for PackageBoundsIndex     #
+########################################
+
+
+def test_package_bounds_index_repr() -> None:
+    assert repr(PackageBoundsIndex(PACKAGES)) == "PackageBoundsIndex(names=4, bounds=4)"
+
+
+def test_package_bounds_index_len() -> None:
+    assert len(PackageBoundsIndex(PACKAGES)) == 4
+
+
+def test_package_bounds_index_iter() -> None:
+    assert list(PackageBoundsIndex(PACKAGES)) == PACKAGES
+
+
+def test_package_bounds_index_contains() -> None:
+    index = PackageBoundsIndex(PACKAGES)
+    assert "numpy" in index
+    assert "Scikit_Learn" in index
+    assert "missing" not in index
+    assert 1 not in index
+
+
+def test_package_bounds_index_eq() -> None:
+    assert PackageBoundsIndex(PACKAGES) == PackageBoundsIndex(iter(PACKAGES))
+
+
+def test_package_bounds_index_eq_false() -> None:
+    assert PackageBoundsIndex(PACKAGES) != PackageBoundsIndex(PACKAGES[:2])
+
+
+def test_package_bounds_index_eq_other_type() -> None:
+    assert PackageBoundsIndex(PACKAGES) != PACKAGES
+
+
+def test_package_bounds_index_hash() -> None:
+    assert hash(PackageBoundsIndex(PACKAGES)) == hash(PackageBoundsIndex(PACKAGES))
+
+
+def test_package_bounds_index_is_immutable() -> None:
+    index = PackageBoundsIndex(PACKAGES)
+    with pytest.raises(AttributeError):
+        index.extra = 1  # type: ignore[attr-defined]
+
+
+def test_package_bounds_index_not_affected_by_input_mutation() -> None:
+    packages = list(PACKAGES)
+    index = PackageBoundsIndex(packages)
+    packages.clear()
+    assert len(index) == 4
+
+
+def test_package_bounds_index_bounds() -> None:
+    assert PackageBoundsIndex(PACKAGES).bounds == tuple(PACKAGES)
+
+
+def test_package_bounds_index_names() -> None:
+    index = PackageBoundsIndex([*PACKAGES, make_bounds("NumPy", section="dependency-groups.dev")])
+    assert index.names == ("numpy", "torch", "requests", "scikit_learn")
+
+
+def test_package_bounds_index_get() -> None:
+    assert PackageBoundsIndex(PACKAGES).get("scikit_learn") == make_bounds(
+        "scikit-learn", lower="1.0", upper="2.0"
+    )
+
+
+def test_package_bounds_index_get_missing() -> None:
+    with pytest.raises(ValueError, match=r"Package 'missing' not found"):
+        PackageBoundsIndex(PACKAGES).get("missing")
+
+
+def test_package_bounds_index_get_all_multiple_sections() -> None:
+    index = PackageBoundsIndex(
+        [
+            make_bounds("numpy", lower="1.21"),
+            make_bounds("torch"),
+            make_bounds("NumPy", upper="2.0", section="dependency-groups.dev"),
+        ]
+    )
+    assert index.get_all("numpy") == (
+        make_bounds("numpy", lower="1.21"),
+        make_bounds("NumPy", upper="2.0", section="dependency-groups.dev"),
+    )
+    assert index.sections("numpy") == ("project.dependencies", "dependency-groups.dev")
+
+
+def test_package_bounds_index_get_all_missing() -> None:
+    assert PackageBoundsIndex(PACKAGES).get_all("missing") == ()
+
+
+def test_package_bounds_index_sections_missing() -> None:
+    assert PackageBoundsIndex(PACKAGES).sections("missing") == ()
+
+
+def test_package_bounds_index_partition() -> None:
+    matched, unmatched = PackageBoundsIndex(PACKAGES).partition(["Scikit_Learn", "numpy"])
+    assert matched == [PACKAGES[0], PACKAGES[3]]
+    assert unmatched == [PACKAGES[1], PACKAGES[2]]
+
+
+def test_package_bounds_index_partition_none_matched() -> None:
+    assert PackageBoundsIndex(PACKAGES).partition(["missing"]) == ([], PACKAGES)
+
+
+def test_package_bounds_index_empty() -> None:
+    index = PackageBoundsIndex([])
+    assert len(index) == 0
+    assert index.names == ()
+    assert index.partition(["numpy"]) == ([], [])
+
+
 ########################################
 #     Tests for get_package_bounds     #
 ########################################
 
 
+def test_get_package_bounds_index() -> None:
+    assert get_package_bounds(PackageBoundsIndex(PACKAGES), "Scikit_Learn") == make_bounds(
+        "scikit-learn", lower="1.0", upper="2.0"
+    )
+
+
+def test_get_package_bounds_index_not_found_raises_value_error() -> None:
+    with pytest.raises(ValueError, match=r"Package 'missing' not found"):
+        get_package_bounds(PackageBoundsIndex(PACKAGES), "missing")
+
+
 def test_get_package_bounds_first_match() -> None:
     assert get_package_bounds(PACKAGES, "numpy") == make_bounds("numpy", lower="1.21", upper="2.0")
 
@@ -232,3 +358,10 @@ def test_partition_package_bounds_returns_tuple_of_two_lists() -> None:
     assert len(result) == 2
     assert isinstance(result[0], list)
     assert isinstance(result[1], list)
+
+
+def test_partition_package_bounds_index() -> None:
+    assert partition_package_bounds(PackageBoundsIndex(PACKAGES), ["torch"]) == (
+        [PACKAGES[1]],
+        [PACKAGES[0], PACKAGES[2], PACKAGES[3]],
+    )
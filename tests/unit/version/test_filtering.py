@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from itertools import count
+from typing import TYPE_CHECKING
+
 import pytest
+from packaging.version import Version
 
 from feu.version import (
     filter_every_n_versions,
@@ -8,12 +12,29 @@ from feu.version import (
     filter_range_versions,
     filter_stable_versions,
     filter_valid_versions,
+    iter_every_n_versions,
+    iter_last_n_versions,
+    iter_range_versions,
+    iter_stable_versions,
+    iter_unique_versions,
+    iter_valid_versions,
+    latest_by_key,
     latest_major_versions,
     latest_minor_versions,
     sort_versions,
     unique_versions,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def infinite_versions() -> Iterator[str]:
+    for i in count():
+        yield f"1.{i}.0"
+        yield f"1.{i}.1rc1"
+
+
 #############################################
 #     Tests for filter_every_n_versions     #
 #############################################
@@ -249,6 +270,165 @@ def test_filter_valid_versions_empty() -> None:
     assert filter_valid_versions([]) == []
 
 
+###########################################
+#     Tests for iter_every_n_versions     #
+###########################################
+
+
+def test_iter_every_n_versions() -> None:
+    assert list(iter_every_n_versions(iter(["1.0", "1.1", "1.2", "1.3", "1.5"]), n=2)) == [
+        "1.0",
+        "1.2",
+        "1.5",
+    ]
+
+
+def test_iter_every_n_versions_is_lazy() -> None:
+    versions = iter_every_n_versions(infinite_versions(), n=4)
+    assert next(versions) == "1.0.0"
+    assert next(versions) == "1.2.0"
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_iter_every_n_versions_incorrect_n(n: int) -> None:
+    with pytest.raises(ValueError, match=r"n must be >= 1 but received"):
+        iter_every_n_versions([], n=n)
+
+
+##########################################
+#     Tests for iter_last_n_versions     #
+##########################################
+
+
+def test_iter_last_n_versions() -> None:
+    assert list(iter_last_n_versions(iter(["1.0", "1.1", "1.2", "1.3"]), n=2)) == ["1.2", "1.3"]
+
+
+def test_iter_last_n_versions_larger_n() -> None:
+    assert list(iter_last_n_versions(iter(["1.0", "1.1"]), n=5)) == ["1.0", "1.1"]
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_iter_last_n_versions_incorrect_n(n: int) -> None:
+    with pytest.raises(ValueError, match=r"n must be > 0 but received"):
+        iter_last_n_versions([], n=n)
+
+
+#########################################
+#     Tests for iter_range_versions     #
+#########################################
+
+
+def test_iter_range_versions() -> None:
+    assert list(
+        iter_range_versions(
+            iter(["1.0.0", "1.2.0", "1.3.0", "2.0.0"]), lower="1.1.0", upper="2.0.0"
+        )
+    ) == ["1.2.0", "1.3.0"]
+
+
+def test_iter_range_versions_no_bounds() -> None:
+    assert list(iter_range_versions(iter(["1.0.0", "2.0.0"]))) == ["1.0.0", "2.0.0"]
+
+
+def test_iter_range_versions_is_lazy() -> None:
+    versions = iter_range_versions(infinite_versions(), lower="1.5")
+    assert next(versions) == "1.5.0"
+    assert next(versions) == "1.5.1rc1"
+
+
+def test_iter_range_versions_invalid_bound() -> None:
+    with pytest.raises(ValueError, match=r"Invalid version"):
+        iter_range_versions([], lower="invalid")
+
+
+##########################################
+#     Tests for iter_stable_versions     #
+##########################################
+
+
+def test_iter_stable_versions() -> None:
+    assert list(
+        iter_stable_versions(iter(["1.0.0", "1.0.0a1", "2.0.0", "2.0.0.dev1", "3.0.0.post1"]))
+    ) == ["1.0.0", "2.0.0"]
+
+
+def test_iter_stable_versions_is_lazy() -> None:
+    versions = iter_stable_versions(infinite_versions())
+    assert next(versions) == "1.0.0"
+    assert next(versions) == "1.1.0"
+
+
+def test_iter_stable_versions_empty() -> None:
+    assert list(iter_stable_versions([])) == []
+
+
+##########################################
+#     Tests for iter_unique_versions     #
+##########################################
+
+
+def test_iter_unique_versions() -> None:
+    assert list(iter_unique_versions(iter(["1.0.0", "1.0.1", "1.0.0", "1.2.0", "1.0.1"]))) == [
+        "1.0.0",
+        "1.0.1",
+        "1.2.0",
+    ]
+
+
+def test_iter_unique_versions_empty() -> None:
+    assert list(iter_unique_versions([])) == []
+
+
+#########################################
+#     Tests for iter_valid_versions     #
+#########################################
+
+
+def test_iter_valid_versions() -> None:
+    assert list(iter_valid_versions(iter(["1.0.0", "not-a-version", "", "2", "v1.0.0"]))) == [
+        "1.0.0",
+        "2",
+        "v1.0.0",
+    ]
+
+
+def test_iter_valid_versions_chain() -> None:
+    versions = iter_unique_versions(
+        iter_range_versions(
+            iter_stable_versions(iter_valid_versions(["1.0", "x", "1.1rc1", "1.1", "1.0", "2.0"])),
+            upper="2.0",
+        )
+    )
+    assert list(versions) == ["1.0", "1.1"]
+
+
+def test_iter_valid_versions_empty() -> None:
+    assert list(iter_valid_versions([])) == []
+
+
+###################################
+#     Tests for latest_by_key     #
+###################################
+
+
+def test_latest_by_key() -> None:
+    assert latest_by_key(["1.0.0", "2.0.1", "1.2.0", "1.1.3", "2.0.0"], key=lambda v: v.major) == [
+        "1.2.0",
+        "2.0.1",
+    ]
+
+
+def test_latest_by_key_parsed_versions() -> None:
+    assert latest_by_key(
+        [Version("1.0.0"), "1.2.0", Version("1.10.0")], key=lambda v: v.minor < 5
+    ) == ["1.10.0", "1.2.0"]
+
+
+def test_latest_by_key_empty() -> None:
+    assert latest_by_key([], key=lambda v: v.major) == []
+
+
 ###########################################
 #     Tests for latest_major_versions     #
 ###########################################
@@ -281,6 +461,12 @@ def test_latest_major_versions_empty() -> None:
     assert latest_major_versions([]) == []
 
 
+def test_latest_major_versions_iterator() -> None:
+    assert latest_major_versions(
+        iter_stable_versions(iter(["1.0.0", "1.1.0", "2.0.0rc1", "1.2.1", "2.0.0"]))
+    ) == ["1.2.1", "2.0.0"]
+
+
 ###########################################
 #     Tests for latest_minor_versions     #
 ###########################################
@@ -317,6 +503,12 @@ def test_latest_minor_versions_empty() -> None:
     assert latest_minor_versions([]) == []
 
 
+def test_latest_minor_versions_iterator() -> None:
+    assert latest_minor_versions(
+        iter_stable_versions(iter(["1.0.0", "1.0.1", "1.1.0", "1.1.1rc1", "2.0.0"]))
+    ) == ["1.0.1", "1.1.0", "2.0.0"]
+
+
 #####################################
 #     Tests for unique_versions     #
 #####################################
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
 from typing import Any
 from unittest.mock import Mock, patch
 
+import pytest
+
 from feu.version import (
     PackageBounds,
+    VersionReport,
     fetch_latest_major_versions,
     fetch_latest_major_versions_map,
     fetch_latest_minor_versions,
@@ -12,6 +17,7 @@ from feu.version import (
     fetch_latest_stable_version,
     fetch_latest_version,
     fetch_sampled_latest_minor_versions,
+    fetch_version_report,
     fetch_versions,
 )
 
@@ -364,6 +370,107 @@ def test_fetch_latest_stable_version_random() -> None:
         assert fetch_latest_stable_version("my_package") == "2.1.0"
 
 
+##########################################
+#     Tests for fetch_version_report     #
+##########################################
+
+RELEASES = (
+    "0.9.0",
+    "1.0.0",
+    "1.0.1",
+    "1.1.0",
+    "1.1.2",
+    "1.2.0rc1",
+    "1.2.0",
+    "1.2.0",
+    "2.0.0.dev1",
+    "2.0.0",
+    "2.0.3",
+    "2.1.0.post1",
+    "3.0.0a1",
+    "not-a-version",
+)
+
+
+def test_fetch_version_report() -> None:
+    with patch(f"{MODULE}.fetch_pypi_versions", Mock(return_value=RELEASES)):
+        assert fetch_version_report("my_package", lower="1.0.1", upper="2.0.3", n=2) == (
+            VersionReport(
+                package="my_package",
+                latest="3.0.0a1",
+                latest_stable="2.0.3",
+                stable_versions=("1.0.1", "1.1.0", "1.1.2", "1.2.0", "2.0.0"),
+                latest_major_versions=("1.2.0", "2.0.0"),
+                latest_minor_versions=("1.0.1", "1.1.2", "1.2.0", "2.0.0"),
+                sampled_minor_versions=("1.0.1", "1.2.0", "2.0.0"),
+            )
+        )
+
+
+@pytest.mark.parametrize(
+    ("lower", "upper"), [(None, None), ("1.0.1", None), (None, "2.0.0"), ("1.1.0", "2.0.1")]
+)
+@pytest.mark.parametrize("n", [1, 2, 3])
+@pytest.mark.parametrize("include_lower_bound", [True, False])
+def test_fetch_version_report_matches_functions(
+    lower: str | None, upper: str | None, n: int, include_lower_bound: bool
+) -> None:
+    with patch(f"{MODULE}.fetch_pypi_versions", Mock(return_value=RELEASES)):
+        report = fetch_version_report(
+            "my_package", lower=lower, upper=upper, n=n, include_lower_bound=include_lower_bound
+        )
+        kwargs = {"lower": lower, "upper": upper, "include_lower_bound": include_lower_bound}
+        assert report.latest == fetch_latest_version("my_package")
+        assert report.latest_stable == fetch_latest_stable_version("my_package")
+        assert report.stable_versions == fetch_versions("my_package", lower=lower, upper=upper)
+        assert report.latest_major_versions == fetch_latest_major_versions("my_package", **kwargs)
+        assert report.latest_minor_versions == fetch_latest_minor_versions("my_package", **kwargs)
+        assert report.sampled_minor_versions == fetch_sampled_latest_minor_versions(
+            "my_package", n=n, **kwargs
+        )
+
+
+def test_fetch_version_report_fetches_once() -> None:
+    mock = Mock(return_value=RELEASES)
+    with patch(f"{MODULE}.fetch_pypi_versions", mock):
+        fetch_version_report("my_package")
+    mock.assert_called_once_with("my_package")
+
+
+def test_fetch_version_report_empty() -> None:
+    with patch(f"{MODULE}.fetch_pypi_versions", Mock(return_value=())):
+        assert fetch_version_report("my_package") == VersionReport(
+            package="my_package",
+            latest=None,
+            latest_stable=None,
+            stable_versions=(),
+            latest_major_versions=(),
+            latest_minor_versions=(),
+            sampled_minor_versions=(),
+        )
+
+
+def test_fetch_version_report_only_pre_releases() -> None:
+    with patch(f"{MODULE}.fetch_pypi_versions", Mock(return_value=("1.0.0a1", "1.0.0rc1"))):
+        report = fetch_version_report("my_package")
+    assert report.latest == "1.0.0rc1"
+    assert report.latest_stable is None
+    assert report.stable_versions == ()
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_fetch_version_report_incorrect_n(n: int) -> None:
+    with pytest.raises(ValueError, match=r"n must be >= 1 but received"):
+        fetch_version_report("my_package", n=n)
+
+
+def test_fetch_version_report_is_immutable() -> None:
+    with patch(f"{MODULE}.fetch_pypi_versions", Mock(return_value=RELEASES)):
+        report = fetch_version_report("my_package")
+    with pytest.raises(FrozenInstanceError):
+        report.latest = "0.0.0"  # type: ignore[misc]
+
+
 ##################################################
 #     Tests for fetch_latest_major_versions_map  #
 ##################################################
@@ -490,6 +597,77 @@ def test_fetch_latest_major_versions_map_passes_include_lower_bound_false_by_def
     mock.assert_called_once_with("numpy", lower="1.21", include_lower_bound=False)
 
 
+def test_fetch_latest_major_versions_map_max_workers() -> None:
+    def side_effect(name: str, lower: str | None, include_lower_bound: bool) -> Any:  # noqa: ARG001
+        return iter(
+            {"numpy": ["1.21.6", "1.22.4"], "torch": ["2.0.1", "2.1.0"], "jax": ["0.4.30"]}[name]
+        )
+
+    with patch(f"{MODULE}.fetch_latest_major_versions", side_effect=side_effect):
+        result = fetch_latest_major_versions_map(
+            [
+                make_bounds("torch", lower="2.0"),
+                make_bounds("numpy", lower="1.21"),
+                make_bounds("jax", lower="0.4"),
+            ],
+            max_workers=3,
+        )
+
+    assert result == {"torch": ["2.0.1", "2.1.0"], "numpy": ["1.21.6", "1.22.4"], "jax": ["0.4.30"]}
+    assert list(result) == ["torch", "numpy", "jax"]
+
+
+def test_fetch_latest_major_versions_map_executor() -> None:
+    with (
+        patch(f"{MODULE}.fetch_latest_major_versions", return_value=iter(["1.21.6"])) as mock,
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        result = fetch_latest_major_versions_map(
+            [make_bounds("numpy", lower="1.21")], executor=executor
+        )
+    mock.assert_called_once_with("numpy", lower="1.21", include_lower_bound=False)
+    assert result == {"numpy": ["1.21.6"]}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_fetch_latest_major_versions_map_failure_raises(max_workers: int) -> None:
+    def side_effect(name: str, lower: str | None, include_lower_bound: bool) -> Any:  # noqa: ARG001
+        if name == "numpy":
+            msg = "network error"
+            raise RuntimeError(msg)
+        return iter(["2.0.1"])
+
+    with (
+        patch(f"{MODULE}.fetch_latest_major_versions", side_effect=side_effect),
+        pytest.raises(RuntimeError, match=r"network error"),
+    ):
+        fetch_latest_major_versions_map(
+            [make_bounds("torch", lower="2.0"), make_bounds("numpy", lower="1.21")],
+            max_workers=max_workers,
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_fetch_latest_major_versions_map_failure_does_not_abort(
+    max_workers: int, caplog: pytest.LogCaptureFixture
+) -> None:
+    def side_effect(name: str, lower: str | None, include_lower_bound: bool) -> Any:  # noqa: ARG001
+        if name == "numpy":
+            msg = "network error"
+            raise RuntimeError(msg)
+        return iter(["2.0.1"])
+
+    with patch(f"{MODULE}.fetch_latest_major_versions", side_effect=side_effect):
+        result = fetch_latest_major_versions_map(
+            [make_bounds("numpy", lower="1.21"), make_bounds("torch", lower="2.0")],
+            max_workers=max_workers,
+            raise_on_error=False,
+        )
+
+    assert result == {"torch": ["2.0.1"]}
+    assert "failed to fetch the versions of numpy" in caplog.text
+
+
 ##################################################
 #     Tests for fetch_latest_minor_versions_map  #
 ##################################################
@@ -618,3 +796,74 @@ def test_fetch_latest_minor_versions_map_passes_include_lower_bound_false_by_def
     with patch(f"{MODULE}.fetch_latest_minor_versions", return_value=iter([])) as mock:
         fetch_latest_minor_versions_map([make_bounds("numpy", lower="1.21")])
     mock.assert_called_once_with("numpy", lower="1.21", include_lower_bound=False)
+
+
+def test_fetch_latest_minor_versions_map_max_workers() -> None:
+    def side_effect(name: str, lower: str | None, include_lower_bound: bool) -> Any:  # noqa: ARG001
+        return iter(
+            {"numpy": ["1.21.6", "1.22.4"], "torch": ["2.0.1", "2.1.0"], "jax": ["0.4.30"]}[name]
+        )
+
+    with patch(f"{MODULE}.fetch_latest_minor_versions", side_effect=side_effect):
+        result = fetch_latest_minor_versions_map(
+            [
+                make_bounds("torch", lower="2.0"),
+                make_bounds("numpy", lower="1.21"),
+                make_bounds("jax", lower="0.4"),
+            ],
+            max_workers=3,
+        )
+
+    assert result == {"torch": ["2.0.1", "2.1.0"], "numpy": ["1.21.6", "1.22.4"], "jax": ["0.4.30"]}
+    assert list(result) == ["torch", "numpy", "jax"]
+
+
+def test_fetch_latest_minor_versions_map_executor() -> None:
+    with (
+        patch(f"{MODULE}.fetch_latest_minor_versions", return_value=iter(["1.21.6"])) as mock,
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        result = fetch_latest_minor_versions_map(
+            [make_bounds("numpy", lower="1.21")], executor=executor
+        )
+    mock.assert_called_once_with("numpy", lower="1.21", include_lower_bound=False)
+    assert result == {"numpy": ["1.21.6"]}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_fetch_latest_minor_versions_map_failure_raises(max_workers: int) -> None:
+    def side_effect(name: str, lower: str | None, include_lower_bound: bool) -> Any:  # noqa: ARG001
+        if name == "numpy":
+            msg = "network error"
+            raise RuntimeError(msg)
+        return iter(["2.0.1"])
+
+    with (
+        patch(f"{MODULE}.fetch_latest_minor_versions", side_effect=side_effect),
+        pytest.raises(RuntimeError, match=r"network error"),
+    ):
+        fetch_latest_minor_versions_map(
+            [make_bounds("torch", lower="2.0"), make_bounds("numpy", lower="1.21")],
+            max_workers=max_workers,
+        )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_fetch_latest_minor_versions_map_failure_does_not_abort(
+    max_workers: int, caplog: pytest.LogCaptureFixture
+) -> None:
+    def side_effect(name: str, lower: str | None, include_lower_bound: bool) -> Any:  # noqa: ARG001
+        if name == "numpy":
+            msg = "network error"
+            raise RuntimeError(msg)
+        return iter(["2.0.1"])
+
+    with patch(f"{MODULE}.fetch_latest_minor_versions", side_effect=side_effect):
+        result = fetch_latest_minor_versions_map(
+            [make_bounds("numpy", lower="1.21"), make_bounds("torch", lower="2.0")],
+            max_workers=max_workers,
+            raise_on_error=False,
+        )
+
+    assert result == {"torch": ["2.0.1"]}
+    assert "failed to fetch the versions of numpy" in caplog.text
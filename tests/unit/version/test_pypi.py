@@ -8,8 +8,12 @@ import pytest
 from feu.imports import is_requests_available
 from feu.testing import requests_available
 from feu.version import (
+    ReleaseIndex,
+    fetch_pypi_last_serial,
     fetch_pypi_pinned_dependency_version,
+    fetch_pypi_release_index,
     fetch_pypi_requires_python,
+    fetch_pypi_upload_times,
     fetch_pypi_versions,
     fetch_pypi_wheel_filenames,
 )
@@ -24,9 +28,12 @@ else:
 @pytest.fixture(autouse=True)
 def _reset_cache() -> None:
     fetch_pypi_versions.cache_clear()
+    fetch_pypi_release_index.cache_clear()
     fetch_pypi_requires_python.cache_clear()
     fetch_pypi_wheel_filenames.cache_clear()
     fetch_pypi_pinned_dependency_version.cache_clear()
+    fetch_pypi_last_serial.cache_clear()
+    fetch_pypi_upload_times.cache_clear()
 
 
 #########################################
@@ -212,6 +219,155 @@ def test_fetch_pypi_versions_ignore_yanked_false(monkeypatch: pytest.MonkeyPatch
     )
 
 
+@requests_available
+def test_fetch_pypi_versions_date_windows_fetch_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = Mock(get=Mock(return_value=make_mock_dated_response()))
+    monkeypatch.setattr(requests, "Session", lambda: session)
+
+    assert fetch_pypi_versions("my_package", start_date="2024-06-01") == ("1.2.0", "1.3.0", "2.0.0")
+    assert fetch_pypi_versions("my_package", end_date="2024-01-10") == ("1.0.0", "1.1.0")
+    session.get.assert_called_once_with(url="https://pypi.org/pypi/my_package/json", timeout=10.0)
+
+
+##################################
+#     Tests for ReleaseIndex     #
+##################################
+
+
+def test_release_index_from_releases() -> None:
+    index = ReleaseIndex.from_releases(
+        {
+            "1.1.0": [{"upload_time_iso_8601": "2024-01-10T00:00:00.000000Z", "yanked": True}],
+            "1.0.0": [
+                {"upload_time_iso_8601": "2023-06-16T00:00:00.000000Z"},
+                {"upload_time_iso_8601": "2023-06-15T00:00:00.000000Z"},
+            ],
+            "2.0.0": [],
+            "2.1.0": None,
+        }
+    )
+    assert index == ReleaseIndex(
+        versions=("1.1.0", "1.0.0", "2.0.0", "2.1.0"),
+        yanked=frozenset({"1.1.0"}),
+        dated_versions=("1.0.0", "1.1.0"),
+        dates=(date(2023, 6, 15), date(2024, 1, 10)),
+    )
+
+
+def test_release_index_from_releases_empty() -> None:
+    assert ReleaseIndex.from_releases({}) == ReleaseIndex(
+        versions=(), yanked=frozenset(), dated_versions=(), dates=()
+    )
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        (None, None, ("1.0.0", "1.1.0", "1.2.0")),
+        ("2024-01-10", None, ("1.1.0", "1.2.0")),
+        (None, "2024-01-10", ("1.0.0", "1.1.0")),
+        (date(2024, 1, 10), date(2024, 1, 10), ("1.1.0",)),
+        ("2024-01-11", "2024-05-31", ()),
+        ("2026-01-01", None, ()),
+    ],
+)
+def test_release_index_between(
+    start: date | str | None, end: date | str | None, expected: tuple[str, ...]
+) -> None:
+    index = ReleaseIndex(
+        versions=("1.0.0", "1.1.0", "1.2.0"),
+        yanked=frozenset(),
+        dated_versions=("1.0.0", "1.1.0", "1.2.0"),
+        dates=(date(2023, 6, 15), date(2024, 1, 10), date(2024, 6, 1)),
+    )
+    assert index.between(start=start, end=end) == expected
+
+
+##############################################
+#     Tests for fetch_pypi_release_index     #
+##############################################
+
+
+@requests_available
+def test_fetch_pypi_release_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = Mock(get=Mock(return_value=make_mock_dated_response()))
+    monkeypatch.setattr(requests, "Session", lambda: session)
+
+    index = fetch_pypi_release_index("my_package")
+    assert index.versions == ("1.0.0", "1.1.0", "1.2.0", "1.3.0", "2.0.0", "2.1.0")
+    assert index.dated_versions == ("1.0.0", "1.1.0", "1.2.0", "1.3.0", "2.0.0")
+    session.get.assert_called_once_with(url="https://pypi.org/pypi/my_package/json", timeout=10.0)
+
+
+@patch("feu.imports.requests.is_requests_available", lambda: False)
+def test_fetch_pypi_release_index_no_requests() -> None:
+    with pytest.raises(RuntimeError, match=r"'requests' package is required but not installed."):
+        fetch_pypi_release_index("my_package")
+
+
+############################################
+#     Tests for fetch_pypi_last_serial     #
+############################################
+
+
+@requests_available
+def test_fetch_pypi_last_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    resp = Mock(json=Mock(return_value={"last_serial": 12345, "releases": {}}))
+    resp.status_code = 200
+    session = Mock(get=Mock(return_value=resp))
+    monkeypatch.setattr(requests, "Session", lambda: session)
+
+    assert fetch_pypi_last_serial("my_package") == 12345
+    session.get.assert_called_once_with(url="https://pypi.org/pypi/my_package/json", timeout=10.0)
+
+
+@patch("feu.imports.requests.is_requests_available", lambda: False)
+def test_fetch_pypi_last_serial_no_requests() -> None:
+    with pytest.raises(RuntimeError, match=r"'requests' package is required but not installed."):
+        fetch_pypi_last_serial("my_package")
+
+
+#############################################
+#     Tests for fetch_pypi_upload_times     #
+#############################################
+
+
+@requests_available
+def test_fetch_pypi_upload_times(monkeypatch: pytest.MonkeyPatch) -> None:
+    resp = Mock(
+        json=Mock(
+            return_value={
+                "releases": {
+                    "1.0.0": [
+                        {"upload_time_iso_8601": "2023-06-15T10:00:00.500000Z"},
+                        {"upload_time_iso_8601": "2024-01-10T08:30:00Z"},
+                    ],
+                    "1.1.0": [{"upload_time_iso_8601": "2024-06-01T00:00:00.000000Z"}],
+                    "1.2.0": [],
+                    "2.0.0": None,
+                }
+            }
+        )
+    )
+    resp.status_code = 200
+    session = Mock(get=Mock(return_value=resp))
+    monkeypatch.setattr(requests, "Session", lambda: session)
+
+    assert fetch_pypi_upload_times("my_package") == {
+        "1.0.0": "2024-01-10T08:30:00.000000+00:00",
+        "1.1.0": "2024-06-01T00:00:00.000000+00:00",
+        "1.2.0": None,
+        "2.0.0": None,
+    }
+    session.get.assert_called_once_with(url="https://pypi.org/pypi/my_package/json", timeout=10.0)
+
+
+@patch("feu.imports.requests.is_requests_available", lambda: False)
+def test_fetch_pypi_upload_times_no_requests() -> None:
+    with pytest.raises(RuntimeError, match=r"'requests' package is required but not installed."):
+        fetch_pypi_upload_times("my_package")
+
+
 ##################################################
 #     Tests for fetch_pypi_requires_python     #
 ##################################################
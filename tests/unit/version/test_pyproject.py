@@ -7,6 +7,7 @@ import pytest
 
 from feu.version import (
     PackageBounds,
+    PyprojectDocument,
     read_pyproject_dependencies,
     read_pyproject_optional_dependencies,
     read_pyproject_package_bounds,
@@ -290,6 +291,21 @@ def test_read_pyproject_dependencies_invalid_toml(tmp_path: Path) -> None:
         read_pyproject_dependencies(path)
 
 
+def test_read_pyproject_dependencies_ignores_malformed_other_sections(tmp_path: Path) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text(
+        "[project]\n"
+        'dependencies = ["numpy>=1.21"]\n'
+        "[project.optional-dependencies]\n"
+        'dev = ["not a valid spec!!"]\n'
+        "[dependency-groups]\n"
+        'test = ["pytest >= = 7"]\n'
+    )
+    assert read_pyproject_dependencies(path) == [
+        PackageBounds(name="numpy", lower="1.21", upper=None, section="project.dependencies")
+    ]
+
+
 ##########################################################
 #     Tests for read_pyproject_optional_dependencies     #
 ##########################################################
@@ -348,6 +364,25 @@ def test_read_pyproject_optional_dependencies_section_reflects_group(
     }
 
 
+def test_read_pyproject_optional_dependencies_ignores_malformed_other_sections(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "pyproject.toml"
+    path.write_text(
+        "[project]\n"
+        'dependencies = ["not a valid spec!!"]\n'
+        "[project.optional-dependencies]\n"
+        'dev = ["pytest>=7.0"]\n'
+        "[dependency-groups]\n"
+        'test = ["pytest >= = 7"]\n'
+    )
+    assert read_pyproject_optional_dependencies(path) == [
+        PackageBounds(
+            name="pytest", lower="7.0", upper=None, section="project.optional-dependencies.dev"
+        )
+    ]
+
+
 def test_read_pyproject_optional_dependencies_minimal_file_returns_empty_list(
     pyproject_minimal: Path,
 ) -> None:
@@ -370,3 +405,117 @@ def test_read_pyproject_optional_dependencies_invalid_toml(tmp_path: Path) -> No
     path.write_text("this is not : valid [ toml")
     with pytest.raises(tomllib.TOMLDecodeError):
         read_pyproject_optional_dependencies(path)
+
+
+#######################################
+#     Tests for PyprojectDocument     #
+#######################################
+
+
+def test_pyproject_document_repr(pyproject: Path) -> None:
+    assert repr(PyprojectDocument.load(pyproject)).startswith("PyprojectDocument(")
+
+
+def test_pyproject_document_path(pyproject: Path) -> None:
+    assert PyprojectDocument.load(pyproject).path == pyproject
+
+
+def test_pyproject_document_path_none() -> None:
+    assert PyprojectDocument.from_dict({}).path is None
+
+
+def test_pyproject_document_bounds(pyproject: Path) -> None:
+    assert [(b.name, b.section) for b in PyprojectDocument.load(pyproject).bounds] == [
+        ("numpy", "project.dependencies"),
+        ("torch", "project.dependencies"),
+        ("requests", "project.dependencies"),
+        ("coola", "project.dependencies"),
+        ("scikit-learn", "project.dependencies"),
+        ("pytest", "project.optional-dependencies.dev"),
+        ("numpy", "project.optional-dependencies.dev"),
+        ("scipy", "project.optional-dependencies.extra"),
+        ("mypy", "dependency-groups.dev"),
+        ("numpy", "dependency-groups.dev"),
+        ("ruff", "dependency-groups.lint"),
+    ]
+
+
+def test_pyproject_document_sections(pyproject: Path) -> None:
+    assert PyprojectDocument.load(pyproject).sections == (
+        "project.dependencies",
+        "project.optional-dependencies.dev",
+        "project.optional-dependencies.extra",
+        "dependency-groups.dev",
+        "dependency-groups.lint",
+    )
+
+
+def test_pyproject_document_from_dict_empty() -> None:
+    doc = PyprojectDocument.from_dict({})
+    assert doc.bounds == ()
+    assert doc.dependencies() == []
+    assert doc.optional_dependencies() == []
+    assert doc.package_bounds("numpy") == []
+
+
+def test_pyproject_document_dependencies(pyproject: Path) -> None:
+    doc = PyprojectDocument.load(pyproject)
+    assert doc.dependencies() == read_pyproject_dependencies(pyproject)
+
+
+def test_pyproject_document_optional_dependencies(pyproject: Path) -> None:
+    doc = PyprojectDocument.load(pyproject)
+    assert doc.optional_dependencies() == read_pyproject_optional_dependencies(pyproject)
+
+
+def test_pyproject_document_package_bounds(pyproject: Path) -> None:
+    assert PyprojectDocument.load(pyproject).package_bounds("NumPy") == [
+        PackageBounds(name="numpy", lower="1.21", upper="2.0", section="project.dependencies"),
+        PackageBounds(
+            name="numpy", lower="1.24", upper=None, section="project.optional-dependencies.dev"
+        ),
+        PackageBounds(name="numpy", lower=None, upper="3.0", section="dependency-groups.dev"),
+    ]
+
+
+def test_pyproject_document_package_bounds_normalized_name(pyproject: Path) -> None:
+    assert PyprojectDocument.load(pyproject).package_bounds("scikit_learn") == [
+        PackageBounds(name="scikit-learn", lower="1.0", upper="2.0", section="project.dependencies")
+    ]
+
+
+def test_pyproject_document_package_bounds_returns_copy(pyproject: Path) -> None:
+    doc = PyprojectDocument.load(pyproject)
+    doc.package_bounds("numpy").clear()
+    assert len(doc.package_bounds("numpy")) == 3
+
+
+def test_pyproject_document_section_bounds(pyproject: Path) -> None:
+    assert PyprojectDocument.load(pyproject).section_bounds("dependency-groups.lint") == [
+        PackageBounds(name="ruff", lower="0.1", upper=None, section="dependency-groups.lint")
+    ]
+
+
+def test_pyproject_document_section_bounds_missing(pyproject: Path) -> None:
+    assert PyprojectDocument.load(pyproject).section_bounds("dependency-groups.missing") == []
+
+
+def test_pyproject_document_load_file_not_found(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        PyprojectDocument.load(tmp_path / "nonexistent.toml")
+
+
+def test_pyproject_document_load_many(pyproject: Path, tmp_path: Path) -> None:
+    other = tmp_path / "other" / "pyproject.toml"
+    other.parent.mkdir()
+    other.write_text('[project]\nname = "other"\ndependencies = ["torch>=2.0"]\n')
+    docs = PyprojectDocument.load_many([other, str(pyproject)])
+    assert list(docs) == [other, pyproject]
+    assert docs[other].dependencies() == [
+        PackageBounds(name="torch", lower="2.0", upper=None, section="project.dependencies")
+    ]
+    assert len(docs[pyproject].bounds) == 11
+
+
+def test_pyproject_document_load_many_empty() -> None:
+    assert PyprojectDocument.load_many([]) == {}
@@ -1,14 +1,209 @@
 from __future__ import annotations
 
+import os
+import shutil
+from importlib.metadata import distributions
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
 import pytest
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
+
+from feu.version import (
+    InstalledDistributions,
+    get_installed_distributions,
+    get_package_version,
+    get_package_versions,
+    get_python_major_minor,
+)
+from feu.version.runtime import _compute_fingerprint
 
-from feu.version import get_package_version, get_python_major_minor
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture(autouse=True)
 def _reset() -> None:
     get_python_major_minor.cache_clear()
+    if hasattr(get_installed_distributions, "_installed"):
+        del get_installed_distributions._installed
+
+
+def create_dist_info(path: Path, name: str, version: str) -> Path:
+    dist_info = path / f"{name}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    dist_info.joinpath("METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    )
+    # Make sure the modification time of the parent directory changes
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    return dist_info
+
+
+@pytest.fixture
+def site_packages(tmp_path: Path) -> Path:
+    path = tmp_path / "site-packages"
+    path.mkdir()
+    create_dist_info(path, "Foo_Bar", "1.2.0")
+    create_dist_info(path, "baz", "0.1")
+    return path
+
+
+############################################
+#     Tests for InstalledDistributions     #
+############################################
+
+
+def test_installed_distributions_repr() -> None:
+    assert repr(InstalledDistributions()) == "InstalledDistributions(paths=sys.path)"
+
+
+def test_installed_distributions_repr_paths(site_packages: Path) -> None:
+    assert repr(InstalledDistributions([str(site_packages)])) == "InstalledDistributions(paths=1)"
+
+
+def test_installed_distributions_get(site_packages: Path) -> None:
+    installed = InstalledDistributions([str(site_packages)])
+    assert installed.get("foo-bar") == Version("1.2.0")
+    assert installed.get("Foo.Bar") == Version("1.2.0")
+    assert installed.get("baz") == Version("0.1")
+
+
+def test_installed_distributions_get_missing(site_packages: Path) -> None:
+    assert InstalledDistributions([str(site_packages)]).get("missing") is None
+
+
+def test_installed_distributions_get_sys_path() -> None:
+    assert isinstance(InstalledDistributions().get("pytest"), Version)
+
+
+def test_installed_distributions_contains(site_packages: Path) -> None:
+    installed = InstalledDistributions([str(site_packages)])
+    assert "FOO_BAR" in installed
+    assert "missing" not in installed
+    assert 1 not in installed
+
+
+def test_installed_distributions_len(site_packages: Path) -> None:
+    assert len(InstalledDistributions([str(site_packages)])) == 2
+
+
+def test_installed_distributions_get_many(site_packages: Path) -> None:
+    assert InstalledDistributions([str(site_packages)]).get_many(["Foo_Bar", "baz", "missing"]) == {
+        "Foo_Bar": Version("1.2.0"),
+        "baz": Version("0.1"),
+        "missing": None,
+    }
+
+
+def test_installed_distributions_to_dict(site_packages: Path) -> None:
+    assert InstalledDistributions([str(site_packages)]).to_dict() == {
+        "foo-bar": Version("1.2.0"),
+        "baz": Version("0.1"),
+    }
+
+
+def test_installed_distributions_empty(tmp_path: Path) -> None:
+    assert InstalledDistributions([str(tmp_path)]).to_dict() == {}
+
+
+def test_installed_distributions_missing_path(tmp_path: Path) -> None:
+    assert InstalledDistributions([str(tmp_path / "missing")]).to_dict() == {}
+
+
+def test_installed_distributions_first_path_wins(tmp_path: Path) -> None:
+    create_dist_info(tmp_path / "first", "foo", "2.0")
+    create_dist_info(tmp_path / "second", "foo", "1.0")
+    installed = InstalledDistributions([str(tmp_path / "first"), str(tmp_path / "second")])
+    assert installed.get("foo") == Version("2.0")
+
+
+def test_installed_distributions_invalid_version(site_packages: Path) -> None:
+    create_dist_info(site_packages, "invalid", "not-a-version")
+    installed = InstalledDistributions([str(site_packages)])
+    with pytest.raises(InvalidVersion, match="not-a-version"):
+        installed.get("invalid")
+    assert "invalid" in installed
+    assert len(installed) == 2
+    assert "invalid" not in installed.to_dict()
+
+
+def test_installed_distributions_scans_once(site_packages: Path) -> None:
+    installed = InstalledDistributions([str(site_packages)])
+    with patch("feu.version.runtime.distributions", wraps=distributions) as mock:
+        installed.get("foo-bar")
+        installed.get("baz")
+        installed.get_many(["foo-bar", "baz"])
+    mock.assert_called_once()
+
+
+def test_installed_distributions_hit_does_not_check_staleness(site_packages: Path) -> None:
+    installed = InstalledDistributions([str(site_packages)])
+    with patch("feu.version.runtime._compute_fingerprint", wraps=_compute_fingerprint) as mock:
+        installed.get("foo-bar")
+        installed.get("baz")
+        installed.get_many(["foo-bar", "baz"])
+        assert "baz" in installed
+    mock.assert_called_once()
+
+
+def test_installed_distributions_miss_checks_staleness_once(site_packages: Path) -> None:
+    installed = InstalledDistributions([str(site_packages)])
+    installed.get("baz")
+    with patch("feu.version.runtime._compute_fingerprint", wraps=_compute_fingerprint) as mock:
+        assert installed.get_many(["missing1", "missing2", "baz"]) == {
+            "missing1": None,
+            "missing2": None,
+            "baz": Version("0.1"),
+        }
+    mock.assert_called_once()
+
+
+def test_installed_distributions_detects_install(site_packages: Path) -> None:
+    installed = InstalledDistributions([str(site_packages)])
+    assert installed.get("new") is None
+    create_dist_info(site_packages, "new", "3.0")
+    assert installed.get("new") == Version("3.0")
+
+
+def test_installed_distributions_upgrade_needs_refresh(site_packages: Path) -> None:
+    installed = InstalledDistributions([str(site_packages)])
+    assert installed.get("baz") == Version("0.1")
+    shutil.rmtree(site_packages / "baz-0.1.dist-info")
+    create_dist_info(site_packages, "baz", "0.2")
+    assert installed.get("baz") == Version("0.1")
+    installed.refresh()
+    assert installed.get("baz") == Version("0.2")
+
+
+def test_installed_distributions_detects_sys_path_change(
+    site_packages: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    installed = InstalledDistributions()
+    assert installed.get("foo-bar") is None
+    monkeypatch.syspath_prepend(str(site_packages))
+    assert installed.get("foo-bar") == Version("1.2.0")
+
+
+def test_installed_distributions_refresh(site_packages: Path) -> None:
+    installed = InstalledDistributions([str(site_packages)])
+    with patch("feu.version.runtime.distributions", wraps=distributions) as mock:
+        installed.get("baz")
+        installed.refresh()
+        installed.get("baz")
+    assert mock.call_count == 2
+
+
+#################################################
+#     Tests for get_installed_distributions     #
+#################################################
+
+
+def test_get_installed_distributions() -> None:
+    installed = get_installed_distributions()
+    assert isinstance(installed, InstalledDistributions)
+    assert installed is get_installed_distributions()
 
 
 #########################################
@@ -25,6 +220,26 @@ def test_get_package_version_missing() -> None:
     assert get_package_version("missing") is None
 
 
+def test_get_package_version_normalized_name() -> None:
+    assert get_package_version("PyTest") == get_package_version("pytest")
+
+
+##########################################
+#     Tests for get_package_versions     #
+##########################################
+
+
+def test_get_package_versions() -> None:
+    versions = get_package_versions(["pytest", "missing"])
+    assert list(versions) == ["pytest", "missing"]
+    assert isinstance(versions["pytest"], Version)
+    assert versions["missing"] is None
+
+
+def test_get_package_versions_empty() -> None:
+    assert get_package_versions([]) == {}
+
+
 ############################################
 #     Tests for get_python_major_minor     #
 ############################################
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from feu.version import (
+    PackageBounds,
+    PyprojectScanner,
+    find_pyproject_files,
+    merge_package_bounds,
+    scan_package_bounds,
+)
+from feu.version.scan import _read_entry
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    import tomli as tomllib
+
+
+def write_pyproject(path: Path, dependencies: list[str]) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    path = path / "pyproject.toml"
+    specs = ", ".join(f'"{spec}"' for spec in dependencies)
+    path.write_text(f'[project]\nname = "pkg"\ndependencies = [{specs}]\n')
+    return path
+
+
+@pytest.fixture
+def monorepo(tmp_path: Path) -> Path:
+    write_pyproject(tmp_path / "a", ["numpy>=1.21,<2.0", "torch>=2.0"])
+    write_pyproject(tmp_path / "b", ["NumPy>=1.24", "requests"])
+    write_pyproject(tmp_path / "b" / "c", ["numpy>=1.22,<1.26"])
+    write_pyproject(tmp_path / ".venv" / "lib", ["hidden>=1.0"])
+    write_pyproject(tmp_path / "node_modules" / "x", ["excluded>=1.0"])
+    # The scanner returns resolved paths
+    return tmp_path.resolve()
+
+
+##########################################
+#     Tests for find_pyproject_files     #
+##########################################
+
+
+def test_find_pyproject_files(monorepo: Path) -> None:
+    assert find_pyproject_files(monorepo) == [
+        monorepo / "a" / "pyproject.toml",
+        monorepo / "b" / "c" / "pyproject.toml",
+        monorepo / "b" / "pyproject.toml",
+    ]
+
+
+def test_find_pyproject_files_exclude(monorepo: Path) -> None:
+    assert find_pyproject_files(monorepo, exclude=["b"]) == [
+        monorepo / "a" / "pyproject.toml",
+        monorepo / "node_modules" / "x" / "pyproject.toml",
+    ]
+
+
+def test_find_pyproject_files_empty(tmp_path: Path) -> None:
+    assert find_pyproject_files(tmp_path) == []
+
+
+##########################################
+#     Tests for merge_package_bounds     #
+##########################################
+
+
+def test_merge_package_bounds_tightest() -> None:
+    assert merge_package_bounds(
+        [
+            PackageBounds(name="numpy", lower="1.21", upper="2.0", section="a"),
+            PackageBounds(name="torch", lower=None, upper=None, section="a"),
+            PackageBounds(name="NumPy", lower="1.24", upper=None, section="b"),
+            PackageBounds(name="numpy", lower="1.9", upper="1.26", section="a"),
+        ]
+    ) == [
+        PackageBounds(name="numpy", lower="1.24", upper="1.26", section="a,b"),
+        PackageBounds(name="torch", lower=None, upper=None, section="a"),
+    ]
+
+
+def test_merge_package_bounds_loosest() -> None:
+    assert merge_package_bounds(
+        [
+            PackageBounds(name="numpy", lower="1.21", upper="2.0", section="a"),
+            PackageBounds(name="numpy", lower="1.9", upper="1.26", section="b"),
+            PackageBounds(name="torch", lower="2.0", upper="3.0", section="a"),
+            PackageBounds(name="torch", lower=None, upper="2.5", section="b"),
+        ],
+        mode="loosest",
+    ) == [
+        PackageBounds(name="numpy", lower="1.9", upper="2.0", section="a,b"),
+        PackageBounds(name="torch", lower=None, upper="3.0", section="a,b"),
+    ]
+
+
+def test_merge_package_bounds_loosest_unbounded_upper() -> None:
+    assert merge_package_bounds(
+        [
+            PackageBounds(name="numpy", lower="1.21", upper="2.0", section="a"),
+            PackageBounds(name="numpy", lower="1.24", upper=None, section="b"),
+        ],
+        mode="loosest",
+    ) == [PackageBounds(name="numpy", lower="1.21", upper=None, section="a,b")]
+
+
+def test_merge_package_bounds_empty() -> None:
+    assert merge_package_bounds([]) == []
+
+
+def test_merge_package_bounds_incorrect_mode() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect mode 'incorrect'"):
+        merge_package_bounds([], mode="incorrect")
+
+
+######################################
+#     Tests for PyprojectScanner     #
+######################################
+
+
+def test_pyproject_scanner_repr() -> None:
+    assert repr(PyprojectScanner()).startswith("PyprojectScanner(")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, None])
+def test_pyproject_scanner_scan(monorepo: Path, max_workers: int | None) -> None:
+    docs = PyprojectScanner(max_workers=max_workers).scan(monorepo)
+    assert list(docs) == [
+        monorepo / "a" / "pyproject.toml",
+        monorepo / "b" / "c" / "pyproject.toml",
+        monorepo / "b" / "pyproject.toml",
+    ]
+    assert docs[monorepo / "b" / "pyproject.toml"].dependencies() == [
+        PackageBounds(name="NumPy", lower="1.24", upper=None, section="project.dependencies"),
+        PackageBounds(name="requests", lower=None, upper=None, section="project.dependencies"),
+    ]
+
+
+def test_pyproject_scanner_scan_processes(monorepo: Path) -> None:
+    docs = PyprojectScanner(max_workers=2, use_processes=True).scan(monorepo)
+    assert docs[monorepo / "a" / "pyproject.toml"].package_bounds("torch") == [
+        PackageBounds(name="torch", lower="2.0", upper=None, section="project.dependencies")
+    ]
+
+
+def test_pyproject_scanner_scan_relative_root(
+    monorepo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(monorepo / "b")
+    assert list(PyprojectScanner(max_workers=1).scan("c")) == [
+        monorepo / "b" / "c" / "pyproject.toml"
+    ]
+
+
+def test_pyproject_scanner_rescan_only_parses_changed_files(monorepo: Path) -> None:
+    scanner = PyprojectScanner(max_workers=1)
+    scanner.scan(monorepo)
+    path = write_pyproject(monorepo / "a", ["numpy>=1.23"])
+    with patch("feu.version.scan._read_entry", wraps=_read_entry) as mock:
+        docs = scanner.scan(monorepo)
+    assert [call.args[0] for call in mock.call_args_list] == [path]
+    assert docs[path].dependencies() == [
+        PackageBounds(name="numpy", lower="1.23", upper=None, section="project.dependencies")
+    ]
+
+
+def test_pyproject_scanner_rescan_touched_file_is_not_parsed(monorepo: Path) -> None:
+    scanner = PyprojectScanner(max_workers=1)
+    scanner.scan(monorepo)
+    path = monorepo / "a" / "pyproject.toml"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with patch("feu.version.scan.tomllib.loads", wraps=tomllib.loads) as mock:
+        docs = scanner.scan(monorepo)
+    mock.assert_not_called()
+    assert len(docs[path].dependencies()) == 2
+
+
+def test_pyproject_scanner_rescan_removed_file(monorepo: Path) -> None:
+    scanner = PyprojectScanner(max_workers=1)
+    scanner.scan(monorepo)
+    (monorepo / "b" / "c" / "pyproject.toml").unlink()
+    assert list(scanner.scan(monorepo)) == [
+        monorepo / "a" / "pyproject.toml",
+        monorepo / "b" / "pyproject.toml",
+    ]
+
+
+def test_pyproject_scanner_cache_path(monorepo: Path, tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache" / "scan.json"
+    docs = PyprojectScanner(max_workers=1, cache_path=cache_path).scan(monorepo)
+    assert cache_path.is_file()
+    with patch("feu.version.scan._read_entry", wraps=_read_entry) as mock:
+        cached_docs = PyprojectScanner(max_workers=1, cache_path=cache_path).scan(monorepo)
+    mock.assert_not_called()
+    assert {path: doc.bounds for path, doc in cached_docs.items()} == {
+        path: doc.bounds for path, doc in docs.items()
+    }
+
+
+def test_pyproject_scanner_cache_path_other_format(monorepo: Path, tmp_path: Path) -> None:
+    cache_path = tmp_path / "scan.json"
+    cache_path.write_text('{"version": 0, "files": {}}')
+    docs = PyprojectScanner(max_workers=1, cache_path=cache_path).scan(monorepo)
+    assert len(docs) == 3
+
+
+def test_pyproject_scanner_scan_invalid_toml(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text("this is not : valid [ toml")
+    with pytest.raises(tomllib.TOMLDecodeError):
+        PyprojectScanner(max_workers=1).scan(tmp_path)
+
+
+#########################################
+#     Tests for scan_package_bounds     #
+#########################################
+
+
+def test_scan_package_bounds(monorepo: Path) -> None:
+    assert scan_package_bounds(monorepo, max_workers=1) == [
+        PackageBounds(name="numpy", lower="1.24", upper="1.26", section="project.dependencies"),
+        PackageBounds(name="torch", lower="2.0", upper=None, section="project.dependencies"),
+        PackageBounds(name="requests", lower=None, upper=None, section="project.dependencies"),
+    ]
+
+
+def test_scan_package_bounds_loosest(monorepo: Path) -> None:
+    assert scan_package_bounds(monorepo, mode="loosest")[0] == PackageBounds(
+        name="numpy", lower="1.21", upper=None, section="project.dependencies"
+    )
+
+
+def test_scan_package_bounds_incorrect_mode(monorepo: Path) -> None:
+    with pytest.raises(ValueError, match=r"Incorrect mode 'incorrect'"):
+        scan_package_bounds(monorepo, mode="incorrect")